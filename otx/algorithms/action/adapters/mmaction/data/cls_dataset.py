@@ -22,7 +22,9 @@ from mmaction.datasets.builder import DATASETS
 from mmaction.datasets.pipelines import Compose
 from mmaction.datasets.rawframe_dataset import RawframeDataset
 
-from otx.algorithms.action.adapters.mmaction.data.pipelines import RawFrameDecode
+from otx.algorithms.action.adapters.mmaction.data.pipelines import (
+    setup_raw_frame_decode,
+)
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.label import LabelEntity
 from otx.api.utils.argument_checks import (
@@ -115,9 +117,7 @@ class OTXActionClsDataset(RawframeDataset):
         self.video_infos = OTXActionClsDataset._DataInfoProxy(otx_dataset, labels, modality)
 
         self.pipeline = Compose(pipeline)
-        for transform in self.pipeline.transforms:
-            if isinstance(transform, RawFrameDecode):
-                transform.otx_dataset = self.otx_dataset
+        setup_raw_frame_decode(self.pipeline.transforms, self.otx_dataset)
 
     def __len__(self) -> int:
         """Return length of dataset."""
@@ -29,7 +29,9 @@ from mmaction.datasets.pipelines import Compose
 from mmaction.utils import get_root_logger
 from mmcv.utils import print_log
 
-from otx.algorithms.action.adapters.mmaction.data.pipelines import RawFrameDecode
+from otx.algorithms.action.adapters.mmaction.data.pipelines import (
+    setup_raw_frame_decode,
+)
 from otx.algorithms.action.adapters.mmaction.utils import det_eval
 from otx.api.entities.annotation import Annotation
 from otx.api.entities.datasets import DatasetEntity
@@ -238,9 +240,7 @@ class OTXActionDetDataset(AVADataset):
         )
 
         self.pipeline = Compose(pipeline)
-        for transform in self.pipeline.transforms:
-            if isinstance(transform, RawFrameDecode):
-                transform.otx_dataset = self.otx_dataset
+        setup_raw_frame_decode(self.pipeline.transforms, self.otx_dataset)
 
         # TODO. Handle exclude file for AVA dataset
         self.exclude_file = None
@@ -14,6 +14,6 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
-from .loading import RawFrameDecode
+from .loading import RawFrameDecode, setup_raw_frame_decode
 
-__all__ = ["RawFrameDecode"]
+__all__ = ["RawFrameDecode", "setup_raw_frame_decode"]
@@ -14,19 +14,73 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
-from typing import Any, Dict
+import uuid
+from typing import Any, Dict, Optional, Sequence
 
+import cv2
 import numpy as np
 from mmaction.datasets.builder import PIPELINES
 
+from otx.algorithms.common.utils.image_cache import (
+    BaseImageCache,
+    MemoryImageCache,
+    build_image_cache,
+    get_image_cache_key,
+)
 from otx.api.entities.datasets import DatasetEntity
 
+# Config of the default cache of the frames decoded by RawFrameDecode. The frames are identified by their dataset and
+# index, so a single cache is shared by all the pipelines using this config.
+DEFAULT_FRAME_CACHE_SIZE = 1024**3
+DEFAULT_FRAME_CACHE = {"type": "memory", "max_bytes": DEFAULT_FRAME_CACHE_SIZE}
+
+_default_frame_cache: Optional[BaseImageCache] = None
+
+
+def _get_default_frame_cache() -> BaseImageCache:
+    """Returns the frame cache shared by the pipelines using DEFAULT_FRAME_CACHE, created on first use."""
+    global _default_frame_cache  # pylint: disable=global-statement
+    if _default_frame_cache is None:
+        _default_frame_cache = MemoryImageCache(DEFAULT_FRAME_CACHE_SIZE)
+    return _default_frame_cache
+
 
 @PIPELINES.register_module(force=True)
 class RawFrameDecode:
-    """Load and decode frames with given indices."""
+    """Load and decode frames with given indices.
+
+    Overlapping clips and several clips of a video decode the same frames, so the decoded frames are kept in an image
+    cache. The default cache is an in-memory cache shared by all the pipelines and with the DataLoader workers. It
+    holds about 170 frames of 1920x1080, or about 3000 frames once downscaled to 455x256.
+
+    If resize_frames is True, the frames are downscaled before being cached to the short side of the resize that
+    follows RawFrameDecode in the pipeline, see setup_raw_frame_decode().
+
+    Args:
+        image_cache (Optional[Dict[str, Any]]): Config of the frame cache, see build_image_cache(). Defaults to
+            DEFAULT_FRAME_CACHE. If None, the frames are decoded every time.
+        resize_frames (bool): Whether to downscale the frames to the resolution of the pipeline before caching them.
+            Defaults to False.
+    """
+
+    def __init__(self, image_cache: Optional[Dict[str, Any]] = DEFAULT_FRAME_CACHE, resize_frames: bool = False):
+        if image_cache == DEFAULT_FRAME_CACHE:
+            self.image_cache: Optional[BaseImageCache] = _get_default_frame_cache()
+        else:
+            self.image_cache = build_image_cache(image_cache)
+        self.resize_frames = resize_frames
+        self.short_side: Optional[int] = None
+
+    @property
+    def otx_dataset(self) -> DatasetEntity:
+        """Dataset whose items are the frames of the videos."""
+        return self._otx_dataset
 
-    otx_dataset: DatasetEntity
+    @otx_dataset.setter
+    def otx_dataset(self, otx_dataset: DatasetEntity):
+        self._otx_dataset = otx_dataset
+        # Identifies the frames of the dataset in the shared cache, unlike id(), which is reused once a dataset is freed
+        self._dataset_id = uuid.uuid4().hex
 
     def __call__(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Call function of RawFrameDecode."""
@@ -35,9 +89,7 @@ class RawFrameDecode:
 
     def _decode_from_list(self, results: Dict[str, Any]):
         """Generate numpy array list from list of DatasetItemEntity."""
-        imgs = []
-        for index in results["frame_inds"]:
-            imgs.append(self.otx_dataset[int(index)].media.numpy)
+        imgs = [self._load_frame(int(index)) for index in results["frame_inds"]]
         results["imgs"] = imgs
         results["original_shape"] = imgs[0].shape[:2]
         results["img_shape"] = imgs[0].shape[:2]
@@ -55,3 +107,61 @@ class RawFrameDecode:
                 results["proposals"] = proposals
 
         return results
+
+    def _load_frame(self, index: int) -> np.ndarray:
+        """Load a frame from the cache, or decode it and add it to the cache.
+
+        All the frames are video frames, so the video_frames_only flag of the cache does not apply.
+        """
+        dataset_item = self.otx_dataset[index]
+        key = None
+        if self.image_cache is not None:
+            frame_info = {"dataset_item": dataset_item, "dataset_id": self._dataset_id, "index": index}
+            key = get_image_cache_key(frame_info, self.image_cache.persistent)
+        if self.image_cache is not None and key is not None:
+            if self.short_side is not None:
+                key = f"{key}-{self.short_side}"
+            frame = self.image_cache.get(key)
+            if frame is not None:
+                return frame
+
+        frame = dataset_item.numpy
+        if self.short_side is not None and min(frame.shape[:2]) > self.short_side:
+            height, width = frame.shape[:2]
+            scale = self.short_side / min(height, width)
+            frame = cv2.resize(
+                frame, (int(width * scale + 0.5), int(height * scale + 0.5)), interpolation=cv2.INTER_AREA
+            )
+        if self.image_cache is not None and key is not None:
+            self.image_cache.put(key, frame)
+        return frame
+
+
+def setup_raw_frame_decode(transforms: Sequence[Any], otx_dataset: DatasetEntity):
+    """Hand the dataset to the RawFrameDecode transforms of a data pipeline and set their resolution.
+
+    The short side of the frames of a RawFrameDecode with resize_frames is the one of a Resize keeping the ratio of
+    the frames, or the maximum of the range of a RandomRescale, right after it. It is left unset for other transforms.
+
+    Args:
+        transforms (Sequence[Any]): Transforms of the data pipeline.
+        otx_dataset (DatasetEntity): Dataset whose items are the frames of the videos.
+    """
+    for transform, next_transform in zip(transforms, list(transforms[1:]) + [None]):
+        if not isinstance(transform, RawFrameDecode):
+            continue
+        transform.otx_dataset = otx_dataset
+        if transform.resize_frames:
+            transform.short_side = _get_short_side(next_transform)
+
+
+def _get_short_side(transform: Any) -> Optional[int]:
+    """Returns the short side a resize transform rescales the frames to, None if it is not known."""
+    if type(transform).__name__ == "RandomRescale":
+        return int(max(transform.scale_range))
+    if type(transform).__name__ == "Resize" and getattr(transform, "keep_ratio", False):
+        # Resize stores a short side scale like (-1, 256) as (np.inf, 256)
+        scale = getattr(transform, "scale", None)
+        if isinstance(scale, tuple) and np.isinf(scale[0]):
+            return int(scale[1])
+    return None
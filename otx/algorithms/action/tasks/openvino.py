@@ -73,6 +73,8 @@ from otx.api.utils.argument_checks import (
     DatasetParamTypeCheck,
     check_input_parameters_type,
 )
+from otx.api.utils.pipelined_inference import predict_pipelined
+from otx.api.utils.tiler import ASYNC_PLUGIN_CONFIG
 
 try:
     from openvino.model_zoo.model_api.adapters import OpenvinoAdapter, create_core
@@ -116,7 +118,12 @@ class ActionOpenVINOInferencer(BaseInferencer):
         self.task_type = task_type
         self.label_schema = label_schema
         model_adapter = OpenvinoAdapter(
-            create_core(), model_file, weight_file, device=device, max_num_requests=num_requests
+            create_core(),
+            model_file,
+            weight_file,
+            device=device,
+            plugin_config=ASYNC_PLUGIN_CONFIG if num_requests > 1 else None,
+            max_num_requests=num_requests,
         )
         self.configuration: Dict[Any, Any] = {}
         self.model = Model.create_model(self.task_type, model_adapter, self.configuration, preload=True)
@@ -186,6 +193,7 @@ class ActionOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOpti
         self.hparams = self.task_environment.get_hyper_parameters(ActionConfig)
         self.model = self.task_environment.model
         self.task_type = self.task_environment.model_template.task_type.name
+        self.num_requests = 1
         self.inferencer = self.load_inferencer()
 
     def load_inferencer(self) -> ActionOpenVINOInferencer:
@@ -200,6 +208,7 @@ class ActionOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOpti
             self.task_environment.label_schema,
             self.model.get_data("openvino.xml"),
             self.model.get_data("openvino.bin"),
+            num_requests=self.num_requests,
         )
 
     # pylint: disable=no-value-for-parameter
@@ -214,8 +223,10 @@ class ActionOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOpti
         height = self.inferencer.model.h
         dataloader = get_ovdataloader(dataset, self.task_type, clip_len, width, height)
         dataset_size = len(dataloader)
-        for i, data in enumerate(dataloader):
-            prediction = self.inferencer.predict(data)
+        if inference_parameters is not None and inference_parameters.num_requests > self.num_requests:
+            self.num_requests = inference_parameters.num_requests
+            self.inferencer = self.load_inferencer()
+        for i, (data, prediction) in enumerate(predict_pipelined(dataloader, self.inferencer, inference_parameters)):
             if isinstance(dataloader, ActionOVClsDataLoader):
                 dataloader.add_prediction(dataset, data, prediction)
             else:
@@ -18,7 +18,7 @@ import io
 import json
 import os
 import tempfile
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from zipfile import ZipFile
 
 import numpy as np
@@ -37,6 +37,7 @@ from otx.algorithms.anomaly.adapters.anomalib.config import get_anomalib_config
 from otx.algorithms.anomaly.adapters.anomalib.logger import get_logger
 from otx.algorithms.anomaly.configs.base.configuration import BaseAnomalyConfig
 from otx.api.configuration.configurable_parameters import ConfigurableParameters
+from otx.api.entities.annotation import Annotation
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.inference_parameters import (
     InferenceParameters,
@@ -69,6 +70,7 @@ from otx.api.usecases.tasks.interfaces.optimization_interface import (
     OptimizationType,
 )
 from otx.api.utils.anomaly_utils import create_detection_annotation_from_anomaly_heatmap
+from otx.api.utils.pipelined_inference import PipelinedInferenceEngine
 from otx.api.utils.segmentation_utils import create_annotation_from_segmentation_map
 
 logger = get_logger(__name__)
@@ -168,32 +170,29 @@ class OpenVINOTask(IInferenceTask, IEvaluationTask, IOptimizationTask, IDeployme
 
         # This always assumes that threshold is available in the task environment's model
         meta_data = self.get_meta_data()
-        for idx, dataset_item in enumerate(dataset):
-            image_result = self.inferencer.predict(dataset_item.numpy, meta_data=meta_data)
-
-            # TODO: inferencer should return predicted label and mask
-            pred_label = image_result.pred_score >= 0.5
-            pred_mask = (image_result.anomaly_map >= 0.5).astype(np.uint8)
-            probability = image_result.pred_score if pred_label else 1 - image_result.pred_score
-            if self.task_type == TaskType.ANOMALY_CLASSIFICATION:
-                label = self.anomalous_label if image_result.pred_score >= 0.5 else self.normal_label
-            elif self.task_type == TaskType.ANOMALY_SEGMENTATION:
-                annotations = create_annotation_from_segmentation_map(
-                    pred_mask, image_result.anomaly_map.squeeze(), {0: self.normal_label, 1: self.anomalous_label}
-                )
-                dataset_item.append_annotations(annotations)
-                label = self.normal_label if len(annotations) == 0 else self.anomalous_label
-            elif self.task_type == TaskType.ANOMALY_DETECTION:
-                annotations = create_detection_annotation_from_anomaly_heatmap(
-                    pred_mask, image_result.anomaly_map.squeeze(), {0: self.normal_label, 1: self.anomalous_label}
+        if inference_parameters is not None and inference_parameters.is_pipelined:
+            # The anomalib inferencer only infers synchronously, so the decoding of the images and the conversion of
+            # the predictions are pipelined around it
+            engine = PipelinedInferenceEngine(
+                pre_process=lambda dataset_item: (dataset_item.numpy, None),
+                post_process=lambda image_result, _: self.convert_prediction(image_result),
+                forward=lambda image: self.inferencer.predict(image, meta_data=meta_data),
+                num_workers=max(inference_parameters.num_workers, 1),
+            )
+            predictions = engine.predict(dataset)
+        else:
+            predictions = (
+                (
+                    dataset_item,
+                    self.convert_prediction(self.inferencer.predict(dataset_item.numpy, meta_data=meta_data)),
                 )
-                dataset_item.append_annotations(annotations)
-                label = self.normal_label if len(annotations) == 0 else self.anomalous_label
-            else:
-                raise ValueError(f"Unknown task type: {self.task_type}")
+                for dataset_item in dataset
+            )
 
-            dataset_item.append_labels([ScoredLabel(label=label, probability=float(probability))])
-            anomaly_map = anomaly_map_to_color_map(image_result.anomaly_map, normalize=False)
+        for idx, (dataset_item, (annotations, scored_label, anomaly_map)) in enumerate(predictions):
+            if annotations is not None:
+                dataset_item.append_annotations(annotations)
+            dataset_item.append_labels([scored_label])
             heatmap_media = ResultMediaEntity(
                 name="Anomaly Map",
                 type="anomaly_map",
@@ -205,6 +204,39 @@ class OpenVINOTask(IInferenceTask, IEvaluationTask, IOptimizationTask, IDeployme
 
         return dataset
 
+    def convert_prediction(self, image_result: Any) -> Tuple[Optional[List[Annotation]], ScoredLabel, np.ndarray]:
+        """Convert the prediction of the anomalib inferencer.
+
+        Args:
+            image_result (Any): Prediction of the anomalib inferencer for an image.
+
+        Returns:
+            Tuple[Optional[List[Annotation]], ScoredLabel, np.ndarray]: Predicted annotations, None for anomaly
+                classification, predicted label and colored anomaly map.
+        """
+        # TODO: inferencer should return predicted label and mask
+        pred_label = image_result.pred_score >= 0.5
+        pred_mask = (image_result.anomaly_map >= 0.5).astype(np.uint8)
+        probability = image_result.pred_score if pred_label else 1 - image_result.pred_score
+        annotations = None
+        if self.task_type == TaskType.ANOMALY_CLASSIFICATION:
+            label = self.anomalous_label if image_result.pred_score >= 0.5 else self.normal_label
+        elif self.task_type == TaskType.ANOMALY_SEGMENTATION:
+            annotations = create_annotation_from_segmentation_map(
+                pred_mask, image_result.anomaly_map.squeeze(), {0: self.normal_label, 1: self.anomalous_label}
+            )
+            label = self.anomalous_label if annotations else self.normal_label
+        elif self.task_type == TaskType.ANOMALY_DETECTION:
+            annotations = create_detection_annotation_from_anomaly_heatmap(
+                pred_mask, image_result.anomaly_map.squeeze(), {0: self.normal_label, 1: self.anomalous_label}
+            )
+            label = self.anomalous_label if annotations else self.normal_label
+        else:
+            raise ValueError(f"Unknown task type: {self.task_type}")
+
+        anomaly_map = anomaly_map_to_color_map(image_result.anomaly_map, normalize=False)
+        return annotations, ScoredLabel(label=label, probability=float(probability)), anomaly_map
+
     def get_meta_data(self) -> Dict:
         """Get Meta Data."""
         meta_data = {}
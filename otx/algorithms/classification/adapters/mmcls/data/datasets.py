@@ -92,6 +92,7 @@ class OTXClsDataset(BaseDataset):
 
         data_info = dict(
             dataset_item=item,
+            dataset_id=id(dataset),
             width=width,
             height=height,
             index=index,
@@ -445,6 +446,7 @@ class SelfSLDataset(Dataset):
 
         data_info = dict(
             dataset_item=item,
+            dataset_id=id(dataset),
             width=width,
             height=height,
             index=index,
@@ -3,8 +3,7 @@
 # Copyright (C) 2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 import copy
-import tempfile
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 from mmcls.datasets import PIPELINES
@@ -14,10 +13,9 @@ from PIL import Image, ImageFilter
 from torchvision import transforms as T
 
 from otx.algorithms.common.utils.data import get_image
+from otx.algorithms.common.utils.image_cache import build_image_cache
 from otx.api.utils.argument_checks import check_input_parameters_type
 
-_CACHE_DIR = tempfile.TemporaryDirectory(prefix="img-cache-")  # pylint: disable=consider-using-with
-
 # TODO: refactoring to common modules
 # TODO: refactoring to Sphinx style.
 
@@ -33,17 +31,20 @@ class LoadImageFromOTXDataset:
         results['index']: index of the item in the dataset
 
     :param to_float32: optional bool, True to convert images to fp32. defaults to False
+    :param image_cache: optional dict, config of the image cache, e.g. dict(type="npy"), see build_image_cache().
+        defaults to None, which only caches the training video frames
     """
 
     @check_input_parameters_type()
-    def __init__(self, to_float32: bool = False):
+    def __init__(self, to_float32: bool = False, image_cache: Optional[Dict[str, Any]] = None):
         self.to_float32 = to_float32
+        self.image_cache = build_image_cache(image_cache)
 
     @check_input_parameters_type()
     def __call__(self, results: Dict[str, Any]):
         """Callback function of LoadImageFromOTXDataset."""
         # Get image (possibly from cache)
-        img = get_image(results, _CACHE_DIR.name, to_float32=self.to_float32)
+        img = get_image(results, self.image_cache, to_float32=self.to_float32)
         shape = img.shape
 
         assert img.shape[0] == results["height"], f"{img.shape[0]} != {results['height']}"
@@ -232,6 +232,11 @@ class ClassificationInferenceTask(
 
         dataset_size = len(dataset)
         pos_thr = 0.5
+        if self._hierarchical:
+            prediction_results = list(prediction_results)
+            hierarchical_labels = self._resolve_hierarchical_labels(
+                [prediction_item for prediction_item, _, _ in prediction_results], pos_thr
+            )
         for i, (dataset_item, prediction_items) in enumerate(zip(dataset, prediction_results)):
             item_labels = []
             prediction_item, feature_vector, saliency_map = prediction_items
@@ -249,23 +254,7 @@ class ClassificationInferenceTask(
                             item_labels.append(cls_label)
 
             elif self._hierarchical:
-                for head_idx in range(self._hierarchical_info["num_multiclass_heads"]):
-                    logits_begin, logits_end = self._hierarchical_info["head_idx_to_logits_range"][head_idx]
-                    head_logits = prediction_item[logits_begin:logits_end]
-                    head_pred = np.argmax(head_logits)  # Assume logits already passed softmax
-                    label_str = self._hierarchical_info["all_groups"][head_idx][head_pred]
-                    otx_label = next(x for x in self._labels if x.name == label_str)
-                    item_labels.append(ScoredLabel(label=otx_label, probability=float(head_logits[head_pred])))
-
-                if self._hierarchical_info["num_multilabel_classes"]:
-                    head_logits = prediction_item[self._hierarchical_info["num_single_label_classes"] :]
-                    for logit_idx, logit in enumerate(head_logits):
-                        if logit > pos_thr:  # Assume logits already passed sigmoid
-                            label_str_idx = self._hierarchical_info["num_multiclass_heads"] + logit_idx
-                            label_str = self._hierarchical_info["all_groups"][label_str_idx][0]
-                            otx_label = next(x for x in self._labels if x.name == label_str)
-                            item_labels.append(ScoredLabel(label=otx_label, probability=float(logit)))
-                item_labels = self._task_environment.label_schema.resolve_labels_probabilistic(item_labels)
+                item_labels = hierarchical_labels[i]
                 if not item_labels:
                     logger.info("item_labels is empty.")
                     item_labels.append(ScoredLabel(self._empty_label, probability=1.0))
@@ -304,6 +293,38 @@ class ClassificationInferenceTask(
                 )
             update_progress_callback(int(i / dataset_size * 100))
 
+    def _resolve_hierarchical_labels(self, prediction_items, pos_thr):
+        """Resolve the labels predicted by the hierarchical heads, for all the items at once.
+
+        The most likely label of each multiclass head and the multilabel classes above pos_thr are resolved with the
+        compiled index of the label schema, the other labels being not predicted.
+        """
+        if not prediction_items:
+            return []
+        label_schema_index = self._task_environment.label_schema.compile()
+        name_to_label = {}
+        for label in self._labels:
+            name_to_label.setdefault(label.name, label)
+        all_groups = self._hierarchical_info["all_groups"]
+        labels = [name_to_label[label_str] for group in all_groups for label_str in group]
+        group_offsets = np.cumsum([0] + [len(group) for group in all_groups])
+
+        predictions = np.stack(prediction_items).reshape(len(prediction_items), -1)
+        rows = np.arange(len(predictions))
+        probabilities = np.full((len(predictions), len(labels)), np.nan)
+        for head_idx in range(self._hierarchical_info["num_multiclass_heads"]):
+            logits_begin, logits_end = self._hierarchical_info["head_idx_to_logits_range"][head_idx]
+            head_logits = predictions[:, logits_begin:logits_end]
+            head_preds = np.argmax(head_logits, axis=1)  # Assume logits already passed softmax
+            probabilities[rows, group_offsets[head_idx] + head_preds] = head_logits[rows, head_preds]
+
+        if self._hierarchical_info["num_multilabel_classes"]:
+            head_logits = predictions[:, self._hierarchical_info["num_single_label_classes"] :]
+            label_str_idx = self._hierarchical_info["num_multiclass_heads"] + np.arange(head_logits.shape[1])
+            # Assume logits already passed sigmoid
+            probabilities[:, group_offsets[label_str_idx]] = np.where(head_logits > pos_thr, head_logits, np.nan)
+        return label_schema_index.resolve_labels_probabilistic(probabilities, labels)
+
     def _add_saliency_maps_to_dataset(self, saliency_maps, dataset, update_progress_callback):
         """Loop over dataset again and assign saliency maps."""
         dataset_size = len(dataset)
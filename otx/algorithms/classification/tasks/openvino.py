@@ -73,6 +73,8 @@ from otx.api.utils.argument_checks import (
     check_input_parameters_type,
 )
 from otx.api.utils.dataset_utils import add_saliency_maps_to_dataset_item
+from otx.api.utils.pipelined_inference import predict_pipelined
+from otx.api.utils.tiler import ASYNC_PLUGIN_CONFIG
 
 try:
     from openvino.model_zoo.model_api.adapters import OpenvinoAdapter, create_core
@@ -119,7 +121,12 @@ class ClassificationOpenVINOInferencer(BaseInferencer):
         self.label_schema = label_schema
 
         model_adapter = OpenvinoAdapter(
-            create_core(), model_file, weight_file, device=device, max_num_requests=num_requests
+            create_core(),
+            model_file,
+            weight_file,
+            device=device,
+            plugin_config=ASYNC_PLUGIN_CONFIG if num_requests > 1 else None,
+            max_num_requests=num_requests,
         )
         self.configuration = {
             "multilabel": multilabel,
@@ -151,6 +158,13 @@ class ClassificationOpenVINOInferencer(BaseInferencer):
 
         image, metadata = self.pre_process(image)
         raw_predictions = self.forward(image)
+        return self.post_process_outputs(raw_predictions, metadata)
+
+    @check_input_parameters_type()
+    def post_process_outputs(
+        self, raw_predictions: Dict[str, np.ndarray], metadata: Dict[str, Any]
+    ) -> Tuple[AnnotationSceneEntity, np.ndarray, np.ndarray, np.ndarray, Any]:
+        """Post-process the raw predictions into the predictions and auxiliary outputs returned by predict."""
         predictions = self.post_process(raw_predictions, metadata)
         probs, actmap, repr_vectors, act_score = self.model.postprocess_aux_outputs(raw_predictions, metadata)
 
@@ -196,6 +210,7 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
         self.task_environment = task_environment
         self.hparams = self.task_environment.get_hyper_parameters(ClassificationConfig)
         self.model = self.task_environment.model
+        self.num_requests = 1
         self.inferencer = self.load_inferencer()
 
     def load_inferencer(self) -> ClassificationOpenVINOInferencer:
@@ -209,6 +224,7 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
             self.task_environment.label_schema,
             self.model.get_data("openvino.xml"),
             self.model.get_data("openvino.bin"),
+            num_requests=self.num_requests,
         )
 
     # pylint: disable-msg=too-many-locals
@@ -225,8 +241,18 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
         if inference_parameters is not None:
             dump_features = not inference_parameters.is_evaluation
         dataset_size = len(dataset)
-        for i, dataset_item in enumerate(dataset, 1):
-            predicted_scene, probs, saliency_map, repr_vector, act_score = self.inferencer.predict(dataset_item.numpy)
+        if inference_parameters is not None and inference_parameters.num_requests > self.num_requests:
+            self.num_requests = inference_parameters.num_requests
+            self.inferencer = self.load_inferencer()
+        predictions = predict_pipelined(
+            dataset,
+            self.inferencer,
+            inference_parameters,
+            get_inputs=lambda dataset_item: dataset_item.numpy,
+            post_process=self.inferencer.post_process_outputs,
+        )
+        for i, (dataset_item, prediction) in enumerate(predictions, 1):
+            predicted_scene, probs, saliency_map, repr_vector, act_score = prediction
             dataset_item.append_labels(predicted_scene.annotations[0].get_labels())
             active_score_media = FloatMetadata(name="active_score", value=act_score, float_type=FloatType.ACTIVE_SCORE)
             dataset_item.append_metadata_item(active_score_media, model=self.model)
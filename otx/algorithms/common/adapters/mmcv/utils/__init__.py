@@ -3,7 +3,11 @@
 # Copyright (C) 2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-from ._builder_build_data_parallel import build_data_parallel
+from ._builder_build_data_parallel import (
+    CPUDistributedDataParallel,
+    build_data_parallel,
+    support_cpu_distributed,
+)
 from ._config_utils_get_configs_by_keys import get_configs_by_keys
 from ._config_utils_get_configs_by_pairs import get_configs_by_pairs
 from .builder import build_dataloader, build_dataset
@@ -29,6 +33,8 @@ __all__ = [
     "build_dataset",
     "build_dataloader",
     "build_data_parallel",
+    "CPUDistributedDataParallel",
+    "support_cpu_distributed",
     "remove_from_config",
     "remove_from_configs_by_type",
     "get_configs_by_pairs",
@@ -5,16 +5,67 @@
 
 # NOTE: a workaround for https://github.com/python/mypy/issues/5028
 
+import functools
 import os
-from typing import Literal, Union, overload
+from typing import Callable, Literal, Union, overload
 
 import torch
 from mmcv import Config
-from mmcv.parallel import MMDataParallel, MMDistributedDataParallel
+from mmcv.parallel import MMDataParallel, MMDistributedDataParallel, scatter_kwargs
 
 from otx.api.utils.argument_checks import check_input_parameters_type
 
 
+class CPUDistributedDataParallel(MMDistributedDataParallel):
+    """MMDistributedDataParallel for the models on CPU, trained with the gloo backend.
+
+    MMDistributedDataParallel only unpacks the DataContainers of the inputs when it has devices to scatter them to.
+    This wrapper always unpacks them on CPU.
+    """
+
+    # pylint: disable=arguments-differ
+
+    def _scatter_to_cpu(self, inputs, kwargs):
+        inputs, kwargs = scatter_kwargs(inputs, kwargs, [-1], dim=self.dim)
+        return inputs[0], kwargs[0]
+
+    def train_step(self, *inputs, **kwargs):
+        """Unpack the inputs on CPU and run the parent training step."""
+        inputs, kwargs = self._scatter_to_cpu(inputs, kwargs)
+        return super().train_step(*inputs, **kwargs)
+
+    def val_step(self, *inputs, **kwargs):
+        """Unpack the inputs on CPU and run the parent validation step."""
+        inputs, kwargs = self._scatter_to_cpu(inputs, kwargs)
+        return super().val_step(*inputs, **kwargs)
+
+    def forward(self, *inputs, **kwargs):
+        """Unpack the inputs on CPU and run the parent forward pass."""
+        inputs, kwargs = self._scatter_to_cpu(inputs, kwargs)
+        return super().forward(*inputs, **kwargs)
+
+
+def support_cpu_distributed(build_ddp: Callable) -> Callable:
+    """Extend a function wrapping models for distributed training to the models on CPU.
+
+    The mm libraries only wrap the models on accelerators, e.g. mmdet.utils.build_ddp(model, device, ...).
+    The returned function builds a CPUDistributedDataParallel model when the device is "cpu",
+    and calls the original function otherwise.
+
+    :param build_ddp: Function taking the model and the device type as the first arguments.
+    :return: Wrapped function.
+    """
+
+    @functools.wraps(build_ddp)
+    def wrapper(model, device="cuda", *args, **kwargs):
+        if device != "cpu":
+            return build_ddp(model, device, *args, **kwargs)
+        kwargs.pop("device_ids", None)
+        return CPUDistributedDataParallel(model, *args, **kwargs)
+
+    return wrapper
+
+
 @overload
 def build_data_parallel(
     model: torch.nn.Module,
@@ -61,7 +112,13 @@ def build_data_parallel(
     :param distributed: Enable distributed training mode.
     :return:
     """
-    if torch.cuda.is_available() and config.get("gpu_ids", []):
+    if distributed and not torch.cuda.is_available():
+        model = CPUDistributedDataParallel(
+            model,
+            broadcast_buffers=False,
+            find_unused_parameters=config.get("find_unused_parameters", False),
+        )
+    elif torch.cuda.is_available() and config.get("gpu_ids", []):
         if distributed:
             model = model.cuda()
             # put model on gpus
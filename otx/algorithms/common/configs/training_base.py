@@ -330,4 +330,25 @@ class BaseConfig(ConfigurableParameters):
             affects_outcome_of=ModelLifecycle.NONE,
         )
 
+        tile_inference_num_requests = configurable_integer(
+            header="Number of concurrent tile inference requests",
+            description="Number of tiles inferred concurrently by the OpenVINO model. With more than one request, "
+            "the tiles are inferred asynchronously.",
+            default_value=1,
+            min_value=1,
+            max_value=64,
+            affects_outcome_of=ModelLifecycle.NONE,
+        )
+
+        tile_skip_threshold = configurable_float(
+            header="Tile skipping saliency threshold",
+            description="If greater than 0, the full image is inferred first and the tiles which neither overlap its "
+            "detections nor reach this saliency score are skipped. Higher values skip more tiles, trading recall for "
+            "speed.",
+            default_value=0.0,
+            min_value=0.0,
+            max_value=1.0,
+            affects_outcome_of=ModelLifecycle.NONE,
+        )
+
     tiling_parameters = add_parameter_group(BaseTilingParameters)
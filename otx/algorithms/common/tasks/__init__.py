@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
+from .inference_session import InferenceSession
 from .training_base import BaseTask
 
-__all__ = ["BaseTask"]
+__all__ = ["BaseTask", "InferenceSession"]
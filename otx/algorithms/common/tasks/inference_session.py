@@ -0,0 +1,136 @@
+"""Warm inference session of the OTX tasks."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+from mmcv.utils import Config
+
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.datasets import DatasetEntity, DatasetItemEntity
+from otx.api.entities.image import Image
+from otx.api.entities.inference_parameters import InferenceParameters
+from otx.mpa.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class CachedModelBuilder:
+    """Model builder building the model on its first call, and returning the same model on the next calls.
+
+    Args:
+        model_builder (Callable): Model builder to call the first time.
+    """
+
+    def __init__(self, model_builder: Callable):
+        self.model_builder = model_builder
+        self.model: Optional[torch.nn.Module] = None
+
+    def __call__(self, cfg: Config, **kwargs) -> torch.nn.Module:
+        """Build the model if it has not been built yet."""
+        if self.model is None:
+            self.model = self.model_builder(cfg, **kwargs)
+        return self.model
+
+
+class InferenceSession:
+    """Warm inference session of a task, keeping its inference model alive between inferences.
+
+    The first inference of the session configures the inference stage of the task and builds its model, loading the
+    checkpoint on the device. The next inferences reuse the configured stage and the built model, so that only the data
+    pipeline and the forward pass run for each batch. The items are inferred by micro-batches of batch_size items.
+
+    The session is opened with BaseTask.open_inference_session and stays warm until it is closed, or until the task runs
+    a stage which is not an inference stage, like a training or an export, which may change the model.
+
+    Example:
+        >>> with task.open_inference_session(batch_size=4) as session:
+        ...     for frames in video:
+        ...         annotations = session.predict(frames)
+
+    Args:
+        task (BaseTask): Task inferring the items.
+        batch_size (int): Number of items inferred together. Defaults to 1.
+    """
+
+    def __init__(self, task: Any, batch_size: int = 1):
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be greater than 0, but {batch_size} is given")
+        self.task = task
+        self.batch_size = batch_size
+        # Configured inference stages by stage module, with their configuration and cached model builder
+        self.warm_stages: Dict[str, Tuple[Any, Config, CachedModelBuilder]] = {}
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the session is the open inference session of its task."""
+        return self.task._inference_session is self  # pylint: disable=protected-access
+
+    def infer(
+        self, dataset: DatasetEntity, inference_parameters: Optional[InferenceParameters] = None
+    ) -> DatasetEntity:
+        """Infer the dataset by micro-batches, adding the predictions to its items like the infer method of the task.
+
+        Args:
+            dataset (DatasetEntity): Dataset to infer.
+            inference_parameters (Optional[InferenceParameters]): Inference parameters of the task. Defaults to None.
+
+        Returns:
+            DatasetEntity: Dataset with the predictions.
+        """
+        if not self.is_open:
+            raise RuntimeError("The inference session is closed")
+        for start in range(0, len(dataset), self.batch_size):
+            batch = DatasetEntity(items=dataset[start : start + self.batch_size], purpose=dataset.purpose)
+            self.task.infer(batch, inference_parameters)
+        return dataset
+
+    def predict(self, images: Sequence[np.ndarray]) -> List[List[Annotation]]:
+        """Predict images given as numpy arrays.
+
+        Args:
+            images (Sequence[np.ndarray]): RGB images of shape (height, width, 3).
+
+        Returns:
+            List[List[Annotation]]: Predicted annotations of each image.
+        """
+        dataset = DatasetEntity(
+            items=[
+                DatasetItemEntity(
+                    media=Image(data=image),
+                    annotation_scene=AnnotationSceneEntity(annotations=[], kind=AnnotationSceneKind.PREDICTION),
+                )
+                for image in images
+            ]
+        )
+        self.infer(dataset, InferenceParameters(is_evaluation=True))
+        return [item.get_annotations() for item in dataset]
+
+    def release(self):
+        """Release the configured stages and their models, which are built again by the next inference."""
+        if self.warm_stages:
+            logger.info("releasing the models of the inference session")
+            self.warm_stages.clear()
+            torch.cuda.empty_cache()
+
+    def close(self):
+        """Close the session, releasing its models."""
+        self.release()
+        if self.is_open:
+            self.task._inference_session = None  # pylint: disable=protected-access
+
+    def __enter__(self) -> "InferenceSession":
+        """Use the session as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the session."""
+        self.close()
@@ -16,6 +16,7 @@
 
 
 import abc
+import inspect
 import io
 import os
 import shutil
@@ -30,9 +31,15 @@ from mmcv.utils.config import Config, ConfigDict
 from otx.algorithms.common.adapters.mmcv.hooks import OTXLoggerHook
 from otx.algorithms.common.adapters.mmcv.utils import (
     align_data_config_with_recipe,
+    get_configs_by_keys,
     get_configs_by_pairs,
+    update_config,
 )
 from otx.algorithms.common.configs import TrainType
+from otx.algorithms.common.tasks.inference_session import (
+    CachedModelBuilder,
+    InferenceSession,
+)
 from otx.algorithms.common.utils import UncopiableDefaultDict
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.label import LabelEntity
@@ -47,6 +54,7 @@ from otx.api.usecases.tasks.interfaces.unload_interface import IUnload
 from otx.api.utils.argument_checks import check_input_parameters_type
 from otx.mpa.builder import build
 from otx.mpa.modules.hooks.cancel_interface_hook import CancelInterfaceHook
+from otx.mpa.registry import STAGES
 from otx.mpa.stage import Stage
 from otx.mpa.utils.config_utils import (
     MPAConfig,
@@ -116,6 +124,7 @@ class BaseTask(IInferenceTask, IExportTask, IEvaluationTask, IUnload):
         self.cancel_interface = None
         self.reserved_cancel = False
         self.on_hook_initialized = self.OnHookInitialized(self)
+        self._inference_session = None  # type: Optional[InferenceSession]
 
         # Initialize Train type related var
         self._train_type = self._hyperparams.algo_backend.train_type
@@ -127,29 +136,19 @@ class BaseTask(IInferenceTask, IExportTask, IEvaluationTask, IUnload):
         self.override_configs = {}  # type: Dict[str, str]
 
     def _run_task(self, stage_module, mode=None, dataset=None, **kwargs):
+        if self._inference_session is not None:
+            if self._is_inference_stage(self._update_stage_module(stage_module)):
+                return self._run_warm_task(stage_module, mode, dataset, **kwargs)
+            # Training or exporting may change the model kept by the inference session
+            self._inference_session.release()
+
         self._initialize(kwargs)
         stage_module = self._update_stage_module(stage_module)
 
         if mode is not None:
             self._mode = mode
 
-        # deepcopy all configs to make sure
-        # changes under MPA and below does not take an effect to OTX for clear distinction
-        model_cfg = deepcopy(self._model_cfg)
-        recipe_cfg = deepcopy(self._recipe_cfg)
-        data_cfg = deepcopy(self._data_cfg)
-        assert model_cfg is not None, "'model_cfg' is not initialized."
-        assert recipe_cfg is not None, "'recipe_cfg' is not initialized."
-
-        # update model config -> model label schema
-        data_classes = [label.name for label in self._labels]
-        model_classes = [label.name for label in self._model_label_schema]
-        model_cfg["model_classes"] = model_classes
-        if dataset is not None:
-            train_data_cfg = Stage.get_data_cfg(data_cfg, "train")
-            train_data_cfg["data_classes"] = data_classes
-            new_classes = np.setdiff1d(data_classes, model_classes).tolist()
-            train_data_cfg["new_classes"] = new_classes
+        model_cfg, recipe_cfg, data_cfg = self._copy_task_configs(dataset)
 
         logger.info(  # pylint: disable=logging-not-lazy
             "running task... kwargs = "
@@ -179,6 +178,98 @@ class BaseTask(IInferenceTask, IExportTask, IEvaluationTask, IUnload):
         logger.info("run task done.")
         return output
 
+    def _run_warm_task(self, stage_module, mode=None, dataset=None, **kwargs):
+        """Run an inference stage in the inference session, configuring it and building its model only once."""
+        assert self._inference_session is not None, "'_inference_session' is not opened."
+        warm_stages = self._inference_session.warm_stages
+        if stage_module not in warm_stages:
+            self._initialize(kwargs)
+            if mode is not None:
+                self._mode = mode
+            model_cfg, recipe_cfg, data_cfg = self._copy_task_configs(dataset)
+
+            logger.info(f"warming up {stage_module} for the inference session")
+            common_cfg = ConfigDict(dict(output_path=self._output_path, resume=self._resume))
+            stage = build(
+                recipe_cfg,
+                self._mode,
+                stage_type=self._update_stage_module(stage_module),
+                common_cfg=common_cfg,
+            )
+            model_builder = CachedModelBuilder(kwargs.pop("model_builder", None) or stage.MODEL_BUILDER)
+            cfg = stage.configure(
+                model_cfg,
+                self._model_ckpt,
+                data_cfg,
+                training=False,
+                mode=self._mode,
+                model_builder=model_builder,
+                **kwargs,
+            )
+            # The progress of each batch is not reported, and the batches are loaded in the main process
+            remove_custom_hook(cfg, "OTXProgressHook")
+            test_dataloader = cfg.data.get("test_dataloader", ConfigDict())
+            test_dataloader.update(
+                samples_per_gpu=self._inference_session.batch_size, workers_per_gpu=0, persistent_workers=False
+            )
+            cfg.data.test_dataloader = test_dataloader
+            warm_stages[stage_module] = (stage, cfg, model_builder)
+        else:
+            stage, cfg, model_builder = warm_stages[stage_module]
+            # Swap the dataset of the previous run for the new one
+            otx_datasets = get_configs_by_keys(cfg.data, "otx_dataset", return_path=True)
+            update_config(
+                cfg.data, {path: dataset for path, otx_dataset in otx_datasets.items() if otx_dataset is not None}
+            )
+
+        infer_parameters = inspect.signature(stage.infer).parameters
+        outputs = stage.infer(
+            cfg, model_builder=model_builder, **{k: v for k, v in kwargs.items() if k in infer_parameters}
+        )
+        # The cached model has already been wrapped for FP16
+        cfg.pop("fp16", None)
+        return dict(outputs=outputs)
+
+    def _copy_task_configs(self, dataset=None):
+        """Copy the configurations of the task to run a stage, updating the classes of the model and the dataset."""
+        # deepcopy all configs to make sure
+        # changes under MPA and below does not take an effect to OTX for clear distinction
+        model_cfg = deepcopy(self._model_cfg)
+        recipe_cfg = deepcopy(self._recipe_cfg)
+        data_cfg = deepcopy(self._data_cfg)
+        assert model_cfg is not None, "'model_cfg' is not initialized."
+        assert recipe_cfg is not None, "'recipe_cfg' is not initialized."
+
+        # update model config -> model label schema
+        data_classes = [label.name for label in self._labels]
+        model_classes = [label.name for label in self._model_label_schema]
+        model_cfg["model_classes"] = model_classes
+        if dataset is not None:
+            train_data_cfg = Stage.get_data_cfg(data_cfg, "train")
+            train_data_cfg["data_classes"] = data_classes
+            new_classes = np.setdiff1d(data_classes, model_classes).tolist()
+            train_data_cfg["new_classes"] = new_classes
+        return model_cfg, recipe_cfg, data_cfg
+
+    @staticmethod
+    def _is_inference_stage(stage_module: str) -> bool:
+        stage_cls = STAGES.get(stage_module)
+        return stage_cls is not None and hasattr(stage_cls, "infer")
+
+    def open_inference_session(self, batch_size: int = 1) -> InferenceSession:
+        """Open a warm inference session, keeping the inference model of the task alive until the session is closed.
+
+        Args:
+            batch_size (int): Number of items inferred together by the session. Defaults to 1.
+
+        Returns:
+            InferenceSession: Opened inference session.
+        """
+        if self._inference_session is not None:
+            self._inference_session.close()
+        self._inference_session = InferenceSession(self, batch_size)
+        return self._inference_session
+
     def _delete_scratch_space(self):
         """Remove model checkpoints and mpa logs."""
         if os.path.exists(self._output_path):
@@ -19,11 +19,15 @@
 import glob
 import logging
 import os
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional
 
-import cv2
 import numpy as np
 
+from otx.algorithms.common.utils.image_cache import (
+    BaseImageCache,
+    NumpyImageCache,
+    get_image_cache_key,
+)
 from otx.api.entities.annotation import NullAnnotationSceneEntity
 from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
@@ -143,12 +147,13 @@ def get_old_new_img_indices(labels, new_classes, dataset):
     return {"old": ids_old, "new": ids_new}
 
 
-def get_image(results: Dict[str, Any], cache_dir: str, to_float32=False) -> np.ndarray:
-    """Load an image and cache it if it's a training video frame.
+def get_image(results: Dict[str, Any], cache: Optional[BaseImageCache] = None, to_float32=False) -> np.ndarray:
+    """Load an image, going through the cache if the item is cacheable.
 
     Args:
         results (Dict[str, Any]): A dictionary that contains information about the dataset item.
-        cache_dir (str): A directory path where the cached images will be stored.
+        cache (Optional[BaseImageCache]): Cache of the loaded images. If None, the default cache is used, which only
+            holds the video frames of the training and validation subsets.
         to_float32 (bool, optional): A flag indicating whether to convert the image to float32. Defaults to False.
 
     Returns:
@@ -158,48 +163,42 @@ def get_image(results: Dict[str, Any], cache_dir: str, to_float32=False) -> np.n
     def is_training_video_frame(subset, media) -> bool:
         return subset.name in ["TRAINING", "VALIDATION"] and "VideoFrame" in repr(media)
 
-    def load_image_from_cache(filename: str, to_float32=False) -> Union[np.ndarray, None]:
-        try:
-            cached_img = cv2.imread(filename)
-            if to_float32:
-                cached_img = cached_img.astype(np.float32)
-            return cached_img
-        except Exception as e:  # pylint: disable=broad-except
-            logger.warning(f"Skip loading cached {filename} \nError msg: {e}")
-            return None
-
-    def save_image_to_cache(img: np.array, filename: str):
-        tmp_filename = filename.replace(".png", "-tmp.png")
-        if os.path.exists(filename) or os.path.exists(tmp_filename):  # if image is cached or caching
-            return
-        try:
-            cv2.imwrite(tmp_filename, img=img)
-        except Exception as e:  # pylint: disable=broad-except
-            logger.warning(f"Skip caching for {filename} \nError msg: {e}")
-            return
-
-        if os.path.exists(tmp_filename) and not os.path.exists(filename):
-            try:
-                os.replace(tmp_filename, filename)
-            except Exception as e:  # pylint: disable=broad-except
-                os.remove(tmp_filename)
-                logger.warning(f"Failed to rename {tmp_filename} -> {filename} \nError msg: {e}")
-
-    subset = results["dataset_item"].subset
-    media = results["dataset_item"].media
-    if is_training_video_frame(subset, media):
-        index = results["index"]
-        filename = os.path.join(cache_dir, f"{subset}-{index:06d}.png")
-        if os.path.exists(filename):
-            loaded_img = load_image_from_cache(filename, to_float32=to_float32)
-            if loaded_img is not None:
-                return loaded_img
-
-    img = results["dataset_item"].numpy  # this takes long for VideoFrame
+    if cache is None:
+        cache = _get_default_image_cache()
+
+    key = None
+    dataset_item = results["dataset_item"]
+    if not cache.video_frames_only or is_training_video_frame(dataset_item.subset, dataset_item.media):
+        key = get_image_cache_key(results, cache.persistent)
+
+    img = cache.get(key) if key is not None else None
+    if img is None:
+        img = dataset_item.numpy  # this takes long for VideoFrame
+        if key is not None:
+            cache.put(key, img)
+
     if to_float32:
         img = img.astype(np.float32)
+    return img
 
-    if is_training_video_frame(subset, media):
-        save_image_to_cache(img, filename)
 
-    return img
+_default_image_cache: Optional[BaseImageCache] = None
+
+
+def set_default_image_cache(cache: Optional[BaseImageCache]):
+    """Sets the cache used by get_image() when the pipeline does not configure one.
+
+    Args:
+        cache (Optional[BaseImageCache]): Default image cache. If None, the cache of the training video frames is
+            used again.
+    """
+    global _default_image_cache  # pylint: disable=global-statement
+    _default_image_cache = cache
+
+
+def _get_default_image_cache() -> BaseImageCache:
+    """Returns the cache of the training video frames, created on first use."""
+    global _default_image_cache  # pylint: disable=global-statement
+    if _default_image_cache is None:
+        _default_image_cache = NumpyImageCache(video_frames_only=True)
+    return _default_image_cache
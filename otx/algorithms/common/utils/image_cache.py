@@ -0,0 +1,227 @@
+"""Caches of the images loaded by the data pipelines of OTX algorithms."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import abc
+import copy
+import hashlib
+import logging
+import os
+import tempfile
+from abc import abstractmethod
+from typing import Any, Dict, Optional
+
+import cv2
+import numpy as np
+
+from otx.api.utils.image_cache import SharedImageCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_CACHE_SIZE = 1024**3
+
+
+class BaseImageCache(metaclass=abc.ABCMeta):
+    """Base class of the caches used by get_image().
+
+    Args:
+        video_frames_only (bool): Whether to only cache the video frames of the training and validation subsets,
+            whose decoding is expensive. Defaults to False.
+    """
+
+    # Whether the images are identified by their file and ROI, so that they are found again by the next runs.
+    # Otherwise, they are identified by their subset and index in the dataset.
+    persistent = False
+
+    def __init__(self, video_frames_only: bool = False):
+        self.video_frames_only = video_frames_only
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Returns the cached image, or None if it is not in the cache."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, image: np.ndarray):
+        """Add an image to the cache."""
+        raise NotImplementedError
+
+
+class MemoryImageCache(BaseImageCache):
+    """In-memory LRU cache, shared by the DataLoader workers forked after its creation.
+
+    Args:
+        max_bytes (int): Budget for the cached images in bytes. Defaults to 1 GiB.
+        video_frames_only (bool): Whether to only cache the video frames. Defaults to False.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_CACHE_SIZE, video_frames_only: bool = False):
+        super().__init__(video_frames_only)
+        self._cache = SharedImageCache(max_bytes)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Returns a copy of the cached image, or None if it is not in the cache."""
+        return self._cache.get(key)
+
+    def put(self, key: str, image: np.ndarray):
+        """Add an image to the cache, evicting the least recently used images if needed."""
+        self._cache.put(key, image)
+
+
+class NumpyImageCache(BaseImageCache):
+    """Cache storing the images as raw .npy files, which are memory-mapped instead of being decoded.
+
+    The images are mapped copy-on-write, so that the pipelines can modify them without altering the cache.
+
+    Args:
+        cache_dir (Optional[str]): Cache directory. If None, a temporary directory removed at exit is used.
+        video_frames_only (bool): Whether to only cache the video frames. Defaults to False.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, video_frames_only: bool = False):
+        super().__init__(video_frames_only)
+        self._tmp_dir = None
+        if cache_dir is None:
+            self._tmp_dir = tempfile.TemporaryDirectory(prefix="img-cache-")  # pylint: disable=consider-using-with
+            cache_dir = self._tmp_dir.name
+        self.cache_dir = cache_dir
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "NumpyImageCache":
+        """Copies share the cache directory, so they also keep its temporary directory alive."""
+        cache = copy.copy(self)
+        memo[id(self)] = cache
+        return cache
+
+    # Extension of the cached files
+    extension = ".npy"
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{self.extension}")
+
+    def _read(self, path: str) -> Optional[np.ndarray]:
+        return np.asarray(np.load(path, mmap_mode="c"))
+
+    def _write(self, path: str, image: np.ndarray):
+        np.save(path, image)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Returns the cached image, or None if it is not in the cache."""
+        path = self._get_path(key)
+        try:
+            return self._read(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skip loading cached {path} \nError msg: {e}")
+            return None
+
+    def put(self, key: str, image: np.ndarray):
+        """Write the image to the cache, atomically so that concurrent workers never read a partial file."""
+        path = self._get_path(key)
+        tmp_path = f"{path[: -len(self.extension)]}-{os.getpid()}-tmp{self.extension}"
+        try:
+            self._write(tmp_path, image)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skip caching for {path} \nError msg: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class PngImageCache(NumpyImageCache):
+    """Cache storing the images as losslessly compressed PNG files.
+
+    The images are smaller than with NumpyImageCache but must be decoded, which is best suited to images that
+    compress well, such as segmentation masks. Only uint8 and uint16 images with 1, 3 or 4 channels can be cached.
+
+    Args:
+        cache_dir (Optional[str]): Cache directory. If None, a temporary directory removed at exit is used.
+        video_frames_only (bool): Whether to only cache the video frames. Defaults to False.
+    """
+
+    extension = ".png"
+
+    def _read(self, path: str) -> Optional[np.ndarray]:
+        if not os.path.exists(path):
+            return None
+        image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        if image is None:
+            raise ValueError("The file can not be decoded")
+        return image
+
+    def _write(self, path: str, image: np.ndarray):
+        if image.dtype not in (np.uint8, np.uint16) or (image.ndim == 3 and image.shape[2] not in (1, 3, 4)):
+            raise ValueError(f"PNG can not store {image.dtype} images of shape {image.shape}")
+        if not cv2.imwrite(path, image):
+            raise OSError("The image can not be encoded")
+
+
+class PersistentImageCache(NumpyImageCache):
+    """Cache storing the images as raw .npy files in a directory kept across runs.
+
+    The images are identified by the path, size and modification time of their file, so that the cache stays valid
+    when the dataset changes. Images which are not loaded from a file are not cached.
+
+    Args:
+        cache_dir (str): Cache directory.
+        video_frames_only (bool): Whether to only cache the video frames. Defaults to False.
+    """
+
+    persistent = True
+
+    def __init__(self, cache_dir: str, video_frames_only: bool = False):
+        os.makedirs(cache_dir, exist_ok=True)
+        super().__init__(cache_dir, video_frames_only)
+
+
+IMAGE_CACHES = {
+    "memory": MemoryImageCache,
+    "npy": NumpyImageCache,
+    "png": PngImageCache,
+    "persistent": PersistentImageCache,
+}
+
+
+def build_image_cache(cfg: Optional[Dict[str, Any]]) -> Optional[BaseImageCache]:
+    """Build an image cache from its config.
+
+    Args:
+        cfg (Optional[Dict[str, Any]]): Config with the cache "type" among "memory", "npy", "png" and "persistent",
+            and the arguments of the cache class. If None, no cache is built.
+
+    Returns:
+        Optional[BaseImageCache]: Image cache.
+    """
+    if cfg is None:
+        return None
+    cfg = dict(cfg)
+    cache_type = cfg.pop("type")
+    if cache_type not in IMAGE_CACHES:
+        raise ValueError(f"Unknown image cache type {cache_type}, available types are {list(IMAGE_CACHES)}")
+    return IMAGE_CACHES[cache_type](**cfg)
+
+
+def get_image_cache_key(results: Dict[str, Any], persistent: bool) -> Optional[str]:
+    """Returns the key of the image of a dataset item in a cache.
+
+    Args:
+        results (Dict[str, Any]): A dictionary that contains information about the dataset item, its index and
+            optionally the id of its dataset.
+        persistent (bool): Whether the key must identify the image across runs.
+
+    Returns:
+        Optional[str]: Key of the image, None if the image can not be identified across runs.
+    """
+    dataset_item = results["dataset_item"]
+    if not persistent:
+        # The datasets sharing a cache are told apart by their id, if given
+        namespace = f"{results['dataset_id']}-" if "dataset_id" in results else ""
+        return f"{namespace}{dataset_item.subset}-{results['index']:06d}"
+    path = getattr(dataset_item.media, "path", None)
+    if path is None or not os.path.isfile(path):
+        return None
+    stat = os.stat(path)
+    identity = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}:{dataset_item.roi.shape}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
@@ -17,7 +17,7 @@
 import tempfile
 from collections import OrderedDict
 from copy import copy
-from typing import Any, Dict, List, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from mmcv import Config
@@ -36,7 +36,6 @@ from otx.api.utils.argument_checks import (
     DatasetParamTypeCheck,
     check_input_parameters_type,
 )
-from otx.api.utils.shape_factory import ShapeFactory
 
 from .tiling import Tile
 
@@ -60,36 +59,33 @@ def get_annotation_mmdet_format(
     """
     width, height = dataset_item.width, dataset_item.height
 
-    # load annotations for item
-    gt_bboxes = []
-    gt_labels = []
-    gt_polygons = []
+    # load annotations for item, as arrays
+    store = dataset_item.get_annotation_store(labels=labels, include_empty=False)
 
     label_idx = {label.id: i for i, label in enumerate(labels)}
-
-    for annotation in dataset_item.get_annotations(labels=labels, include_empty=False):
-
-        box = ShapeFactory.shape_as_rectangle(annotation.shape)
-
-        if min(box.width * width, box.height * height) < min_size:
-            continue
-
-        class_indices = [
-            label_idx[label.id] for label in annotation.get_labels(include_empty=False) if label.domain == domain
-        ]
-
-        n = len(class_indices)
-        gt_bboxes.extend([[box.x1 * width, box.y1 * height, box.x2 * width, box.y2 * height] for _ in range(n)])
-        if domain != Domain.DETECTION:
-            polygon = ShapeFactory.shape_as_polygon(annotation.shape)
-            polygon = np.array([p for point in polygon.points for p in [point.x * width, point.y * height]])
-            gt_polygons.extend([[polygon] for _ in range(n)])
-        gt_labels.extend(class_indices)
+    # Class index of each label of the store, -1 for the labels of another domain or filtered out
+    class_indices = np.array(
+        [label_idx.get(label.id, -1) if label.domain == domain else -1 for label in store.labels], dtype=int
+    ).reshape(-1)
+
+    boxes = store.boxes
+    large_enough = np.minimum((boxes[:, 2] - boxes[:, 0]) * width, (boxes[:, 3] - boxes[:, 1]) * height) >= min_size
+    boxes = boxes * np.array([width, height, width, height])
+    # One ground truth per label of the annotations
+    gt_labels = class_indices[store.label_indices]
+    gt_annotations = store.label_annotation_indices
+    keep = (gt_labels >= 0) & large_enough[gt_annotations]
+    gt_labels, gt_annotations = gt_labels[keep], gt_annotations[keep]
+    gt_bboxes = boxes[gt_annotations]
+    gt_polygons = []
+    if domain != Domain.DETECTION:
+        polygons = {i: (store.get_polygon(i) * [width, height]).reshape(-1) for i in np.unique(gt_annotations)}
+        gt_polygons = [[polygons[i]] for i in gt_annotations]
 
     if len(gt_bboxes) > 0:
         ann_info = dict(
-            bboxes=np.array(gt_bboxes, dtype=np.float32).reshape(-1, 4),
-            labels=np.array(gt_labels, dtype=int),
+            bboxes=gt_bboxes.astype(np.float32).reshape(-1, 4),
+            labels=gt_labels.astype(int),
             masks=PolygonMasks(gt_polygons, height=height, width=width) if gt_polygons else [],
         )
     else:
@@ -147,6 +143,7 @@ class OTXDetDataset(CustomDataset):
 
             data_info = dict(
                 dataset_item=item,
+                dataset_id=id(dataset),
                 width=width,
                 height=height,
                 index=index,
@@ -334,6 +331,12 @@ class ImageTilingDataset:
             boxes in tiles' overlap areas. Defaults to 0.45.
         max_per_img (int, optional): if there are more than max_per_img bboxes
             after NMS, only top max_per_img will be kept. Defaults to 200.
+        tile_cache_mode (str, optional): "lazy" to crop the tiles from the
+            decoded images on the fly, or "jpeg" to encode the tiles to disk
+            beforehand. Defaults to "lazy".
+        image_cache (dict, optional): config of the cache of the decoded
+            images in "lazy" mode. Defaults to None, which memory-maps raw
+            images saved in a temporary directory.
     """
 
     def __init__(
@@ -347,6 +350,8 @@ class ImageTilingDataset:
         max_per_img=200,
         filter_empty_gt=True,
         test_mode=False,
+        tile_cache_mode="lazy",
+        image_cache: Optional[Dict[str, Any]] = None,
     ):
         self.dataset = build_dataset(dataset)
         self.CLASSES = self.dataset.CLASSES
@@ -362,6 +367,8 @@ class ImageTilingDataset:
             iou_threshold=iou_threshold,
             max_per_img=max_per_img,
             filter_empty_gt=False if test_mode else filter_empty_gt,
+            tile_cache_mode=tile_cache_mode,
+            image_cache=image_cache,
         )
         self.flag = np.zeros(len(self), dtype=np.uint8)
         self.pipeline = Compose(pipeline)
@@ -13,20 +13,18 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 import copy
-import tempfile
 from typing import Any, Dict, Optional
 
 import numpy as np
 from mmdet.datasets.builder import PIPELINES
 
 from otx.algorithms.common.utils.data import get_image
+from otx.algorithms.common.utils.image_cache import build_image_cache
 from otx.api.entities.label import Domain
 from otx.api.utils.argument_checks import check_input_parameters_type
 
 from .dataset import get_annotation_mmdet_format
 
-_CACHE_DIR = tempfile.TemporaryDirectory(prefix="img-cache-")  # pylint: disable=consider-using-with
-
 
 # pylint: disable=too-many-instance-attributes, too-many-arguments
 @PIPELINES.register_module()
@@ -39,17 +37,20 @@ class LoadImageFromOTXDataset:
         results['index']: index of the item in the dataset
 
     :param to_float32: optional bool, True to convert images to fp32. defaults to False
+    :param image_cache: optional dict, config of the image cache, e.g. dict(type="npy"), see build_image_cache().
+        defaults to None, which only caches the training video frames
     """
 
     @check_input_parameters_type()
-    def __init__(self, to_float32: bool = False):
+    def __init__(self, to_float32: bool = False, image_cache: Optional[Dict[str, Any]] = None):
         self.to_float32 = to_float32
+        self.image_cache = build_image_cache(image_cache)
 
     @check_input_parameters_type()
     def __call__(self, results: Dict[str, Any]):
         """Callback function LoadImageFromOTXDataset."""
         # Get image (possibly from cache)
-        img = get_image(results, _CACHE_DIR.name, to_float32=self.to_float32)
+        img = get_image(results, self.image_cache, to_float32=self.to_float32)
         shape = img.shape
 
         assert img.shape[0] == results["height"], f"{img.shape[0]} != {results['height']}"
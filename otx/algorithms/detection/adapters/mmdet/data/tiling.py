@@ -3,22 +3,29 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-import copy
 import os.path as osp
 import tempfile
-import uuid
-from itertools import product
-from multiprocessing import Pool
+from concurrent.futures import ThreadPoolExecutor
 from time import time
-from typing import Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import mmcv
 import numpy as np
 import pycocotools.mask as mask_util
-from mmcv.ops import nms
-from mmdet.core import BitmapMasks, bbox2result
+import torch
+from mmcv.ops import batched_nms
+from mmdet.core import bbox2result
 from tqdm import tqdm
 
+from otx.algorithms.common.utils.image_cache import (
+    BaseImageCache,
+    NumpyImageCache,
+    build_image_cache,
+    get_image_cache_key,
+)
+
+TILE_CACHE_MODES = ("lazy", "jpeg")
+
 
 def timeit(func) -> Callable:
     """Decorator to measure time of function execution.
@@ -43,6 +50,12 @@ def timeit(func) -> Callable:
 class Tile:
     """Tile and merge datasets.
 
+    The tiles are described by a compact index made of arrays: the image each tile belongs to, its box, and the slice
+    of its annotations in the concatenated tile annotations. The tiles are cropped on the fly in __getitem__, either
+    from the decoded images kept in an image cache ("lazy" mode, default), or from JPEG files encoded before the
+    training ("jpeg" mode). By default, the lazy mode memory-maps the images saved as raw .npy files in tmp_dir, so
+    that a tile only reads its own part of the image and is not re-compressed.
+
     Args:
         dataset (CustomDataset): the dataset to be tiled.
         tile_size (int): the length of side of each tile. Defaults to 400
@@ -60,7 +73,14 @@ class Tile:
             boxes of the dataset's classes will be filtered out. This option
             only works when `test_mode=False`, i.e., we never filter images
             during tests. Defaults to True.
-        nproc (int, optional): Processes used for processing masks. Default: 4.
+        nproc (int, optional): Threads used for encoding the tiles in "jpeg"
+            mode. Default: 4.
+        tile_cache_mode (str, optional): "lazy" to crop the tiles from the
+            decoded images, or "jpeg" to encode the tiles to disk beforehand.
+            Defaults to "lazy".
+        image_cache (Dict, optional): config of the cache of the decoded images
+            used in "lazy" mode, see build_image_cache(). Defaults to None,
+            which memory-maps raw images saved in tmp_dir.
     """
 
     def __init__(
@@ -75,7 +95,11 @@ class Tile:
         max_per_img: int = 1500,
         filter_empty_gt: bool = True,
         nproc: int = 4,
+        tile_cache_mode: str = "lazy",
+        image_cache: Optional[Dict[str, Any]] = None,
     ):
+        if tile_cache_mode not in TILE_CACHE_MODES:
+            raise ValueError(f"Unknown tile cache mode {tile_cache_mode}, available modes are {TILE_CACHE_MODES}")
         self.min_area_ratio = min_area_ratio
         self.filter_empty_gt = filter_empty_gt
         self.iou_threshold = iou_threshold
@@ -88,116 +112,139 @@ class Tile:
         self.CLASSES = dataset.CLASSES  # pylint: disable=invalid-name
         self.tmp_folder = tmp_dir.name
         self.nproc = nproc
+        self.tile_cache_mode = tile_cache_mode
         self.img2fp32 = False
         for p in pipeline:
             if p.type == "PhotoMetricDistortion":
                 self.img2fp32 = True
                 break
 
-        self.dataset = dataset
-        self.tiles = self.gen_tile_ann()
-        self.cache_tiles()
+        self.image_cache: Optional[BaseImageCache] = None
+        if tile_cache_mode == "lazy":
+            self.image_cache = build_image_cache(image_cache) or NumpyImageCache(self.tmp_folder)
 
-    @timeit
-    def cache_tiles(self):
-        """Cache tiles to disk."""
-        pbar = tqdm(total=len(self.tiles))
-        pre_img_idx = None
-        for i, tile in enumerate(self.tiles):
-            tile["tile_path"] = osp.join(
-                self.tmp_folder, "_".join([str(i), tile["uuid"], tile["ori_filename"], ".jpg"])
-            )
-            x_1, y_1, x_2, y_2 = tile["tile_box"]
-            dataset_idx = tile["dataset_idx"]
-            if dataset_idx != pre_img_idx:
-                ori_img = self.dataset[dataset_idx]["img"]
-                pre_img_idx = dataset_idx
-
-            mmcv.imwrite(ori_img[y_1:y_2, x_1:x_2, :], tile["tile_path"])
-            pbar.update(1)
+        self.dataset = dataset
+        # Per image information
+        self.image_infos: List[Dict] = []
+        self.image_cache_keys: List[Optional[str]] = []
+        # Tile index
+        self.tile_image_indices = np.zeros(0, dtype=np.int64)
+        self.tile_boxes = np.zeros((0, 4), dtype=np.int64)
+        self.tile_ann_offsets = np.zeros(1, dtype=np.int64)
+        self.tile_ann_indices = np.zeros(0, dtype=np.int64)
+        self.tile_gt_bboxes = np.zeros((0, 4), dtype=np.float32)
+        self.tile_gt_labels = np.zeros(0, dtype=np.int64)
+        self.gen_tile_ann()
 
     @timeit
-    def gen_tile_ann(self) -> List[Dict]:
-        """Generate tile information and tile annotation from dataset.
+    def gen_tile_ann(self):
+        """Generate the tile index and the tile annotations from the dataset.
 
-        Returns:
-            List[Dict]: A list of tiles generated from the dataset. Each item comprises tile annotation and tile
-                        coordinates relative to the original image.
+        Each image of the dataset is decoded once. Its full-size image comes first in the index, followed by the tiles
+        of all the images. Depending on the tile cache mode, the image is then put in the image cache, or its tiles are
+        encoded to disk concurrently.
         """
-        tiles = []
+        image_indices: List[np.ndarray] = []
+        boxes: List[np.ndarray] = []
+        ann_counts: List[np.ndarray] = []
+        ann_indices: List[np.ndarray] = []
+        gt_bboxes: List[np.ndarray] = []
+        gt_labels: List[np.ndarray] = []
+        full_image_boxes = []
+        full_image_ann_counts = []
+
+        executor = ThreadPoolExecutor(self.nproc) if self.tile_cache_mode == "jpeg" else None
         pbar = tqdm(total=len(self.dataset))
-
-        for idx, result in enumerate(self.dataset):
-            tiles.append(self.gen_single_img(result, dataset_idx=idx))
-
         for idx, result in enumerate(self.dataset):
-            tiles.extend(self.gen_tiles_single_img(result, dataset_idx=idx))
+            img = result.pop("img")
+            info = self.gen_single_img(result, dataset_idx=idx)
+            height, width = info["img_shape"][:2]
+            full_image_boxes.append((0, 0, width, height))
+            full_image_ann_counts.append(len(info["gt_labels"]))
+
+            tile_boxes = self.gen_tile_boxes(height, width)
+            tile_ann = [self.tile_ann_assignment(tile_box, info["gt_bboxes"]) for tile_box in tile_boxes]
+            num_anns = np.array([len(match_idx) for match_idx, _ in tile_ann], dtype=np.int64)
+            if self.filter_empty_gt:
+                keep = np.flatnonzero(num_anns > 0)
+                tile_boxes, num_anns, tile_ann = tile_boxes[keep], num_anns[keep], [tile_ann[i] for i in keep]
+            image_indices.append(np.full(len(tile_boxes), idx, dtype=np.int64))
+            boxes.append(tile_boxes)
+            ann_counts.append(num_anns)
+            for match_idx, tile_bboxes in tile_ann:
+                ann_indices.append(match_idx)
+                gt_bboxes.append(tile_bboxes)
+                gt_labels.append(info["gt_labels"][match_idx])
+
+            if executor is not None:
+                # The tiles must be on disk before the next image is decoded, to bound the memory
+                image_boxes = np.concatenate([np.array([full_image_boxes[-1]], dtype=np.int64), tile_boxes])
+                list(executor.map(lambda box, img=img, idx=idx: self._write_tile(img, idx, box), image_boxes))
+            else:
+                self._put_image(idx, result, img)
+            self.image_infos.append(info)
             pbar.update(1)
-        return tiles
+        if executor is not None:
+            executor.shutdown()
+
+        # Full-size images first, then the tiles
+        self.tile_image_indices = np.concatenate([np.arange(self.num_images, dtype=np.int64)] + image_indices)
+        self.tile_boxes = np.concatenate([np.array(full_image_boxes, dtype=np.int64).reshape(-1, 4)] + boxes)
+        self.tile_ann_offsets = np.concatenate(
+            [[0], np.cumsum(np.concatenate([np.array(full_image_ann_counts, dtype=np.int64)] + ann_counts))]
+        ).astype(np.int64)
+        full_image_ann_indices = [np.arange(count, dtype=np.int64) for count in full_image_ann_counts]
+        self.tile_ann_indices = np.concatenate([np.zeros(0, dtype=np.int64)] + full_image_ann_indices + ann_indices)
+        self.tile_gt_bboxes = np.concatenate(
+            [np.zeros((0, 4), dtype=np.float32)]
+            + [info["gt_bboxes"].astype(np.float32) for info in self.image_infos]
+            + gt_bboxes
+        )
+        self.tile_gt_labels = np.concatenate(
+            [np.zeros(0, dtype=np.int64)] + [info["gt_labels"] for info in self.image_infos] + gt_labels
+        )
 
     def gen_single_img(self, result: Dict, dataset_idx: int) -> Dict:
-        """Add full-size image for inference or training.
+        """Extract the information of an image needed to generate its tiles.
 
         Args:
-            result (Dict): the original image-level result (i.e. the original image annotation)
-            dataset_idx (int): the image index this tile belongs to
+            result (Dict): the original image-level result (i.e. the original image annotation) without the image
+            dataset_idx (int): the image index
 
         Returns:
-            Dict: annotation with some other useful information for data pipeline.
+            Dict: image information, with the image-level result to use for the full-size image, the tile-level
+                result template and the image-level annotations.
         """
-        result["tile_box"] = (0, 0, result["dataset_item"].width, result["dataset_item"].height)
+        gt_bboxes = result.pop("gt_bboxes", None)
+        gt_labels = result.pop("gt_labels", None)
+        gt_masks = result.pop("gt_masks", None)
+        gt_bboxes_ignore = result.get("gt_bboxes_ignore", np.zeros((0, 4), dtype=np.float32))
         result["dataset_idx"] = dataset_idx
-        result["original_shape_"] = result["img_shape"]
-        result["uuid"] = str(uuid.uuid4())
-        return result
+        return dict(
+            result=result,
+            template=self.prepare_result(result),
+            img_shape=result["img_shape"],
+            gt_bboxes=np.zeros((0, 4), dtype=np.float32) if gt_bboxes is None else np.asarray(gt_bboxes),
+            gt_labels=np.array([], dtype=np.int64) if gt_labels is None else np.asarray(gt_labels),
+            gt_masks=gt_masks,
+            gt_bboxes_ignore=gt_bboxes_ignore,
+            has_gt=gt_bboxes is not None,
+        )
 
-    # pylint: disable=too-many-locals
-    def gen_tiles_single_img(self, result: Dict, dataset_idx: int) -> List[Dict]:
-        """Generate tile annotation for a single image.
+    def gen_tile_boxes(self, height: int, width: int) -> np.ndarray:
+        """Generate the boxes of the tiles of an image.
 
         Args:
-            result (Dict): the original image-level result (i.e. the original image annotation)
-            dataset_idx (int): the image index this tile belongs to
+            height (int): the height of the image
+            width (int): the width of the image
 
         Returns:
-            List[Dict]: a list of tile annotation with some other useful information for data pipeline.
+            np.ndarray: the tile boxes (x1, y1, x2, y2) in shape (N, 4).
         """
-        tile_list = []
-        gt_bboxes = result.pop("gt_bboxes", np.zeros((0, 4), dtype=np.float32))
-        gt_masks = result.pop("gt_masks", None)
-        gt_bboxes_ignore = result.pop("gt_bboxes_ignore", np.zeros((0, 4), dtype=np.float32))
-        gt_labels = result.pop("gt_labels", np.array([], dtype=np.int64))
-        img_shape = result.pop("img_shape")
-        height, width = img_shape[:2]
-        _tile = self.prepare_result(result)
-
-        num_patches_h = int((height - self.tile_size) / self.stride) + 1
-        num_patches_w = int((width - self.tile_size) / self.stride) + 1
-        for (_, _), (loc_i, loc_j) in zip(
-            product(range(num_patches_h), range(num_patches_w)),
-            product(
-                range(0, height - self.tile_size + 1, self.stride),
-                range(0, width - self.tile_size + 1, self.stride),
-            ),
-        ):
-            x_1 = loc_j
-            x_2 = loc_j + self.tile_size
-            y_1 = loc_i
-            y_2 = loc_i + self.tile_size
-            tile = copy.deepcopy(_tile)
-            tile["original_shape_"] = img_shape
-            tile["ori_shape"] = (y_2 - y_1, x_2 - x_1, 3)
-            tile["img_shape"] = tile["ori_shape"]
-            tile["tile_box"] = (x_1, y_1, x_2, y_2)
-            tile["dataset_idx"] = dataset_idx
-            tile["gt_bboxes_ignore"] = gt_bboxes_ignore
-            tile["uuid"] = str(uuid.uuid4())
-            self.tile_ann_assignment(tile, np.array([[x_1, y_1, x_2, y_2]]), gt_bboxes, gt_masks, gt_labels)
-            # filter empty ground truth
-            if self.filter_empty_gt and len(tile["gt_labels"]) == 0:
-                continue
-            tile_list.append(tile)
-        return tile_list
+        loc_i = np.arange(0, height - self.tile_size + 1, self.stride, dtype=np.int64)
+        loc_j = np.arange(0, width - self.tile_size + 1, self.stride, dtype=np.int64)
+        y_1, x_1 = [loc.reshape(-1) for loc in np.meshgrid(loc_i, loc_j, indexing="ij")]
+        return np.stack([x_1, y_1, x_1 + self.tile_size, y_1 + self.tile_size], axis=1)
 
     def prepare_result(self, result: Dict) -> Dict:
         """Prepare results dict for pipeline.
@@ -218,55 +265,27 @@ class Tile:
         )
         return result_template
 
-    def tile_ann_assignment(
-        self,
-        tile_result: Dict,
-        tile_box: np.ndarray,
-        gt_bboxes: np.ndarray,
-        gt_masks: BitmapMasks,
-        gt_labels: np.ndarray,
-    ):
-        """Assign new annotation to this tile.
+    def tile_ann_assignment(self, tile_box: np.ndarray, gt_bboxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Assign the annotations of an image to one of its tiles.
 
         Ground-truth is discarded if the overlap with this tile is lower than
         min_area_ratio.
 
         Args:
-            tile_result (Dict): the tile-level result (i.e. the tile annotation)
             tile_box (np.ndarray): the coordinate for this tile box (i.e. the tile coordinate relative to the image)
             gt_bboxes (np.ndarray): the original image-level boxes
-            gt_masks (BitmapMasks): the original image-level masks
-            gt_labels (np.ndarray): the original image-level labels
-        """
-        x_1, y_1 = tile_box[0][:2]
-        overlap_ratio = self.tile_boxes_overlap(tile_box, gt_bboxes)
-        match_idx = np.where((overlap_ratio[0] >= self.min_area_ratio))[0]
-
-        if len(match_idx):
-            tile_lables = gt_labels[match_idx][:]
-            tile_bboxes = gt_bboxes[match_idx][:]
-            tile_bboxes[:, 0] -= x_1
-            tile_bboxes[:, 1] -= y_1
-            tile_bboxes[:, 2] -= x_1
-            tile_bboxes[:, 3] -= y_1
-            tile_bboxes[:, 0] = np.maximum(0, tile_bboxes[:, 0])
-            tile_bboxes[:, 1] = np.maximum(0, tile_bboxes[:, 1])
-            tile_bboxes[:, 2] = np.minimum(self.tile_size, tile_bboxes[:, 2])
-            tile_bboxes[:, 3] = np.minimum(self.tile_size, tile_bboxes[:, 3])
-            tile_result["gt_bboxes"] = tile_bboxes
-            tile_result["gt_labels"] = tile_lables
-            tile_result["gt_masks"] = gt_masks[match_idx].crop(tile_box[0]) if gt_masks is not None else []
-        else:
-            tile_result.pop("bbox_fields")
-            tile_result.pop("mask_fields")
-            tile_result.pop("seg_fields")
-            tile_result.pop("img_fields")
-            tile_result["gt_bboxes"] = []
-            tile_result["gt_labels"] = []
-            tile_result["gt_masks"] = []
 
-        if gt_masks is None:
-            tile_result.pop("gt_masks")
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: the indices of the annotations assigned to the tile, and their boxes
+                relative to the tile.
+        """
+        if len(gt_bboxes) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 4), dtype=np.float32)
+        overlap_ratio = self.tile_boxes_overlap(tile_box[None], gt_bboxes)
+        match_idx = np.flatnonzero(overlap_ratio[0] >= self.min_area_ratio)
+        tile_bboxes = gt_bboxes[match_idx].astype(np.float32) - np.tile(tile_box[:2], 2)
+        tile_bboxes = np.clip(tile_bboxes, 0, self.tile_size)
+        return match_idx, tile_bboxes
 
     def tile_boxes_overlap(self, tile_box: np.ndarray, boxes: np.ndarray) -> np.ndarray:
         """Compute overlapping ratio over boxes.
@@ -289,77 +308,45 @@ class Tile:
         tile_box_ratio = np.where(inter > 0, inter / box_area, np.zeros(1, dtype=inter.dtype))
         return tile_box_ratio
 
-    def multiclass_nms(
-        self, boxes: np.ndarray, scores: np.ndarray, idxs: np.ndarray, iou_threshold: float, max_num: int
-    ):
-        """NMS for multi-class bboxes.
+    def tile_nms(
+        self, bboxes: np.ndarray, scores: np.ndarray, image_indices: np.ndarray, labels: np.ndarray
+    ) -> np.ndarray:
+        """NMS after aggregation suppressing duplicate boxes in tile-overlap areas.
+
+        The NMS runs image by image over all the classes, boxes of different classes never suppressing each other.
+        A single batch over all the images would offset the boxes by image index, and the large offsets would make the
+        float32 coordinates too coarse for the IoU. Then, only the top max_per_img boxes of each image are kept.
 
         Args:
-            boxes (np.ndarray):  boxes in shape (N, 4).
+            bboxes (np.ndarray): image-level boxes of all the images in shape (N, 4).
             scores (np.ndarray): scores in shape (N, ).
-            idxs (np.ndarray):  each index value correspond to a bbox cluster,
-                and NMS will not be applied between elements of different idxs,
-                shape (N, ).
-            iou_threshold (float): IoU threshold to be used to suppress boxes
-                in tiles' overlap areas.
-            max_num (int): if there are more than max_per_img bboxes after
-                NMS, only top max_per_img will be kept.
+            image_indices (np.ndarray): image index of each box in shape (N, ).
+            labels (np.ndarray): label of each box in shape (N, ).
 
         Returns:
-            tuple: tuple: kept dets and indice.
+            np.ndarray: indices of the kept boxes, grouped by image and sorted by decreasing score in each image.
         """
-        if len(boxes) == 0:
-            return None, []
-        max_coordinate = boxes.max()
-        offsets = idxs.astype(boxes.dtype) * (max_coordinate + 1)
-        boxes_for_nms = boxes + offsets[:, None]
-        dets, keep = nms(boxes_for_nms, scores, iou_threshold)
-        if max_num > 0:
-            dets = dets[:max_num]
-            keep = keep[:max_num]
-        return dets, keep
-
-    def tile_nms(
-        self,
-        bbox_results: List[np.ndarray],
-        mask_results: List[List],
-        label_results: List[np.ndarray],
-        iou_threshold: float,
-        max_per_img: int,
-        detection: bool,
-    ):
-        """NMS after aggregation suppressing duplicate boxes in tile-overlap areas.
-
-        Args:
-            bbox_results (List[List]): image-level box prediction
-            mask_results (List[np.ndarray]): image-level mask prediction
-            label_results (List[List]): image-level label prediction
-            iou_threshold (float): IoU threshold to be used to suppress boxes in tiles' overlap areas.
-            max_per_img (int): if there are more than max_per_img bboxes after NMS, only top max_per_img will be kept.
-            detection (bool): whether it is a detection task
-        """
-        assert len(bbox_results) == len(mask_results) == len(label_results)
-        for i, result in enumerate(zip(bbox_results, mask_results, label_results)):
-            score_bboxes, masks, labels = result
-            bboxes = score_bboxes[:, :4]
-            scores = np.ascontiguousarray(score_bboxes[:, 4])
-            _, keep_indices = self.multiclass_nms(
-                bboxes, scores, labels, iou_threshold=iou_threshold, max_num=max_per_img
+        if len(bboxes) == 0:
+            return np.zeros(0, dtype=np.int64)
+        order = np.argsort(image_indices, kind="stable")
+        image_starts = np.flatnonzero(np.diff(image_indices[order])) + 1
+        keeps = []
+        for box_indices in np.split(order, image_starts):
+            _, keep = batched_nms(
+                torch.from_numpy(bboxes[box_indices]),
+                torch.from_numpy(scores[box_indices]),
+                torch.from_numpy(labels[box_indices]),
+                dict(iou_threshold=self.iou_threshold),
             )
-
-            bboxes = bboxes[keep_indices]
-            labels = labels[keep_indices]
-            scores = scores[keep_indices]
-            bbox_results[i] = bbox2result(np.concatenate([bboxes, scores[:, None]], -1), labels, self.num_classes)
-
-            if not detection:
-                masks = [masks[keep_idx] for keep_idx in keep_indices]
-                masks = self.process_masks(masks)
-                mask_results[i] = [list(np.asarray(masks)[labels == i]) for i in range(self.num_classes)]
+            keep = box_indices[keep.numpy()]
+            if self.max_per_img > 0:
+                keep = keep[: self.max_per_img]
+            keeps.append(keep)
+        return np.concatenate(keeps)
 
     def __len__(self):
         """Total number of tiles."""
-        return len(self.tiles)
+        return len(self.tile_boxes)
 
     def __getitem__(self, idx):
         """Get training/test tile.
@@ -370,62 +357,160 @@ class Tile:
         Returns:
             dict: Training/test data.
         """
-        result = copy.deepcopy(self.tiles[idx])
-        if result.get("tile_path") and osp.isfile(result["tile_path"]):
-            img = mmcv.imread(result["tile_path"])
-            if self.img2fp32:
-                img = img.astype(np.float32)
-            result["img"] = img
-            return result
-        dataset_idx = result["dataset_idx"]
-        x_1, y_1, x_2, y_2 = result["tile_box"]
-        ori_img = self.dataset[dataset_idx]["img"]
+        dataset_idx = int(self.tile_image_indices[idx])
+        tile_box = self.tile_boxes[idx]
+        info = self.image_infos[dataset_idx]
+        ann_slice = slice(self.tile_ann_offsets[idx], self.tile_ann_offsets[idx + 1])
+
+        if idx < self.num_images:
+            # Full-size image
+            result = dict(info["result"])
+            for key in ("bbox_fields", "mask_fields", "seg_fields", "img_fields"):
+                if key in result:
+                    result[key] = list(result[key])
+            if info["has_gt"]:
+                result["gt_bboxes"] = info["gt_bboxes"].copy()
+                result["gt_labels"] = info["gt_labels"].copy()
+                if info["gt_masks"] is not None:
+                    result["gt_masks"] = info["gt_masks"]
+        else:
+            result = {key: list(value) for key, value in info["template"].items() if key.endswith("_fields")}
+            result.update(ori_filename=info["template"]["ori_filename"], filename=info["template"]["filename"])
+            result["ori_shape"] = (self.tile_size, self.tile_size, 3)
+            result["img_shape"] = result["ori_shape"]
+            result["dataset_idx"] = dataset_idx
+            result["gt_bboxes_ignore"] = info["gt_bboxes_ignore"]
+            if ann_slice.start < ann_slice.stop:
+                result["gt_bboxes"] = self.tile_gt_bboxes[ann_slice].copy()
+                result["gt_labels"] = self.tile_gt_labels[ann_slice].copy()
+                if info["gt_masks"] is not None:
+                    result["gt_masks"] = info["gt_masks"][self.tile_ann_indices[ann_slice]].crop(tile_box)
+            else:
+                for key in ("bbox_fields", "mask_fields", "seg_fields", "img_fields"):
+                    result.pop(key)
+                result["gt_bboxes"] = []
+                result["gt_labels"] = []
+                if info["gt_masks"] is not None:
+                    result["gt_masks"] = []
+        result["tile_box"] = tuple(int(coord) for coord in tile_box)
+        result["original_shape_"] = info["img_shape"]
+
+        img = self._get_tile_image(dataset_idx, tile_box)
         if self.img2fp32:
-            ori_img = ori_img.astype(np.float32)
-        result["img"] = ori_img[y_1:y_2, x_1:x_2, :]
+            img = img.astype(np.float32)
+        result["img"] = img
         return result
 
     @staticmethod
-    def readjust_tile_mask(tile_rle: Dict):
-        """Shift tile-level mask to image-level mask.
-
-        Args:
-            tile_rle (Dict): _description_
+    def _crop(img: np.ndarray, tile_box: np.ndarray) -> np.ndarray:
+        x_1, y_1, x_2, y_2 = tile_box
+        return img[y_1:y_2, x_1:x_2]
+
+    def _get_tile_path(self, dataset_idx: int, tile_box: np.ndarray) -> str:
+        return osp.join(self.tmp_folder, "{}_{}_{}_{}_{}.jpg".format(dataset_idx, *tile_box))
+
+    def _write_tile(self, img: np.ndarray, dataset_idx: int, tile_box: np.ndarray):
+        mmcv.imwrite(self._crop(img, tile_box), self._get_tile_path(dataset_idx, tile_box))
+
+    def _put_image(self, dataset_idx: int, result: Dict, img: np.ndarray):
+        """Put the decoded image in the image cache."""
+        assert self.image_cache is not None
+        if not self.image_cache.persistent:
+            key: Optional[str] = f"{dataset_idx:06d}"
+        elif "dataset_item" in result:
+            key = get_image_cache_key(dict(result, index=dataset_idx), persistent=True)
+        else:
+            key = None
+        self.image_cache_keys.append(key)
+        # A persistent cache may already have the image from a previous run
+        if key is not None and not (self.image_cache.persistent and self.image_cache.get(key) is not None):
+            self.image_cache.put(key, img)
+
+    def _get_tile_image(self, dataset_idx: int, tile_box: np.ndarray) -> np.ndarray:
+        """Crop the tile from the cached image, or load it from disk in "jpeg" mode."""
+        img, key = None, None
+        if self.tile_cache_mode == "jpeg":
+            tile_path = self._get_tile_path(dataset_idx, tile_box)
+            if osp.isfile(tile_path):
+                return mmcv.imread(tile_path)
+        else:
+            key = self.image_cache_keys[dataset_idx]
+        # The keys are only set in "lazy" mode, where the image cache exists
+        if key is not None and self.image_cache is not None:
+            img = self.image_cache.get(key)
+        if img is None:
+            img = self.dataset[dataset_idx]["img"]
+            if key is not None and self.image_cache is not None:
+                self.image_cache.put(key, img)
+        # Copy the tile only, the cached image may be memory-mapped
+        return np.array(self._crop(img, tile_box))
 
-        Returns:
-            _type_: _description_
-        """
-        x1, y1, x2, y2 = tile_rle.pop("tile_box")
-        height, width = tile_rle.pop("img_size")
-        tile_mask = mask_util.decode(tile_rle)
-        tile_mask = np.pad(tile_mask, ((y1, height - y2), (x1, width - x2)))
-        return mask_util.encode(tile_mask)
+    @staticmethod
+    def readjust_tile_mask(tile_rle: Dict, tile_box: Tuple[int, int, int, int], img_size: Tuple[int, int]) -> Dict:
+        """Shift tile-level mask to image-level mask.
 
-    def process_masks(self, tile_masks: List[Dict]):
-        """Decode Mask Result to Numpy mask, add paddings then encode masks again.
+        The mask is shifted in RLE space: the runs of the tile mask are split at the tile column boundaries and moved
+        to the image columns, without decoding the mask.
 
         Args:
-            tile_masks (_type_): _description_
+            tile_rle (Dict): COCO RLE of the tile-level mask.
+            tile_box (Tuple[int, int, int, int]): the tile box (x1, y1, x2, y2) in the image.
+            img_size (Tuple[int, int]): the image height and width.
 
         Returns:
-            _type_: _description_
+            Dict: COCO RLE of the image-level mask.
         """
-        with Pool(self.nproc) as pool:
-            results = pool.map(Tile.readjust_tile_mask, tile_masks)
-        return results
+        x_1, y_1, x_2, y_2 = tile_box
+        height, width = img_size
+        if (x_1, y_1, x_2, y_2) == (0, 0, width, height) and isinstance(tile_rle["counts"], bytes):
+            return tile_rle
+        tile_height = tile_rle["size"][0]
+
+        # Runs of ones in the tile, column-major
+        run_lengths = _rle_counts(tile_rle["counts"])
+        ends = np.cumsum(run_lengths)
+        starts = ends - run_lengths
+        starts, ends = starts[1::2], ends[1::2]
+        non_empty = ends > starts
+        starts, ends = starts[non_empty], ends[non_empty]
+
+        # Split the runs at the column boundaries
+        first_cols = starts // tile_height
+        num_cols = (ends - 1) // tile_height - first_cols + 1
+        run_indices = np.repeat(np.arange(len(starts)), num_cols)
+        cols = (
+            first_cols[run_indices] + np.arange(len(run_indices)) - np.repeat(np.cumsum(num_cols) - num_cols, num_cols)
+        )
+        piece_starts = np.maximum(starts[run_indices], cols * tile_height)
+        piece_ends = np.minimum(ends[run_indices], (cols + 1) * tile_height)
+
+        # Move the pieces to the image, merging the ones which become contiguous
+        img_starts = (x_1 + cols) * height + y_1 + piece_starts - cols * tile_height
+        img_ends = img_starts + piece_ends - piece_starts
+        breaks = np.flatnonzero(img_starts[1:] != img_ends[:-1]) + 1
+        img_starts = img_starts[np.concatenate([[0], breaks])] if len(img_starts) else img_starts
+        img_ends = img_ends[np.concatenate([breaks - 1, [len(img_ends) - 1]])] if len(img_ends) else img_ends
+        boundaries = np.stack([img_starts, img_ends], axis=1).reshape(-1)
+        counts = np.diff(np.concatenate([[0], boundaries, [height * width]]))
+        if len(counts) > 1 and counts[-1] == 0:
+            counts = counts[:-1]
+        return mask_util.frPyObjects(dict(counts=counts.tolist(), size=[height, width]), height, width)
 
     # pylint: disable=too-many-locals
     @timeit
     def merge(self, results: List[List]) -> Union[List[Tuple[np.ndarray, list]], List[np.ndarray]]:
         """Merge/Aggregate tile-level prediction to image-level prediction.
 
+        The predictions of all the tiles are gathered and shifted to the image coordinates at once, then a single
+        batched NMS suppresses the duplicates of all the images.
+
         Args:
             results (list[list | tuple]): Testing tile results of the dataset.
 
         Returns:
             List[List]: Testing image results of the dataset.
         """
-        assert len(results) == len(self.tiles)
+        assert len(results) == len(self)
 
         detection = False
         if isinstance(results[0], tuple):
@@ -438,51 +523,66 @@ class Tile:
         else:
             raise RuntimeError("Unknown data type")
 
-        merged_bbox_results: List[np.ndarray] = [np.empty((0, 5), dtype=dtype) for _ in range(self.num_images)]
-        merged_mask_results: List[List] = [[] for _ in range(self.num_images)]
-        merged_label_results: List[Union[List, np.ndarray]] = [[] for _ in range(self.num_images)]
-
-        for result, tile in zip(results, self.tiles):
-            tile_x1, tile_y1, _, _ = tile["tile_box"]
-            img_idx = tile["dataset_idx"]
-            img_h, img_w, _ = tile["original_shape_"]
-
-            mask_result: List[List] = [[] for _ in range(num_classes)]
-            if isinstance(result, tuple):
-                bbox_result, mask_result = result
-            else:
-                bbox_result = result
-
-            for cls_idx, cls_result in enumerate(zip(bbox_result, mask_result)):
-                cls_bbox_result, cls_mask_result = cls_result
-                _tmp_cls_bbox_result = np.zeros_like(cls_bbox_result)
-                _tmp_cls_bbox_result[:, 0] = cls_bbox_result[:, 0] + tile_x1
-                _tmp_cls_bbox_result[:, 1] = cls_bbox_result[:, 1] + tile_y1
-                _tmp_cls_bbox_result[:, 2] = cls_bbox_result[:, 2] + tile_x1
-                _tmp_cls_bbox_result[:, 3] = cls_bbox_result[:, 3] + tile_y1
-                _tmp_cls_bbox_result[:, 4] = cls_bbox_result[:, 4]
-
-                merged_bbox_results[img_idx] = np.concatenate((merged_bbox_results[img_idx], _tmp_cls_bbox_result))
-                merged_label_results[img_idx] = np.concatenate(
-                    [merged_label_results[img_idx], len(cls_bbox_result) * [cls_idx]]
-                )
-
-                for cls_mask_dict in cls_mask_result:
-                    cls_mask_dict.update(dict(tile_box=tile["tile_box"], img_size=(img_h, img_w)))
-                merged_mask_results[img_idx] += cls_mask_result
+        bbox_results = [result if detection else result[0] for result in results]
+        counts = np.array([[len(cls_result) for cls_result in result] for result in bbox_results], dtype=np.int64)
+        counts = counts.reshape(len(results), num_classes)
+        dets = np.empty((counts.sum(), 5), dtype=dtype)
+        np.concatenate([cls_result for result in bbox_results for cls_result in result], out=dets)
+        labels = np.repeat(np.tile(np.arange(num_classes), len(results)), counts.reshape(-1))
+        tile_indices = np.repeat(np.arange(len(results)), counts.sum(axis=1))
+        dets[:, :4] += np.tile(self.tile_boxes[tile_indices, :2], 2).astype(dtype)
+        image_indices = self.tile_image_indices[tile_indices]
 
         # run NMS after aggregation suppressing duplicate boxes in
         # overlapping areas
-        self.tile_nms(
-            merged_bbox_results,
-            merged_mask_results,
-            merged_label_results,
-            iou_threshold=self.iou_threshold,
-            max_per_img=self.max_per_img,
-            detection=detection,
-        )
-
-        assert len(merged_bbox_results) == len(merged_mask_results)
+        keep = self.tile_nms(dets[:, :4], dets[:, 4], image_indices, labels)
+        image_ends = np.searchsorted(image_indices[keep], np.arange(self.num_images), side="right")
+        image_keeps = np.split(keep, image_ends[:-1])
+        merged_bbox_results = [
+            bbox2result(dets[image_keep], labels[image_keep], num_classes) for image_keep in image_keeps
+        ]
         if detection:
-            return list(merged_bbox_results)
+            return merged_bbox_results
+
+        masks = [mask for result in results for cls_result in result[1] for mask in cls_result]
+        merged_mask_results: List[List] = []
+        for image_keep in image_keeps:
+            image_masks = []
+            for i in image_keep:
+                x_1, y_1, x_2, y_2 = (int(coord) for coord in self.tile_boxes[tile_indices[i]])
+                image_masks.append(
+                    self.readjust_tile_mask(
+                        masks[i], (x_1, y_1, x_2, y_2), self.image_infos[image_indices[i]]["img_shape"][:2]
+                    )
+                )
+            merged_mask_results.append(
+                [
+                    [mask for mask, label in zip(image_masks, labels[image_keep]) if label == i]
+                    for i in range(num_classes)
+                ]
+            )
         return list(zip(merged_bbox_results, merged_mask_results))
+
+
+def _rle_counts(counts: Union[bytes, str, List[int]]) -> np.ndarray:
+    """Returns the run lengths of a COCO RLE, decoding its compressed string if needed."""
+    if isinstance(counts, list):
+        return np.array(counts, dtype=np.int64)
+    if isinstance(counts, str):
+        counts = counts.encode("ascii")
+    run_lengths: List[int] = []
+    pos = 0
+    while pos < len(counts):
+        value, shift, more = 0, 0, True
+        while more:
+            char = counts[pos] - 48
+            value |= (char & 0x1F) << shift
+            more = bool(char & 0x20)
+            pos += 1
+            shift += 5
+            if not more and char & 0x10:
+                value |= -1 << shift
+        if len(run_lengths) > 2:
+            value += run_lengths[-2]
+        run_lengths.append(value)
+    return np.array(run_lengths, dtype=np.int64)
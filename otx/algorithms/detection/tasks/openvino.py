@@ -21,7 +21,7 @@ import multiprocessing
 import os
 import tempfile
 import warnings
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 from zipfile import ZipFile
 
 import attr
@@ -39,6 +39,7 @@ from otx.algorithms.detection.adapters.openvino import model_wrappers
 from otx.algorithms.detection.configs.base import DetectionConfig
 from otx.api.configuration.helper.utils import config_to_bytes
 from otx.api.entities.annotation import AnnotationSceneEntity
+from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.inference_parameters import (
     InferenceParameters,
@@ -82,6 +83,8 @@ from otx.api.utils.argument_checks import (
 )
 from otx.api.utils.dataset_utils import add_saliency_maps_to_dataset_item
 from otx.api.utils.detection_utils import detection2array
+from otx.api.utils.pipelined_inference import predict_pipelined
+from otx.api.utils.tiler import ASYNC_PLUGIN_CONFIG
 from otx.mpa.utils.logger import get_logger
 
 logger = get_logger()
@@ -101,6 +104,11 @@ class BaseInferencerWithConverter(BaseInferencer):
         self.configuration = configuration
         self.model = model
         self.converter = converter
+        # Number of tiles and skipped tiles accumulated over the images predicted by predict_tile
+        self.num_tiles = 0
+        self.num_skipped_tiles = 0
+        # Tiler of predict_tile, reused while the tiling parameters are the same
+        self.tiler: Optional[Tiler] = None
 
     @check_input_parameters_type()
     def pre_process(self, image: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
@@ -119,6 +127,13 @@ class BaseInferencerWithConverter(BaseInferencer):
         """Predict function of OpenVINO Detection Inferencer."""
         image, metadata = self.pre_process(image)
         raw_predictions = self.forward(image)
+        return self.post_process_outputs(raw_predictions, metadata)
+
+    @check_input_parameters_type()
+    def post_process_outputs(
+        self, raw_predictions: Dict[str, np.ndarray], metadata: Dict[str, Any]
+    ) -> Tuple[AnnotationSceneEntity, Tuple[np.ndarray, np.ndarray]]:
+        """Post-process the raw predictions into the predictions and features returned by predict."""
         predictions = self.post_process(raw_predictions, metadata)
         if "feature_vector" not in raw_predictions or "saliency_map" not in raw_predictions:
             warnings.warn(
@@ -141,7 +156,13 @@ class BaseInferencerWithConverter(BaseInferencer):
     # TODO [Eugene]: implement unittest for tiling predict
     @check_input_parameters_type()
     def predict_tile(
-        self, image: np.ndarray, tile_size: int, overlap: float, max_number: int
+        self,
+        image: np.ndarray,
+        tile_size: int,
+        overlap: float,
+        max_number: int,
+        num_requests: int = 1,
+        skip_threshold: float = 0.0,
     ) -> Tuple[AnnotationSceneEntity, Tuple[np.ndarray, np.ndarray]]:
         """Run prediction by tiling image to small patches.
 
@@ -150,14 +171,38 @@ class BaseInferencerWithConverter(BaseInferencer):
             tile_size (int): tile crop size
             overlap (float): overlap ratio between tiles
             max_number (int): max number of predicted objects allowed
+            num_requests (int): number of tiles inferred concurrently, at most the number of infer requests of the
+                model. Defaults to 1.
+            skip_threshold (float): saliency threshold of the coarse-to-fine mode, 0 to infer all the tiles.
+                Defaults to 0.
 
         Returns:
             detections: AnnotationSceneEntity
             features: list including saliency map and feature vector
         """
-        segm = isinstance(self.converter, (MaskToAnnotationConverter, RotatedRectToAnnotationConverter))
-        tiler = Tiler(tile_size=tile_size, overlap=overlap, max_number=max_number, model=self.model, segm=segm)
+        tiler = self.tiler
+        tiling_parameters = (tile_size, overlap, max_number, num_requests, skip_threshold)
+        if tiler is None or tiling_parameters != (
+            tiler.tile_size,
+            tiler.overlap,
+            tiler.max_number,
+            tiler.num_requests,
+            tiler.skip_threshold,
+        ):
+            segm = isinstance(self.converter, (MaskToAnnotationConverter, RotatedRectToAnnotationConverter))
+            tiler = self.tiler = Tiler(
+                tile_size=tile_size,
+                overlap=overlap,
+                max_number=max_number,
+                model=self.model,
+                segm=segm,
+                num_requests=num_requests,
+                skip_threshold=skip_threshold,
+            )
+        num_tiles, num_skipped_tiles = tiler.num_tiles, tiler.num_skipped_tiles
         detections, features = tiler.predict(image)
+        self.num_tiles += tiler.num_tiles - num_tiles
+        self.num_skipped_tiles += tiler.num_skipped_tiles - num_skipped_tiles
         detections = self.converter.convert_to_annotation(detections, metadata={"original_shape": image.shape})
         return detections, features
 
@@ -190,6 +235,7 @@ class OpenVINODetectionInferencer(BaseInferencerWithConverter):
             model_file,
             weight_file,
             device=device,
+            plugin_config=ASYNC_PLUGIN_CONFIG if num_requests > 1 else None,
             max_num_requests=num_requests,
         )
         configuration = {
@@ -229,6 +275,7 @@ class OpenVINOMaskInferencer(BaseInferencerWithConverter):
             model_file,
             weight_file,
             device=device,
+            plugin_config=ASYNC_PLUGIN_CONFIG if num_requests > 1 else None,
             max_num_requests=num_requests,
         )
 
@@ -264,6 +311,7 @@ class OpenVINORotatedRectInferencer(BaseInferencerWithConverter):
             model_file,
             weight_file,
             device=device,
+            plugin_config=ASYNC_PLUGIN_CONFIG if num_requests > 1 else None,
             max_num_requests=num_requests,
         )
 
@@ -313,6 +361,7 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
         self.model = self.task_environment.model
         self.task_type = self.task_environment.model_template.task_type
         self.confidence_threshold: float = 0.0
+        self.num_requests = 1
         self.config = self.load_config()
         self.inferencer = self.load_inferencer()
         logger.info("OpenVINO task initialization completed")
@@ -322,6 +371,13 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
         """Hparams of OpenVINO Detection Task."""
         return self.task_environment.get_hyper_parameters(DetectionConfig)
 
+    @property
+    def tile_num_requests(self) -> int:
+        """Number of tiles inferred concurrently, 1 if tiling is disabled or the model predates this parameter."""
+        if not (self.config and self.config["tiling_parameters"]["enable_tiling"]["value"]):
+            return 1
+        return int(self.config["tiling_parameters"].get("tile_inference_num_requests", {}).get("value", 1))
+
     def load_config(self) -> Dict:
         """Load configurable parameters from model adapter.
 
@@ -352,12 +408,13 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
             self.model.get_data("openvino.xml"),
             self.model.get_data("openvino.bin"),
         ]
+        kwargs = dict(num_requests=max(self.num_requests, self.tile_num_requests))
         if self.task_type == TaskType.DETECTION:
-            return OpenVINODetectionInferencer(*args)
+            return OpenVINODetectionInferencer(*args, **kwargs)
         if self.task_type == TaskType.INSTANCE_SEGMENTATION:
-            return OpenVINOMaskInferencer(*args)
+            return OpenVINOMaskInferencer(*args, **kwargs)
         if self.task_type == TaskType.ROTATED_DETECTION:
-            return OpenVINORotatedRectInferencer(*args)
+            return OpenVINORotatedRectInferencer(*args, **kwargs)
         raise RuntimeError(f"Unknown OpenVINO Inferencer TaskType: {self.task_type}")
 
     @check_input_parameters_type({"dataset": DatasetParamTypeCheck})
@@ -382,20 +439,40 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
             tile_size = self.config["tiling_parameters"]["tile_size"]["value"]
             tile_overlap = self.config["tiling_parameters"]["tile_overlap"]["value"]
             max_number = self.config["tiling_parameters"]["tile_max_number"]["value"]
+            skip_threshold = float(self.config["tiling_parameters"].get("tile_skip_threshold", {}).get("value", 0.0))
+            self.inferencer.num_tiles = self.inferencer.num_skipped_tiles = 0
             logger.info("Run inference with tiling")
 
-        dataset_size = len(dataset)
-        for i, dataset_item in enumerate(dataset, 1):
-            if tile_enabled:
-                predicted_scene, features = self.inferencer.predict_tile(
-                    dataset_item.numpy,
-                    tile_size=tile_size,
-                    overlap=tile_overlap,
-                    max_number=max_number,
+        predictions: Iterable[Tuple[DatasetItemEntity, Tuple[AnnotationSceneEntity, Any]]]
+        if tile_enabled:
+            predictions = (
+                (
+                    dataset_item,
+                    self.inferencer.predict_tile(
+                        dataset_item.numpy,
+                        tile_size=tile_size,
+                        overlap=tile_overlap,
+                        max_number=max_number,
+                        num_requests=self.tile_num_requests,
+                        skip_threshold=skip_threshold,
+                    ),
                 )
-            else:
-                predicted_scene, features = self.inferencer.predict(dataset_item.numpy)
+                for dataset_item in dataset
+            )
+        else:
+            if inference_parameters is not None and inference_parameters.num_requests > self.num_requests:
+                self.num_requests = inference_parameters.num_requests
+                self.inferencer = self.load_inferencer()
+            predictions = predict_pipelined(
+                dataset,
+                self.inferencer,
+                inference_parameters,
+                get_inputs=lambda dataset_item: dataset_item.numpy,
+                post_process=self.inferencer.post_process_outputs,
+            )
 
+        dataset_size = len(dataset)
+        for i, (dataset_item, (predicted_scene, features)) in enumerate(predictions, 1):
             dataset_item.append_annotations(predicted_scene.annotations)
             feature_vector, saliency_map = features
             if feature_vector is not None:
@@ -412,6 +489,8 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
                     predicted_scene=predicted_scene,
                 )
             update_progress_callback(int(i / dataset_size * 100), None)
+        if tile_enabled and skip_threshold > 0:
+            logger.info(f"Skipped {self.inferencer.num_skipped_tiles} of {self.inferencer.num_tiles} tiles")
         logger.info("OpenVINO inference completed")
         return dataset
 
@@ -23,6 +23,7 @@ from mmseg.datasets.custom import CustomDataset
 from mmseg.datasets.pipelines import Compose
 
 from otx.algorithms.common.utils.data import get_old_new_img_indices
+from otx.algorithms.common.utils.image_cache import BaseImageCache
 from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.label import LabelEntity
@@ -35,7 +36,9 @@ from otx.api.utils.segmentation_utils import mask_from_dataset_item
 
 # pylint: disable=invalid-name, too-many-locals, too-many-instance-attributes, super-init-not-called
 @check_input_parameters_type()
-def get_annotation_mmseg_format(dataset_item: DatasetItemEntity, labels: List[LabelEntity]) -> dict:
+def get_annotation_mmseg_format(
+    dataset_item: DatasetItemEntity, labels: List[LabelEntity], mask_cache: Optional[BaseImageCache] = None
+) -> dict:
     """Function to convert a OTX annotation to mmsegmentation format.
 
     This is used both in the OTXDataset class defined in this file
@@ -43,10 +46,11 @@ def get_annotation_mmseg_format(dataset_item: DatasetItemEntity, labels: List[La
 
     :param dataset_item: DatasetItem for which to get annotations
     :param labels: List of labels in the project
+    :param mask_cache: Optional cache of the rasterized masks, see mask_from_dataset_item()
     :return dict: annotation information dict in mmseg format
     """
 
-    gt_seg_map = mask_from_dataset_item(dataset_item, labels)
+    gt_seg_map = mask_from_dataset_item(dataset_item, labels, mask_cache)
     gt_seg_map = gt_seg_map.squeeze(2).astype(np.uint8)
 
     ann_info = dict(gt_semantic_seg=gt_seg_map)
@@ -102,6 +106,7 @@ class OTXSegDataset(CustomDataset, metaclass=ABCMeta):
 
             data_info = dict(
                 dataset_item=item,
+                dataset_id=id(dataset),
                 width=item.width,
                 height=item.height,
                 index=index,
@@ -12,9 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions
 # and limitations under the License.
-import tempfile
 from copy import deepcopy
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 from mmcv.utils import build_from_cfg
@@ -25,11 +24,29 @@ from torchvision import transforms as T
 from torchvision.transforms import functional as F
 
 from otx.algorithms.common.utils.data import get_image
+from otx.algorithms.common.utils.image_cache import (
+    BaseImageCache,
+    MemoryImageCache,
+    build_image_cache,
+)
 from otx.api.utils.argument_checks import check_input_parameters_type
 
 from .dataset import get_annotation_mmseg_format
 
-_CACHE_DIR = tempfile.TemporaryDirectory(prefix="img-cache-")  # pylint: disable=consider-using-with
+# Config of the default cache of the masks rasterized by LoadAnnotationFromOTXDataset. The masks are identified by
+# their content, so a single cache is shared by all the pipelines using this config.
+DEFAULT_MASK_CACHE_SIZE = 256 * 1024**2
+DEFAULT_MASK_CACHE = {"type": "memory", "max_bytes": DEFAULT_MASK_CACHE_SIZE}
+
+_default_mask_cache: Optional[BaseImageCache] = None
+
+
+def _get_default_mask_cache() -> BaseImageCache:
+    """Returns the mask cache shared by the pipelines using DEFAULT_MASK_CACHE, created on first use."""
+    global _default_mask_cache  # pylint: disable=global-statement
+    if _default_mask_cache is None:
+        _default_mask_cache = MemoryImageCache(DEFAULT_MASK_CACHE_SIZE)
+    return _default_mask_cache
 
 
 @PIPELINES.register_module()
@@ -42,17 +59,20 @@ class LoadImageFromOTXDataset:
         results['index']: index of the item in the dataset
 
     :param to_float32: optional bool, True to convert images to fp32. defaults to False
+    :param image_cache: optional dict, config of the image cache, e.g. dict(type="npy"), see build_image_cache().
+        defaults to None, which only caches the training video frames
     """
 
     @check_input_parameters_type()
-    def __init__(self, to_float32: bool = False):
+    def __init__(self, to_float32: bool = False, image_cache: Optional[Dict[str, Any]] = None):
         self.to_float32 = to_float32
+        self.image_cache = build_image_cache(image_cache)
 
     @check_input_parameters_type()
     def __call__(self, results: Dict[str, Any]):
         """Callback function LoadImageFromOTXDataset."""
         # Get image (possibly from cache)
-        img = get_image(results, _CACHE_DIR.name, to_float32=self.to_float32)
+        img = get_image(results, self.image_cache, to_float32=self.to_float32)
         shape = img.shape
 
         assert img.shape[0] == results["height"], f"{img.shape[0]} != {results['height']}"
@@ -83,10 +103,19 @@ class LoadAnnotationFromOTXDataset:
         results['dataset_item']: dataset_item from which to load the annotation
         results['ann_info']['label_list']: list of all labels in the project
 
+    The rasterized masks are cached, so that the polygons are not rasterized again at every epoch.
+
+    :param mask_cache: optional dict, config of the mask cache, e.g. dict(type="png") to keep the masks compressed on
+        disk, see build_image_cache(). defaults to DEFAULT_MASK_CACHE, an in-memory cache shared by all the pipelines
+        and with the data loader workers, None disables the cache
     """
 
-    def __init__(self):
-        pass
+    @check_input_parameters_type()
+    def __init__(self, mask_cache: Optional[Dict[str, Any]] = DEFAULT_MASK_CACHE):
+        if mask_cache == DEFAULT_MASK_CACHE:
+            self.mask_cache = _get_default_mask_cache()
+        else:
+            self.mask_cache = build_image_cache(mask_cache)
 
     @check_input_parameters_type()
     def __call__(self, results: Dict[str, Any]):
@@ -94,7 +123,7 @@ class LoadAnnotationFromOTXDataset:
         dataset_item = results["dataset_item"]
         labels = results["ann_info"]["labels"]
 
-        ann_info = get_annotation_mmseg_format(dataset_item, labels)
+        ann_info = get_annotation_mmseg_format(dataset_item, labels, self.mask_cache)
 
         results["gt_semantic_seg"] = ann_info["gt_semantic_seg"]
         results["seg_fields"].append("gt_semantic_seg")
@@ -75,6 +75,8 @@ from otx.api.utils.argument_checks import (
     DatasetParamTypeCheck,
     check_input_parameters_type,
 )
+from otx.api.utils.pipelined_inference import predict_pipelined
+from otx.api.utils.tiler import ASYNC_PLUGIN_CONFIG
 from otx.mpa.utils.logger import get_logger
 
 logger = get_logger()
@@ -105,7 +107,12 @@ class OpenVINOSegmentationInferencer(BaseInferencer):
         """
 
         model_adapter = OpenvinoAdapter(
-            create_core(), model_file, weight_file, device=device, max_num_requests=num_requests
+            create_core(),
+            model_file,
+            weight_file,
+            device=device,
+            plugin_config=ASYNC_PLUGIN_CONFIG if num_requests > 1 else None,
+            max_num_requests=num_requests,
         )
         self.configuration = {
             **attr.asdict(
@@ -180,6 +187,7 @@ class OpenVINOSegmentationTask(IDeploymentTask, IInferenceTask, IEvaluationTask,
         self.task_environment = task_environment
         self.model = self.task_environment.model
         self.model_name = self.task_environment.model_template.model_template_id
+        self.num_requests = 1
         self.inferencer = self.load_inferencer()
 
         labels = task_environment.get_labels(include_empty=False)
@@ -201,6 +209,7 @@ class OpenVINOSegmentationTask(IDeploymentTask, IInferenceTask, IEvaluationTask,
             self.task_environment.label_schema,
             self.model.get_data("openvino.xml"),
             self.model.get_data("openvino.bin"),
+            num_requests=self.num_requests,
         )
 
     @check_input_parameters_type({"dataset": DatasetParamTypeCheck})
@@ -216,8 +225,13 @@ class OpenVINOSegmentationTask(IDeploymentTask, IInferenceTask, IEvaluationTask,
             dump_soft_prediction = True
 
         dataset_size = len(dataset)
-        for i, dataset_item in enumerate(dataset, 1):
-            predicted_scene, feature_vector, soft_prediction = self.inferencer.predict(dataset_item.numpy)
+        if inference_parameters is not None and inference_parameters.num_requests > self.num_requests:
+            self.num_requests = inference_parameters.num_requests
+            self.inferencer = self.load_inferencer()
+        predictions = predict_pipelined(
+            dataset, self.inferencer, inference_parameters, get_inputs=lambda dataset_item: dataset_item.numpy
+        )
+        for i, (dataset_item, (predicted_scene, feature_vector, soft_prediction)) in enumerate(predictions, 1):
             dataset_item.append_annotations(predicted_scene.annotations)
 
             if feature_vector is not None:
@@ -0,0 +1,330 @@
+"""This module implements a compact columnar storage of the annotations of a scene."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import datetime
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.id import ID
+from otx.api.entities.label import LabelEntity
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.ellipse import Ellipse
+from otx.api.entities.shapes.polygon import Point, Polygon
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.entities.shapes.shape import ShapeEntity, ShapeType
+
+
+class AnnotationStore:
+    """Annotations of a scene stored as NumPy arrays instead of Annotation objects.
+
+    The shapes are stored by their points: the two corners of the rectangles and of the bounding boxes of the
+    ellipses, and the vertices of the polygons. The labels of the annotations are stored as indices in a list of
+    label entities, along with their probabilities. The points and the labels of the i-th annotation are respectively
+    the rows ``point_offsets[i]:point_offsets[i + 1]`` and ``label_offsets[i]:label_offsets[i + 1]``.
+
+    The ids of the annotations, the modification dates of the shapes and the sources of the labels are not stored.
+
+    Args:
+        labels (Sequence[LabelEntity]): Label entities referred to by the label indices.
+        shape_types (np.ndarray): ShapeType of each annotation.
+        points (np.ndarray): (P, 2) array of the normalized x, y coordinates of the points.
+        point_offsets (np.ndarray): Offsets of the points of each annotation, with a final offset.
+        label_indices (np.ndarray): Index of each label of the annotations in ``labels``.
+        scores (np.ndarray): Probability of each label of the annotations.
+        label_offsets (np.ndarray): Offsets of the labels of each annotation, with a final offset.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        labels: Sequence[LabelEntity],
+        shape_types: np.ndarray,
+        points: np.ndarray,
+        point_offsets: np.ndarray,
+        label_indices: np.ndarray,
+        scores: np.ndarray,
+        label_offsets: np.ndarray,
+    ):
+        if len(point_offsets) != len(shape_types) + 1 or len(label_offsets) != len(shape_types) + 1:
+            raise ValueError("There must be one offset per annotation and a final offset")
+        self.labels = list(labels)
+        self.shape_types = np.asarray(shape_types, dtype=np.uint8)
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.point_offsets = np.asarray(point_offsets, dtype=np.int64)
+        self.label_indices = np.asarray(label_indices, dtype=np.int64)
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.label_offsets = np.asarray(label_offsets, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Returns the number of annotations."""
+        return len(self.shape_types)
+
+    def __repr__(self):
+        """String representation of the annotation store."""
+        return f"{self.__class__.__name__}(num_annotations={len(self)}, num_labels={len(self.label_indices)})"
+
+    @classmethod
+    def from_annotations(cls, annotations: Sequence[Annotation]) -> "AnnotationStore":
+        """Creates the store of a list of annotations.
+
+        Args:
+            annotations (Sequence[Annotation]): Annotations with Rectangle, Ellipse or Polygon shapes.
+
+        Returns:
+            AnnotationStore: Store of the annotations.
+        """
+        labels: List[LabelEntity] = []
+        label_positions: Dict[int, int] = {}
+        shape_types, points, label_indices, scores = [], [], [], []
+        point_counts, label_counts = [], []
+        for annotation in annotations:
+            shape = annotation.shape
+            shape_points = cls._get_shape_points(shape)
+            shape_types.append(shape.type)
+            points.extend(shape_points)
+            point_counts.append(len(shape_points))
+            scored_labels = annotation.get_labels(include_empty=True)
+            for scored_label in scored_labels:
+                label = scored_label.label
+                if id(label) not in label_positions:
+                    label_positions[id(label)] = len(labels)
+                    labels.append(label)
+                label_indices.append(label_positions[id(label)])
+                scores.append(scored_label.probability)
+            label_counts.append(len(scored_labels))
+        return cls(
+            labels,
+            np.array(shape_types, dtype=np.uint8),
+            np.array(points, dtype=np.float64).reshape(-1, 2),
+            np.concatenate([[0], np.cumsum(point_counts, dtype=np.int64)]),
+            np.array(label_indices, dtype=np.int64),
+            np.array(scores, dtype=np.float64),
+            np.concatenate([[0], np.cumsum(label_counts, dtype=np.int64)]),
+        )
+
+    @staticmethod
+    def _get_shape_points(shape: ShapeEntity) -> List[List[float]]:
+        if isinstance(shape, (Rectangle, Ellipse)):
+            return [[shape.x1, shape.y1], [shape.x2, shape.y2]]
+        if isinstance(shape, Polygon):
+            return [[point.x, point.y] for point in shape.points]
+        raise ValueError(f"Shape of type {type(shape).__name__} can not be stored")
+
+    def get_shape(self, index: int) -> ShapeEntity:
+        """Creates the shape of an annotation.
+
+        Args:
+            index (int): Index of the annotation.
+
+        Returns:
+            ShapeEntity: Rectangle, Ellipse or Polygon shape.
+        """
+        points = self.points[self.point_offsets[index] : self.point_offsets[index + 1]]
+        shape_type = self.shape_types[index]
+        if shape_type == ShapeType.POLYGON:
+            return Polygon(points=[Point(x=float(x), y=float(y)) for x, y in points])
+        (x1, y1), (x2, y2) = points.tolist()
+        if shape_type == ShapeType.ELLIPSE:
+            return Ellipse(x1=x1, y1=y1, x2=x2, y2=y2)
+        return Rectangle(x1=x1, y1=y1, x2=x2, y2=y2)
+
+    def get_polygon(self, index: int) -> np.ndarray:
+        """Returns the vertices of the shape of an annotation converted to a polygon.
+
+        The conversion is the same as ShapeFactory.shape_as_polygon: the rectangles are closed polygons of 5 points,
+        and the ellipses are sampled.
+
+        Args:
+            index (int): Index of the annotation.
+
+        Returns:
+            np.ndarray: (K, 2) array of the normalized x, y coordinates of the vertices.
+        """
+        points = self.points[self.point_offsets[index] : self.point_offsets[index + 1]]
+        shape_type = self.shape_types[index]
+        if shape_type == ShapeType.POLYGON:
+            return points
+        (x1, y1), (x2, y2) = points
+        if shape_type == ShapeType.ELLIPSE:
+            return np.array(Ellipse(x1=x1, y1=y1, x2=x2, y2=y2).get_evenly_distributed_ellipse_coordinates())
+        return np.array([[x1, y1], [x2, y1], [x2, y2], [x1, y2], [x1, y1]])
+
+    def to_annotations(self) -> List[Annotation]:
+        """Creates the Annotation objects of the store."""
+        annotations = []
+        for index in range(len(self)):
+            first, last = self.label_offsets[index], self.label_offsets[index + 1]
+            scored_labels = [
+                ScoredLabel(label=self.labels[label_index], probability=float(score))
+                for label_index, score in zip(self.label_indices[first:last], self.scores[first:last])
+            ]
+            annotations.append(Annotation(shape=self.get_shape(index), labels=scored_labels))
+        return annotations
+
+    @property
+    def boxes(self) -> np.ndarray:
+        """Returns the (N, 4) array of the normalized x1, y1, x2, y2 bounding boxes of the shapes."""
+        if len(self) == 0:
+            return np.zeros((0, 4), dtype=np.float64)
+        starts = self.point_offsets[:-1]
+        return np.stack(
+            [
+                np.minimum.reduceat(self.points[:, 0], starts),
+                np.minimum.reduceat(self.points[:, 1], starts),
+                np.maximum.reduceat(self.points[:, 0], starts),
+                np.maximum.reduceat(self.points[:, 1], starts),
+            ],
+            axis=1,
+        )
+
+    def has_full_box(self) -> bool:
+        """Returns True if an annotation is a rectangle covering the full media, see Rectangle.is_full_box."""
+        starts = self.point_offsets[:-1][self.shape_types == ShapeType.RECTANGLE]
+        return bool(np.any(np.all(self.points[starts] == 0, axis=1) & np.all(self.points[starts + 1] == 1, axis=1)))
+
+    @property
+    def label_annotation_indices(self) -> np.ndarray:
+        """Returns the index of the annotation of each label."""
+        return np.repeat(np.arange(len(self)), np.diff(self.label_offsets))
+
+    def select(self, annotation_mask: np.ndarray, label_mask: Optional[np.ndarray] = None) -> "AnnotationStore":
+        """Creates the store of a subset of the annotations and of their labels.
+
+        Args:
+            annotation_mask (np.ndarray): Boolean mask of the annotations to keep.
+            label_mask (Optional[np.ndarray]): Boolean mask of the labels to keep, all of them if None.
+
+        Returns:
+            AnnotationStore: Store of the selected annotations.
+        """
+        annotation_mask = np.asarray(annotation_mask, dtype=bool)
+        point_counts = np.diff(self.point_offsets)
+        keep_labels = np.repeat(annotation_mask, np.diff(self.label_offsets))
+        if label_mask is not None:
+            keep_labels &= label_mask
+        label_counts = np.bincount(self.label_annotation_indices[keep_labels], minlength=len(self))
+        return AnnotationStore(
+            self.labels,
+            self.shape_types[annotation_mask],
+            self.points[np.repeat(annotation_mask, point_counts)],
+            np.concatenate([[0], np.cumsum(point_counts[annotation_mask])]),
+            self.label_indices[keep_labels],
+            self.scores[keep_labels],
+            np.concatenate([[0], np.cumsum(label_counts[annotation_mask])]),
+        )
+
+
+class ColumnarAnnotationSceneEntity(AnnotationSceneEntity):
+    """Annotation scene keeping its annotations in an AnnotationStore.
+
+    It saves the memory and the time spent in creating and walking Python objects for the scenes with many
+    annotations. The scene behaves as a regular AnnotationSceneEntity: the Annotation objects are created on the first
+    access to ``annotations``, and kept from then on, so that they can be modified. The consumers of many scenes, such
+    as the data pipelines, should rather read the arrays of ``store`` (or of DatasetItemEntity.get_annotation_store)
+    while it is available.
+
+    Args:
+        store (AnnotationStore): Annotations of the scene.
+        kind (AnnotationSceneKind): Kind of the annotation scene. E.g. `AnnotationSceneKind.ANNOTATION`.
+        editor (str): The user that made this annotation scene object.
+        creation_date (Optional[datetime.datetime]): Creation date of annotation scene entity. If None, current time is
+            used. Defaults to None.
+        id (Optional[ID]): ID of AnnotationSceneEntity. If None a new `ID` is created. Defaults to None.
+    """
+
+    # pylint: disable=too-many-arguments, redefined-builtin
+    def __init__(
+        self,
+        store: AnnotationStore,
+        kind: AnnotationSceneKind,
+        editor: str = "",
+        creation_date: Optional[datetime.datetime] = None,
+        id: Optional[ID] = None,
+    ):
+        super().__init__([], kind, editor=editor, creation_date=creation_date, id=id)
+        self.__store: Optional[AnnotationStore] = store
+
+    @classmethod
+    def from_annotations(
+        cls, annotations: Sequence[Annotation], kind: AnnotationSceneKind, **kwargs
+    ) -> "ColumnarAnnotationSceneEntity":
+        """Creates a columnar scene from a list of annotations.
+
+        Args:
+            annotations (Sequence[Annotation]): Annotations of the scene.
+            kind (AnnotationSceneKind): Kind of the annotation scene.
+            kwargs: Other arguments of the scene.
+
+        Returns:
+            ColumnarAnnotationSceneEntity: Annotation scene.
+        """
+        return cls(AnnotationStore.from_annotations(annotations), kind, **kwargs)
+
+    def __repr__(self):
+        """String representation of the annotation scene, which does not create the annotations."""
+        if self.__store is None:
+            return super().__repr__()
+        return (
+            f"{self.__class__.__name__}("
+            f"store={self.__store}, "
+            f"kind={self.kind}, "
+            f"editor={self.editor_name}, "
+            f"creation_date={self.creation_date}, "
+            f"id={self.id_})"
+        )
+
+    @property
+    def store(self) -> Optional[AnnotationStore]:
+        """Returns the store of the annotations, None once the Annotation objects have been created."""
+        return self.__store
+
+    @property
+    def annotations(self) -> List[Annotation]:
+        """Return the Annotations of the scene, created from the store on the first access."""
+        if self.__store is not None:
+            AnnotationSceneEntity.annotations.fset(self, self.__store.to_annotations())
+            self.__store = None
+        return AnnotationSceneEntity.annotations.fget(self)
+
+    @annotations.setter
+    def annotations(self, value: List[Annotation]):
+        self.__store = None
+        AnnotationSceneEntity.annotations.fset(self, value)
+
+    def get_labels(self, include_empty: bool = False) -> List[LabelEntity]:
+        """Returns a list of unique labels which appear in this annotation scene.
+
+        Args:
+            include_empty (bool): Set to True to include empty label (if exists) in the output. Defaults to False.
+
+        Returns:
+            List[LabelEntity]: a list of labels which appear in this annotation.
+        """
+        if self.__store is None:
+            return super().get_labels(include_empty)
+        labels: Dict[ID, LabelEntity] = {}
+        for label_index in np.unique(self.__store.label_indices):
+            label = self.__store.labels[label_index]
+            if (include_empty or not label.is_empty) and label.id_ not in labels:
+                labels[label.id_] = label
+        return list(labels.values())
+
+    def get_label_ids(self, include_empty: bool = False) -> Set[ID]:
+        """Returns a set of the ID's of unique labels which appear in this annotation scene.
+
+        Args:
+            include_empty (bool): Set to True to include empty label (if exists) in the output. Defaults to False.
+
+        Returns:
+            Set[ID]: a set of the ID's of labels which appear in this annotation.
+        """
+        return {label.id_ for label in self.get_labels(include_empty)}
@@ -15,6 +15,10 @@ from typing import List, Optional, Sequence, Set, Tuple, Union
 import numpy as np
 
 from otx.api.entities.annotation import Annotation, AnnotationSceneEntity
+from otx.api.entities.annotation_store import (
+    AnnotationStore,
+    ColumnarAnnotationSceneEntity,
+)
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.media import IMedia2DEntity
 from otx.api.entities.metadata import IMetadata, MetadataItemEntity
@@ -104,7 +108,7 @@ class DatasetItemEntity(metaclass=abc.ABCMeta):
         self.__roi_lock = Lock()
 
         # set ROI
-        if roi is None:
+        if roi is None and not self._has_no_full_box(annotation_scene):
             for annotation in annotation_scene.annotations:
                 # if there is a full box in annotation.shapes, set it as ROI
                 if Rectangle.is_full_box(annotation.shape):
@@ -118,6 +122,13 @@ class DatasetItemEntity(metaclass=abc.ABCMeta):
 
         self.__ignored_labels: Set[LabelEntity] = set() if ignored_labels is None else set(ignored_labels)
 
+    @staticmethod
+    def _has_no_full_box(annotation_scene: AnnotationSceneEntity) -> bool:
+        """Returns True if a columnar annotation scene has no full box, which can be checked on its arrays."""
+        if isinstance(annotation_scene, ColumnarAnnotationSceneEntity) and annotation_scene.store is not None:
+            return not annotation_scene.store.has_full_box()
+        return False
+
     def set_metadata(self, metadata: List[MetadataItemEntity]):
         """Sets the metadata."""
         self.__metadata = metadata
@@ -260,17 +271,22 @@ class DatasetItemEntity(metaclass=abc.ABCMeta):
             List[Annotation]: The intersection of the input label set and those present within the ROI
         """
         is_full_box = Rectangle.is_full_box(self.roi.shape)
+        store = self._get_scene_store()
         annotations = []
         if is_full_box and labels is None and include_empty and include_ignored:
             # Fast path for the case where we do not need to change the shapes
             annotations = self.annotation_scene.annotations
+        elif is_full_box and store is not None:
+            # Only create the objects of the selected annotations of a columnar scene
+            annotations = self._filter_store(store, labels, include_empty, include_ignored).to_annotations()
         else:
             # Todo: improve speed. This is O(n) for n shapes.
             roi_as_box = ShapeFactory.shape_as_rectangle(self.roi.shape)
 
             labels_set = {label.name for label in labels} if labels is not None else set()
 
-            for annotation in self.annotation_scene.annotations:
+            scene_annotations = self.annotation_scene.annotations if store is None else store.to_annotations()
+            for annotation in scene_annotations:
                 if not is_full_box and not self.roi.shape.contains_center(annotation.shape):
                     continue
 
@@ -299,6 +315,63 @@ class DatasetItemEntity(metaclass=abc.ABCMeta):
                 annotations.append(Annotation(shape=shape, labels=shape_labels))
         return annotations
 
+    def get_annotation_store(
+        self,
+        labels: Optional[List[LabelEntity]] = None,
+        include_empty: bool = False,
+        include_ignored: bool = False,
+    ) -> AnnotationStore:
+        """Returns the annotations that exist in the dataset item (wrt. ROI) as arrays.
+
+        This is the fast path of get_annotations() for the consumers which only need the coordinates and the labels,
+        such as the data pipelines: the arrays of a ColumnarAnnotationSceneEntity are filtered without creating any
+        Annotation object.
+
+        Args:
+            labels (Optional[LabelEntity]): Subset of input labels to filter with; if ``None``, all the shapes within
+                the ROI are returned.
+            include_empty (bool): if True, returns both empty and non-empty labels
+            include_ignored (bool): if True, includes the labels in ignored_labels
+
+        Returns:
+            AnnotationStore: The annotations with the intersection of the input label set and those present within
+                the ROI
+        """
+        store = self._get_scene_store()
+        if store is not None and Rectangle.is_full_box(self.roi.shape):
+            return self._filter_store(store, labels, include_empty, include_ignored)
+        return AnnotationStore.from_annotations(self.get_annotations(labels, include_empty, include_ignored))
+
+    def _get_scene_store(self) -> Optional[AnnotationStore]:
+        """Returns the store of a columnar annotation scene, None for the other scenes."""
+        if isinstance(self.annotation_scene, ColumnarAnnotationSceneEntity):
+            return self.annotation_scene.store
+        return None
+
+    def _filter_store(
+        self,
+        store: AnnotationStore,
+        labels: Optional[List[LabelEntity]],
+        include_empty: bool,
+        include_ignored: bool,
+    ) -> AnnotationStore:
+        """Select the labels of a store like get_annotations(), and the annotations which still have labels."""
+        labels_set = {label.name for label in labels} if labels is not None else set()
+        known_labels = np.array(
+            [
+                (include_empty or not label.is_empty)
+                and (include_ignored or label not in self.ignored_labels)
+                and (labels is None or label.name in labels_set)
+                for label in store.labels
+            ],
+            dtype=bool,
+        )
+        label_mask = known_labels[store.label_indices]
+        annotation_mask = np.ones(len(store), dtype=bool)
+        if not include_ignored or labels is not None:
+            annotation_mask = np.bincount(store.label_annotation_indices[label_mask], minlength=len(store)) > 0
+        return store.select(annotation_mask, label_mask)
+
     def append_annotations(self, annotations: Sequence[Annotation]):
         """Adds a list of shapes to the annotation."""
         roi_as_box = ShapeFactory.shape_as_rectangle(self.roi.shape)
@@ -372,9 +445,19 @@ class DatasetItemEntity(metaclass=abc.ABCMeta):
         Returns:
             List[LabelEntity]: a list of labels from the shapes within the roi of this dataset item
         """
-        annotations = self.get_annotations(labels=labels, include_empty=include_empty, include_ignored=include_ignored)
-        scored_label_set = set(itertools.chain(*[annotation.get_labels(include_empty) for annotation in annotations]))
-        label_set = {scored_label.get_label() for scored_label in scored_label_set}
+        if self._get_scene_store() is not None:
+            store = self.get_annotation_store(
+                labels=labels, include_empty=include_empty, include_ignored=include_ignored
+            )
+            label_set = {store.labels[label_index] for label_index in np.unique(store.label_indices)}
+        else:
+            annotations = self.get_annotations(
+                labels=labels, include_empty=include_empty, include_ignored=include_ignored
+            )
+            scored_label_set = set(
+                itertools.chain(*[annotation.get_labels(include_empty) for annotation in annotations])
+            )
+            label_set = {scored_label.get_label() for scored_label in scored_label_set}
         if not include_ignored:
             label_set -= self.ignored_labels
         if labels is None:
@@ -447,6 +530,17 @@ class DatasetItemEntity(metaclass=abc.ABCMeta):
                 setattr(clone, name, copy.deepcopy(value, memo))
         return clone
 
+    def __getstate__(self):
+        """Drops the lock from the pickled state, as it can not be pickled."""
+        state = self.__dict__.copy()
+        state.pop("_DatasetItemEntity__roi_lock", None)
+        return state
+
+    def __setstate__(self, state):
+        """Restores the pickled state with a new lock."""
+        self.__dict__.update(state)
+        self.__roi_lock = Lock()
+
     def append_metadata_item(self, data: IMetadata, model: Optional[ModelEntity] = None):
         """Appends metadata produced by some model to the dataset item.
 
@@ -99,7 +99,7 @@ class Graph(IGraph):
     @property
     def num_labels(self):
         """Returns the number of labels in the graph."""
-        return nx.convert_matrix.to_numpy_matrix(self._graph).shape[0]
+        return self.num_nodes()
 
     def remove_edges(self, node1, node2):
         """Removes edges between both the nodes."""
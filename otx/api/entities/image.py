@@ -14,6 +14,46 @@ import numpy as np
 from otx.api.entities.annotation import Annotation
 from otx.api.entities.media import IMedia2DEntity
 from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.utils.image_cache import SharedImageCache
+
+# Cache of the images decoded by Image.numpy, disabled by default
+_decoded_image_cache: Optional[SharedImageCache] = None
+
+
+def set_decoded_image_cache(cache: Optional[SharedImageCache]):
+    """Sets the cache used by Image.numpy for the images loaded from files.
+
+    The cache should be set before the DataLoader workers are started, so that they share it.
+
+    Args:
+        cache (Optional[SharedImageCache]): Cache of decoded images, or None to disable the caching.
+    """
+    global _decoded_image_cache  # pylint: disable=global-statement
+    _decoded_image_cache = cache
+
+
+def get_decoded_image_cache() -> Optional[SharedImageCache]:
+    """Returns the cache used by Image.numpy, None if the caching is disabled."""
+    return _decoded_image_cache
+
+
+def get_image_size(file_path: str) -> Tuple[int, int]:
+    """Returns the size of an image file, reading only its header when possible.
+
+    Args:
+        file_path (str): Path to image file.
+
+    Returns:
+        Tuple[int, int]: Image size as a (height, width) tuple.
+    """
+    try:
+        width, height = imagesize.get(file_path)
+        if width <= 0 or height <= 0:
+            raise ValueError("Invalide image size")
+    except ValueError:
+        image = cv2.imread(file_path)
+        height, width = image.shape[:2]
+    return height, width
 
 
 class Image(IMedia2DEntity):
@@ -25,6 +65,8 @@ class Image(IMedia2DEntity):
     Args:
         data (Optional[np.ndarray]): NumPy data.
         file_path (Optional[str]): Path to image file.
+        size (Optional[Tuple[int, int]]): Already known (height, width) of the image file. If given, the file header
+            is not read again when the image size is queried. Defaults to None.
     """
 
     # pylint: disable=too-many-arguments, redefined-builtin
@@ -32,6 +74,7 @@ class Image(IMedia2DEntity):
         self,
         data: Optional[np.ndarray] = None,
         file_path: Optional[str] = None,
+        size: Optional[Tuple[int, int]] = None,
     ):
         if (data is None) == (file_path is None):
             raise ValueError("Either path to image file or image data should be provided.")
@@ -39,6 +82,8 @@ class Image(IMedia2DEntity):
         self.__file_path: Optional[str] = file_path
         self.__height: Optional[int] = None
         self.__width: Optional[int] = None
+        if size is not None and data is None:
+            self.__height, self.__width = size
 
     def __str__(self):
         """String representation of the image. Returns the image format, name and dimensions."""
@@ -56,26 +101,30 @@ class Image(IMedia2DEntity):
         """
         if self.__data is not None:
             return self.__data.shape[0], self.__data.shape[1]
-        try:
-            width, height = imagesize.get(self.__file_path)
-            if width <= 0 or height <= 0:
-                raise ValueError("Invalide image size")
-        except ValueError:
-            image = cv2.imread(self.__file_path)
-            height, width = image.shape[:2]
-        return height, width
+        assert self.__file_path is not None, "The image has neither data nor file"
+        return get_image_size(self.__file_path)
 
     @property
     def numpy(self) -> np.ndarray:
         """Numpy representation of the image.
 
         For color images the dimensions are (height, width, color) with RGB color channel order.
+        Images loaded from files are decoded on every access, unless a decoded image cache is set with
+        set_decoded_image_cache().
 
         Returns:
             np.ndarray: NumPy representation of the image.
         """
         if self.__data is None:
-            return cv2.cvtColor(cv2.imread(self.__file_path), cv2.COLOR_BGR2RGB)
+            file_path = self.__file_path
+            assert file_path is not None, "The image has neither data nor file"
+            if _decoded_image_cache is None:
+                return cv2.cvtColor(cv2.imread(file_path), cv2.COLOR_BGR2RGB)
+            data = _decoded_image_cache.get(file_path)
+            if data is None:
+                data = cv2.cvtColor(cv2.imread(file_path), cv2.COLOR_BGR2RGB)
+                _decoded_image_cache.put(file_path, data)
+            return data
         return self.__data
 
     @numpy.setter
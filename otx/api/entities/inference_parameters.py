@@ -28,8 +28,21 @@ class InferenceParameters:
             about the progress of a task.
         explainer: Explain algorithm to be used in explanation mode.
             Will be converted automatically to lowercase.
+        num_requests: Number of items inferred concurrently by the OpenVINO
+            tasks, on as many asynchronous infer requests.
+        num_workers: Number of threads decoding and pre-processing the items
+            ahead of the inference, and post-processing the predictions, in
+            the OpenVINO tasks. With the default values, the items are
+            predicted one after another.
     """
 
     is_evaluation: bool = False
     update_progress: Callable[[int, Optional[float]], Any] = default_progress_callback
     explainer: str = ""
+    num_requests: int = 1
+    num_workers: int = 0
+
+    @property
+    def is_pipelined(self) -> bool:
+        """Whether the OpenVINO tasks should pipeline the inference of the items."""
+        return self.num_requests > 1 or self.num_workers > 0
@@ -8,7 +8,7 @@ import copy
 import logging
 import re
 from enum import Enum
-from typing import Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from bson import ObjectId
@@ -182,6 +182,7 @@ class LabelTree(MultiDiGraph):
         super().__init__()
 
         self.__topological_order_cache: Optional[List[LabelEntity]] = None
+        self.__version = 0
 
     def add_edge(self, node1, node2, edge_value=None):
         """Add edge between two nodes in the tree.
@@ -209,6 +210,16 @@ class LabelTree(MultiDiGraph):
         super().remove_node(node)
         self.clear_topological_cache()
 
+    def remove_edges(self, node1, node2):
+        """Removes edges between both the nodes."""
+        super().remove_edges(node1, node2)
+        self.clear_topological_cache()
+
+    def set_graph(self, graph):
+        """Set the underlying graph of the tree."""
+        super().set_graph(graph)
+        self.clear_topological_cache()
+
     @property
     def num_labels(self):
         """Return the number of labels in the tree."""
@@ -223,6 +234,12 @@ class LabelTree(MultiDiGraph):
             methods provided by this class.
         """
         self.__topological_order_cache = None
+        self.__version += 1
+
+    @property
+    def version(self) -> int:
+        """Number of changes of the topology, used to detect stale caches of the tree."""
+        return self.__version
 
     def get_labels_in_topological_order(self) -> List[LabelEntity]:
         """Return a list of the labels in this graph sorted in topological order.
@@ -299,6 +316,250 @@ class LabelTree(MultiDiGraph):
         return False
 
 
+class LabelSchemaIndex:
+    """Immutable index of a label schema, answering the queries on its labels without walking graphs.
+
+    The labels are mapped to integers, the ancestors and the labels exclusive to each label are stored as rows of
+    boolean matrices, and the probabilistic resolution of the labels is vectorized over a batch of predictions. The
+    index is built by LabelSchemaEntity.compile, and is not updated when the schema changes.
+
+    Args:
+        label_schema (LabelSchemaEntity): Label schema to index.
+    """
+
+    # pylint: disable=too-many-instance-attributes, too-many-locals
+    def __init__(self, label_schema: "LabelSchemaEntity"):
+        label_tree = label_schema.label_tree
+        group_labels = label_schema.get_labels(include_empty=True)
+        tree_labels = label_tree.get_labels_in_topological_order()
+        group_label_set = set(group_labels)
+        labels = group_labels + [label for label in tree_labels if label not in group_label_set]
+        self.labels: Tuple[LabelEntity, ...] = tuple(labels)
+        self.label_to_index: Dict[LabelEntity, int] = {label: i for i, label in enumerate(labels)}
+        num_labels = len(labels)
+        tree_indices = [self.label_to_index[label] for label in tree_labels]
+
+        # Hierarchy
+        parents = np.full(num_labels, -1)
+        for index in tree_indices:
+            parent = label_tree.get_parent(labels[index])
+            if parent is not None:
+                parents[index] = self.label_to_index[parent]
+        ancestor_chains: List[Tuple[int, ...]] = []
+        for index in range(num_labels):
+            ancestor_chain = [index]
+            while parents[ancestor_chain[-1]] >= 0:
+                ancestor_chain.append(int(parents[ancestor_chain[-1]]))
+            ancestor_chains.append(tuple(ancestor_chain))
+        descendants: List[Tuple[int, ...]] = [()] * num_labels
+        for index in tree_indices:
+            descendants[index] = tuple(
+                self.label_to_index[label] for label in label_tree.get_descendants(labels[index])
+            )
+        self._ancestor_chains: Tuple[Tuple[int, ...], ...] = tuple(ancestor_chains)
+        self._descendants: Tuple[Tuple[int, ...], ...] = tuple(descendants)
+        # ancestors[i, j] is True if j is i or one of the ancestors of i
+        ancestors = np.zeros((num_labels, num_labels), dtype=bool)
+        for index, chain in enumerate(ancestor_chains):
+            ancestors[index, list(chain)] = True
+        strict_ancestors = ancestors & ~np.eye(num_labels, dtype=bool)
+        self._depths = ancestors.sum(axis=1) - 1
+        # Labels of each depth with their parents, from the deepest ones, to propagate values up the tree
+        self._levels = tuple(
+            (np.flatnonzero(self._depths == depth), parents[self._depths == depth])
+            for depth in range(self._depths.max(initial=0), 0, -1)
+        )
+
+        # Exclusivity
+        siblings_in_group = np.zeros((num_labels, num_labels), dtype=bool)
+        for group in reversed(label_schema.get_groups(include_empty=True)):
+            # The siblings of a label in many groups are the labels of its first group
+            group_indices = [self.label_to_index[label] for label in group.labels]
+            siblings_in_group[group_indices] = False
+            siblings_in_group[np.ix_(group_indices, group_indices)] = True
+        np.fill_diagonal(siblings_in_group, False)
+        children = np.zeros((num_labels, num_labels), dtype=bool)
+        children[parents[parents >= 0], np.flatnonzero(parents >= 0)] = True
+        in_group = np.arange(num_labels) < len(group_labels)
+        is_empty = np.array([label.is_empty for label in labels], dtype=bool)
+        # A label is exclusive to the labels of the groups of itself and its ancestors, to their children, and to the
+        # empty labels which are not its descendants. An empty label is exclusive to all but its ancestors.
+        exclusive_in_group = siblings_in_group | (siblings_in_group.astype(int) @ children.astype(int) > 0)
+        exclusive = (ancestors.astype(int) @ exclusive_in_group.astype(int) > 0) | (
+            in_group & is_empty & ~strict_ancestors.T
+        )
+        exclusive[is_empty] = in_group & ~ancestors[is_empty]
+
+        # Labels resolved together: the children of each label, and the top level labels of the tree
+        self._sibling_groups = tuple(
+            np.array([self.label_to_index[child] for child in label_tree.get_children(labels[index])])
+            for index in tree_indices
+            if label_tree.get_children(labels[index])
+        )
+        self._roots = np.array([index for index in tree_indices if parents[index] < 0], dtype=int)
+        self._not_in_tree = np.setdiff1d(np.arange(num_labels), tree_indices)
+
+        for array in (parents, ancestors, strict_ancestors, exclusive):
+            array.flags.writeable = False
+        self.parents = parents
+        self.ancestors = ancestors
+        self.exclusive = exclusive
+        self._strict_ancestors = strict_ancestors
+
+    def __len__(self) -> int:
+        """Returns the number of indexed labels."""
+        return len(self.labels)
+
+    def __contains__(self, label: object) -> bool:
+        """Returns True if the label is indexed."""
+        return label in self.label_to_index
+
+    def get_ancestors(self, label: LabelEntity) -> List[LabelEntity]:
+        """Returns ancestors of `label`, including self."""
+        return [self.labels[index] for index in self._ancestor_chains[self.label_to_index[label]]]
+
+    def get_descendants(self, label: LabelEntity) -> List[LabelEntity]:
+        """Returns descendants (children and children of children, etc.) of `label`."""
+        return [self.labels[index] for index in self._descendants[self.label_to_index[label]]]
+
+    def get_labels_exclusive_to(self, label: LabelEntity) -> List[LabelEntity]:
+        """Returns a list of labels that are exclusive to `label`."""
+        return [self.labels[index] for index in np.flatnonzero(self.exclusive[self.label_to_index[label]])]
+
+    def are_exclusive(self, label1: LabelEntity, label2: LabelEntity) -> bool:
+        """Returns whether `label1` and `label2` are mutually exclusive."""
+        return bool(self.exclusive[self.label_to_index[label1], self.label_to_index[label2]])
+
+    def resolve_labels_probabilistic(
+        self,
+        probabilities: np.ndarray,
+        labels: Sequence[LabelEntity],
+        selected_labels: Optional[Sequence[LabelEntity]] = None,
+    ) -> List[List[ScoredLabel]]:
+        """Resolves hierarchical labels and exclusivity for a batch of probabilistic predictions.
+
+        This is the batched version of LabelSchemaEntity.resolve_labels_probabilistic. Each row of `probabilities`
+        holds the probabilities of `labels` predicted for an item, NaN marking the labels which are not predicted.
+        The labels are considered in the order of `labels`, which breaks the ties in their groups.
+
+        Args:
+            probabilities (np.ndarray): Probabilities of shape (number of items, number of labels).
+            labels (Sequence[LabelEntity]): Distinct indexed labels of the columns of `probabilities`.
+            selected_labels (Optional[Sequence[LabelEntity]]): if not None, will only consider labels within
+                `selected_labels` for resolving. The missing ancestors of the predicted labels which are outside
+                `selected_labels` get a probability of 1.0.
+
+        Returns:
+            List[List[ScoredLabel]]: Resolved labels of each item.
+        """
+        num_labels = len(self.labels)
+        probabilities = np.atleast_2d(np.asarray(probabilities, dtype=float))
+        rows = np.arange(len(probabilities))
+        columns = np.array([self.label_to_index[label] for label in labels], dtype=int)
+        probs = np.full((len(rows), num_labels), np.nan)
+        probs[:, columns] = probabilities
+        predicted = ~np.isnan(probs)
+        ranks = np.full(num_labels, np.inf)
+        ranks[columns] = np.arange(len(columns))
+
+        # Add the missing ancestors of the predicted labels. They come after the predicted labels, in the order of
+        # their first predicted descendant, then from the closest to the farthest one.
+        max_depth = self._depths.max(initial=0) + 1
+        first_descendants = np.where(predicted, ranks * max_depth + self._depths, np.inf).T.copy()
+        for children, parents in self._levels:
+            np.minimum.at(first_descendants, parents, first_descendants[children])
+        first_descendants = first_descendants.T
+        with_ancestors = first_descendants < np.inf
+        orders = np.where(predicted, ranks, len(columns) * max_depth + first_descendants - self._depths)
+        missing_probabilities = 0.0
+        if selected_labels is not None:
+            selected_label_set = set(selected_labels)
+            missing_probabilities = np.array([label not in selected_label_set for label in self.labels], dtype=float)
+        probs = np.where(predicted | ~with_ancestors, probs, missing_probabilities)
+        values = np.where(with_ancestors, probs, 0.0)
+
+        # Hard classification of the labels, NaN for the unresolved ones, and the order of the resolved labels by the
+        # first considered label of their group and their position in the group
+        hard = np.full_like(probs, np.nan)
+        output_orders = np.full_like(probs, np.inf)
+        output_positions = np.zeros(probs.shape, dtype=int)
+
+        def first_in_group(group: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            """Returns the position in `group` of its first considered label, or -1 if none, and its order."""
+            group_orders = np.where(with_ancestors[:, group], orders[:, group], np.inf)
+            first = np.argmin(group_orders, axis=1)
+            first_orders = group_orders[rows, first]
+            return np.where(first_orders < np.inf, first, -1), first_orders
+
+        def resolve_group(group: np.ndarray, first: np.ndarray, first_orders: np.ndarray, contenders=None):
+            """Selects the most likely label of `group` in the rows where the position `first` is not -1.
+
+            The label at the position `first` is considered first and wins the ties, unless `first` is the size of
+            the group, meaning that a contender label out of the group was considered first. The contender value of a
+            row, if not NaN, wins against all the labels of the group if it is not lower.
+            """
+            group_values = values[:, group]
+            max_values = group_values.max(axis=1)
+            first_max = np.argmax(group_values == max_values[:, None], axis=1)
+            positions = np.arange(len(group))
+            if len(group) == 1:
+                winners = np.where(group_values[:, 0] > 0.0, 0, -1)
+            else:
+                first_values = group_values[rows, np.minimum(first, len(group) - 1)]
+                winners = np.where(first_values == max_values, first, first_max)
+            if contenders is not None:
+                winners = np.where(np.isnan(contenders), winners, np.where(contenders >= max_values, -1, first_max))
+            resolved = (first >= 0)[:, None]
+            hard[:, group] = np.where(resolved, positions == winners[:, None], hard[:, group])
+            output_orders[:, group] = np.where(resolved, first_orders[:, None], output_orders[:, group])
+            # The first label comes first, then the other labels of the group in their order
+            group_positions = positions + (positions < first[:, None]) - (positions == first[:, None]) * positions
+            output_positions[:, group] = np.where(resolved, group_positions, output_positions[:, group])
+
+        for group in self._sibling_groups:
+            resolve_group(group, *first_in_group(group))
+
+        # A label out of the tree is exclusive to the top level labels of the tree, which keep the classification
+        # against the last label out of the tree
+        not_in_tree = self._not_in_tree
+        not_in_tree_predicted = predicted[:, not_in_tree]
+        if len(self._roots) == 0:
+            hard[:, not_in_tree] = np.where(not_in_tree_predicted, values[:, not_in_tree] > 0.0, np.nan)
+        else:
+            root_max_values = values[:, self._roots].max(axis=1)
+            hard[:, not_in_tree] = np.where(
+                not_in_tree_predicted, values[:, not_in_tree] >= root_max_values[:, None], np.nan
+            )
+            not_in_tree_orders = np.where(not_in_tree_predicted, orders[:, not_in_tree], np.nan)
+            contenders = np.full(len(rows), np.nan)
+            contender_first_orders = np.full(len(rows), np.inf)
+            if len(not_in_tree) > 0:
+                has_contender = not_in_tree_predicted.any(axis=1)
+                last = np.argmax(np.where(not_in_tree_predicted, orders[:, not_in_tree], -np.inf), axis=1)
+                contenders = np.where(has_contender, values[rows, not_in_tree[last]], np.nan)
+                contender_first_orders = np.fmin.reduce(not_in_tree_orders, axis=1, initial=np.inf)
+            first, first_orders = first_in_group(self._roots)
+            first = np.where(contender_first_orders < first_orders, len(self._roots), first)
+            resolve_group(self._roots, first, np.fmin(first_orders, contender_first_orders), contenders)
+        output_orders[:, not_in_tree] = orders[:, not_in_tree]
+        output_positions[:, not_in_tree] = 0
+
+        # Suppress the descendants of the labels which are not the most likely ones in their group
+        suppressed = (hard == 0.0).astype(float) @ self._strict_ancestors.T.astype(float) > 0
+        resolved_probabilities = np.where(suppressed, 0.0, hard) * np.where(with_ancestors, probs, 1.0)
+        resolved_labels = []
+        for row in rows:
+            indices = np.flatnonzero(np.where(suppressed[row], 0.0, hard[row]) > 0.0)
+            indices = indices[np.lexsort((output_positions[row, indices], output_orders[row, indices]))]
+            resolved_labels.append(
+                [
+                    ScoredLabel(self.labels[index], probability=float(resolved_probabilities[row, index]))
+                    for index in indices
+                ]
+            )
+        return resolved_labels
+
+
 class LabelSchemaEntity:
     """This class represents the relationships of labels.
 
@@ -327,6 +588,44 @@ class LabelSchemaEntity:
             label_groups = []
         self._groups = label_groups
 
+        self.__index: Optional[LabelSchemaIndex] = None
+        self.__index_signature: Optional[Tuple] = None
+        self.__index_of_labels_only = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Copy or pickle the label schema without its compiled index, which is built again on demand."""
+        state = self.__dict__.copy()
+        state["_LabelSchemaEntity__index"] = None
+        state["_LabelSchemaEntity__index_signature"] = None
+        state["_LabelSchemaEntity__index_of_labels_only"] = False
+        return state
+
+    def compile(self) -> LabelSchemaIndex:
+        """Returns the compiled index of the label schema.
+
+        The index is built on the first call, and built again if the label tree or the label groups have changed since.
+
+        Returns:
+            LabelSchemaIndex: index of the labels of the schema
+        """
+        signature = (
+            id(self.label_tree),
+            self.label_tree.version,
+            tuple((id(group), group.group_type, tuple(label.id_ for label in group.labels)) for group in self._groups),
+        )
+        if self.__index is None or signature != self.__index_signature:
+            self.__index = LabelSchemaIndex(self)
+            self.__index_signature = signature
+            self.__index_of_labels_only = all(isinstance(label, LabelEntity) for label in self.__index.labels)
+        return self.__index
+
+    def __get_index(self, *labels: LabelEntity) -> Optional[LabelSchemaIndex]:
+        """Returns the compiled index if it holds the labels, otherwise None to walk the label graphs instead."""
+        index = self.compile()
+        if self.__index_of_labels_only and all(label in index for label in labels):
+            return index
+        return None
+
     def get_labels(self, include_empty: bool) -> List[LabelEntity]:
         """Get the labels in the label schema.
 
@@ -446,6 +745,9 @@ class LabelSchemaEntity:
 
     def are_exclusive(self, label1: LabelEntity, label2: LabelEntity) -> bool:
         """Returns whether `label` and `label2` are mutually exclusive."""
+        index = self.__get_index(label1, label2)
+        if index is not None:
+            return index.are_exclusive(label1, label2)
         return label2 in self.get_labels_exclusive_to(label1)
 
     def get_children(self, parent: LabelEntity) -> List[LabelEntity]:
@@ -463,11 +765,17 @@ class LabelSchemaEntity:
     def get_descendants(self, parent: LabelEntity) -> List[LabelEntity]:
         """Returns descendants (children and children of children, etc.) of `parent`."""
         parent = self.__get_label(parent)
+        index = self.__get_index(parent)
+        if index is not None:
+            return index.get_descendants(parent)
         return self.label_tree.get_descendants(parent)
 
     def get_ancestors(self, label: LabelEntity) -> List[LabelEntity]:
         """Returns ancestors of `label`, including self."""
         label = self.__get_label(label)
+        index = self.__get_index(label)
+        if index is not None:
+            return index.get_ancestors(label)
         return self.label_tree.get_ancestors(label)
 
     def get_group_containing_label(self, label: LabelEntity) -> Optional[LabelGroup]:
@@ -487,6 +795,9 @@ class LabelSchemaEntity:
 
     def get_labels_exclusive_to(self, label: LabelEntity) -> List[LabelEntity]:
         """Returns a list of labels that are exclusive to the passed label."""
+        index = self.__get_index(label)
+        if index is not None:
+            return index.get_labels_exclusive_to(label)
         if label.is_empty:
             exclusive_labels = self.__get_exclusivity_for_empty_label(label=label)
         else:
@@ -623,7 +934,13 @@ class LabelSchemaEntity:
         """
         input_domains = set(lbl.domain for lbl in scored_labels)
         label_to_probability = {scored_label.get_label(): scored_label.probability for scored_label in scored_labels}
-        resolved_labels = self.__resolve_labels_probabilistic(label_to_probability, selected_labels)
+        index = self.__get_index(*label_to_probability)
+        if index is not None:
+            resolved_labels = index.resolve_labels_probabilistic(
+                np.array([list(label_to_probability.values())]), list(label_to_probability), selected_labels
+            )[0]
+        else:
+            resolved_labels = self.__resolve_labels_probabilistic(label_to_probability, selected_labels)
         output_domains = set(lbl.domain for lbl in resolved_labels)
         if input_domains != output_domains:
             logger.error(
@@ -34,21 +34,54 @@ def get_intersections_and_cardinalities(
     Returns:
         Tuple[NumberPerLabel, NumberPerLabel]: (all_intersections, all_cardinalities)
     """
-    all_intersections: NumberPerLabel = {label: 0 for label in labels}
-    all_intersections[None] = 0
-    all_cardinalities: NumberPerLabel = {label: 0 for label in labels}
-    all_cardinalities[None] = 0
+    intersections = np.zeros(len(labels) + 1, dtype=np.int64)
+    cardinalities = np.zeros(len(labels) + 1, dtype=np.int64)
     for reference, prediction in zip(references, predictions):
-        intersection = np.where(reference == prediction, reference, 0)
-        all_intersections[None] += np.count_nonzero(intersection)
-        all_cardinalities[None] += np.count_nonzero(reference) + np.count_nonzero(prediction)
-        for i, label in enumerate(labels):
-            label_num = i + 1
-            all_intersections[label] += np.count_nonzero(intersection == label_num)
-            reference_area = np.count_nonzero(reference == label_num)
-            prediction_area = np.count_nonzero(prediction == label_num)
-            all_cardinalities[label] += reference_area + prediction_area
-    return all_intersections, all_cardinalities
+        mask_intersections, mask_cardinalities = get_mask_intersections_and_cardinalities(
+            reference, prediction, len(labels)
+        )
+        intersections += mask_intersections
+        cardinalities += mask_cardinalities
+    return to_number_per_label(intersections, labels), to_number_per_label(cardinalities, labels)
+
+
+def get_mask_intersections_and_cardinalities(
+    reference: np.ndarray, prediction: np.ndarray, num_labels: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the intersections and cardinalities between a reference mask and a prediction mask.
+
+    Args:
+        reference (np.ndarray): reference mask, whose pixel values are the label indices with offset 1
+        prediction (np.ndarray): prediction mask, whose pixel values are the label indices with offset 1
+        num_labels (int): number of labels in the masks
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (intersections, cardinalities) arrays of num_labels + 1 pixel counts. The first
+            count is for all the labels, then the i-th count is for the label of index i - 1.
+    """
+    intersection = np.where(reference == prediction, reference, 0)
+    counts = []
+    for mask in (intersection, reference, prediction):
+        label_counts = np.bincount(mask.ravel(), minlength=num_labels + 1)
+        label_counts[0] = mask.size - label_counts[0]
+        counts.append(label_counts[: num_labels + 1])
+    intersections, reference_areas, prediction_areas = counts
+    return intersections, reference_areas + prediction_areas
+
+
+def to_number_per_label(numbers: np.ndarray, labels: List[LabelEntity]) -> NumberPerLabel:
+    """Converts the numbers of get_mask_intersections_and_cardinalities to a NumberPerLabel dictionary.
+
+    Args:
+        numbers (np.ndarray): number for all the labels, followed by the number of each label
+        labels (List[LabelEntity]): labels of the numbers
+
+    Returns:
+        NumberPerLabel: numbers per label, with the number for all the labels at the key ``None``
+    """
+    number_per_label: NumberPerLabel = {label: int(number) for label, number in zip(labels, numbers[1:])}
+    number_per_label[None] = int(numbers[0])
+    return number_per_label
 
 
 def intersection_box(box1: Rectangle, box2: Rectangle) -> Optional[List[float]]:
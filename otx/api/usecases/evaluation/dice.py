@@ -4,9 +4,12 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from typing import Dict, List, Optional, Tuple
+import numpy as np
 
+from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.metrics import (
     BarChartInfo,
@@ -20,6 +23,8 @@ from otx.api.entities.resultset import ResultSetEntity
 from otx.api.usecases.evaluation.averaging import MetricAverageMethod
 from otx.api.usecases.evaluation.basic_operations import (
     get_intersections_and_cardinalities,
+    get_mask_intersections_and_cardinalities,
+    to_number_per_label,
 )
 from otx.api.usecases.evaluation.performance_provider_interface import (
     IPerformanceProvider,
@@ -39,23 +44,31 @@ class DiceAverage(IPerformanceProvider):
     Dice is computed by computing the intersection and union computed over the whole dataset, instead of
     computing intersection and union for individual images and then averaging.
 
+    In streaming mode, the masks of each item are counted as soon as they are created, so that only the masks being
+    rasterized by the workers are held in memory, instead of all the masks of the dataset.
+
     Args:
         resultset (ResultSetEntity): ResultSet that score will be computed for
         average (MetricAverageMethod): One of
             - MICRO: every pixel has the same weight, regardless of label
             - MACRO: compute score per label, return the average of the per-label scores
+        streaming (bool): Whether to accumulate the intersections and cardinalities item by item. Defaults to True.
+        num_workers (Optional[int]): Number of threads rasterizing the masks in streaming mode. 0 rasterizes them in
+            the calling thread, None uses the default number of threads of ThreadPoolExecutor. Defaults to None.
     """
 
     def __init__(
         self,
         resultset: ResultSetEntity,
         average: MetricAverageMethod = MetricAverageMethod.MACRO,
+        streaming: bool = True,
+        num_workers: Optional[int] = None,
     ):
         self.average = average
         (
             self._overall_dice,
             self._dice_per_label,
-        ) = self.__compute_dice_averaged_over_pixels(resultset, average)
+        ) = self.__compute_dice_averaged_over_pixels(resultset, average, streaming, num_workers)
 
     @property
     def overall_dice(self) -> ScoreMetric:
@@ -88,13 +101,19 @@ class DiceAverage(IPerformanceProvider):
     @classmethod
     @timeit
     def __compute_dice_averaged_over_pixels(
-        cls, resultset: ResultSetEntity, average: MetricAverageMethod
+        cls,
+        resultset: ResultSetEntity,
+        average: MetricAverageMethod,
+        streaming: bool = True,
+        num_workers: Optional[int] = None,
     ) -> Tuple[ScoreMetric, Dict[LabelEntity, ScoreMetric]]:
         """Computes the diced averaged over pixels.
 
         Args:
             resultset (ResultSetEntity): Result set to use
             average (MetricAverageMethod): Averaging method to use
+            streaming (bool): Whether to accumulate the intersections and cardinalities item by item
+            num_workers (Optional[int]): Number of threads rasterizing the masks in streaming mode
 
         Returns:
             Tuple[ScoreMetric, Dict[LabelEntity, ScoreMetric]]: Tuple of the overall dice and the dice averaged over
@@ -112,6 +131,12 @@ class DiceAverage(IPerformanceProvider):
         resultset_labels = set(resultset.prediction_dataset.get_labels() + resultset.ground_truth_dataset.get_labels())
         model_labels = set(resultset.model.configuration.get_label_schema().get_labels(include_empty=False))
         labels = sorted(resultset_labels.intersection(model_labels))
+        if streaming:
+            all_intersection, all_cardinality = cls.__accumulate_intersections_and_cardinalities(
+                zip(resultset.prediction_dataset, resultset.ground_truth_dataset), labels, num_workers
+            )
+            return cls.compute_dice_using_intersection_and_cardinality(all_intersection, all_cardinality, average)
+
         hard_predictions = []
         hard_references = []
         for prediction_item, reference_item in zip(
@@ -126,6 +151,46 @@ class DiceAverage(IPerformanceProvider):
 
         return cls.compute_dice_using_intersection_and_cardinality(all_intersection, all_cardinality, average)
 
+    @staticmethod
+    def __accumulate_intersections_and_cardinalities(
+        item_pairs: Iterable[Tuple[DatasetItemEntity, DatasetItemEntity]],
+        labels: List[LabelEntity],
+        num_workers: Optional[int],
+    ) -> Tuple[Dict[Optional[LabelEntity], int], Dict[Optional[LabelEntity], int]]:
+        """Accumulates the intersections and cardinalities of the masks of the items, rasterized by a thread pool.
+
+        Args:
+            item_pairs (Iterable[Tuple[DatasetItemEntity, DatasetItemEntity]]): prediction and reference items
+            labels (List[LabelEntity]): labels of the masks
+            num_workers (Optional[int]): number of threads, 0 to rasterize the masks in the calling thread
+
+        Returns:
+            Tuple[Dict[Optional[LabelEntity], int], Dict[Optional[LabelEntity], int]]: intersections and
+                cardinalities per label, and for all the labels at the key None
+        """
+
+        def count_item_pixels(item_pair: Tuple[DatasetItemEntity, DatasetItemEntity]) -> Tuple[np.ndarray, np.ndarray]:
+            prediction_item, reference_item = item_pair
+            return get_mask_intersections_and_cardinalities(
+                mask_from_dataset_item(reference_item, labels),
+                mask_from_dataset_item(prediction_item, labels),
+                len(labels),
+            )
+
+        def accumulate(counts: Iterator[Tuple[np.ndarray, np.ndarray]]):
+            intersections = np.zeros(len(labels) + 1, dtype=np.int64)
+            cardinalities = np.zeros(len(labels) + 1, dtype=np.int64)
+            for item_intersections, item_cardinalities in counts:
+                intersections += item_intersections
+                cardinalities += item_cardinalities
+            return to_number_per_label(intersections, labels), to_number_per_label(cardinalities, labels)
+
+        if num_workers == 0:
+            return accumulate(map(count_item_pixels, item_pairs))
+        # The rasterization and the counting release the GIL, and threads do not need to copy the items
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return accumulate(executor.map(count_item_pixels, item_pairs))
+
     @classmethod
     def compute_dice_using_intersection_and_cardinality(
         cls,
@@ -6,7 +6,7 @@
 
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 
@@ -121,6 +121,42 @@ def get_iou_matrix(
     return matrix
 
 
+def get_batched_iou_matrix(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """Constructs an iou matrix of shape [num_boxes1, num_boxes2] in a single vectorized pass.
+
+    Each cell(x,y) holds exactly the value that bounding_box_intersection_over_union(box1(x), box2(y)) would return,
+    but the whole matrix is computed with NumPy broadcasting instead of a Python loop over every pair of boxes.
+
+    Args:
+        boxes1 (np.ndarray): Array of shape [N, 4] with (x1, y1, x2, y2) coordinates.
+        boxes2 (np.ndarray): Array of shape [M, 4] with (x1, y1, x2, y2) coordinates.
+
+    Raises:
+        ValueError: In case any IoU is outside of [0.0, 1.0]
+
+    Returns:
+        np.ndarray: IoU matrix of shape [N, M]
+    """
+    x_left = np.maximum(boxes1[:, None, 0], boxes2[None, :, 0])
+    y_top = np.maximum(boxes1[:, None, 1], boxes2[None, :, 1])
+    x_right = np.minimum(boxes1[:, None, 2], boxes2[None, :, 2])
+    y_bottom = np.minimum(boxes1[:, None, 3], boxes2[None, :, 3])
+
+    intersection_area = (x_right - x_left) * (y_bottom - y_top)
+    bb1_area = (boxes1[:, 2] - boxes1[:, 0]) * (boxes1[:, 3] - boxes1[:, 1])
+    bb2_area = (boxes2[:, 2] - boxes2[:, 0]) * (boxes2[:, 3] - boxes2[:, 1])
+    union_area = bb1_area[:, None] + bb2_area[None, :] - intersection_area
+
+    overlapping = (x_right > x_left) & (y_bottom > y_top) & (union_area != 0)
+    iou = np.zeros(intersection_area.shape, dtype=np.float64)
+    np.divide(intersection_area, union_area, out=iou, where=overlapping)
+
+    out_of_range = (iou < 0.0) | (iou > 1.0)
+    if np.any(out_of_range):
+        raise ValueError(f"intersection over union should be in range [0,1], actual={iou[out_of_range][0]}")
+    return iou
+
+
 def get_n_false_negatives(iou_matrix: np.ndarray, iou_threshold: float) -> int:
     """Get the number of false negatives inside the IoU matrix for a given threshold.
 
@@ -146,6 +182,68 @@ def get_n_false_negatives(iou_matrix: np.ndarray, iou_threshold: float) -> int:
     return n_false_negatives
 
 
+def get_matching_statistics(
+    iou_matrix: np.ndarray, activation: np.ndarray, iou_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Summarizes an IoU matrix so that get_n_false_negatives can be evaluated for many thresholds at once.
+
+    A predicted box takes part in the evaluation at threshold t if its activation is strictly greater than t (for
+    the confidence sweep the activation is simply the score). This function returns:
+
+    - for every ground truth box, the highest activation among the predicted boxes with iou >= iou_threshold
+      (-inf if there is none). The ground truth box is a false negative at threshold t iff this value is <= t.
+    - for every predicted box, the number of extra ground truth boxes it matches with iou > iou_threshold. These
+      are added to the false negatives for every threshold at which the predicted box is active.
+
+    Args:
+        iou_matrix (np.ndarray): IoU matrix of shape [ground_truth_boxes, predicted_boxes]
+        activation (np.ndarray): Activation value of each predicted box, shape [predicted_boxes]
+        iou_threshold (float): IoU threshold to use for the false negatives.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Coverage activation per ground truth box and extra matches per predicted box.
+    """
+    coverage = np.where(iou_matrix >= iou_threshold, activation[None, :], -np.inf)
+    ground_truth_activation = np.max(coverage, axis=1, initial=-np.inf)
+    extra_matches = np.maximum(np.count_nonzero(iou_matrix > iou_threshold, axis=0) - 1, 0)
+    return ground_truth_activation, extra_matches
+
+
+class _BoxArrays(NamedTuple):
+    """Column-wise NumPy representation of the boxes of a single image.
+
+    Args:
+        coordinates (np.ndarray): Array of shape [N, 4] with (x1, y1, x2, y2) coordinates.
+        class_names (np.ndarray): Object array of shape [N] with the class name of each box.
+        lower_class_names (np.ndarray): Object array of shape [N] with the lower-cased class name of each box.
+        scores (np.ndarray): Array of shape [N] with the score of each box.
+    """
+
+    coordinates: np.ndarray
+    class_names: np.ndarray
+    lower_class_names: np.ndarray
+    scores: np.ndarray
+
+    @classmethod
+    def from_boxes(cls, boxes: List[Tuple[float, float, float, float, str, float]]) -> "_BoxArrays":
+        """Converts a list of box tuples to column arrays.
+
+        Args:
+            boxes (List[Tuple[float, float, float, float, str, float]]): a box: [x1: float, y1, x2, y2, class: str,
+                score: float]
+
+        Returns:
+            _BoxArrays: Column arrays of the given boxes.
+        """
+        coordinates = np.array([box[:4] for box in boxes], dtype=np.float64).reshape(-1, 4)
+        class_names = np.empty(len(boxes), dtype=object)
+        class_names[:] = [box[FMeasure.box_class_index] for box in boxes]
+        lower_class_names = np.empty(len(boxes), dtype=object)
+        lower_class_names[:] = [name.lower() for name in class_names]  # type: ignore[union-attr]
+        scores = np.array([float(box[FMeasure.box_score_index]) for box in boxes], dtype=np.float64)
+        return cls(coordinates, class_names, lower_class_names, scores)
+
+
 class _Metrics:
     """This class collects the metrics related to detection.
 
@@ -256,18 +354,27 @@ class _FMeasureCalculator:
                 a box: [x1: float, y1, x2, y2, class: str, score: float]
                 boxes_per_image: [box1, box2, …]
                 predicted_boxes_per_image: [boxes_per_image_1, boxes_per_image_2, boxes_per_image_3, …]
+        vectorized (bool): If True, threshold sweeps compute the IoU matrices once per image and class with NumPy and
+            evaluate all thresholds in a single sorted pass using cumulative counts. If False, every threshold is
+            evaluated from scratch with the per-box Python implementation. Both give identical results.
+            Defaults to True.
     """
 
     def __init__(
         self,
         ground_truth_boxes_per_image: List[List[Tuple[float, float, float, float, str, float]]],
         prediction_boxes_per_image: List[List[Tuple[float, float, float, float, str, float]]],
+        vectorized: bool = True,
     ):
         self.ground_truth_boxes_per_image = ground_truth_boxes_per_image
         self.prediction_boxes_per_image = prediction_boxes_per_image
         self.confidence_range = [0.025, 1.0, 0.025]
         self.nms_range = [0.1, 1, 0.05]
         self.default_confidence_threshold = 0.35
+        self.vectorized = vectorized
+        self.__ground_truth_arrays: Optional[List[_BoxArrays]] = None
+        self.__prediction_arrays: Optional[List[_BoxArrays]] = None
+        self.__class_iou_cache: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
 
     def evaluate_detections(
         self,
@@ -350,12 +457,26 @@ class _FMeasureCalculator:
         result = _AggregatedResults(classes)
         result.best_threshold = 0.1
 
-        for confidence_threshold in np.arange(*confidence_range):
-            result_point = self.evaluate_classes(
-                classes=classes.copy(),
+        confidence_thresholds = np.arange(*confidence_range)
+        result_points: Iterable[Dict[str, _Metrics]]
+        if self.__use_vectorized_path():
+            result_points = self.__sweep_thresholds(
+                classes=classes,
                 iou_threshold=iou_threshold,
-                confidence_threshold=confidence_threshold,
+                activation_per_image=[boxes.scores for boxes in self.__get_prediction_arrays()],
+                thresholds=confidence_thresholds,
+            )
+        else:
+            result_points = (
+                self.evaluate_classes(
+                    classes=classes.copy(),
+                    iou_threshold=iou_threshold,
+                    confidence_threshold=confidence_threshold,
+                )
+                for confidence_threshold in confidence_thresholds
             )
+
+        for confidence_threshold, result_point in zip(confidence_thresholds, result_points):
             all_classes_f_measure = result_point[ALL_CLASSES_NAME].f_measure
             result.all_classes_f_measure_curve.append(all_classes_f_measure)
 
@@ -395,20 +516,39 @@ class _FMeasureCalculator:
         result.best_f_measure = min_f_measure
         result.best_threshold = 0.5
 
-        critical_nms_per_image = self.__get_critical_nms(self.prediction_boxes_per_image, cross_class_nms)
-
-        for nms_threshold in np.arange(*self.nms_range):
-            predicted_boxes_per_image_per_nms = self.__filter_nms(
-                self.prediction_boxes_per_image, critical_nms_per_image, nms_threshold
-            )
-            boxes_pair_for_nms = _FMeasureCalculator(
-                self.ground_truth_boxes_per_image, predicted_boxes_per_image_per_nms
-            )
-            result_point = boxes_pair_for_nms.evaluate_classes(
-                classes=classes.copy(),
+        nms_thresholds = np.arange(*self.nms_range)
+        result_points: Iterable[Dict[str, _Metrics]]
+        if self.__use_vectorized_path():
+            # A box survives NMS threshold t iff critical_nms < t, i.e. iff -critical_nms > -t, so the NMS sweep maps
+            # onto the same "activation > threshold" sweep as the confidence one. Boxes below the default confidence
+            # threshold never take part in the evaluation.
+            prediction_arrays = self.__get_prediction_arrays()
+            critical_nms_per_image = self.__get_critical_nms_vectorized(prediction_arrays, cross_class_nms)
+            result_points = self.__sweep_thresholds(
+                classes=classes,
                 iou_threshold=iou_threshold,
-                confidence_threshold=self.default_confidence_threshold,
+                activation_per_image=[
+                    np.where(boxes.scores > self.default_confidence_threshold, -critical_nms, -np.inf)
+                    for boxes, critical_nms in zip(prediction_arrays, critical_nms_per_image)
+                ],
+                thresholds=-nms_thresholds,
+            )
+        else:
+            critical_nms_per_image = self.__get_critical_nms(self.prediction_boxes_per_image, cross_class_nms)
+            result_points = (
+                _FMeasureCalculator(
+                    self.ground_truth_boxes_per_image,
+                    self.__filter_nms(self.prediction_boxes_per_image, critical_nms_per_image, nms_threshold),
+                    vectorized=False,
+                ).evaluate_classes(
+                    classes=classes.copy(),
+                    iou_threshold=iou_threshold,
+                    confidence_threshold=self.default_confidence_threshold,
+                )
+                for nms_threshold in nms_thresholds
             )
+
+        for nms_threshold, result_point in zip(nms_thresholds, result_points):
             all_classes_f_measure = result_point[ALL_CLASSES_NAME].f_measure
             result.all_classes_f_measure_curve.append(all_classes_f_measure)
 
@@ -493,6 +633,137 @@ class _FMeasureCalculator:
             results = (_Metrics(0.0, 0.0, 0.0), _ResultCounters(0, 0, 0))
         return results
 
+    def __use_vectorized_path(self) -> bool:
+        """Returns True if threshold sweeps should use the NumPy-batched matching engine."""
+        # Without any image the per-class evaluation only emits warnings and zero metrics, keep that behaviour.
+        return self.vectorized and len(self.ground_truth_boxes_per_image) > 0
+
+    def __get_ground_truth_arrays(self) -> List[_BoxArrays]:
+        """Returns the ground truth boxes converted to column arrays, converting them on first use."""
+        if self.__ground_truth_arrays is None:
+            self.__ground_truth_arrays = [_BoxArrays.from_boxes(boxes) for boxes in self.ground_truth_boxes_per_image]
+        return self.__ground_truth_arrays
+
+    def __get_prediction_arrays(self) -> List[_BoxArrays]:
+        """Returns the predicted boxes converted to column arrays, converting them on first use."""
+        if self.__prediction_arrays is None:
+            self.__prediction_arrays = [_BoxArrays.from_boxes(boxes) for boxes in self.prediction_boxes_per_image]
+        return self.__prediction_arrays
+
+    def __get_class_iou_matrices(self, class_name: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Returns the IoU matrix and the predicted box mask of a class for each image.
+
+        The IoU matrices do not depend on any threshold, so they are computed once per image and class and shared by
+        the confidence and the NMS sweeps.
+
+        Args:
+            class_name (str): Name of the class, matched case-insensitively like in __filter_class.
+
+        Returns:
+            List[Tuple[np.ndarray, np.ndarray]]: (iou_matrix, predicted_box_mask) for each image.
+        """
+        lower_class_name = class_name.lower()
+        if lower_class_name not in self.__class_iou_cache:
+            matrices = []
+            for ground_truth, prediction in zip(self.__get_ground_truth_arrays(), self.__get_prediction_arrays()):
+                ground_truth_mask = ground_truth.lower_class_names == lower_class_name
+                prediction_mask = prediction.lower_class_names == lower_class_name
+                iou_matrix = get_batched_iou_matrix(
+                    ground_truth.coordinates[ground_truth_mask], prediction.coordinates[prediction_mask]
+                )
+                matrices.append((iou_matrix, prediction_mask))
+            self.__class_iou_cache[lower_class_name] = matrices
+        return self.__class_iou_cache[lower_class_name]
+
+    def __sweep_thresholds(
+        self,
+        classes: List[str],
+        iou_threshold: float,
+        activation_per_image: List[np.ndarray],
+        thresholds: np.ndarray,
+    ) -> List[Dict[str, _Metrics]]:
+        """Evaluates the classes for all thresholds at once.
+
+        A predicted box takes part in the evaluation at threshold t iff its activation is strictly greater than t.
+        For each class the boxes are sorted by activation once, then the number of predictions and false negatives
+        for every threshold are read from cumulative counts with a binary search. The result for each threshold is
+        the same as the one of evaluate_classes on the boxes active at that threshold.
+
+        Args:
+            classes (List[str]): List of classes to be evaluated.
+            iou_threshold (float): IoU threshold to use for false negatives.
+            activation_per_image (List[np.ndarray]): Activation value of each predicted box for each image.
+            thresholds (np.ndarray): Thresholds to be evaluated.
+
+        Returns:
+            List[Dict[str, _Metrics]]: The metrics (e.g. F-measure) for each class, for each threshold.
+        """
+        n_thresholds = len(thresholds)
+        counters_per_class: List[Tuple[str, np.ndarray, int, np.ndarray]] = []
+        for class_name in classes:
+            if class_name == ALL_CLASSES_NAME:
+                continue
+            ground_truth_activations = []
+            prediction_activations = []
+            extra_matches = []
+            for (iou_matrix, prediction_mask), activation in zip(
+                self.__get_class_iou_matrices(class_name), activation_per_image
+            ):
+                class_activation = activation[prediction_mask]
+                ground_truth_activation, class_extra_matches = get_matching_statistics(
+                    iou_matrix, class_activation, iou_threshold
+                )
+                ground_truth_activations.append(ground_truth_activation)
+                prediction_activations.append(class_activation)
+                extra_matches.append(class_extra_matches)
+
+            ground_truth_activation = np.sort(np.concatenate(ground_truth_activations))
+            prediction_activation = np.concatenate(prediction_activations)
+            order = np.argsort(prediction_activation, kind="stable")
+            cumulative_extra_matches = np.concatenate(([0], np.cumsum(np.concatenate(extra_matches)[order])))
+
+            n_inactive = np.searchsorted(prediction_activation[order], thresholds, side="right")
+            n_uncovered = np.searchsorted(ground_truth_activation, thresholds, side="right")
+            n_false_negatives = n_uncovered + cumulative_extra_matches[-1] - cumulative_extra_matches[n_inactive]
+            n_predicted = len(prediction_activation) - n_inactive
+            counters_per_class.append((class_name, n_false_negatives, len(ground_truth_activation), n_predicted))
+
+        result_points = []
+        for threshold_index in range(n_thresholds):
+            result: Dict[str, _Metrics] = {}
+            all_classes_counters = _ResultCounters(0, 0, 0)
+            for class_name, n_false_negatives, n_true, n_predicted in counters_per_class:
+                counters = _ResultCounters(
+                    int(n_false_negatives[threshold_index]), n_true, int(n_predicted[threshold_index])
+                )
+                result[class_name] = counters.calculate_f_measure()
+                all_classes_counters.n_false_negatives += counters.n_false_negatives
+                all_classes_counters.n_true += counters.n_true
+                all_classes_counters.n_predicted += counters.n_predicted
+            result[ALL_CLASSES_NAME] = all_classes_counters.calculate_f_measure()
+            result_points.append(result)
+        return result_points
+
+    @staticmethod
+    def __get_critical_nms_vectorized(boxes_per_image: List[_BoxArrays], cross_class_nms: bool) -> List[np.ndarray]:
+        """Vectorized version of __get_critical_nms working on column arrays.
+
+        Args:
+            boxes_per_image (List[_BoxArrays]): Predicted boxes of each image as column arrays.
+            cross_class_nms (bool): Whether to use cross class NMS.
+
+        Returns:
+            List[np.ndarray]: Critical NMS value for each box in each image.
+        """
+        critical_nms_per_image = []
+        for boxes in boxes_per_image:
+            iou_matrix = get_batched_iou_matrix(boxes.coordinates, boxes.coordinates)
+            suppressing = boxes.scores[:, None] < boxes.scores[None, :]
+            if not cross_class_nms:
+                suppressing &= boxes.class_names[:, None] == boxes.class_names[None, :]
+            critical_nms_per_image.append(np.max(np.where(suppressing, iou_matrix, 0.0), axis=1, initial=0.0))
+        return critical_nms_per_image
+
     @staticmethod
     def __get_critical_nms(
         boxes_per_image: List[List[Tuple[float, float, float, float, str, float]]], cross_class_nms: bool = False
@@ -16,6 +16,7 @@ from otx.api.entities.model_template import TaskType
 from otx.api.serialization.label_mapper import LabelSchemaMapper
 from otx.api.utils import Tiler
 from otx.api.utils.detection_utils import detection2array
+from otx.api.utils.tiler import ASYNC_PLUGIN_CONFIG
 
 from .utils import get_model_path, get_parameters
 
@@ -40,7 +41,14 @@ class ModelContainer:
         self.model_parameters = self.parameters["model_parameters"]
         self.model_parameters["labels"] = []
 
-        model_adapter = OpenvinoAdapter(create_core(), get_model_path(model_dir / "model.xml"), device=device)
+        self.tile_num_requests = self.get_tile_num_requests()
+        model_adapter = OpenvinoAdapter(
+            create_core(),
+            get_model_path(model_dir / "model.xml"),
+            device=device,
+            plugin_config=ASYNC_PLUGIN_CONFIG if self.tile_num_requests > 1 else None,
+            max_num_requests=self.tile_num_requests,
+        )
 
         self._initialize_wrapper()
         self.core_model = Model.create_model(
@@ -52,6 +60,13 @@ class ModelContainer:
 
         self.tiler = self.setup_tiler()
 
+    def get_tile_num_requests(self) -> int:
+        """Returns the number of tiles inferred concurrently, 1 if tiling is disabled."""
+        tiling_parameters = self.parameters.get("tiling_parameters")
+        if not tiling_parameters or not tiling_parameters["enable_tiling"]["value"]:
+            return 1
+        return int(tiling_parameters.get("tile_inference_num_requests", {}).get("value", 1))
+
     def setup_tiler(self):
         """Setup tiler.
 
@@ -67,7 +82,10 @@ class ModelContainer:
         tile_size = self.parameters["tiling_parameters"]["tile_size"]["value"]
         tile_overlap = self.parameters["tiling_parameters"]["tile_overlap"]["value"]
         max_number = self.parameters["tiling_parameters"]["tile_max_number"]["value"]
-        tiler = Tiler(tile_size, tile_overlap, max_number, self.core_model, self.segm)
+        skip_threshold = self.parameters["tiling_parameters"].get("tile_skip_threshold", {}).get("value", 0.0)
+        tiler = Tiler(
+            tile_size, tile_overlap, max_number, self.core_model, self.segm, self.tile_num_requests, skip_threshold
+        )
         return tiler
 
     @property
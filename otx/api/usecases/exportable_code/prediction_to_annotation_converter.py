@@ -261,6 +261,9 @@ class ClassificationToAnnotationConverter(IPredictionToAnnotationConverter):
         self.hierarchical = not multilabel and len(label_schema.get_groups(False)) > 1
 
         self.label_schema = label_schema
+        if self.hierarchical:
+            # Compile the label schema once, rather than on the first prediction
+            self.label_schema.compile()
 
     def convert_to_annotation(
         self, predictions: List[Tuple[int, float]], metadata: Optional[Dict] = None
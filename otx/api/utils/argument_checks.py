@@ -6,10 +6,11 @@
 
 import inspect
 import itertools
+import os
 import typing
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from functools import wraps
+from functools import lru_cache, partial, wraps
 from os.path import exists, splitext
 
 import yaml
@@ -188,9 +189,207 @@ def check_parameter_type(parameter, parameter_name, expected_type):
         )
 
 
+# Containers with more elements have only a sample of their elements checked
+MAX_CHECKED_ELEMENTS = 32
+# Nested containers deeper than this have only their own type checked, not the types of their elements
+MAX_CHECKED_DEPTH = 4
+
+# In trusted mode, the decorated functions are called without checking their input parameters
+_TRUSTED_MODE = os.getenv("OTX_TRUSTED_MODE", "0").lower() in ("1", "true")
+
+
+def set_trusted_mode(trusted: bool = True):
+    """Turn on or off the trusted mode, in which check_input_parameters_type is a pass-through.
+
+    The trusted mode is also turned on by setting the OTX_TRUSTED_MODE environment variable to 1 before importing otx,
+    in which case the functions are not even wrapped and set_trusted_mode(False) has no effect on them.
+    """
+    global _TRUSTED_MODE  # pylint: disable=global-statement
+    _TRUSTED_MODE = trusted
+
+
+def is_trusted_mode() -> bool:
+    """Whether check_input_parameters_type is a pass-through."""
+    return _TRUSTED_MODE
+
+
+@lru_cache(maxsize=None)
+def _get_base_names(parameter_type: type) -> frozenset:
+    """Names of all base classes of a type, cached per type."""
+
+    def __get_bases(base_type):
+        return [base_type.__name__] + list(itertools.chain.from_iterable(__get_bases(t1) for t1 in base_type.__bases__))
+
+    return frozenset(__get_bases(parameter_type))
+
+
+def _sample_elements(iterable) -> typing.Iterable:
+    """At most MAX_CHECKED_ELEMENTS elements of a container, evenly spaced for lists and tuples."""
+    if isinstance(iterable, (list, tuple)):
+        if len(iterable) <= MAX_CHECKED_ELEMENTS:
+            return iterable
+        step = -(-len(iterable) // MAX_CHECKED_ELEMENTS)
+        return itertools.chain(iterable[:-1:step], iterable[-1:])
+    return itertools.islice(iterable, MAX_CHECKED_ELEMENTS)
+
+
+def _compile_type_check(expected_type, depth: int = 0) -> typing.Optional[typing.Callable]:
+    """Compile the check of check_parameter_type for an expected type once.
+
+    Returns:
+        None if any value is accepted, otherwise a function of the parameter and parameter name raising ValueError
+        exception if parameter has unexpected type.
+    """
+    # pylint: disable=too-many-return-statements,protected-access
+    if expected_type in [typing.Any, inspect._empty]:  # type: ignore
+        return None
+    if not isinstance(expected_type, typing._GenericAlias):  # type: ignore
+        return _compile_single_type_check(expected_type)
+    origin_class = expected_type.__dict__.get("__origin__")
+    nested_elements_class = expected_type.__dict__.get("__args__")
+    if origin_class == typing.Union:
+        return _compile_union_check(nested_elements_class, depth)
+    try:
+        is_iterable = issubclass(origin_class, typing.Iterable)
+    except TypeError:
+        is_iterable = None
+    if is_iterable is None or (origin_class == dict and len(nested_elements_class) != 2):
+        # Unsupported annotations raise their error when the parameter is checked, as check_parameter_type does
+        return partial(_check_parameter_type_later, expected_type=expected_type)
+    if not is_iterable:
+        return None
+
+    origin_check = _compile_single_type_check(origin_class)
+    if depth >= MAX_CHECKED_DEPTH:
+        return origin_check
+    if origin_class == dict:
+        key_check, value_check = (_compile_type_check(arg, depth + 1) for arg in nested_elements_class)
+        return partial(_check_dictionary, origin_check=origin_check, key_check=key_check, value_check=value_check)
+    if origin_class in [list, set, tuple, Sequence]:
+        if origin_class == tuple:
+            if len(nested_elements_class) > 2 or (
+                len(nested_elements_class) == 2 and nested_elements_class[1] != Ellipsis
+            ):
+                return partial(_check_parameter_type_later, expected_type=expected_type)
+            nested_elements_class = (
+                nested_elements_class[0] if len(nested_elements_class) == 2 else nested_elements_class
+            )
+        elif len(nested_elements_class) != 1:
+            return partial(_check_parameter_type_later, expected_type=expected_type)
+        else:
+            nested_elements_class = nested_elements_class[0]
+        element_check = _compile_type_check(nested_elements_class, depth + 1)
+        return partial(_check_elements, origin_check=origin_check, element_check=element_check)
+    return origin_check
+
+
+def _compile_single_type_check(expected_type) -> typing.Callable:
+    if isinstance(expected_type, typing.ForwardRef):
+        expected_type = expected_type.__forward_arg__
+    if isinstance(expected_type, str):
+        return partial(_check_base_name, expected_type=expected_type)
+    if expected_type == float:
+        expected_type = (int, float, floating)
+    return partial(_check_instance, expected_type=expected_type)
+
+
+def _compile_union_check(expected_args, depth: int) -> typing.Optional[typing.Callable]:
+    checks = [_compile_type_check(expected_arg, depth) for expected_arg in expected_args]
+    if any(check is None for check in checks):
+        return None
+    return partial(_check_union, checks=checks, expected_args=expected_args)
+
+
+def _check_parameter_type_later(parameter, parameter_name, expected_type):
+    check_parameter_type(parameter=parameter, parameter_name=parameter_name, expected_type=expected_type)
+
+
+def _check_base_name(parameter, parameter_name, expected_type):
+    if expected_type not in _get_base_names(type(parameter)):
+        parameter_str = get_parameter_repr(parameter)
+        raise ValueError(
+            f"Unexpected type of '{parameter_name}' parameter, expected: {expected_type}, "
+            f"actual value: {parameter_str}"
+        )
+
+
+def _check_instance(parameter, parameter_name, expected_type):
+    if not isinstance(parameter, expected_type):
+        raise_value_error_if_parameter_has_unexpected_type(parameter, parameter_name, expected_type)
+
+
+def _check_union(parameter, parameter_name, checks, expected_args):
+    for check in checks:
+        try:
+            check(parameter, parameter_name)
+            return
+        except ValueError:
+            pass
+    actual_type = type(parameter)
+    raise ValueError(
+        f"Unexpected type of '{parameter_name}' parameter, expected: {expected_args}, "
+        f"actual type: {actual_type}, actual value: {parameter}"
+    )
+
+
+def _check_elements(parameter, parameter_name, origin_check, element_check):
+    origin_check(parameter, parameter_name)
+    if element_check is not None:
+        for element in _sample_elements(parameter):
+            element_check(element, f"nested {parameter_name}")
+
+
+def _check_dictionary(parameter, parameter_name, origin_check, key_check, value_check):
+    origin_check(parameter, parameter_name)
+    if key_check is None and value_check is None:
+        return
+    for key, value in _sample_elements(parameter.items()):
+        if key_check is not None:
+            key_check(key, f"key in {parameter_name}")
+        if value_check is not None:
+            value_check(value, f"value in {parameter_name}")
+
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+class _ParameterCheck:
+    """Compiled check of one parameter of a function decorated with check_input_parameters_type."""
+
+    __slots__ = ("name", "position", "default", "check", "check_default")
+
+    def __init__(self, parameter: inspect.Parameter, position: int, custom_checks: dict):
+        self.name = parameter.name
+        self.position = position
+        # pylint: disable=protected-access
+        self.default = None if parameter.default is inspect._empty else parameter.default  # type: ignore
+        self.check: typing.Optional[typing.Callable[..., typing.Any]]
+        self.check_default: typing.Optional[typing.Callable[..., typing.Any]]
+        if parameter.name in custom_checks:
+            custom_check = custom_checks[parameter.name]
+            self.check = None if custom_check is None else partial(_run_custom_check, custom_check=custom_check)
+            # Custom checks may depend on the environment, such as existing files, so they are always run
+            self.check_default = self.check
+        else:
+            self.check = _compile_type_check(parameter.annotation)
+            self.check_default = None if self.check is None else self._check_default_once
+
+    def _check_default_once(self, parameter, parameter_name):
+        self.check(parameter, parameter_name)
+        self.check_default = None
+
+
+def _run_custom_check(parameter, parameter_name, custom_check):
+    custom_check(parameter, parameter_name).check()
+
+
 def check_input_parameters_type(custom_checks: typing.Optional[dict] = None):
     """Decorator to check input parameters type.
 
+    The signature of the decorated function is compiled once into a check per parameter. Only a sample of the elements
+    of large containers and of the nested containers up to a depth are checked, see MAX_CHECKED_ELEMENTS and
+    MAX_CHECKED_DEPTH. Nothing is checked in trusted mode, see set_trusted_mode.
+
     Args:
         custom_checks: dictionary where key - name of parameter and
             value - custom check class
@@ -199,39 +398,43 @@ def check_input_parameters_type(custom_checks: typing.Optional[dict] = None):
         custom_checks = {}
 
     def _check_input_parameters_type(function):
+        if _TRUSTED_MODE:
+            return function
+
+        parameters = inspect.signature(function).parameters
+        num_parameters = len(parameters)
+        parameter_checks = [
+            # Keyword-only parameters are given a position which is never reached by the positional arguments
+            _ParameterCheck(
+                parameter, position if parameter.kind in _POSITIONAL_KINDS else num_parameters, custom_checks
+            )
+            for position, parameter in enumerate(parameters.values())
+            if parameter.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        ]
+
         @wraps(function)
         def validate(*args, **kwargs):
-            # Forming expected types dictionary
-            signature = inspect.signature(function)
-            expected_types_map = signature.parameters
-            if len(expected_types_map) < len(args):
+            if _TRUSTED_MODE:
+                return function(*args, **kwargs)
+            num_args = len(args)
+            if num_parameters < num_args:
                 raise TypeError("Too many positional arguments")
-            # Forming input parameters dictionary
-            input_parameters_values_map = dict(zip(signature.parameters.keys(), args))
-            for key, value in kwargs.items():
-                if key in input_parameters_values_map:
-                    raise TypeError(f"Duplication of the parameter {key} -- both in args and kwargs")
-                input_parameters_values_map[key] = value
-            # Checking input parameters type
-            for parameter_name in expected_types_map:
-                parameter = input_parameters_values_map.get(parameter_name)
-                if parameter_name not in input_parameters_values_map:
-                    default_value = expected_types_map.get(parameter_name).default
-                    # pylint: disable=protected-access
-                    if default_value != inspect._empty:  # type: ignore
-                        parameter = default_value
-                if parameter_name in custom_checks:
-                    custom_check = custom_checks[parameter_name]
-                    if custom_check is None:
-                        continue
-                    custom_check(parameter, parameter_name).check()
+            for parameter_check in parameter_checks:
+                parameter_name = parameter_check.name
+                if parameter_check.position < num_args:
+                    if parameter_name in kwargs:
+                        raise TypeError(f"Duplication of the parameter {parameter_name} -- both in args and kwargs")
+                    check = parameter_check.check
+                    parameter = args[parameter_check.position]
+                elif parameter_name in kwargs:
+                    check = parameter_check.check
+                    parameter = kwargs[parameter_name]
                 else:
-                    check_parameter_type(
-                        parameter=parameter,
-                        parameter_name=parameter_name,
-                        expected_type=expected_types_map.get(parameter_name).annotation,
-                    )
-            return function(**input_parameters_values_map)
+                    check = parameter_check.check_default
+                    parameter = parameter_check.default
+                if check is not None:
+                    check(parameter, parameter_name)
+            return function(*args, **kwargs)
 
         return validate
 
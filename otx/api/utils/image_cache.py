@@ -0,0 +1,173 @@
+"""This module implements a cache of decoded images shared between processes."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import hashlib
+import mmap
+import multiprocessing
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+_INDEX_DTYPE = np.dtype(
+    [
+        ("key", np.uint64),
+        ("offset", np.int64),
+        ("nbytes", np.int64),
+        ("last_used", np.int64),
+        ("shape", np.int32, (3,)),
+        ("ndim", np.int32),
+    ]
+)
+
+# Positions of the shared counters
+_CLOCK, _HITS, _MISSES, _EVICTIONS, _NUM_COUNTERS = range(5)
+
+
+class ImageCacheStats(NamedTuple):
+    """Statistics of a SharedImageCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    num_images: int
+    used_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the ratio of lookups which found the image in the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+class SharedImageCache:
+    """LRU cache of decoded uint8 images with a budget in bytes, shared between processes.
+
+    The images, their index and the statistics counters live in a single anonymous shared memory mapping, protected
+    by a multiprocessing lock. Hence, a cache created in the main process is shared with all the processes forked
+    afterwards, such as the DataLoader workers: an image decoded by one worker is a hit for all the others.
+
+    Images are identified by a 64-bit hash of their key (usually the image file path). When there is not enough room
+    left, the least recently used images are evicted.
+
+    Args:
+        max_bytes (int): Budget for the image data in bytes.
+        max_images (int): Maximum number of images in the cache. Defaults to 65536.
+    """
+
+    def __init__(self, max_bytes: int, max_images: int = 65536):
+        if max_bytes <= 0 or max_images <= 0:
+            raise ValueError("The size of the cache must be positive")
+        self.max_bytes = max_bytes
+        self.max_images = max_images
+        counters_size = _NUM_COUNTERS * np.dtype(np.int64).itemsize
+        index_size = max_images * _INDEX_DTYPE.itemsize
+        self._buffer = mmap.mmap(-1, counters_size + index_size + max_bytes)
+        self._counters = np.frombuffer(self._buffer, dtype=np.int64, count=_NUM_COUNTERS)
+        self._index = np.frombuffer(self._buffer, dtype=_INDEX_DTYPE, count=max_images, offset=counters_size)
+        self._data = np.frombuffer(self._buffer, dtype=np.uint8, count=max_bytes, offset=counters_size + index_size)
+        self._lock = multiprocessing.Lock()
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        # 0 marks the free slots of the index
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little") or 1
+
+    def _find(self, key_hash: int) -> Optional[int]:
+        slots = np.flatnonzero(self._index["key"] == key_hash)
+        return int(slots[0]) if len(slots) > 0 else None
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Returns a copy of the cached image, or None if it is not in the cache.
+
+        Args:
+            key (str): Key of the image.
+
+        Returns:
+            Optional[np.ndarray]: Cached image.
+        """
+        key_hash = self._hash(key)
+        with self._lock:
+            slot = self._find(key_hash)
+            if slot is None:
+                self._counters[_MISSES] += 1
+                return None
+            self._counters[_HITS] += 1
+            self._counters[_CLOCK] += 1
+            entry = self._index[slot]
+            entry["last_used"] = self._counters[_CLOCK]
+            offset, nbytes = int(entry["offset"]), int(entry["nbytes"])
+            shape = tuple(entry["shape"][: entry["ndim"]])
+            # Copy under the lock, since the slot may be reused as soon as it is released
+            return self._data[offset : offset + nbytes].reshape(shape).copy()
+
+    def put(self, key: str, image: np.ndarray) -> bool:
+        """Add an image to the cache, evicting the least recently used images if needed.
+
+        Args:
+            key (str): Key of the image.
+            image (np.ndarray): Decoded image, must be a 2D or 3D uint8 array.
+
+        Returns:
+            bool: True if the image is in the cache, False if it can not be cached.
+        """
+        if image.dtype != np.uint8 or image.ndim not in (2, 3) or image.nbytes > self.max_bytes:
+            return False
+        key_hash = self._hash(key)
+        with self._lock:
+            if self._find(key_hash) is not None:
+                return True
+            free_slots = np.flatnonzero(self._index["key"] == 0)
+            if len(free_slots) == 0:
+                self._evict_least_recently_used()
+                free_slots = np.flatnonzero(self._index["key"] == 0)
+            slot = int(free_slots[0])
+            offset = self._allocate(image.nbytes)
+            self._data[offset : offset + image.nbytes] = image.reshape(-1)
+            self._counters[_CLOCK] += 1
+            entry = self._index[slot]
+            entry["offset"] = offset
+            entry["nbytes"] = image.nbytes
+            entry["last_used"] = self._counters[_CLOCK]
+            entry["shape"] = image.shape + (0,) * (3 - image.ndim)
+            entry["ndim"] = image.ndim
+            entry["key"] = key_hash
+        return True
+
+    def _allocate(self, nbytes: int) -> int:
+        """Returns the offset of a free range of nbytes bytes in the data, evicting images until there is one."""
+        while True:
+            used = self._index[self._index["key"] != 0]
+            used = used[np.argsort(used["offset"])]
+            gap_starts = np.concatenate([[0], used["offset"] + used["nbytes"]])
+            gap_ends = np.concatenate([used["offset"], [self.max_bytes]])
+            large_enough = np.flatnonzero(gap_ends - gap_starts >= nbytes)
+            if len(large_enough) > 0:
+                return int(gap_starts[large_enough[0]])
+            self._evict_least_recently_used()
+
+    def _evict_least_recently_used(self):
+        used_slots = np.flatnonzero(self._index["key"] != 0)
+        slot = used_slots[np.argmin(self._index["last_used"][used_slots])]
+        self._index[slot]["key"] = 0
+        self._counters[_EVICTIONS] += 1
+
+    def clear(self):
+        """Remove all the images from the cache and reset the statistics."""
+        with self._lock:
+            self._index["key"] = 0
+            self._counters[:] = 0
+
+    def stats(self) -> ImageCacheStats:
+        """Returns the statistics of the cache, accumulated over all the processes sharing it."""
+        with self._lock:
+            used = self._index["key"] != 0
+            return ImageCacheStats(
+                hits=int(self._counters[_HITS]),
+                misses=int(self._counters[_MISSES]),
+                evictions=int(self._counters[_EVICTIONS]),
+                num_images=int(np.count_nonzero(used)),
+                used_bytes=int(self._index["nbytes"][used].sum()),
+            )
@@ -0,0 +1,262 @@
+"""Pipelined inference, overlapping the decoding, pre-processing, inference and post-processing of many inputs."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import logging
+import queue
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from otx.api.entities.inference_parameters import InferenceParameters
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InferenceThroughput:
+    """Throughput of a pipelined inference.
+
+    Attributes:
+        num_items: Number of predicted items.
+        elapsed_time: Time in seconds from the first item to the last prediction.
+    """
+
+    num_items: int = 0
+    elapsed_time: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Number of predicted items per second."""
+        return self.num_items / self.elapsed_time if self.elapsed_time > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Human readable throughput."""
+        return f"{self.num_items} items in {self.elapsed_time:.2f} s, {self.items_per_second:.2f} items/s"
+
+
+class PipelinedInferenceEngine:
+    """Predict many items, overlapping their pre-processing, inference and post-processing.
+
+    The items are decoded and pre-processed by a pool of threads, ahead of the inference. If an OpenVINO model API
+    model is given and num_requests is greater than 1, up to num_requests items are inferred asynchronously on the
+    infer requests of the model, which should have been created with at least as many requests. Otherwise, the items
+    are inferred one after another with the forward function, while the next items are pre-processed and the previous
+    ones post-processed. The raw predictions are post-processed by the same pool of threads, and the predictions are
+    yielded in the order of the items, waiting for the next one when too many later predictions are pending.
+
+    Example:
+        >>> engine = PipelinedInferenceEngine(
+        ...     pre_process=lambda item: inferencer.pre_process(item.numpy),
+        ...     post_process=inferencer.post_process,
+        ...     model=inferencer.model,
+        ...     num_requests=4,
+        ... )
+        >>> for dataset_item, prediction in engine.predict(dataset):
+        ...     dataset_item.append_annotations(prediction.annotations)
+        >>> print(engine.throughput)
+
+    Args:
+        pre_process (Callable[[Any], Tuple[Any, Any]]): Function decoding and pre-processing an item, returning the
+            inputs of the model and the metadata of the item.
+        post_process (Callable[[Any, Any], Any]): Function post-processing the raw predictions of the model with the
+            metadata of the item.
+        model (Optional[Any]): OpenVINO model API model inferring the items asynchronously. Defaults to None.
+        forward (Optional[Callable[[Any], Any]]): Function inferring the inputs synchronously, used if there is no
+            model or num_requests is 1. Defaults to model.infer_sync.
+        num_requests (int): Number of items inferred concurrently. Defaults to 1.
+        num_workers (int): Number of threads pre-processing and post-processing the items. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        pre_process: Callable[[Any], Tuple[Any, Any]],
+        post_process: Callable[[Any, Any], Any],
+        model: Optional[Any] = None,
+        forward: Optional[Callable[[Any], Any]] = None,
+        num_requests: int = 1,
+        num_workers: int = 1,
+    ):  # pylint: disable=too-many-arguments
+        if num_requests < 1:
+            raise ValueError(f"num_requests should be greater than 0, but {num_requests} is given")
+        if num_workers < 1:
+            raise ValueError(f"num_workers should be greater than 0, but {num_workers} is given")
+        if forward is None:
+            if model is None:
+                raise ValueError("Either a model or a forward function should be given")
+            forward = model.infer_sync
+        self.pre_process = pre_process
+        self.post_process = post_process
+        self.model = model
+        self.forward = forward
+        self.num_requests = num_requests
+        self.num_workers = num_workers
+        self.throughput = InferenceThroughput()
+
+    @property
+    def is_async(self) -> bool:
+        """Whether the items are inferred asynchronously on the infer requests of the model."""
+        return self.model is not None and self.num_requests > 1
+
+    def predict(self, items: Iterable[Any]) -> Iterator[Tuple[Any, Any]]:
+        """Predict the items.
+
+        Args:
+            items (Iterable[Any]): Items to predict, given to the pre-processing function.
+
+        Yields:
+            Tuple[Any, Any]: Each item and its post-processed prediction, in the order of the items.
+        """
+        # pylint: disable=too-many-locals
+        self.throughput = InferenceThroughput()
+        start_time = time.perf_counter()
+        # Raw predictions of the asynchronous requests, put by the callbacks of the infer requests
+        completed: "queue.SimpleQueue[Tuple[int, Any, Any]]" = queue.SimpleQueue()
+        callback_exceptions: List[Exception] = []
+        # Model inferring the items asynchronously, if any
+        async_model = self.model if self.is_async else None
+        if async_model is not None:
+            async_model.model_adapter.set_callback(
+                lambda request, callback_args: self._callback(request, callback_args, completed, callback_exceptions)
+            )
+
+        with ThreadPoolExecutor(self.num_workers) as executor:
+            pre_processed: Deque[Tuple[Any, Future]] = deque()
+            post_processed: Dict[int, Tuple[Any, Future]] = {}
+            items_in_flight: Dict[int, Any] = {}
+            num_inferred = 0
+            num_yielded = 0
+
+            def post_process_completed():
+                while not completed.empty():
+                    index, raw_predictions, metadata = completed.get()
+                    post_processed[index] = (
+                        items_in_flight.pop(index),
+                        executor.submit(self.post_process, raw_predictions, metadata),
+                    )
+
+            def infer_next():
+                nonlocal num_inferred
+                item, future = pre_processed.popleft()
+                inputs, metadata = future.result()
+                if self.is_async:
+                    while not self.model.is_ready():
+                        self.model.await_any()
+                        self._raise_callback_exception(callback_exceptions)
+                        post_process_completed()
+                    items_in_flight[num_inferred] = item
+                    self.model.infer_async(inputs, (num_inferred, metadata))
+                    post_process_completed()
+                else:
+                    raw_predictions = self.forward(inputs)
+                    post_processed[num_inferred] = (item, executor.submit(self.post_process, raw_predictions, metadata))
+                num_inferred += 1
+
+            def pop_predictions(wait: bool) -> Iterator[Tuple[Any, Any]]:
+                nonlocal num_yielded
+                while num_yielded in post_processed and (wait or post_processed[num_yielded][1].done()):
+                    item, future = post_processed.pop(num_yielded)
+                    num_yielded += 1
+                    yield item, future.result()
+
+            def pop_ready_predictions() -> Iterator[Tuple[Any, Any]]:
+                yield from pop_predictions(wait=False)
+                # Wait for the next prediction while too many later ones are pending, so that a slow item or slow
+                # post-processing does not let the predictions waiting to be yielded in order pile up
+                while len(items_in_flight) + len(post_processed) >= max_pending:
+                    if num_yielded not in post_processed:
+                        assert async_model is not None
+                        async_model.await_all()
+                        self._raise_callback_exception(callback_exceptions)
+                        post_process_completed()
+                    yield from pop_predictions(wait=True)
+
+            # Keep enough items pre-processed ahead to feed all the requests while the workers are busy
+            max_pre_processed = self.num_requests + self.num_workers
+            max_pending = 2 * max_pre_processed
+            try:
+                for item in items:
+                    pre_processed.append((item, executor.submit(self.pre_process, item)))
+                    if len(pre_processed) > max_pre_processed:
+                        infer_next()
+                        yield from pop_ready_predictions()
+                while pre_processed:
+                    infer_next()
+                    yield from pop_ready_predictions()
+                if async_model is not None:
+                    async_model.await_all()
+                    self._raise_callback_exception(callback_exceptions)
+                    post_process_completed()
+                yield from pop_predictions(wait=True)
+            finally:
+                if async_model is not None and items_in_flight:
+                    async_model.await_all()
+                for _, future in pre_processed:
+                    future.cancel()
+
+        self.throughput = InferenceThroughput(num_yielded, time.perf_counter() - start_time)
+        logger.info(f"Pipelined inference throughput: {self.throughput}")
+
+    def _callback(
+        self,
+        request: Any,
+        callback_args: Tuple[int, Any],
+        completed: "queue.SimpleQueue[Tuple[int, Any, Any]]",
+        callback_exceptions: List[Exception],
+    ):
+        """Copy the raw predictions of a completed infer request, called from the thread of the request."""
+        assert self.model is not None
+        try:
+            index, metadata = callback_args
+            completed.put((index, self.model.model_adapter.copy_raw_result(request), metadata))
+        except Exception as e:  # pylint: disable=broad-except
+            callback_exceptions.append(e)
+
+    @staticmethod
+    def _raise_callback_exception(callback_exceptions: List[Exception]):
+        if callback_exceptions:
+            raise callback_exceptions[0]
+
+
+def predict_pipelined(
+    items: Iterable[Any],
+    inferencer: Any,
+    inference_parameters: Optional[InferenceParameters] = None,
+    get_inputs: Optional[Callable[[Any], Any]] = None,
+    post_process: Optional[Callable[[Any, Any], Any]] = None,
+) -> Iterator[Tuple[Any, Any]]:
+    """Predict the items in order with an OpenVINO inferencer, pipelined if the inference parameters ask for it.
+
+    Args:
+        items (Iterable[Any]): Items to predict, such as dataset items or clips.
+        inferencer (Any): Inferencer with the predict, pre_process, forward and post_process functions of the OpenVINO
+            tasks, and their model API model.
+        inference_parameters (Optional[InferenceParameters]): Inference parameters. The items are predicted one after
+            another with inferencer.predict, unless the parameters are pipelined. Defaults to None.
+        get_inputs (Optional[Callable[[Any], Any]]): Function returning the inputs of the inferencer for an item, such
+            as its image. Defaults to None, giving the item itself.
+        post_process (Optional[Callable[[Any, Any], Any]]): Function post-processing the raw predictions with the
+            metadata of an item. Defaults to None, using inferencer.post_process.
+
+    Returns:
+        Iterator[Tuple[Any, Any]]: Each item and its prediction, in the order of the items.
+    """
+
+    def get_item_inputs(item: Any) -> Any:
+        return item if get_inputs is None else get_inputs(item)
+
+    if inference_parameters is None or not inference_parameters.is_pipelined:
+        return ((item, inferencer.predict(get_item_inputs(item))) for item in items)
+    engine = PipelinedInferenceEngine(
+        pre_process=lambda item: inferencer.pre_process(get_item_inputs(item)),
+        post_process=inferencer.post_process if post_process is None else post_process,
+        model=inferencer.model,
+        forward=inferencer.forward,
+        num_requests=inference_parameters.num_requests,
+        num_workers=max(inference_parameters.num_workers, 1),
+    )
+    return engine.predict(items)
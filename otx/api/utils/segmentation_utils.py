@@ -4,15 +4,19 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import hashlib
 import warnings
-from copy import copy
-from typing import List, Optional, Sequence, Tuple, cast
+from typing import Any, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
 from bson import ObjectId
 
 from otx.api.entities.annotation import Annotation
+from otx.api.entities.annotation_store import (
+    AnnotationStore,
+    ColumnarAnnotationSceneEntity,
+)
 from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.id import ID
 from otx.api.entities.label import LabelEntity
@@ -21,7 +25,9 @@ from otx.api.entities.shapes.polygon import Point, Polygon
 from otx.api.utils.shape_factory import ShapeFactory
 
 
-def mask_from_dataset_item(dataset_item: DatasetItemEntity, labels: List[LabelEntity]) -> np.ndarray:
+def mask_from_dataset_item(
+    dataset_item: DatasetItemEntity, labels: List[LabelEntity], cache: Optional[Any] = None
+) -> np.ndarray:
     """Creates a mask from dataset item.
 
     The mask will be two dimensional, and the value of each pixel matches the class index with offset 1. The background
@@ -32,21 +38,71 @@ def mask_from_dataset_item(dataset_item: DatasetItemEntity, labels: List[LabelEn
         dataset_item: Item to make mask for
         labels: The labels to use for creating the mask. The order of
             the labels determines the class index.
+        cache: Optional cache of the masks, with ``get(key)`` and ``put(key, mask)`` methods, such as
+            SharedImageCache. The masks are identified by get_mask_cache_key(), so that they are rasterized again
+            as soon as the annotations change.
 
     Returns:
         Numpy array of mask
     """
-    # todo: cache this so that it does not have to be redone for all the same media
-    mask = mask_from_annotation(
-        dataset_item.get_annotations(),
-        labels,
-        dataset_item.width,
-        dataset_item.height,
-    )
+    key = None
+    if cache is not None:
+        key = get_mask_cache_key(dataset_item, labels)
+        mask = cache.get(key)
+        if mask is not None:
+            return mask.reshape(mask.shape[0], mask.shape[1], 1)
+
+    annotation_scene = dataset_item.annotation_scene
+    if isinstance(annotation_scene, ColumnarAnnotationSceneEntity) and annotation_scene.store is not None:
+        mask = mask_from_annotation_store(
+            dataset_item.get_annotation_store(),
+            labels,
+            dataset_item.width,
+            dataset_item.height,
+        )
+    else:
+        mask = mask_from_annotation(
+            dataset_item.get_annotations(),
+            labels,
+            dataset_item.width,
+            dataset_item.height,
+        )
 
+    if cache is not None:
+        cache.put(key, mask[:, :, 0])
     return mask
 
 
+def get_mask_cache_key(dataset_item: DatasetItemEntity, labels: List[LabelEntity]) -> str:
+    """Returns the key of the mask of a dataset item in a cache of mask_from_dataset_item().
+
+    The key is a digest of everything the mask depends on: the size of the item, the order of the labels and the
+    shapes and labels of the annotations. Hence, it changes when the annotations change, which invalidates the cached
+    mask, and the items with the same annotations share their mask.
+
+    Args:
+        dataset_item: Item of the mask
+        labels: The labels used for creating the mask
+
+    Returns:
+        str: Key of the mask
+    """
+    store = dataset_item.get_annotation_store()
+    digest = hashlib.blake2b(digest_size=16)
+
+    def update_labels(label_entities: Sequence[LabelEntity]):
+        digest.update("\n".join(f"{label.id_}:{label.name}:{label.is_empty}" for label in label_entities).encode())
+        digest.update(b"\0")
+
+    digest.update(f"{dataset_item.width}x{dataset_item.height}\0".encode())
+    update_labels(sorted(labels))
+    update_labels(store.labels)
+    for array in (store.shape_types, store.point_offsets, store.points, store.label_offsets, store.label_indices):
+        digest.update(len(array).to_bytes(8, "little"))
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
 def mask_from_annotation(
     annotations: List[Annotation], labels: List[LabelEntity], width: int, height: int
 ) -> np.ndarray:
@@ -94,6 +150,47 @@ def mask_from_annotation(
     return mask
 
 
+def mask_from_annotation_store(
+    store: AnnotationStore, labels: List[LabelEntity], width: int, height: int
+) -> np.ndarray:
+    """Generate a segmentation mask from the arrays of an annotation store.
+
+    The mask is the same as the one of mask_from_annotation() for the annotations of the store.
+
+    Args:
+        store: Annotations to plot in mask
+        labels: List of labels. The index position of the label
+            determines the class number in the segmentation mask.
+        width: Width of the mask
+        height: Height of the mask
+
+    Returns:
+        2d numpy array of mask
+    """
+    labels = sorted(labels)  # type: ignore
+    # Class number of each label of the store, 0 for the unknown labels
+    class_numbers = np.array(
+        [labels.index(label) + 1 if label in labels and not label.is_empty else 0 for label in store.labels],
+        dtype=np.int64,
+    ).reshape(-1)
+    label_classes = class_numbers[store.label_indices]
+    mask = np.zeros(shape=(height, width), dtype=np.uint8)
+    for index in range(len(store)):
+        annotation_classes = label_classes[store.label_offsets[index] : store.label_offsets[index + 1]]
+        known_classes = annotation_classes[annotation_classes > 0]
+        if len(known_classes) == 0:
+            # Skip unknown shapes
+            continue
+
+        class_idx = int(known_classes[0])
+        contour = (store.get_polygon(index) * [width, height]).astype(np.int64)
+        mask = cv2.drawContours(mask, np.asarray([contour]), 0, (class_idx, class_idx, class_idx), -1)
+
+    mask = np.expand_dims(mask, axis=2)
+
+    return mask
+
+
 def create_hard_prediction_from_soft_prediction(
     soft_prediction: np.ndarray, soft_threshold: float, blur_strength: int = 5
 ) -> np.ndarray:
@@ -134,39 +231,48 @@ Contour = List[Tuple[float, float]]
 
 def get_subcontours(contour: Contour) -> List[Contour]:
     """Splits contour into subcontours that do not have self intersections."""
+    return [
+        [(float(x), float(y)) for x, y in subcontour.tolist()] for subcontour in _split_contour(np.asarray(contour))
+    ]
 
-    ContourInternal = List[Optional[Tuple[float, float]]]
-
-    def find_loops(points: ContourInternal) -> List[Sequence[int]]:
-        """For each consecutive pair of equivalent rows in the input matrix returns their indices."""
-        _, inverse, count = np.unique(points, axis=0, return_inverse=True, return_counts=True)
-        duplicates = np.where(count > 1)[0]
-        indices = []
-        for x in duplicates:
-            y = np.nonzero(inverse == x)[0]
-            for i, _ in enumerate(y[:-1]):
-                indices.append(y[i : i + 2])
-        return indices
 
-    base_contour = cast(ContourInternal, copy(contour))
+def _split_contour(contour: np.ndarray) -> List[np.ndarray]:
+    """Splits a (N, 2) array of points into subcontours that do not have self intersections.
 
+    Each pair of consecutive occurrences of a point closes a loop, and the loops are cut out of the contour from the
+    last one, so that the inner loops are removed from the outer ones. Subcontours with less than 3 points are dropped.
+    """
     # Make sure that contour is closed.
-    if not np.array_equal(base_contour[0], base_contour[-1]):
-        base_contour.append(base_contour[0])
-
-    subcontours: List[Contour] = []
-    loops = sorted(find_loops(base_contour), key=lambda x: x[0], reverse=True)
-    for loop in loops:
-        i, j = loop
-        subcontour = base_contour[i:j]
-        subcontour = list(x for x in subcontour if x is not None)
-        subcontours.append(cast(Contour, subcontour))
-        base_contour[i:j] = [None] * (j - i)
-
-    subcontours = [i for i in subcontours if len(i) > 2]
+    if not np.array_equal(contour[0], contour[-1]):
+        contour = np.concatenate([contour, contour[:1]])
+
+    if np.issubdtype(contour.dtype, np.integer) and contour.min() >= 0:
+        point_ids = contour[:, 0].astype(np.int64) * (int(contour[:, 1].max()) + 1) + contour[:, 1]
+    else:
+        _, point_ids = np.unique(contour, axis=0, return_inverse=True)
+        point_ids = point_ids.ravel()
+    # The stable sort keeps the occurrences of each point in the contour order
+    order = np.argsort(point_ids, kind="stable")
+    repeated = np.flatnonzero(point_ids[order[1:]] == point_ids[order[:-1]])
+    loop_starts, loop_ends = order[repeated], order[repeated + 1]
+
+    remaining = np.ones(len(contour), dtype=bool)
+    subcontours = []
+    for loop in np.argsort(loop_starts)[::-1]:
+        i, j = loop_starts[loop], loop_ends[loop]
+        subcontour = contour[i:j][remaining[i:j]]
+        remaining[i:j] = False
+        if len(subcontour) > 2:
+            subcontours.append(subcontour)
     return subcontours
 
 
+def _get_doubled_area(contour: np.ndarray) -> int:
+    """Returns twice the signed area of a polygon of integer points, computed exactly with the shoelace formula."""
+    x, y = contour[:, 0].astype(np.int64), contour[:, 1].astype(np.int64)
+    return int(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
 def create_annotation_from_segmentation_map(
     hard_prediction: np.ndarray, soft_prediction: np.ndarray, label_map: dict
 ) -> List[Annotation]:
@@ -192,7 +298,6 @@ def create_annotation_from_segmentation_map(
     """
     # pylint: disable=too-many-locals
     height, width = hard_prediction.shape[:2]
-    img_class = hard_prediction.swapaxes(0, 1)
 
     # pylint: disable=too-many-nested-blocks
     annotations: List[Annotation] = []
@@ -207,8 +312,7 @@ def create_annotation_from_segmentation_map(
         else:
             current_label_soft_prediction = soft_prediction
 
-        obj_group = img_class == label_index
-        label_index_map = (obj_group.T.astype(int) * 255).astype(np.uint8)
+        label_index_map = (hard_prediction == label_index).astype(np.uint8) * 255
 
         # Contour retrieval mode CCOMP (Connected components) creates a two-level
         # hierarchy of contours
@@ -218,28 +322,23 @@ def create_annotation_from_segmentation_map(
             for contour, hierarchy in zip(contours, hierarchies[0]):
                 if hierarchy[3] == -1:
                     # In this case a contour does not represent a hole
-                    contour = list((point[0][0], point[0][1]) for point in contour)
-
                     # Split contour into subcontours that do not have self intersections.
-                    subcontours = get_subcontours(contour)
+                    subcontours = _split_contour(contour[:, 0, :])
 
                     for subcontour in subcontours:
-                        # compute probability of the shape
-                        mask = np.zeros(hard_prediction.shape, dtype=np.uint8)
-                        cv2.drawContours(
-                            mask,
-                            np.asarray([[[x, y]] for x, y in subcontour]),
-                            contourIdx=-1,
-                            color=1,
-                            thickness=-1,
+                        # The probability of the shape is the mean soft prediction of the distinct pixels of its
+                        # outline, gathered directly instead of being drawn on a full-frame mask
+                        pixels = np.unique(subcontour[:, 1].astype(np.int64) * width + subcontour[:, 0])
+                        probability = float(
+                            np.mean(current_label_soft_prediction[pixels // width, pixels % width], dtype=np.float64)
                         )
-                        probability = cv2.mean(current_label_soft_prediction, mask)[0]
 
                         # convert the list of points to a closed polygon
-                        points = [Point(x=x / width, y=y / height) for x, y in subcontour]
+                        points = [Point(x=x, y=y) for x, y in (subcontour / (width, height)).tolist()]
                         polygon = Polygon(points=points)
 
-                        if polygon.get_area() > 0:
+                        # The integer area of the outline is exact, and shapely is only needed when it is zero
+                        if _get_doubled_area(subcontour) != 0 or polygon.get_area() > 0:
                             # Contour is a closed polygon with area > 0
                             annotations.append(
                                 Annotation(
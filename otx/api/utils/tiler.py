@@ -6,13 +6,16 @@
 
 import copy
 from itertools import product
-from typing import Any, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 from otx.api.utils.detection_utils import detection2array
 from otx.api.utils.nms import multiclass_nms
 
+# OpenVINO plugin config for the models running several infer requests concurrently
+ASYNC_PLUGIN_CONFIG = {"PERFORMANCE_HINT": "THROUGHPUT"}
+
 
 class Tiler:
     """Tile Image into (non)overlapping Patches. Images are tiled in order to efficiently process large images.
@@ -22,6 +25,11 @@ class Tiler:
         overlap: Overlap between adjacent tile
         max_number: max number of prediction per image
         segm: enable instance segmentation mask output
+        num_requests: number of tiles inferred concurrently. If greater than 1, the tiles are inferred asynchronously,
+            so the model adapter should have been created with at least as many infer requests. Defaults to 1.
+        skip_threshold: enable the coarse-to-fine mode if greater than 0. The full image is inferred first, and the
+            tiles which neither overlap a detection of the full image nor reach this saliency score (between 0 and
+            1) are skipped. Higher values skip more tiles, trading recall for speed. Defaults to 0.
     """
 
     def __init__(
@@ -31,6 +39,8 @@ class Tiler:
         max_number: int,
         model: Any,
         segm: bool = False,
+        num_requests: int = 1,
+        skip_threshold: float = 0.0,
     ) -> None:
         self.tile_size = tile_size
         self.overlap = overlap
@@ -38,6 +48,12 @@ class Tiler:
         self.max_number = max_number
         self.model = model
         self.segm = segm
+        self.num_requests = num_requests
+        self.skip_threshold = skip_threshold
+        self.async_pipeline: Optional[Any] = None
+        # Statistics accumulated over the predicted images
+        self.num_tiles = 0
+        self.num_skipped_tiles = 0
 
     def tile(self, image: np.ndarray) -> List[List[int]]:
         """Tiles an input image to either overlapping, non-overlapping or random patches.
@@ -68,15 +84,20 @@ class Tiler:
             detection: prediction results
             features: saliency map and feature vector
         """
-        detections = np.empty((0, 6), dtype=np.float32)
-        features = (None, None)
         masks: List[np.ndarray] = []
-        for i, coord in enumerate(self.tile(image)):
-            feats, output = self.predict_tile(image, coord, masks, i == 0)
-            detections = np.append(detections, output, axis=0)
-            # cache full image feature vector and saliency map at 0 index
-            if i == 0:
-                features = copy.deepcopy(feats)
+        coords = self.tile(image)
+        predict_tiles = self.predict_tiles_async if self.num_requests > 1 else self.predict_tiles_sync
+        if self.skip_threshold > 0:
+            # Coarse pass on the full image, which selects the tiles inferred at full resolution
+            features, full_output = self.predict_tile(image, coords[0], masks, return_features=True)
+            tile_coords = self.select_tiles(coords[1:], full_output, features[1], image.shape)
+            outputs, _ = predict_tiles(image, masks, tile_coords)
+            outputs.insert(0, full_output)
+            self.num_skipped_tiles += len(coords) - 1 - len(tile_coords)
+        else:
+            outputs, features = predict_tiles(image, masks, coords)
+        self.num_tiles += len(coords) - 1
+        detections = np.concatenate([np.empty((0, 6), dtype=np.float32)] + outputs, axis=0)
 
         if np.prod(detections.shape):
             detections, keep = multiclass_nms(detections, max_num=self.max_number)
@@ -86,6 +107,144 @@ class Tiler:
                 detections = *Tiler.detection2tuple(detections), masks
         return detections, features
 
+    def select_tiles(
+        self,
+        coords: List[List[int]],
+        full_output: np.ndarray,
+        saliency_map: Optional[np.ndarray],
+        shape: Tuple[int, ...],
+    ) -> List[List[int]]:
+        """Select the tiles worth inferring at full resolution from the prediction on the full image.
+
+        A tile is selected if it overlaps a box detected on the full image, or if the saliency map reaches
+        skip_threshold inside it. Without saliency map, all the tiles are selected.
+
+        Args:
+            coords (List): tile coordinates
+            full_output (np.ndarray): predictions on the full image, with the boxes in the last 4 columns
+            saliency_map (Optional[np.ndarray]): saliency map of the full image, per class or class-agnostic
+            shape (Tuple): full-res image shape
+
+        Returns:
+            Coordinates of the selected tiles
+        """
+        if saliency_map is None or len(coords) == 0:
+            return coords
+        tiles = np.asarray(coords, dtype=np.float32)
+        boxes = full_output[:, -4:]
+        overlaps = (
+            (tiles[:, None, 0] < boxes[None, :, 2])
+            & (boxes[None, :, 0] < tiles[:, None, 2])
+            & (tiles[:, None, 1] < boxes[None, :, 3])
+            & (boxes[None, :, 1] < tiles[:, None, 3])
+        )
+        selected = overlaps.any(axis=1)
+
+        saliency = saliency_map.max(axis=0) if saliency_map.ndim == 3 else saliency_map
+        scale = 255.0 if saliency.dtype == np.uint8 else 1.0
+        map_height, map_width = saliency.shape
+        scales = np.array([map_width / shape[1], map_height / shape[0]] * 2)
+        cells = tiles * scales
+        cells[:, :2] = np.floor(cells[:, :2])
+        cells[:, 2:] = np.maximum(np.ceil(cells[:, 2:]), cells[:, :2] + 1)
+        for i, (x1, y1, x2, y2) in enumerate(cells.astype(np.int64)):
+            if not selected[i]:
+                selected[i] = saliency[y1:y2, x1:x2].max() / scale >= self.skip_threshold
+        return [coord for coord, keep in zip(coords, selected) if keep]
+
+    def predict_tiles_sync(
+        self, image: np.ndarray, masks: List[np.ndarray], coords: List[List[int]]
+    ) -> Tuple[List[np.ndarray], Tuple]:
+        """Predict on the tiles one by one.
+
+        Args:
+            image (np.ndarray): full size image
+            masks (List): list of raw np.ndarray masks, extended with the masks of all the tiles
+            coords (List): tile coordinates
+
+        Returns:
+            outputs: predictions of each tile
+            features: saliency map and feature vector of the first tile, i.e. the full image
+        """
+        outputs = []
+        features: Tuple[Any, ...] = (None, None)
+        for i, coord in enumerate(coords):
+            feats, output = self.predict_tile(image, coord, masks, i == 0)
+            outputs.append(output)
+            # cache full image feature vector and saliency map at 0 index
+            if i == 0:
+                features = copy.deepcopy(feats)
+        return outputs, features
+
+    def predict_tiles_async(
+        self, image: np.ndarray, masks: List[np.ndarray], coords: List[List[int]]
+    ) -> Tuple[List[np.ndarray], Tuple]:
+        """Predict on the tiles asynchronously, keeping up to num_requests tiles in flight.
+
+        The completed tiles are post-processed in order while the next ones are inferred.
+
+        Args:
+            image (np.ndarray): full size image
+            masks (List): list of raw np.ndarray masks, extended with the masks of all the tiles
+            coords (List): tile coordinates
+
+        Returns:
+            outputs: predictions of each tile
+            features: saliency map and feature vector of the first tile, i.e. the full image
+        """
+        if self.async_pipeline is None:
+            # The OpenVINO model API is only required for asynchronous inference
+            from openvino.model_zoo.model_api.pipelines import (  # pylint: disable=import-outside-toplevel
+                AsyncPipeline,
+            )
+
+            self.async_pipeline = AsyncPipeline(self.model)
+        else:
+            # The pipeline is reused across images, while other users of the model may have replaced its callback
+            self.model.model_adapter.set_callback(self.async_pipeline.callback)
+        outputs: List[np.ndarray] = []
+        features: Tuple[Any, ...] = (None, None)
+
+        def postprocess_completed_tiles():
+            nonlocal features
+            while len(outputs) < len(coords):
+                result = self.async_pipeline.get_raw_result(len(outputs))
+                if result is None:
+                    return
+                raw_predictions, meta, tile_meta, _ = result
+                if self.segm:
+                    tile_meta["resize_mask"] = False
+                output = self.model.postprocess(raw_predictions, tile_meta)
+                outputs.append(self.postprocess_tile(output, *meta["coord"][:2], masks))
+                # cache full image feature vector and saliency map at 0 index
+                if len(outputs) == 1:
+                    features = self.get_features(raw_predictions)
+
+        for i, coord in enumerate(coords):
+            x1, y1, x2, y2 = coord
+            self.async_pipeline.submit_data(image[y1:y2, x1:x2], i, {"coord": coord})
+            postprocess_completed_tiles()
+        self.async_pipeline.await_all()
+        postprocess_completed_tiles()
+        return outputs, features
+
+    @staticmethod
+    def get_features(raw_predictions: Dict[str, np.ndarray]) -> Tuple:
+        """Extract the saliency map and the feature vector from the raw predictions, if the model outputs them.
+
+        Args:
+            raw_predictions (Dict[str, np.ndarray]): raw predictions of the model
+
+        Returns:
+            features: saliency map and feature vector
+        """
+        if "feature_vector" in raw_predictions or "saliency_map" in raw_predictions:
+            return (
+                raw_predictions["feature_vector"].reshape(-1),
+                raw_predictions["saliency_map"][0],
+            )
+        return (None, None)
+
     def resize_masks(self, masks: List, dets: np.ndarray, shape: List[int]):
         """Resize Masks.
 
@@ -116,17 +275,13 @@ class Tiler:
             features: saliency map and feature vector
             output: single tile prediction
         """
-        features = (None, None)
+        features: Tuple[Any, ...] = (None, None)
         offset_x, offset_y, tile_dict, tile_meta = self.preprocess_tile(image, coord)
         raw_predictions = self.model.infer_sync(tile_dict)
         output = self.model.postprocess(raw_predictions, tile_meta)
         output = self.postprocess_tile(output, offset_x, offset_y, masks)
         if return_features:
-            if "feature_vector" in raw_predictions or "saliency_map" in raw_predictions:
-                features = (
-                    raw_predictions["feature_vector"].reshape(-1),
-                    raw_predictions["saliency_map"][0],
-                )
+            features = self.get_features(raw_predictions)
         return features, output
 
     def postprocess_tile(
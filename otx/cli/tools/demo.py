@@ -79,7 +79,10 @@ def get_args():
 
 
 def get_predictions(task, frame):
-    """Returns list of predictions made by task on frame and time spent on doing prediction."""
+    """Returns list of predictions made by task on frame and time spent on doing prediction.
+
+    The task can also be the inference session of a task, which keeps its model alive between the frames.
+    """
 
     empty_annotation = AnnotationSceneEntity(annotations=[], kind=AnnotationSceneKind.PREDICTION)
 
@@ -132,6 +135,8 @@ def main():
     environment.model = read_model(environment.get_model_configuration(), args.load_weights, None)
 
     task = task_class(task_environment=environment)
+    # The PyTorch tasks keep their model alive between the frames in an inference session
+    predictor = task.open_inference_session() if hasattr(task, "open_inference_session") else task
 
     capture = open_images_capture(args.input, args.loop)
 
@@ -142,7 +147,7 @@ def main():
         if frame is None:
             break
 
-        predictions, elapsed_time = get_predictions(task, frame)
+        predictions, elapsed_time = get_predictions(predictor, frame)
         elapsed_times.append(elapsed_time)
         elapsed_time = np.mean(elapsed_times)
 
@@ -162,6 +167,8 @@ def main():
         else:
             print(f"{frame_index=}, {elapsed_time=}, {len(predictions)=}")
 
+    if predictor is not task:
+        predictor.close()
     return dict(retcode=0, template=template.name)
 
 
@@ -29,7 +29,7 @@ from otx.cli.utils.parser import (
     add_hyper_parameters_sub_parser,
     get_parser_and_hprams_data,
 )
-from otx.core.data.adapter import get_dataset_adapter
+from otx.core.data.adapter import get_otx_dataset_and_label_schema
 
 # pylint: disable=too-many-locals
 
@@ -56,6 +56,17 @@ def get_args():
         help="Location where the intermediate output of the task will be stored.",
         default=None,
     )
+    parser.add_argument(
+        "--data-cache-dir",
+        type=str,
+        default=None,
+        help="Directory to cache the converted dataset in, so that it is reused by the next runs on the same data.",
+    )
+    parser.add_argument(
+        "--invalidate-data-cache",
+        action="store_true",
+        help="Convert the dataset again instead of loading it from the dataset cache.",
+    )
 
     add_hyper_parameters_sub_parser(parser, hyper_parameters, modes=("INFERENCE",))
     override_param = [f"params.{param[2:].split('=')[0]}" for param in params if param.startswith("--")]
@@ -107,8 +118,9 @@ def main():
     # Auto-Configuration for Dataset configuration
     config_manager.configure_data_config(update_data_yaml=config_manager.check_workspace())
     dataset_config = config_manager.get_dataset_config(subsets=["test"])
-    dataset_adapter = get_dataset_adapter(**dataset_config)
-    dataset, label_schema = dataset_adapter.get_otx_dataset(), dataset_adapter.get_label_schema()
+    dataset, label_schema = get_otx_dataset_and_label_schema(
+        **dataset_config, cache_dir=args.data_cache_dir, invalidate_cache=args.invalidate_data_cache
+    )
 
     environment = TaskEnvironment(
         model=None,
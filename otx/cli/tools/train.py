@@ -18,6 +18,7 @@
 
 from pathlib import Path
 
+from otx.api.entities.image import get_decoded_image_cache, set_decoded_image_cache
 from otx.api.entities.inference_parameters import InferenceParameters
 from otx.api.entities.model import ModelEntity
 from otx.api.entities.model_template import TaskType
@@ -27,16 +28,17 @@ from otx.api.entities.task_environment import TaskEnvironment
 from otx.api.entities.train_parameters import TrainParameters
 from otx.api.serialization.label_mapper import label_schema_to_bytes
 from otx.api.usecases.adapters.model_adapter import ModelAdapter
+from otx.api.utils.image_cache import SharedImageCache
 from otx.cli.manager import ConfigManager
 from otx.cli.utils.hpo import run_hpo
 from otx.cli.utils.importing import get_impl_class
 from otx.cli.utils.io import read_binary, read_label_schema, save_model_data
-from otx.cli.utils.multi_gpu import MultiGPUManager
+from otx.cli.utils.multi_gpu import MultiCPUManager, MultiGPUManager
 from otx.cli.utils.parser import (
     add_hyper_parameters_sub_parser,
     get_parser_and_hprams_data,
 )
-from otx.core.data.adapter import get_dataset_adapter
+from otx.core.data.adapter import get_otx_dataset_and_label_schema
 
 
 def get_args():
@@ -87,12 +89,31 @@ def get_args():
         type=float,
         help="Expected ratio of total time to run HPO to time taken for full fine-tuning.",
     )
+    parser.add_argument(
+        "--hpo-shared-image-cache",
+        action="store_true",
+        help="Cache the decoded images on disk in the HPO directory, so that they are shared by all the HPO trials.",
+    )
+    parser.add_argument(
+        "--decoded-image-cache-size",
+        type=int,
+        default=0,
+        help="Size in MB of the in-memory cache of the decoded images, shared by the data loader workers. "
+        "The images are decoded on every epoch if it is 0.",
+    )
     parser.add_argument(
         "--gpus",
         type=str,
         help="Comma-separated indices of GPU. \
               If there are more than one available GPU, then model is trained with multi GPUs.",
     )
+    parser.add_argument(
+        "--cpu-procs",
+        type=int,
+        default=0,
+        help="Number of processes for multi-process training on CPU. The CPU cores are split between the processes. \
+              It is ignored if --gpus is given.",
+    )
     parser.add_argument(
         "--rdzv-endpoint",
         type=str,
@@ -117,6 +138,17 @@ def get_args():
         default=None,
         help="The data.yaml path want to use in train task.",
     )
+    parser.add_argument(
+        "--data-cache-dir",
+        type=str,
+        default=None,
+        help="Directory to cache the converted dataset in, so that it is reused by the next runs on the same data.",
+    )
+    parser.add_argument(
+        "--invalidate-data-cache",
+        action="store_true",
+        help="Convert the dataset again instead of loading it from the dataset cache.",
+    )
 
     sub_parser = add_hyper_parameters_sub_parser(parser, hyper_parameters, return_sub_parser=True)
     # TODO: Temporary solution for cases where there is no template input
@@ -147,11 +179,15 @@ def main():  # pylint: disable=too-many-branches
     if not config_manager.check_workspace():
         config_manager.build_workspace(new_workspace_path=args.work_dir)
 
+    if args.decoded_image_cache_size > 0:
+        set_decoded_image_cache(SharedImageCache(args.decoded_image_cache_size * 1024 * 1024))
+
     # Auto-Configuration for Dataset configuration
     config_manager.configure_data_config(update_data_yaml=config_manager.check_workspace())
     dataset_config = config_manager.get_dataset_config(subsets=["train", "val", "unlabeled"])
-    dataset_adapter = get_dataset_adapter(**dataset_config)
-    dataset, label_schema = dataset_adapter.get_otx_dataset(), dataset_adapter.get_label_schema()
+    dataset, label_schema = get_otx_dataset_and_label_schema(
+        **dataset_config, cache_dir=args.data_cache_dir, invalidate_cache=args.invalidate_data_cache
+    )
 
     # Get classes for Task, ConfigurableParameters and Dataset.
     template = config_manager.template
@@ -193,8 +229,12 @@ def main():  # pylint: disable=too-many-branches
 
     task = task_class(task_environment=environment, output_path=args.work_dir)
 
+    multigpu_manager = None
     if args.gpus:
         multigpu_manager = MultiGPUManager(main, args.gpus, args.rdzv_endpoint, args.base_rank, args.world_size)
+    elif args.cpu_procs:
+        multigpu_manager = MultiCPUManager(main, args.cpu_procs, args.rdzv_endpoint, args.base_rank, args.world_size)
+    if multigpu_manager is not None:
         if template.task_type in (TaskType.ACTION_CLASSIFICATION, TaskType.ACTION_DETECTION):
             print("Multi-GPU training for action tasks isn't supported yet. A single GPU will be used for a training.")
         elif (
@@ -209,6 +249,9 @@ def main():  # pylint: disable=too-many-branches
 
     save_model_data(output_model, args.save_model_to)
     print(f"[*] Save Model to: {args.save_model_to}")
+    decoded_image_cache = get_decoded_image_cache()
+    if decoded_image_cache is not None:
+        print(f"[*] Decoded image cache: {decoded_image_cache.stats()}")
 
     if config_manager.data_config["val_subset"]["data_root"]:
         validation_dataset = dataset.get_subset(Subset.VALIDATION)
@@ -228,7 +271,7 @@ def main():  # pylint: disable=too-many-branches
 
     task.cleanup()
 
-    if args.gpus:
+    if multigpu_manager is not None:
         multigpu_manager.finalize()
 
     return dict(retcode=0, template=template.name)
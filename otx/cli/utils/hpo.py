@@ -14,13 +14,14 @@ from functools import partial
 from inspect import isclass
 from math import floor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import torch
 import yaml
 
 from otx.api.configuration.helper import create
 from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.label_schema import LabelSchemaEntity
 from otx.api.entities.model import ModelEntity
 from otx.api.entities.model_template import TaskType
 from otx.api.entities.subset import Subset
@@ -29,10 +30,14 @@ from otx.api.entities.train_parameters import TrainParameters, UpdateProgressCal
 from otx.cli.utils.importing import get_impl_class
 from otx.cli.utils.io import read_model, save_model_data
 from otx.core.data.adapter import get_dataset_adapter
-from otx.hpo import HyperBand, TrialStatus, run_hpo_loop
+from otx.core.data.caching import DatasetCache
+from otx.hpo import BOHB, HyperBand, TrialStatus, run_hpo_loop
 
 logger = logging.getLogger(__name__)
 
+# Key of the dataset shared by the HPO trials in the dataset cache of the HPO work directory
+SHARED_DATASET_KEY = "hpo_dataset"
+
 
 def _check_hpo_enabled_task(task_type):
     return task_type in [
@@ -446,12 +451,24 @@ class HpoRunner:
                 self._fixed_hp[batch_size_name] = self._train_dataset_size
                 self._environment.set_hyper_parameter_using_str_key(self._fixed_hp)
 
-    def run_hpo(self, train_func: Callable, data_roots: Dict[str, str]) -> Dict[str, Any]:
+    def run_hpo(
+        self,
+        train_func: Callable,
+        data_roots: Dict[str, str],
+        dataset: Optional[DatasetEntity] = None,
+        share_image_cache: bool = False,
+    ) -> Dict[str, Any]:
         """Run HPO and provides optimized hyper parameters.
 
         Args:
             train_func (Callable): training model function
             data_roots (Dict[str, str]): dataset path of each dataset type
+            dataset (Optional[DatasetEntity], optional): dataset already converted from the data roots. If given, it
+                                                         is saved once in the HPO work directory, and the trials
+                                                         memory-map it instead of converting the data roots again.
+                                                         Defaults to None.
+            share_image_cache (bool, optional): Whether the trials share an on-disk cache of the decoded images in
+                                                the HPO work directory. Defaults to False.
 
         Returns:
             Dict[str, Any]: optimized hyper parameters
@@ -469,6 +486,8 @@ class HpoRunner:
                 hpo_workdir=self._hpo_workdir,
                 initial_weight_name=self._initial_weight_name,
                 metric=self._hpo_config["metric"],
+                shared_dataset_dir=self._share_dataset(dataset) if dataset is not None else None,
+                image_cache_dir=str(self._hpo_workdir / "image_cache") if share_image_cache else None,
             ),
             resource_type,  # type: ignore
         )
@@ -478,6 +497,15 @@ class HpoRunner:
 
         return best_config
 
+    def _share_dataset(self, dataset: DatasetEntity) -> Optional[str]:
+        shared_dataset_dir = str(self._hpo_workdir / "dataset")
+        if DatasetCache(shared_dataset_dir).save(
+            SHARED_DATASET_KEY, dataset, self._environment.environment.label_schema
+        ):
+            return shared_dataset_dir
+        logger.info("The dataset can't be shared by the HPO trials. Each trial will convert the dataset again.")
+        return None
+
     def _restore_fixed_hp(self, hyper_parameter: Dict[str, Any]):
         for key, val in self._fixed_hp.items():
             hyper_parameter[key] = val
@@ -495,7 +523,19 @@ class HpoRunner:
         return hpo_algo
 
     def _prepare_asha(self):
-        args = {
+        args = self._get_hyperband_args()
+        logger.debug(f"ASHA args = {args}")
+
+        return HyperBand(**args)
+
+    def _prepare_smbo(self):
+        args = self._get_hyperband_args()
+        logger.debug(f"BOHB args = {args}")
+
+        return BOHB(**args)
+
+    def _get_hyperband_args(self) -> Dict[str, Any]:
+        return {
             "search_space": self._hpo_config["hp_space"],
             "save_path": str(self._hpo_workdir),
             "maximum_resource": self._hpo_config.get("maximum_resource"),
@@ -512,13 +552,6 @@ class HpoRunner:
             "asynchronous_sha": torch.cuda.device_count() != 1,
         }
 
-        logger.debug(f"ASHA args = {args}")
-
-        return HyperBand(**args)
-
-    def _prepare_smbo(self):
-        raise NotImplementedError
-
     def _get_default_hyper_parameters(self):
         default_hyper_parameters = {}
         hp_from_env = self._environment.get_dict_type_hyper_parameter()
@@ -564,7 +597,7 @@ def run_hpo(
     )
 
     logger.info("started hyper-parameter optimization")
-    best_config = hpo_runner.run_hpo(run_trial, data_roots)
+    best_config = hpo_runner.run_hpo(run_trial, data_roots, dataset, args.hpo_shared_image_cache)
     logger.info("completed hyper-parameter optimization")
 
     env_manager = TaskEnvironmentManager(environment)
@@ -631,6 +664,10 @@ class Trainer:
         hpo_workdir (Union[str, Path]): work directory for HPO
         initial_weight_name (str): initial model weight name for each trials to load
         metric (str): metric name
+        shared_dataset_dir (Optional[str]): dataset cache directory holding the dataset shared by the HPO trials.
+                                            If None or if the dataset can't be loaded, it's converted from data_roots.
+        image_cache_dir (Optional[str]): directory of the decoded image cache shared by the HPO trials.
+                                         If None, the images aren't shared.
     """
 
     # pylint: disable=too-many-arguments, too-many-instance-attributes
@@ -645,6 +682,8 @@ class Trainer:
         hpo_workdir: Union[str, Path],
         initial_weight_name: str,
         metric: str,
+        shared_dataset_dir: Optional[str] = None,
+        image_cache_dir: Optional[str] = None,
     ):
         self._hp_config = hp_config
         self._report_func = report_func
@@ -654,18 +693,17 @@ class Trainer:
         self._hpo_workdir: Path = Path(hpo_workdir)
         self._initial_weight_name = initial_weight_name
         self._metric = metric
+        self._shared_dataset_dir = shared_dataset_dir
+        self._image_cache_dir = image_cache_dir
         self._epoch = floor(self._hp_config["configuration"]["iterations"])
         del self._hp_config["configuration"]["iterations"]
 
     def run(self):
         """Run each training of each trial with given hyper parameters."""
         hyper_parameters = self._prepare_hyper_parameter()
-        dataset_adapter = self._prepare_dataset_adapter()
-
-        dataset = dataset_adapter.get_otx_dataset()
+        dataset, label_schema = self._prepare_dataset()
         dataset = HpoDataset(dataset, self._hp_config)
-
-        label_schema = dataset_adapter.get_label_schema()
+        self._prepare_image_cache()
 
         environment = self._prepare_environment(hyper_parameters, label_schema)
         self._set_hyper_parameter(environment)
@@ -693,6 +731,26 @@ class Trainer:
     def _prepare_hyper_parameter(self):
         return create(self._model_template.hyper_parameters.data)
 
+    def _prepare_dataset(self) -> Tuple[DatasetEntity, LabelSchemaEntity]:
+        if self._shared_dataset_dir is not None:
+            shared_dataset = DatasetCache(self._shared_dataset_dir).load(SHARED_DATASET_KEY)
+            if shared_dataset is not None:
+                return shared_dataset
+            logger.warning("Can't load the dataset shared by the HPO trials. The dataset will be converted again.")
+
+        dataset_adapter = self._prepare_dataset_adapter()
+        dataset = dataset_adapter.get_otx_dataset()
+        return dataset, dataset_adapter.get_label_schema()
+
+    def _prepare_image_cache(self):
+        if self._image_cache_dir is None:
+            return
+        # pylint: disable=import-outside-toplevel
+        from otx.algorithms.common.utils.data import set_default_image_cache
+        from otx.algorithms.common.utils.image_cache import PersistentImageCache
+
+        set_default_image_cache(PersistentImageCache(self._image_cache_dir))
+
     def _prepare_dataset_adapter(self):
         dataset_adapter = get_dataset_adapter(
             self._task.task_type,
@@ -771,6 +829,8 @@ def run_trial(
     hpo_workdir: Union[str, Path],
     initial_weight_name: str,
     metric: str,
+    shared_dataset_dir: Optional[str] = None,
+    image_cache_dir: Optional[str] = None,
 ):
     """Function to train a model given hyper parameters.
 
@@ -783,10 +843,21 @@ def run_trial(
         hpo_workdir (Union[str, Path]): work directory for HPO
         initial_weight_name (str): initial model weight name for each trials to load
         metric (str): metric name
+        shared_dataset_dir (Optional[str]): dataset cache directory holding the dataset shared by the HPO trials
+        image_cache_dir (Optional[str]): directory of the decoded image cache shared by the HPO trials
     """
     # pylint: disable=too-many-arguments
     trainer = Trainer(
-        hp_config, report_func, model_template, data_roots, task_type, hpo_workdir, initial_weight_name, metric
+        hp_config,
+        report_func,
+        model_template,
+        data_roots,
+        task_type,
+        hpo_workdir,
+        initial_weight_name,
+        metric,
+        shared_dataset_dir,
+        image_cache_dir,
     )
     trainer.run()
 
@@ -74,6 +74,29 @@ def get_gpu_ids(gpus: str) -> List[int]:
     return gpu_ids
 
 
+def get_cpu_ids(local_rank: int, local_world_size: int) -> List[int]:
+    """Get CPU cores assigned to a process of multi-process CPU training.
+
+    The CPU cores available to the current process are split into contiguous chunks, one per local process.
+
+    Args:
+        local_rank (int): The rank of worker within a local worker group.
+        local_world_size (int): Number of workers in a local worker group.
+
+    Returns:
+        List[int]:
+            list including CPU core indices for the worker. All the cores if there are less cores than workers.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpu_ids = sorted(os.sched_getaffinity(0))
+    else:
+        cpu_ids = list(range(os.cpu_count() or 1))
+    num_cpus_per_process = len(cpu_ids) // local_world_size
+    if num_cpus_per_process == 0:
+        return cpu_ids
+    return cpu_ids[local_rank * num_cpus_per_process : (local_rank + 1) * num_cpus_per_process]
+
+
 def set_arguments_to_argv(key: str, value: Optional[str] = None, after_params: bool = False):
     """Add arguments at proper position in `sys.argv`.
 
@@ -110,6 +133,9 @@ class MultiGPUManager:
         world_size (int): Total number of workers in a worker group.
     """
 
+    # argument of the device to use, which child processes don't get
+    _device_argument = "--gpus"
+
     def __init__(
         self,
         train_func: Callable,
@@ -127,7 +153,7 @@ class MultiGPUManager:
         rdzv_endpoint = f"{host}:{port}"
 
         self._train_func = train_func
-        self._gpu_ids = get_gpu_ids(gpu_ids)
+        self._gpu_ids = self._get_local_ids(gpu_ids)
         self._rdzv_endpoint = rdzv_endpoint
         self._base_rank = base_rank
         if world_size == 0:
@@ -145,6 +171,9 @@ class MultiGPUManager:
         """
         return len(self._gpu_ids) > 1
 
+    def _get_local_ids(self, gpu_ids: str) -> List[int]:
+        return get_gpu_ids(gpu_ids)
+
     def setup_multi_gpu_train(
         self,
         output_path: str,
@@ -203,8 +232,9 @@ class MultiGPUManager:
         dist.init_process_group(backend="nccl", world_size=world_size, rank=rank)
         logger.info(f"dist info world_size = {dist.get_world_size()}, rank = {dist.get_rank()}")
 
-    @staticmethod
+    @classmethod
     def run_child_process(
+        cls,
         train_func: Callable,
         output_path: str,
         rdzv_endpoint: str,
@@ -228,17 +258,17 @@ class MultiGPUManager:
         # initialize start method
         mp.set_start_method(method=None, force=True)
 
-        gpus_arg_idx = sys.argv.index("--gpus")
+        device_arg_idx = sys.argv.index(cls._device_argument)
         for _ in range(2):
-            sys.argv.pop(gpus_arg_idx)
+            sys.argv.pop(device_arg_idx)
         if "--enable-hpo" in sys.argv:
             sys.argv.remove("--enable-hpo")
         set_arguments_to_argv("--work-dir", output_path)
         set_arguments_to_argv("--rdzv-endpoint", rdzv_endpoint)
 
-        MultiGPUManager.initialize_multigpu_train(rdzv_endpoint, rank, local_rank, gpu_ids, world_size)
+        cls.initialize_multigpu_train(rdzv_endpoint, rank, local_rank, gpu_ids, world_size)
 
-        threading.Thread(target=MultiGPUManager.check_parent_processes_alive, daemon=True).start()
+        threading.Thread(target=cls.check_parent_processes_alive, daemon=True).start()
 
         train_func()
 
@@ -260,7 +290,7 @@ class MultiGPUManager:
         ctx = mp.get_context("spawn")
         for rank in range(1, len(self._gpu_ids)):
             task_p = ctx.Process(
-                target=MultiGPUManager.run_child_process,
+                target=self.run_child_process,
                 args=(
                     self._train_func,
                     output_path,
@@ -321,3 +351,74 @@ class MultiGPUManager:
         logger.warning("Some of child processes are terminated abnormally. process exits.")
         self._kill_child_process()
         os.kill(self._main_pid, signal.SIGKILL)
+
+
+class MultiCPUManager(MultiGPUManager):
+    """Class to manage multi-process data parallel training on CPU.
+
+    Each process trains on its own shard of the dataset with the gloo backend, and its threads are pinned
+    to its own share of the CPU cores.
+
+    Args:
+        train_func (Callable): model training function.
+        num_processes (int): Number of training processes on the current node.
+        rdzv_endpoint (str): Rendezvous endpoint for multi-node training.
+        base_rank (int): Base rank of the worker.
+        world_size (int): Total number of workers in a worker group.
+    """
+
+    _device_argument = "--cpu-procs"
+
+    def __init__(
+        self,
+        train_func: Callable,
+        num_processes: int,
+        rdzv_endpoint: str = "localhost:0",
+        base_rank: int = 0,
+        world_size: int = 0,
+    ):
+        if num_processes < 1:
+            raise ValueError(f"--cpu-procs should be a positive number. Your value is {num_processes}.")
+        super().__init__(train_func, str(num_processes), rdzv_endpoint, base_rank, world_size)
+
+    def _get_local_ids(self, gpu_ids: str) -> List[int]:
+        return list(range(int(gpu_ids)))
+
+    @staticmethod
+    def initialize_multigpu_train(
+        rdzv_endpoint: str,
+        rank: int,
+        local_rank: int,
+        gpu_ids: List[int],
+        world_size: int,
+    ):
+        """Initilization for multi-process CPU training.
+
+        Args:
+            rdzv_endpoint (str): Rendezvous endpoint for multi-node training.
+            rank (int): The rank of worker within a worker group.
+            local_rank (int): The rank of worker within a local worker group.
+            gpu_ids (List[int]): list including the local ranks of the workers of the current node.
+            world_size (int): Total number of workers in a worker group.
+        """
+
+        host, port = rdzv_endpoint.split(":")
+        os.environ["MASTER_ADDR"] = host
+        os.environ["MASTER_PORT"] = port
+        os.environ["LOCAL_WORLD_SIZE"] = str(len(gpu_ids))
+        os.environ["WORLD_SIZE"] = str(world_size)
+        os.environ["LOCAL_RANK"] = str(local_rank)
+        os.environ["RANK"] = str(rank)
+
+        cpu_ids = get_cpu_ids(local_rank, len(gpu_ids))
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpu_ids)
+        # for the libraries which initialize their thread pools later
+        os.environ["OMP_NUM_THREADS"] = str(len(cpu_ids))
+        torch.set_num_threads(len(cpu_ids))
+
+        dist.init_process_group(backend="gloo", world_size=world_size, rank=rank)
+        logger.info(
+            f"dist info world_size = {dist.get_world_size()}, rank = {dist.get_rank()}, "
+            f"{len(cpu_ids)} threads on CPU cores {cpu_ids}"
+        )
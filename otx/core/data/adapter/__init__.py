@@ -16,9 +16,13 @@
 
 # pylint: disable=too-many-return-statements
 import importlib
+from typing import Optional, Tuple
 
 from otx.algorithms.common.configs.training_base import TrainType
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.label_schema import LabelSchemaEntity
 from otx.api.entities.model_template import TaskType
+from otx.core.data.caching import DatasetCache, get_dataset_cache_key
 
 ADAPTERS = {
     TaskType.CLASSIFICATION: {
@@ -88,6 +92,15 @@ ADAPTERS = {
 }
 
 
+def _get_adapter_info(task_type: TaskType, train_type: TrainType) -> dict:
+    """Returns the module name and class of the dataset adapter for the task type and train type."""
+    train_type_to_be_called = TrainType.INCREMENTAL.value
+    # FIXME : Hardcoded solution for self-sl for seg
+    if task_type == TaskType.SEGMENTATION and train_type == TrainType.SELFSUPERVISED.value:
+        train_type_to_be_called = TrainType.SELFSUPERVISED.value
+    return ADAPTERS[task_type][train_type_to_be_called]
+
+
 def get_dataset_adapter(
     task_type: TaskType,
     train_type: TrainType,
@@ -109,17 +122,75 @@ def get_dataset_adapter(
         unlabeled_data_roots: the path of data root for unlabeled data
     """
 
-    train_type_to_be_called = TrainType.INCREMENTAL.value
-    # FIXME : Hardcoded solution for self-sl for seg
-    if task_type == TaskType.SEGMENTATION and train_type == TrainType.SELFSUPERVISED.value:
-        train_type_to_be_called = TrainType.SELFSUPERVISED.value
+    adapter_info = _get_adapter_info(task_type, train_type)
     module_root = "otx.core.data.adapter."
-    module = importlib.import_module(module_root + ADAPTERS[task_type][train_type_to_be_called]["module_name"])
+    module = importlib.import_module(module_root + adapter_info["module_name"])
+
+    return getattr(module, adapter_info["class"])(
+        task_type=task_type,
+        train_data_roots=train_data_roots,
+        val_data_roots=val_data_roots,
+        test_data_roots=test_data_roots,
+        unlabeled_data_roots=unlabeled_data_roots,
+    )
+
+
+def get_otx_dataset_and_label_schema(
+    task_type: TaskType,
+    train_type: TrainType,
+    train_data_roots: str = None,
+    val_data_roots: str = None,
+    test_data_roots: str = None,
+    unlabeled_data_roots: str = None,
+    cache_dir: Optional[str] = None,
+    invalidate_cache: bool = False,
+) -> Tuple[DatasetEntity, LabelSchemaEntity]:
+    """Returns the converted dataset and its label schema, going through the dataset cache if enabled.
+
+    When a cache directory is given, the dataset is looked up in the cache by a key made of the task type, the
+    dataset adapter and the data roots (including the size and modification time of all their files). On a cache
+    miss, the dataset is imported and converted by the dataset adapter as usual and then saved to the cache.
+
+    Args:
+        task_type: A task type, see get_dataset_adapter().
+        train_type: A train type, see get_dataset_adapter().
+        train_data_roots: the path of data root for training data
+        val_data_roots: the path of data root for validation data
+        test_data_roots: the path of data root for test data
+        unlabeled_data_roots: the path of data root for unlabeled data
+        cache_dir: Directory of the dataset cache. If None, the cache is not used.
+        invalidate_cache: Whether to drop the cached dataset and convert it again.
+    """
+    data_roots = {
+        "train": train_data_roots,
+        "val": val_data_roots,
+        "test": test_data_roots,
+        "unlabeled": unlabeled_data_roots,
+    }
+    cache = None
+    cache_key = ""
+    if cache_dir is not None:
+        cache = DatasetCache(cache_dir)
+        adapter_info = _get_adapter_info(task_type, train_type)
+        cache_key = get_dataset_cache_key(
+            data_roots, task_type=task_type, adapter=f"{adapter_info['module_name']}.{adapter_info['class']}"
+        )
+        if invalidate_cache:
+            cache.invalidate(cache_key)
+        else:
+            cached = cache.load(cache_key)
+            if cached is not None:
+                return cached
 
-    return getattr(module, ADAPTERS[task_type][train_type_to_be_called]["class"])(
+    dataset_adapter = get_dataset_adapter(
         task_type=task_type,
+        train_type=train_type,
         train_data_roots=train_data_roots,
         val_data_roots=val_data_roots,
         test_data_roots=test_data_roots,
         unlabeled_data_roots=unlabeled_data_roots,
     )
+    dataset, label_schema = dataset_adapter.get_otx_dataset(), dataset_adapter.get_label_schema()
+    if cache is not None:
+        cache.save(cache_key, dataset, label_schema)
+    return dataset, label_schema
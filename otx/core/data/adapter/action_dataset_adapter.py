@@ -7,15 +7,15 @@
 # pylint: disable=invalid-name, too-many-locals, no-member
 import os
 import os.path as osp
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from datumaro.components.annotation import AnnotationType
 from datumaro.components.annotation import Bbox as DatumaroBbox
 from datumaro.components.dataset import Dataset as DatumaroDataset
+from datumaro.components.dataset_base import DatasetItem
 
 from otx.api.entities.annotation import Annotation
 from otx.api.entities.dataset_item import DatasetItemEntity
-from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.id import ID
 from otx.api.entities.image import Image
 from otx.api.entities.label import LabelEntity
@@ -139,93 +139,72 @@ class ActionBaseDatasetAdapter(BaseDatasetAdapter):
                 return idx
         return None
 
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Get DatasetEntity.
-
-        Args:
-            datumaro_dataset (dict): A Dictionary that includes subset dataset(DatasetEntity)
-
-        Returns:
-            DatasetEntity:
-        """
-        raise NotImplementedError()
+    def _get_subset_chunks(self) -> List[Tuple[Subset, Iterable]]:
+        """Returns the videos to convert, as a list of (subset, datumaro_items) pairs."""
+        return [
+            (subset, datumaro_items) for subset, subset_data in self.dataset.items() for datumaro_items in subset_data
+        ]
 
 
 class ActionClassificationDatasetAdapter(ActionBaseDatasetAdapter):
     """Action classification adapter inherited by ActionBaseDatasetAdapter and BaseDatasetAdapter."""
 
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Convert DatumaroDataset to DatasetEntity for Acion Classification."""
-        label_information = self._prepare_label_information(self.dataset)
-        self.label_entities = label_information["label_entities"]
-
-        dataset_items: List[DatasetItemEntity] = []
-        for subset, subset_data in self.dataset.items():
-            for datumaro_items in subset_data:
-                for datumaro_item in datumaro_items:
-                    image = Image(file_path=datumaro_item.media.path)
-                    video_name = datumaro_item.media.path.split("/")[-3]
-                    shapes: List[Annotation] = []
-                    for annotation in datumaro_item.annotations:
-                        if annotation.type == AnnotationType.label:
-                            shapes.append(self._get_label_entity(annotation))
-
-                    metadata_item = MetadataItemEntity(
-                        data=VideoMetadata(
-                            video_id=video_name,
-                            frame_idx=int(datumaro_item.media.path.split("/")[-1].split(".")[0].lstrip("0")),
-                            is_empty_frame=False,
-                        )
-                    )
-
-                    dataset_item = DatasetItemEntity(
-                        image, self._get_ann_scene_entity(shapes), subset=subset, metadata=[metadata_item]
-                    )
-                    dataset_items.append(dataset_item)
-        return DatasetEntity(items=dataset_items)
+    def _get_dataset_item(
+        self, datumaro_item: DatasetItem, image: Image, subset: Subset, used_labels: Dict[int, None]
+    ) -> DatasetItemEntity:
+        """Convert DatumaroDataset item to DatasetItemEntity for Acion Classification."""
+        video_name = datumaro_item.media.path.split("/")[-3]
+        shapes: List[Annotation] = []
+        for annotation in datumaro_item.annotations:
+            if annotation.type == AnnotationType.label:
+                shapes.append(self._get_label_entity(annotation))
+
+        metadata_item = MetadataItemEntity(
+            data=VideoMetadata(
+                video_id=video_name,
+                frame_idx=int(datumaro_item.media.path.split("/")[-1].split(".")[0].lstrip("0")),
+                is_empty_frame=False,
+            )
+        )
+
+        return DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset, metadata=[metadata_item])
 
 
 class ActionDetectionDatasetAdapter(ActionBaseDatasetAdapter):
     """Action Detection adapter inherited by ActionBaseDatasetAdapter and BaseDatasetAdapter."""
 
-    # pylint: disable=too-many-nested-blocks
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Convert DatumaroDataset to DatasetEntity for Acion Detection."""
-        label_information = self._prepare_label_information(self.dataset)
-        self.label_entities = label_information["label_entities"]
+    def _prepare_label_entities(self):
+        """Prepare the label entities for Action Detection."""
+        super()._prepare_label_entities()
 
         # Detection use index 0 as a background category
         for label_entity in self.label_entities:
             label_entity.id = ID(int(label_entity.id) + 1)
 
-        dataset_items: List[DatasetItemEntity] = []
-        for subset, subset_data in self.dataset.items():
-            for datumaro_items in subset_data:
-                for datumaro_item in datumaro_items:
-                    image = Image(file_path=datumaro_item.media.path)
-                    video_name = datumaro_item.media.path.split("/")[-3]
-                    shapes: List[Annotation] = []
-                    is_empty_frame = False
-                    for annotation in datumaro_item.annotations:
-                        if isinstance(annotation, DatumaroBbox):
-                            if self.label_entities[annotation.label].name == "EmptyFrame":
-                                is_empty_frame = True
-                                shapes.append(self._get_label_entity(annotation))
-                            else:
-                                shapes.append(self._get_original_bbox_entity(annotation))
-                    metadata_item = MetadataItemEntity(
-                        data=VideoMetadata(
-                            video_id=video_name,
-                            frame_idx=int(datumaro_item.media.path.split("/")[-1].split(".")[0].split("_")[-1]),
-                            is_empty_frame=is_empty_frame,
-                        )
-                    )
-                    dataset_item = DatasetItemEntity(
-                        image, self._get_ann_scene_entity(shapes), subset=subset, metadata=[metadata_item]
-                    )
-                    dataset_items.append(dataset_item)
-
+    def _finalize_label_entities(self, used_labels: Dict[int, None]):
+        """Remove the EmptyFrame label."""
         if self.label_entities[-1].name == "EmptyFrame":
             self.label_entities = self.label_entities[:-1]
 
-        return DatasetEntity(items=dataset_items)
+    def _get_dataset_item(
+        self, datumaro_item: DatasetItem, image: Image, subset: Subset, used_labels: Dict[int, None]
+    ) -> DatasetItemEntity:
+        """Convert DatumaroDataset item to DatasetItemEntity for Acion Detection."""
+        video_name = datumaro_item.media.path.split("/")[-3]
+        shapes: List[Annotation] = []
+        is_empty_frame = False
+        for annotation in datumaro_item.annotations:
+            if isinstance(annotation, DatumaroBbox):
+                if self.label_entities[annotation.label].name == "EmptyFrame":
+                    is_empty_frame = True
+                    shapes.append(self._get_label_entity(annotation))
+                else:
+                    shapes.append(self._get_original_bbox_entity(annotation))
+        metadata_item = MetadataItemEntity(
+            data=VideoMetadata(
+                video_id=video_name,
+                frame_idx=int(datumaro_item.media.path.split("/")[-1].split(".")[0].split("_")[-1]),
+                is_empty_frame=is_empty_frame,
+            )
+        )
+        return DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset, metadata=[metadata_item])
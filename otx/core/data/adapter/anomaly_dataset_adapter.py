@@ -11,6 +11,7 @@ from typing import Dict, List, Optional
 import cv2
 import numpy as np
 from datumaro.components.dataset import Dataset as DatumaroDataset
+from datumaro.components.dataset_base import DatasetItem
 
 from otx.algorithms.common.utils.mask_to_bbox import mask2bbox
 from otx.api.entities.annotation import (
@@ -20,7 +21,6 @@ from otx.api.entities.annotation import (
     NullAnnotationSceneEntity,
 )
 from otx.api.entities.dataset_item import DatasetItemEntity
-from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.id import ID
 from otx.api.entities.image import Image
 from otx.api.entities.label import LabelEntity
@@ -79,148 +79,99 @@ class AnomalyBaseDatasetAdapter(BaseDatasetAdapter):
         )
         return [normal_label, abnormal_label]
 
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Get DatasetEntity."""
-        raise NotImplementedError()
+    def _prepare_label_entities(self):
+        """Prepare the normal and anomalous label entities."""
+        self.label_entities = self._prepare_anomaly_label_information()
+
+    def _get_base_shapes(self, datumaro_item: DatasetItem) -> List[Annotation]:
+        """Get the full-image annotation with the normal or anomalous label of the item."""
+        normal_label, abnormal_label = self.label_entities
+        label = normal_label if os.path.dirname(datumaro_item.id) == "good" else abnormal_label
+        return [
+            Annotation(
+                Rectangle.generate_full_box(),
+                labels=[ScoredLabel(label=label, probability=1.0)],
+            )
+        ]
+
+    @staticmethod
+    def _get_mask_file_path(datumaro_item: DatasetItem) -> str:
+        """Get the path of the ground truth mask of the item."""
+        # TODO: avoid hard coding, plan to enable MVTec to Datumaro
+        return os.path.join(
+            "/".join(datumaro_item.media.path.split("/")[:-3]),
+            "ground_truth",
+            str(datumaro_item.id) + "_mask.png",
+        )
+
+    @staticmethod
+    def _get_anomaly_dataset_item(shapes: List[Annotation], image: Image, subset: Subset) -> DatasetItemEntity:
+        """Build the DatasetItemEntity from the item shapes."""
+        annotation_scene: Optional[AnnotationSceneEntity] = None
+        # Unlabeled dataset
+        if len(shapes) == 0:
+            annotation_scene = NullAnnotationSceneEntity()
+        else:
+            annotation_scene = AnnotationSceneEntity(kind=AnnotationSceneKind.ANNOTATION, annotations=shapes)
+        return DatasetItemEntity(image, annotation_scene, subset=subset)
 
 
 class AnomalyClassificationDatasetAdapter(AnomalyBaseDatasetAdapter):
     """Anomaly classification adapter inherited from AnomalyBaseDatasetAdapter."""
 
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Convert DatumaroDataset to DatasetEntity for Anomaly classification."""
-        normal_label, abnormal_label = self._prepare_anomaly_label_information()
-        self.label_entities = [normal_label, abnormal_label]
-
-        # Prepare
-        dataset_items: List[DatasetItemEntity] = []
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = Image(file_path=datumaro_item.media.path)
-                    label = normal_label if os.path.dirname(datumaro_item.id) == "good" else abnormal_label
-                    shapes = [
-                        Annotation(
-                            Rectangle.generate_full_box(),
-                            labels=[ScoredLabel(label=label, probability=1.0)],
-                        )
-                    ]
-                    annotation_scene: Optional[AnnotationSceneEntity] = None
-                    # Unlabeled dataset
-                    if len(shapes) == 0:
-                        annotation_scene = NullAnnotationSceneEntity()
-                    else:
-                        annotation_scene = AnnotationSceneEntity(
-                            kind=AnnotationSceneKind.ANNOTATION, annotations=shapes
-                        )
-                    dataset_item = DatasetItemEntity(image, annotation_scene, subset=subset)
-                    dataset_items.append(dataset_item)
-
-        return DatasetEntity(items=dataset_items)
+    def _get_dataset_item(
+        self, datumaro_item: DatasetItem, image: Image, subset: Subset, used_labels: Dict[int, None]
+    ) -> DatasetItemEntity:
+        """Convert DatumaroDataset item to DatasetItemEntity for Anomaly classification."""
+        return self._get_anomaly_dataset_item(self._get_base_shapes(datumaro_item), image, subset)
 
 
 class AnomalyDetectionDatasetAdapter(AnomalyBaseDatasetAdapter):
     """Anomaly detection adapter inherited from AnomalyBaseDatasetAdapter."""
 
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Conver DatumaroDataset to DatasetEntity for Anomaly detection."""
-        normal_label, abnormal_label = self._prepare_anomaly_label_information()
-        self.label_entities = [normal_label, abnormal_label]
-
-        # Prepare
-        dataset_items: List[DatasetItemEntity] = []
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = Image(file_path=datumaro_item.media.path)
-                    label = normal_label if os.path.dirname(datumaro_item.id) == "good" else abnormal_label
-                    shapes = [
-                        Annotation(
-                            Rectangle.generate_full_box(),
-                            labels=[ScoredLabel(label=label, probability=1.0)],
-                        )
-                    ]
-                    # TODO: avoid hard coding, plan to enable MVTec to Datumaro
-                    mask_file_path = os.path.join(
-                        "/".join(datumaro_item.media.path.split("/")[:-3]),
-                        "ground_truth",
-                        str(datumaro_item.id) + "_mask.png",
+    def _get_dataset_item(
+        self, datumaro_item: DatasetItem, image: Image, subset: Subset, used_labels: Dict[int, None]
+    ) -> DatasetItemEntity:
+        """Convert DatumaroDataset item to DatasetItemEntity for Anomaly detection."""
+        abnormal_label = self.label_entities[1]
+        shapes = self._get_base_shapes(datumaro_item)
+        mask_file_path = self._get_mask_file_path(datumaro_item)
+        if os.path.exists(mask_file_path):
+            mask = (cv2.imread(mask_file_path, cv2.IMREAD_GRAYSCALE) / 255).astype(np.uint8)
+            bboxes = mask2bbox(mask)
+            for bbox in bboxes:
+                x1, y1, x2, y2 = bbox
+                shapes.append(
+                    Annotation(
+                        Rectangle(
+                            x1=x1 / image.width,
+                            y1=y1 / image.height,
+                            x2=x2 / image.width,
+                            y2=y2 / image.height,
+                        ),
+                        labels=[ScoredLabel(label=abnormal_label)],
                     )
-                    if os.path.exists(mask_file_path):
-                        mask = (cv2.imread(mask_file_path, cv2.IMREAD_GRAYSCALE) / 255).astype(np.uint8)
-                        bboxes = mask2bbox(mask)
-                        for bbox in bboxes:
-                            x1, y1, x2, y2 = bbox
-                            shapes.append(
-                                Annotation(
-                                    Rectangle(
-                                        x1=x1 / image.width,
-                                        y1=y1 / image.height,
-                                        x2=x2 / image.width,
-                                        y2=y2 / image.height,
-                                    ),
-                                    labels=[ScoredLabel(label=abnormal_label)],
-                                )
-                            )
-                    annotation_scene: Optional[AnnotationSceneEntity] = None
-                    # Unlabeled dataset
-                    if len(shapes) == 0:
-                        annotation_scene = NullAnnotationSceneEntity()
-                    else:
-                        annotation_scene = AnnotationSceneEntity(
-                            kind=AnnotationSceneKind.ANNOTATION, annotations=shapes
-                        )
-                    dataset_item = DatasetItemEntity(image, annotation_scene, subset=subset)
-                    dataset_items.append(dataset_item)
-
-        return DatasetEntity(items=dataset_items)
+                )
+        return self._get_anomaly_dataset_item(shapes, image, subset)
 
 
 class AnomalySegmentationDatasetAdapter(AnomalyBaseDatasetAdapter):
     """Anomaly segmentation adapter inherited by AnomalyBaseDatasetAdapter and BaseDatasetAdapter."""
 
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Conver DatumaroDataset to DatasetEntity for Anomaly segmentation."""
-        normal_label, abnormal_label = self._prepare_anomaly_label_information()
-        self.label_entities = [normal_label, abnormal_label]
-
-        # Prepare
-        dataset_items: List[DatasetItemEntity] = []
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = Image(file_path=datumaro_item.media.path)
-                    label = normal_label if os.path.dirname(datumaro_item.id) == "good" else abnormal_label
-                    shapes = [
-                        Annotation(
-                            Rectangle.generate_full_box(),
-                            labels=[ScoredLabel(label=label, probability=1.0)],
-                        )
-                    ]
-                    # TODO: avoid hard coding, plan to enable MVTec to Datumaro
-                    mask_file_path = os.path.join(
-                        "/".join(datumaro_item.media.path.split("/")[:-3]),
-                        "ground_truth",
-                        str(datumaro_item.id) + "_mask.png",
-                    )
-                    if os.path.exists(mask_file_path):
-                        mask = (cv2.imread(mask_file_path, cv2.IMREAD_GRAYSCALE) / 255).astype(np.uint8)
-                        shapes.extend(
-                            create_annotation_from_segmentation_map(
-                                hard_prediction=mask,
-                                soft_prediction=np.ones_like(mask),
-                                label_map={0: normal_label, 1: abnormal_label},
-                            )
-                        )
-                    annotation_scene: Optional[AnnotationSceneEntity] = None
-                    # Unlabeled dataset
-                    if len(shapes) == 0:
-                        annotation_scene = NullAnnotationSceneEntity()
-                    else:
-                        annotation_scene = AnnotationSceneEntity(
-                            kind=AnnotationSceneKind.ANNOTATION, annotations=shapes
-                        )
-                    dataset_item = DatasetItemEntity(image, annotation_scene, subset=subset)
-                    dataset_items.append(dataset_item)
-
-        return DatasetEntity(items=dataset_items)
+    def _get_dataset_item(
+        self, datumaro_item: DatasetItem, image: Image, subset: Subset, used_labels: Dict[int, None]
+    ) -> DatasetItemEntity:
+        """Convert DatumaroDataset item to DatasetItemEntity for Anomaly segmentation."""
+        normal_label, abnormal_label = self.label_entities
+        shapes = self._get_base_shapes(datumaro_item)
+        mask_file_path = self._get_mask_file_path(datumaro_item)
+        if os.path.exists(mask_file_path):
+            mask = (cv2.imread(mask_file_path, cv2.IMREAD_GRAYSCALE) / 255).astype(np.uint8)
+            shapes.extend(
+                create_annotation_from_segmentation_map(
+                    hard_prediction=mask,
+                    soft_prediction=np.ones_like(mask),
+                    label_map={0: normal_label, 1: abnormal_label},
+                )
+            )
+        return self._get_anomaly_dataset_item(shapes, image, subset)
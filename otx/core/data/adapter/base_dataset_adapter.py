@@ -7,8 +7,11 @@
 # pylint: disable=invalid-name, too-many-locals, no-member, too-many-instance-attributes, unused-argument
 
 import abc
+import logging
+import multiprocessing
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import datumaro
 from datumaro.components.annotation import Annotation as DatumaroAnnotation
@@ -16,6 +19,7 @@ from datumaro.components.annotation import AnnotationType as DatumaroAnnotationT
 from datumaro.components.annotation import Categories as DatumaroCategories
 from datumaro.components.dataset import Dataset as DatumaroDataset
 from datumaro.components.dataset import DatasetSubset as DatumaroDatasetSubset
+from datumaro.components.dataset_base import DatasetItem as DatumaroDatasetItem
 
 from otx.api.entities.annotation import (
     Annotation,
@@ -23,8 +27,11 @@ from otx.api.entities.annotation import (
     AnnotationSceneKind,
     NullAnnotationSceneEntity,
 )
+from otx.api.entities.annotation_store import ColumnarAnnotationSceneEntity
+from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.id import ID
+from otx.api.entities.image import Image, get_image_size
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.label_schema import LabelGroup, LabelGroupType, LabelSchemaEntity
 from otx.api.entities.model_template import TaskType
@@ -33,6 +40,14 @@ from otx.api.entities.shapes.polygon import Point, Polygon
 from otx.api.entities.shapes.rectangle import Rectangle
 from otx.api.entities.subset import Subset
 
+logger = logging.getLogger(__name__)
+
+# Number of items whose image headers are probed together (and kept in memory) during the conversion
+IMAGE_SIZE_PROBE_BATCH_SIZE = 256
+
+# Adapter shared with the forked conversion workers, see BaseDatasetAdapter._convert_in_parallel()
+_worker_adapter: Optional["BaseDatasetAdapter"] = None
+
 
 class BaseDatasetAdapter(metaclass=abc.ABCMeta):
     """Base dataset adapter for all of downstream tasks to use Datumaro.
@@ -136,11 +151,157 @@ class BaseDatasetAdapter(metaclass=abc.ABCMeta):
 
         return dataset
 
+    def get_otx_dataset(self, num_workers: int = 0) -> DatasetEntity:
+        """Convert DatumaroDataset to DatasetEntity.
+
+        Args:
+            num_workers (int): Number of worker processes used to convert the Datumaro subsets in parallel.
+                If 0, all items are converted in the calling process. Defaults to 0.
+
+        Returns:
+            DatasetEntity: Converted dataset.
+        """
+        self._prepare_label_entities()
+        used_labels: Dict[int, None] = {}
+        if num_workers > 0 and "fork" in multiprocessing.get_all_start_methods():
+            dataset_items = self._convert_in_parallel(num_workers, used_labels)
+        else:
+            if num_workers > 0:
+                logger.warning("Parallel dataset conversion requires the 'fork' start method, converting serially.")
+            dataset_items = list(self._iter_dataset_items(used_labels))
+        self._finalize_label_entities(used_labels)
+        return DatasetEntity(items=dataset_items)
+
+    def iter_otx_dataset_items(self) -> Iterator[DatasetItemEntity]:
+        """Convert DatumaroDataset to DatasetItemEntity objects lazily, one item at a time.
+
+        Contrary to get_otx_dataset(), the converted items are never gathered in a list. Note that the label
+        entities (and the label schema) are only final once the iterator is exhausted, since unused labels can only
+        be removed after all items have been seen.
+
+        Yields:
+            DatasetItemEntity: Converted dataset items, in the same order as get_otx_dataset().
+        """
+        self._prepare_label_entities()
+        used_labels: Dict[int, None] = {}
+        yield from self._iter_dataset_items(used_labels)
+        self._finalize_label_entities(used_labels)
+
+    def _prepare_label_entities(self):
+        """Prepare the label entities before converting the items."""
+        label_information = self._prepare_label_information(self.dataset)
+        self.label_entities = label_information["label_entities"]
+
+    def _finalize_label_entities(self, used_labels: Dict[int, None]):
+        """Update the label entities once all items have been converted.
+
+        Args:
+            used_labels (Dict[int, None]): Insertion-ordered set of label indices used by the converted items.
+        """
+
+    def _get_subset_chunks(self) -> List[Tuple[Subset, Iterable]]:
+        """Returns the Datumaro subsets to convert, as a list of (subset, datumaro_items) pairs."""
+        return [
+            (subset, datumaro_items)
+            for subset, subset_data in self.dataset.items()
+            for datumaro_items in subset_data.subsets().values()
+        ]
+
+    def _needs_image_size(self, datumaro_item: DatumaroDatasetItem) -> bool:
+        """Returns True if the image size is needed to convert this item, so that it is probed in batch."""
+        return False
+
     @abstractmethod
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Get DatasetEntity."""
+    def _get_dataset_item(
+        self, datumaro_item: DatumaroDatasetItem, image: Image, subset: Subset, used_labels: Dict[int, None]
+    ) -> DatasetItemEntity:
+        """Convert a Datumaro item to DatasetItemEntity.
+
+        Args:
+            datumaro_item (DatumaroDatasetItem): Item to convert.
+            image (Image): Image of the item.
+            subset (Subset): Subset of the item.
+            used_labels (Dict[int, None]): Insertion-ordered set of used label indices, to be updated.
+
+        Returns:
+            DatasetItemEntity: Converted item.
+        """
         raise NotImplementedError
 
+    def _iter_dataset_items(self, used_labels: Dict[int, None]) -> Iterator[DatasetItemEntity]:
+        """Convert the items of all subsets in the calling process."""
+        for subset, datumaro_items in self._get_subset_chunks():
+            yield from self._iter_subset_items(subset, datumaro_items, used_labels)
+
+    def _iter_subset_items(
+        self, subset: Subset, datumaro_items: Iterable, used_labels: Dict[int, None]
+    ) -> Iterator[DatasetItemEntity]:
+        """Convert the items of a Datumaro subset, probing the needed image sizes batch by batch."""
+        with ThreadPoolExecutor() as executor:
+            batch: List[DatumaroDatasetItem] = []
+            for datumaro_item in datumaro_items:
+                batch.append(datumaro_item)
+                if len(batch) == IMAGE_SIZE_PROBE_BATCH_SIZE:
+                    yield from self._convert_batch(batch, subset, used_labels, executor)
+                    batch = []
+            yield from self._convert_batch(batch, subset, used_labels, executor)
+
+    def _convert_batch(
+        self,
+        batch: List[DatumaroDatasetItem],
+        subset: Subset,
+        used_labels: Dict[int, None],
+        executor: ThreadPoolExecutor,
+    ) -> Iterator[DatasetItemEntity]:
+        """Convert a batch of Datumaro items after reading all the needed image headers concurrently."""
+        paths = [datumaro_item.media.path for datumaro_item in batch if self._needs_image_size(datumaro_item)]
+        sizes = dict(zip(paths, executor.map(get_image_size, paths)))
+        for datumaro_item in batch:
+            image = Image(file_path=datumaro_item.media.path, size=sizes.get(datumaro_item.media.path))
+            yield self._get_dataset_item(datumaro_item, image, subset, used_labels)
+
+    def _convert_in_parallel(self, num_workers: int, used_labels: Dict[int, None]) -> List[DatasetItemEntity]:
+        """Convert the Datumaro subsets in a pool of forked worker processes.
+
+        The workers inherit the adapter (and the imported Datumaro dataset) from the parent process, so only the
+        chunk index is sent to them. The results are merged in chunk order, which gives the same item and label
+        order as the serial conversion.
+
+        Args:
+            num_workers (int): Number of worker processes.
+            used_labels (Dict[int, None]): Insertion-ordered set of used label indices, to be updated.
+
+        Returns:
+            List[DatasetItemEntity]: Converted items.
+        """
+        global _worker_adapter  # pylint: disable=global-statement
+        _worker_adapter = self
+        dataset_items: List[DatasetItemEntity] = []
+        try:
+            with ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                for chunk_items, chunk_used_labels in executor.map(
+                    _convert_subset_chunk, range(len(self._get_subset_chunks()))
+                ):
+                    dataset_items.extend(chunk_items)
+                    used_labels.update(dict.fromkeys(chunk_used_labels))
+        finally:
+            _worker_adapter = None
+        self._relink_label_entities(dataset_items)
+        return dataset_items
+
+    def _relink_label_entities(self, dataset_items: List[DatasetItemEntity]):
+        """Make the items returned by the workers refer to the label entities of this adapter instead of copies."""
+        label_entities = {label_entity.id_: label_entity for label_entity in self.label_entities}
+        for dataset_item in dataset_items:
+            annotation_scene = dataset_item.annotation_scene
+            if isinstance(annotation_scene, ColumnarAnnotationSceneEntity) and annotation_scene.store is not None:
+                store_labels = annotation_scene.store.labels
+                store_labels[:] = [label_entities.get(label.id_, label) for label in store_labels]
+                continue
+            for annotation in annotation_scene.annotations:
+                for scored_label in annotation.get_labels(include_empty=True):
+                    scored_label.label = label_entities.get(scored_label.label.id_, scored_label.label)
+
     def get_label_schema(self) -> LabelSchemaEntity:
         """Get Label Schema."""
         return self._generate_default_label_schema(self.label_entities)
@@ -221,10 +382,13 @@ class BaseDatasetAdapter(metaclass=abc.ABCMeta):
         """
         return data_candidates[0]
 
-    def _get_ann_scene_entity(self, shapes: List[Annotation]) -> AnnotationSceneEntity:
+    def _get_ann_scene_entity(self, shapes: List[Annotation], columnar: bool = False) -> AnnotationSceneEntity:
+        """Get the annotation scene of the shapes, stored as arrays if columnar is True."""
         annotation_scene: Optional[AnnotationSceneEntity] = None
         if len(shapes) == 0:
             annotation_scene = NullAnnotationSceneEntity()
+        elif columnar:
+            annotation_scene = ColumnarAnnotationSceneEntity.from_annotations(shapes, AnnotationSceneKind.ANNOTATION)
         else:
             annotation_scene = AnnotationSceneEntity(kind=AnnotationSceneKind.ANNOTATION, annotations=shapes)
         return annotation_scene
@@ -272,7 +436,7 @@ class BaseDatasetAdapter(metaclass=abc.ABCMeta):
             labels=[ScoredLabel(label=self.label_entities[annotation.label])],
         )
 
-    def remove_unused_label_entities(self, used_labels: List):
+    def remove_unused_label_entities(self, used_labels: Iterable[int]):
         """Remove unused label from label entities.
 
         Because label entities will be used to make Label Schema,
@@ -280,9 +444,26 @@ class BaseDatasetAdapter(metaclass=abc.ABCMeta):
         So, remove the unused label from label entities.
 
         Args:
-            used_labels (List): list for index of used label
+            used_labels (Iterable[int]): indices of used labels, in order of first use
         """
         clean_label_entities = []
         for used_label in used_labels:
             clean_label_entities.append(self.label_entities[used_label])
         self.label_entities = clean_label_entities
+
+
+def _convert_subset_chunk(chunk_index: int) -> Tuple[List[DatasetItemEntity], List[int]]:
+    """Convert one Datumaro subset in a forked worker process.
+
+    Args:
+        chunk_index (int): Index of the chunk in BaseDatasetAdapter._get_subset_chunks().
+
+    Returns:
+        Tuple[List[DatasetItemEntity], List[int]]: Converted items and used label indices in order of first use.
+    """
+    assert _worker_adapter is not None
+    subset, datumaro_items = _worker_adapter._get_subset_chunks()[chunk_index]  # pylint: disable=protected-access
+    used_labels: Dict[int, None] = {}
+    # pylint: disable-next=protected-access
+    dataset_items = list(_worker_adapter._iter_subset_items(subset, datumaro_items, used_labels))
+    return dataset_items, list(used_labels)
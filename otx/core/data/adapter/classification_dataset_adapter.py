@@ -5,16 +5,17 @@
 #
 
 # pylint: disable=invalid-name, too-many-locals, no-member
-from typing import List, Union
+from typing import Dict, List, Union
 
 from datumaro.components.annotation import AnnotationType, LabelCategories
+from datumaro.components.dataset_base import DatasetItem
 
 from otx.api.entities.annotation import Annotation
 from otx.api.entities.dataset_item import DatasetItemEntity
-from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.image import Image
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.label_schema import LabelGroup, LabelGroupType, LabelSchemaEntity
+from otx.api.entities.subset import Subset
 from otx.core.data.adapter.base_dataset_adapter import BaseDatasetAdapter
 
 
@@ -25,9 +26,8 @@ class ClassificationDatasetAdapter(BaseDatasetAdapter):
     for multi-class, multi-label, and hierarchical-label classification tasks
     """
 
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Convert DatumaroDataset to DatasetEntity for Classification."""
-        # Prepare label information
+    def _prepare_label_entities(self):
+        """Prepare the label entities and the label schema for Classification."""
         label_information = self._prepare_label_information(self.dataset)
         self.category_items = label_information["category_items"]
         self.label_groups = label_information["label_groups"]
@@ -36,21 +36,16 @@ class ClassificationDatasetAdapter(BaseDatasetAdapter):
         # Generate label schema
         self.label_schema = self._generate_classification_label_schema(self.label_groups, self.label_entities)
 
-        # Set the DatasetItemEntity
-        dataset_items: List[DatasetItemEntity] = []
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = Image(file_path=datumaro_item.media.path)
-                    shapes: List[Annotation] = []
-                    for ann in datumaro_item.annotations:
-                        if ann.type == AnnotationType.label:
-                            shapes.append(self._get_label_entity(ann))
-
-                    dataset_item = DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset)
-                    dataset_items.append(dataset_item)
-
-        return DatasetEntity(items=dataset_items)
+    def _get_dataset_item(
+        self, datumaro_item: DatasetItem, image: Image, subset: Subset, used_labels: Dict[int, None]
+    ) -> DatasetItemEntity:
+        """Convert DatumaroDataset item to DatasetItemEntity for Classification."""
+        shapes: List[Annotation] = []
+        for ann in datumaro_item.annotations:
+            if ann.type == AnnotationType.label:
+                shapes.append(self._get_label_entity(ann))
+
+        return DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset)
 
     def get_label_schema(self) -> LabelSchemaEntity:
         """Get Label Schema."""
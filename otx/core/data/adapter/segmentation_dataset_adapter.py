@@ -14,6 +14,7 @@ import cv2
 import numpy as np
 from datumaro.components.annotation import AnnotationType, Mask
 from datumaro.components.dataset import Dataset as DatumaroDataset
+from datumaro.components.dataset_base import DatasetItem
 from datumaro.plugins.data_formats.common_semantic_segmentation import (
     CommonSemanticSegmentationBase,
     make_categories,
@@ -24,7 +25,6 @@ from skimage.segmentation import felzenszwalb
 
 from otx.api.entities.annotation import Annotation
 from otx.api.entities.dataset_item import DatasetItemEntity
-from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.id import ID
 from otx.api.entities.image import Image
 from otx.api.entities.model_template import TaskType
@@ -50,15 +50,12 @@ class SegmentationDatasetAdapter(BaseDatasetAdapter):
         super().__init__(task_type, train_data_roots, val_data_roots, test_data_roots, unlabeled_data_roots)
         self.updated_label_id: Dict[int, int] = {}
 
-    def get_otx_dataset(self) -> DatasetEntity:
-        """Convert DatumaroDataset to DatasetEntity for Segmentation."""
+    def _prepare_label_entities(self):
+        """Prepare the label entities and the label id mapping for Segmentation."""
         # Prepare label information
         label_information = self._prepare_label_information(self.dataset)
         self.label_entities = label_information["label_entities"]
 
-        dataset_items: List[DatasetItemEntity] = []
-        used_labels: List[int] = []
-
         if hasattr(self, "data_type_candidates"):
             if self.data_type_candidates[0] == "voc":
                 self.set_voc_labels()
@@ -73,31 +70,35 @@ class SegmentationDatasetAdapter(BaseDatasetAdapter):
             # with "common_semantic_segmentation", so we can use it.
             self.set_common_labels()
 
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = Image(file_path=datumaro_item.media.path)
-                    shapes: List[Annotation] = []
-                    for ann in datumaro_item.annotations:
-                        if ann.type == AnnotationType.mask:
-                            # TODO: consider case -> didn't include the background information
-                            datumaro_polygons = MasksToPolygons.convert_mask(ann)
-                            for d_polygon in datumaro_polygons:
-                                new_label = self.updated_label_id.get(d_polygon.label, None)
-                                if new_label is not None:
-                                    d_polygon.label = new_label
-                                else:
-                                    continue
-
-                                shapes.append(self._get_polygon_entity(d_polygon, image.width, image.height))
-                                if d_polygon.label not in used_labels:
-                                    used_labels.append(d_polygon.label)
-
-                    dataset_item = DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset)
-                    dataset_items.append(dataset_item)
-
+    def _finalize_label_entities(self, used_labels: Dict[int, None]):
+        """Remove the labels which are not used by any item."""
         self.remove_unused_label_entities(used_labels)
-        return DatasetEntity(items=dataset_items)
+
+    def _needs_image_size(self, datumaro_item: DatasetItem) -> bool:
+        """Image size is needed to normalize the polygons."""
+        return len(datumaro_item.annotations) > 0
+
+    def _get_dataset_item(
+        self, datumaro_item: DatasetItem, image: Image, subset: Subset, used_labels: Dict[int, None]
+    ) -> DatasetItemEntity:
+        """Convert DatumaroDataset item to DatasetItemEntity for Segmentation."""
+        shapes: List[Annotation] = []
+        for ann in datumaro_item.annotations:
+            if ann.type == AnnotationType.mask:
+                # TODO: consider case -> didn't include the background information
+                datumaro_polygons = MasksToPolygons.convert_mask(ann)
+                for d_polygon in datumaro_polygons:
+                    new_label = self.updated_label_id.get(d_polygon.label, None)
+                    if new_label is not None:
+                        d_polygon.label = new_label
+                    else:
+                        continue
+
+                    shapes.append(self._get_polygon_entity(d_polygon, image.width, image.height))
+                    used_labels.setdefault(d_polygon.label)
+
+        # Store the annotations as arrays, the datasets may have millions of shapes
+        return DatasetItemEntity(image, self._get_ann_scene_entity(shapes, columnar=True), subset=subset)
 
     def set_voc_labels(self):
         """Set labels for common_semantic_segmentation dataset."""
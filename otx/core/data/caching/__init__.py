@@ -0,0 +1,9 @@
+"""OTX Core Data Caching."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from .dataset_cache import DatasetCache, get_dataset_cache_key
+
+__all__ = ["DatasetCache", "get_dataset_cache_key"]
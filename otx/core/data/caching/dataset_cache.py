@@ -0,0 +1,395 @@
+"""Persistent on-disk cache of the datasets converted by the dataset adapters."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from otx.api.entities.annotation import (
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+    NullAnnotationSceneEntity,
+)
+from otx.api.entities.annotation_store import (
+    AnnotationStore,
+    ColumnarAnnotationSceneEntity,
+)
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.image import Image
+from otx.api.entities.label import LabelEntity
+from otx.api.entities.label_schema import LabelSchemaEntity
+from otx.api.entities.metadata import MetadataItemEntity, VideoMetadata
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.entities.subset import Subset
+from otx.api.serialization.label_mapper import LabelMapper, LabelSchemaMapper
+
+logger = logging.getLogger(__name__)
+
+# Must be increased whenever the layout of the cache entries changes
+CACHE_FORMAT_VERSION = 2
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "otx", "datasets")
+DEFAULT_MAX_CACHE_SIZE = 10 * 1024**3
+
+HEADER_FILE_NAME = "header.json"
+
+
+def get_dataset_cache_key(data_roots: Dict[str, Optional[str]], **attributes: Any) -> str:
+    """Returns the key of a converted dataset in the cache.
+
+    The key is a hash of the given attributes (e.g. task type, adapter and data format), of the data root paths and
+    of the relative path, size and modification time of every file under the data roots. Thus, it changes whenever a
+    file is added, removed or modified.
+
+    Args:
+        data_roots (Dict[str, Optional[str]]): Data root paths by subset name, None if the subset is not used.
+        attributes (Any): Other attributes the converted dataset depends on, converted to strings.
+
+    Returns:
+        str: Hexadecimal key.
+    """
+    hasher = hashlib.sha256()
+    abs_data_roots = {name: os.path.abspath(path) for name, path in data_roots.items() if path is not None}
+    header = {
+        "version": CACHE_FORMAT_VERSION,
+        "attributes": {name: str(value) for name, value in attributes.items()},
+        "data_roots": abs_data_roots,
+    }
+    hasher.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+    for _, data_root in sorted(abs_data_roots.items()):
+        if os.path.isfile(data_root):
+            stat = os.stat(data_root)
+            hasher.update(f"\0{data_root}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8"))
+            continue
+        for dir_path, dir_names, file_names in os.walk(data_root):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                file_path = os.path.join(dir_path, file_name)
+                stat = os.stat(file_path)
+                relative_path = os.path.relpath(file_path, data_root)
+                hasher.update(f"\0{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class DatasetCache:
+    """Persistent on-disk cache of converted datasets and their label schemas.
+
+    Each entry is a directory named by its key (see get_dataset_cache_key()) holding a JSON header with the label
+    schema and the label table, and flat NumPy arrays for everything else: the image paths as a string table, the
+    image sizes and subsets, and the arrays of the AnnotationStore of each item concatenated. The arrays are
+    memory-mapped when an entry is loaded, and the items get ColumnarAnnotationSceneEntity scenes. Once the total size
+    of the entries exceeds max_size, the least recently used entries are evicted.
+
+    Only datasets made of file-backed images are cached, with full-image ROIs, no ignored labels and at most video
+    metadata, which covers all datasets created by the dataset adapters.
+
+    Args:
+        cache_dir (Optional[str]): Cache directory. Defaults to ~/.cache/otx/datasets.
+        max_size (int): Maximum total size of the cache in bytes. Defaults to 10 GiB.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = DEFAULT_MAX_CACHE_SIZE):
+        self.cache_dir = DEFAULT_CACHE_DIR if cache_dir is None else cache_dir
+        self.max_size = max_size
+
+    def _get_entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, key: str) -> Optional[Tuple[DatasetEntity, LabelSchemaEntity]]:
+        """Load a converted dataset from the cache.
+
+        Args:
+            key (str): Key of the dataset.
+
+        Returns:
+            Optional[Tuple[DatasetEntity, LabelSchemaEntity]]: Dataset and label schema, None if they are not cached.
+        """
+        entry_dir = self._get_entry_dir(key)
+        if not os.path.isfile(os.path.join(entry_dir, HEADER_FILE_NAME)):
+            return None
+        try:
+            with open(os.path.join(entry_dir, HEADER_FILE_NAME), encoding="utf-8") as header_file:
+                header = json.load(header_file)
+            if header["version"] != CACHE_FORMAT_VERSION:
+                raise ValueError(f"unsupported cache format version {header['version']}")
+            arrays = {
+                file_name[: -len(".npy")]: np.load(os.path.join(entry_dir, file_name), mmap_mode="r")
+                for file_name in os.listdir(entry_dir)
+                if file_name.endswith(".npy")
+            }
+            label_schema = LabelSchemaMapper.backward(header["label_schema"])
+            dataset = _decode_dataset(arrays, _get_label_table(header["labels"], label_schema))
+        except (OSError, KeyError, ValueError) as error:
+            logger.warning(f"Dropping the broken dataset cache entry {entry_dir}: {error}")
+            self.invalidate(key)
+            return None
+        # The modification time of the entry directory is used as last access time for the eviction
+        os.utime(entry_dir)
+        logger.info(f"Loaded {len(dataset)} dataset items from the dataset cache {entry_dir}")
+        return dataset, label_schema
+
+    def save(self, key: str, dataset: DatasetEntity, label_schema: LabelSchemaEntity) -> bool:
+        """Save a converted dataset to the cache, replacing any entry with the same key.
+
+        Args:
+            key (str): Key of the dataset.
+            dataset (DatasetEntity): Dataset to save.
+            label_schema (LabelSchemaEntity): Label schema of the dataset.
+
+        Returns:
+            bool: True if the dataset was saved, False if it can not be cached.
+        """
+        try:
+            arrays, label_entities = _encode_dataset(dataset)
+        except ValueError as error:
+            logger.warning(f"The dataset is not cached: {error}")
+            return False
+        header = {
+            "version": CACHE_FORMAT_VERSION,
+            "labels": [LabelMapper.forward(label_entity) for label_entity in label_entities],
+            "label_schema": LabelSchemaMapper.forward(label_schema),
+        }
+
+        # Write to a temporary directory first, so that a concurrent reader never sees a partial entry
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}-", dir=self.cache_dir)
+        try:
+            for name, array in arrays.items():
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), array)
+            with open(os.path.join(tmp_dir, HEADER_FILE_NAME), "w", encoding="utf-8") as header_file:
+                json.dump(header, header_file)
+            self.invalidate(key)
+            os.replace(tmp_dir, self._get_entry_dir(key))
+        except OSError as error:
+            logger.warning(f"The dataset is not cached: {error}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+        self._evict(keep=key)
+        return True
+
+    def invalidate(self, key: Optional[str] = None):
+        """Remove an entry from the cache.
+
+        Args:
+            key (Optional[str]): Key of the entry to remove. If None, all entries are removed.
+        """
+        if key is None:
+            for entry_name in self._list_entries():
+                shutil.rmtree(self._get_entry_dir(entry_name), ignore_errors=True)
+        else:
+            shutil.rmtree(self._get_entry_dir(key), ignore_errors=True)
+
+    def _list_entries(self) -> List[str]:
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [
+            entry_name
+            for entry_name in os.listdir(self.cache_dir)
+            if os.path.isfile(os.path.join(self.cache_dir, entry_name, HEADER_FILE_NAME))
+        ]
+
+    def _evict(self, keep: str):
+        """Remove the least recently used entries until the cache fits in max_size, except the entry to keep."""
+        entries = []
+        for entry_name in self._list_entries():
+            entry_dir = self._get_entry_dir(entry_name)
+            size = sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+            entries.append((os.stat(entry_dir).st_mtime_ns, entry_name, size))
+        total_size = sum(size for _, _, size in entries)
+        for _, entry_name, size in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if entry_name != keep:
+                logger.info(f"Evicting {entry_name} from the dataset cache")
+                self.invalidate(entry_name)
+                total_size -= size
+
+
+def _encode_strings(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode strings as a string table: their concatenated UTF-8 bytes and the offsets of each string."""
+    encoded_strings = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(len(encoded_strings) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(encoded_string) for encoded_string in encoded_strings])
+    return np.frombuffer(b"".join(encoded_strings), dtype=np.uint8), offsets
+
+
+def _decode_strings(data: np.ndarray, offsets: np.ndarray) -> List[str]:
+    """Decode a string table made by _encode_strings()."""
+    buffer = data.tobytes()
+    bounds = offsets.tolist()
+    return [buffer[start:end].decode("utf-8") for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _encode_dataset(dataset: DatasetEntity) -> Tuple[Dict[str, np.ndarray], List[LabelEntity]]:
+    """Encode a dataset as flat arrays.
+
+    The annotations of each item are taken from its AnnotationStore, without creating the Annotation objects of the
+    columnar scenes.
+
+    Args:
+        dataset (DatasetEntity): Dataset to encode.
+
+    Raises:
+        ValueError: If the dataset contains anything which can not be encoded.
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], List[LabelEntity]]: Arrays by name and table of the labels they refer to.
+    """
+    label_indices: Dict[int, int] = {}
+    label_entities: List[LabelEntity] = []
+    paths: List[str] = []
+    item_values: Dict[str, List[int]] = {"subsets": [], "heights": [], "widths": [], "scene_kinds": []}
+    stores: List[AnnotationStore] = []
+    annotation_labels: List[np.ndarray] = []
+    video_metadata: List[VideoMetadata] = []
+
+    for item in dataset:
+        media = item.media
+        if not isinstance(media, Image) or media.path is None:
+            raise ValueError("only file-backed images can be cached")
+        if item.ignored_labels:
+            raise ValueError("ignored labels can not be cached")
+        annotation_scene = item.annotation_scene
+        store = annotation_scene.store if isinstance(annotation_scene, ColumnarAnnotationSceneEntity) else None
+        roi = item.roi
+        if not Rectangle.is_full_box(roi.shape) or (
+            roi.get_labels(include_empty=True)
+            and (store is not None or not any(roi is annotation for annotation in annotation_scene.annotations))
+        ):
+            raise ValueError("only full-image ROIs can be cached")
+        metadata = item.get_metadata()
+        if metadata:
+            if len(metadata) > 1 or metadata[0].model is not None or not isinstance(metadata[0].data, VideoMetadata):
+                raise ValueError("only video metadata can be cached")
+            video_metadata.append(metadata[0].data)
+        if store is None:
+            store = AnnotationStore.from_annotations(annotation_scene.annotations)
+
+        paths.append(media.path)
+        item_values["subsets"].append(item.subset.value)
+        item_values["heights"].append(media.height)
+        item_values["widths"].append(media.width)
+        item_values["scene_kinds"].append(annotation_scene.kind.value)
+        stores.append(store)
+        store_label_indices = []
+        for label in store.labels:
+            label_index = label_indices.setdefault(id(label), len(label_entities))
+            if label_index == len(label_entities):
+                label_entities.append(label)
+            store_label_indices.append(label_index)
+        annotation_labels.append(np.array(store_label_indices, dtype=np.int32)[store.label_indices])
+
+    if video_metadata and len(video_metadata) != len(paths):
+        raise ValueError("video metadata can only be cached if all items have it")
+
+    def concatenate_offsets(offsets: List[np.ndarray]) -> np.ndarray:
+        """Concatenate the offsets of the stores into offsets in the concatenated arrays."""
+        counts = [np.diff(store_offsets) for store_offsets in offsets]
+        return np.concatenate([[0], np.cumsum(np.concatenate([np.zeros(0, dtype=np.int64)] + counts))])
+
+    path_data, path_offsets = _encode_strings(paths)
+    arrays = {
+        "path_data": path_data,
+        "path_offsets": path_offsets,
+        "subsets": np.array(item_values["subsets"], dtype=np.int8),
+        "heights": np.array(item_values["heights"], dtype=np.int32),
+        "widths": np.array(item_values["widths"], dtype=np.int32),
+        "scene_kinds": np.array(item_values["scene_kinds"], dtype=np.int8),
+        "annotation_offsets": np.concatenate([[0], np.cumsum([len(store) for store in stores], dtype=np.int64)]),
+        "shape_types": np.concatenate([np.zeros(0, dtype=np.uint8)] + [store.shape_types for store in stores]),
+        "point_offsets": concatenate_offsets([store.point_offsets for store in stores]).astype(np.int64),
+        "points": np.concatenate([np.zeros((0, 2))] + [store.points for store in stores]),
+        "label_offsets": concatenate_offsets([store.label_offsets for store in stores]).astype(np.int64),
+        "annotation_labels": np.concatenate([np.zeros(0, dtype=np.int32)] + annotation_labels),
+        "label_probabilities": np.concatenate([np.zeros(0)] + [store.scores for store in stores]),
+    }
+    if video_metadata:
+        video_id_data, video_id_offsets = _encode_strings([data.video_id for data in video_metadata])
+        arrays.update(
+            video_id_data=video_id_data,
+            video_id_offsets=video_id_offsets,
+            frame_indices=np.array([data.frame_idx for data in video_metadata], dtype=np.int64),
+            empty_frames=np.array([data.is_empty_frame for data in video_metadata], dtype=bool),
+        )
+    return arrays, label_entities
+
+
+def _get_label_table(serialized_labels: List[dict], label_schema: LabelSchemaEntity) -> List[LabelEntity]:
+    """Deserialize the label table, reusing the label entities of the label schema when they match."""
+    schema_labels = {(label.id_, label.name): label for label in label_schema.get_labels(include_empty=True)}
+    label_table = []
+    for serialized_label in serialized_labels:
+        label = LabelMapper.backward(serialized_label)
+        label_table.append(schema_labels.get((label.id_, label.name), label))
+    return label_table
+
+
+def _decode_dataset(arrays: Dict[str, np.ndarray], label_table: List[LabelEntity]) -> DatasetEntity:
+    """Decode a dataset encoded by _encode_dataset()."""
+    # The arrays are memory-mapped, so only the values of each item are converted to Python objects
+    paths = _decode_strings(arrays["path_data"], arrays["path_offsets"])
+    subsets = arrays["subsets"]
+    heights = arrays["heights"]
+    widths = arrays["widths"]
+    scene_kinds = arrays["scene_kinds"]
+    annotation_offsets = arrays["annotation_offsets"]
+    shape_types = arrays["shape_types"]
+    point_offsets = arrays["point_offsets"]
+    points = arrays["points"]
+    label_offsets = arrays["label_offsets"]
+    annotation_labels = arrays["annotation_labels"]
+    label_probabilities = arrays["label_probabilities"]
+    video_ids: Optional[List[str]] = None
+    if "video_id_data" in arrays:
+        video_ids = _decode_strings(arrays["video_id_data"], arrays["video_id_offsets"])
+
+    items = []
+    for item_index, path in enumerate(paths):
+        first, last = annotation_offsets[item_index], annotation_offsets[item_index + 1]
+        first_point, first_label = point_offsets[first], label_offsets[first]
+        # Each store only refers to the labels of its annotations
+        store_labels, store_label_indices = np.unique(
+            annotation_labels[first_label : label_offsets[last]], return_inverse=True
+        )
+        store = AnnotationStore(
+            [label_table[label_index] for label_index in store_labels],
+            shape_types[first:last],
+            points[first_point : point_offsets[last]],
+            point_offsets[first : last + 1] - first_point,
+            store_label_indices.ravel(),
+            label_probabilities[first_label : label_offsets[last]],
+            label_offsets[first : last + 1] - first_label,
+        )
+        scene_kind = AnnotationSceneKind(int(scene_kinds[item_index]))
+        annotation_scene: AnnotationSceneEntity
+        if scene_kind == AnnotationSceneKind.NONE and len(store) == 0:
+            annotation_scene = NullAnnotationSceneEntity()
+        else:
+            annotation_scene = ColumnarAnnotationSceneEntity(store, scene_kind)
+        metadata: Optional[List[MetadataItemEntity]] = None
+        if video_ids is not None:
+            video_metadata = VideoMetadata(
+                video_ids[item_index],
+                int(arrays["frame_indices"][item_index]),
+                bool(arrays["empty_frames"][item_index]),
+            )
+            metadata = [MetadataItemEntity(data=video_metadata)]
+        items.append(
+            DatasetItemEntity(
+                Image(file_path=path, size=(int(heights[item_index]), int(widths[item_index]))),
+                annotation_scene,
+                metadata=metadata,
+                subset=Subset(int(subsets[item_index])),
+            )
+        )
+    return DatasetEntity(items=items)
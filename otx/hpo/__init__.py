@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
+from .bohb import BOHB
 from .hpo_base import TrialStatus
 from .hpo_runner import run_hpo_loop
 from .hyperband import HyperBand
@@ -22,4 +23,5 @@ __all__ = [
     "run_hpo_loop",
     "TrialStatus",
     "HyperBand",
+    "BOHB",
 ]
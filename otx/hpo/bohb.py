@@ -0,0 +1,255 @@
+"""BOHB implementation, HyperBand with model-based sampling of new trials."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import logging
+import math
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+from scipy.special import logsumexp
+from scipy.stats import truncnorm
+
+from otx.algorithms.common.utils.utils import check_mode_input, check_positive
+from otx.hpo.hyperband import AshaTrial, HyperBand
+from otx.hpo.search_space import SearchSpace
+
+logger = logging.getLogger(__name__)
+
+
+class TreeParzenEstimator:
+    """Tree-structured Parzen Estimator (TPE) over a search space.
+
+    The configurations are mapped to the unit hypercube of the search space. The observations are split into good and
+    bad configurations by their score, a kernel density is fitted on each group, and the suggested configuration is
+    the candidate sampled from the good density which maximizes the ratio of good to bad densities.
+    Categorical parameters are handled as continuous ones over the indices of their choices.
+
+    Args:
+        search_space (SearchSpace): Search space of the configurations.
+        mode (str, optional): One of {min, max}. Whether the objective is minimizing or maximizing the score.
+                              Defaults to "max".
+        top_ratio (float, optional): Ratio of observations deemed good. Defaults to 0.15.
+        num_candidates (int, optional): Number of candidates sampled from the good density. Defaults to 64.
+        bandwidth_factor (float, optional): Factor widening the good density to sample the candidates.
+                                            Defaults to 3.0.
+        min_bandwidth (float, optional): Minimum bandwidth of the kernels in the unit hypercube. Defaults to 1e-3.
+        seed (Optional[int], optional): Seed of the random generator. Defaults to None.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        search_space: SearchSpace,
+        mode: str = "max",
+        top_ratio: float = 0.15,
+        num_candidates: int = 64,
+        bandwidth_factor: float = 3.0,
+        min_bandwidth: float = 1e-3,
+        seed: Optional[int] = None,
+    ):
+        # pylint: disable=too-many-arguments
+        check_mode_input(mode)
+        if not 0 < top_ratio < 1:
+            raise ValueError(f"top_ratio should be greater than 0 and lesser than 1. Your value is {top_ratio}")
+        check_positive(num_candidates, "num_candidates")
+        check_positive(bandwidth_factor, "bandwidth_factor")
+        check_positive(min_bandwidth, "min_bandwidth")
+
+        self.search_space = search_space
+        self.mode = mode
+        self.top_ratio = top_ratio
+        self.num_candidates = num_candidates
+        self.bandwidth_factor = bandwidth_factor
+        self.min_bandwidth = min_bandwidth
+        self._keys = list(search_space)
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def min_num_observations(self) -> int:
+        """Minimum number of observations to fit the densities, enough for both groups to span every dimension."""
+        return 2 * (len(self._keys) + 1)
+
+    def to_unit_point(self, config: Dict[str, Any]) -> np.ndarray:
+        """Convert a configuration to a point of the unit hypercube.
+
+        Args:
+            config (Dict[str, Any]): Configuration in the human perspective.
+
+        Returns:
+            np.ndarray: Coordinates of the configuration between 0 and 1.
+        """
+        point = np.zeros(len(self._keys))
+        for idx, key in enumerate(self._keys):
+            single_space = self.search_space[key]
+            if single_space.is_categorical():
+                value = single_space.choice_list.index(config[key])
+            else:
+                value = single_space.real_to_space(config[key])
+            lower, upper = single_space.lower_space(), single_space.upper_space()
+            point[idx] = (value - lower) / (upper - lower) if upper > lower else 0.0
+        return np.clip(point, 0.0, 1.0)
+
+    def from_unit_point(self, point: np.ndarray) -> Dict[str, Any]:
+        """Convert a point of the unit hypercube to a configuration.
+
+        Args:
+            point (np.ndarray): Coordinates of the configuration between 0 and 1.
+
+        Returns:
+            Dict[str, Any]: Configuration in the human perspective.
+        """
+        return self.search_space.convert_from_zero_one_scale_to_real_space(
+            {key: float(point[idx]) for idx, key in enumerate(self._keys)}
+        )
+
+    def suggest(self, observations: List[Tuple[Dict[str, Any], Union[int, float]]]) -> Optional[Dict[str, Any]]:
+        """Suggest a configuration to try given the scores of already trained configurations.
+
+        Args:
+            observations (List[Tuple[Dict[str, Any], Union[int, float]]]): Configurations and their scores, all
+                                                                            obtained with the same resource.
+
+        Returns:
+            Optional[Dict[str, Any]]: Suggested configuration, None if there are not enough observations.
+        """
+        if len(observations) < self.min_num_observations:
+            return None
+
+        points = np.stack([self.to_unit_point(config) for config, _ in observations])
+        scores = np.array([score for _, score in observations], dtype=np.float64)
+        order = np.argsort(-scores if self.mode == "max" else scores, kind="stable")
+        num_good = max(len(self._keys) + 1, math.ceil(self.top_ratio * len(observations)))
+        good_points, bad_points = points[order[:num_good]], points[order[num_good:]]
+        good_bandwidth = self._get_bandwidth(good_points)
+        bad_bandwidth = self._get_bandwidth(bad_points)
+
+        # Sample the candidates around the good points, with wider kernels to keep exploring
+        centers = good_points[self._rng.integers(len(good_points), size=self.num_candidates)]
+        scale = np.minimum(good_bandwidth * self.bandwidth_factor, 1.0)
+        candidates = truncnorm.rvs(
+            (0.0 - centers) / scale, (1.0 - centers) / scale, loc=centers, scale=scale, random_state=self._rng
+        )
+        candidates = np.atleast_2d(candidates).reshape(self.num_candidates, len(self._keys))
+
+        ratio = self._log_density(candidates, good_points, good_bandwidth) - self._log_density(
+            candidates, bad_points, bad_bandwidth
+        )
+        return self.from_unit_point(candidates[np.argmax(ratio)])
+
+    def _get_bandwidth(self, points: np.ndarray) -> np.ndarray:
+        """Scott's rule of thumb for each dimension, bounded by the minimum bandwidth."""
+        num_points, num_dims = points.shape
+        bandwidth = points.std(axis=0) * num_points ** (-1.0 / (num_dims + 4))
+        return np.maximum(bandwidth, self.min_bandwidth)
+
+    @staticmethod
+    def _log_density(candidates: np.ndarray, points: np.ndarray, bandwidth: np.ndarray) -> np.ndarray:
+        """Log density of the candidates for the gaussian kernels centered on the points."""
+        normalized = (candidates[:, None, :] - points[None, :, :]) / bandwidth
+        log_kernels = -0.5 * (normalized**2).sum(axis=2) - np.log(bandwidth).sum()
+        return logsumexp(log_kernels, axis=1) - math.log(len(points))
+
+
+class BOHB(HyperBand):
+    """It implements BOHB, the Asyncronous HyperBand scheduler sampling new trials with a TPE model.
+
+    The trials keep being scheduled and early stopped by the HyperBand brackets. When a trial which was given a
+    random configuration is about to start for the first time, its configuration is replaced by the suggestion of a
+    TreeParzenEstimator fitted on the scores of the trials trained with the largest resource reached by enough
+    trials. Prior hyper parameters are never replaced. With a minimum resource equal to the maximum resource, there is
+    a single bracket without early stopping and the algorithm is a plain sequential TPE.
+
+    Please refer the below paper for the detailed algorithm.
+
+    [1] "BOHB: Robust and Efficient Hyperparameter Optimization at Scale", ICML 2018
+        https://arxiv.org/abs/1807.01774
+
+    Args:
+        random_ratio (float, optional): Ratio of new trials which keep their random configuration,
+                                        so that the search space keeps being explored. Defaults to 1/3.
+        top_ratio (float, optional): Ratio of trials deemed good by the TPE model. Defaults to 0.15.
+        num_candidates (int, optional): Number of candidates evaluated by the TPE model. Defaults to 64.
+        bandwidth_factor (float, optional): Factor widening the good density to sample the candidates.
+                                            Defaults to 3.0.
+        min_bandwidth (float, optional): Minimum bandwidth of the kernels of the TPE model. Defaults to 1e-3.
+        seed (Optional[int], optional): Seed of the random generator. Defaults to None.
+        kwargs: Arguments of HyperBand.
+    """
+
+    def __init__(
+        self,
+        random_ratio: float = 1 / 3,
+        top_ratio: float = 0.15,
+        num_candidates: int = 64,
+        bandwidth_factor: float = 3.0,
+        min_bandwidth: float = 1e-3,
+        seed: Optional[int] = None,
+        **kwargs,
+    ):
+        # pylint: disable=too-many-arguments
+        if not 0 <= random_ratio <= 1:
+            raise ValueError(f"random_ratio should be between 0 and 1. Your value is {random_ratio}")
+        # Trials with a random configuration which haven't started yet, filled while HyperBand makes its brackets
+        self._unstarted_random_trials: Set[str] = set()
+        self._num_model_based_trials = 0
+        super().__init__(**kwargs)
+
+        self._random_ratio = random_ratio
+        self._rng = np.random.default_rng(seed)
+        self._estimator = TreeParzenEstimator(
+            self.search_space,
+            self.mode,
+            top_ratio,
+            num_candidates,
+            bandwidth_factor,
+            min_bandwidth,
+            seed,
+        )
+
+    def _get_random_hyper_parameter(self, num_samples: int) -> List[AshaTrial]:
+        hp_configs = super()._get_random_hyper_parameter(num_samples)
+        self._unstarted_random_trials.update(trial.id for trial in hp_configs)
+        return hp_configs
+
+    def get_next_sample(self) -> Optional[AshaTrial]:
+        """Get next trial to train, sampling its configuration with the TPE model if it starts for the first time.
+
+        Returns:
+            Optional[AshaTrial]: Next trial to train. If there is no trial to train, then return None.
+        """
+        trial = super().get_next_sample()
+        if trial is None or trial.id not in self._unstarted_random_trials:
+            return trial
+
+        self._unstarted_random_trials.discard(trial.id)
+        if self._rng.random() < self._random_ratio:
+            return trial
+        configuration = self._estimator.suggest(self._get_observations())
+        if configuration is not None:
+            logger.debug(f"{trial.id} trial is sampled by the TPE model.")
+            trial.configuration = configuration
+            self._num_model_based_trials += 1
+        return trial
+
+    def _get_observations(self) -> List[Tuple[Dict[str, Any], Union[int, float]]]:
+        """Scores of the trials at the largest resource reached by enough trials to fit the TPE model."""
+        trials = [trial for trial in self._trials.values() if trial.score]
+        resources = sorted({trial.iteration for trial in trials if trial.is_done()}, reverse=True)
+        for resource in resources:
+            observations = [
+                (trial.configuration, trial.get_best_score(self.mode, resource))
+                for trial in trials
+                if trial.get_progress() >= resource
+            ]
+            if len(observations) >= self._estimator.min_num_observations:
+                return observations
+        return []
+
+    def print_result(self):
+        """Print a BOHB result."""
+        print(f"{self._num_model_based_trials} of {len(self._trials)} trials were sampled by the TPE model.")
+        super().print_result()
@@ -194,6 +194,11 @@ class Trial:
         """Configuration to train with."""
         return self._configuration
 
+    @configuration.setter
+    def configuration(self, val: Dict):
+        """Setter for configuration."""
+        self._configuration = val
+
     @property
     def iteration(self):
         """Iteration to use for training."""
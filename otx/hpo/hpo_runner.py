@@ -17,9 +17,11 @@
 import logging
 import multiprocessing
 import os
+import time
 from copy import deepcopy
 from functools import partial
-from typing import Any, Callable, Dict, Literal, Optional, Union
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
 
 from otx.hpo.hpo_base import HpoBase, Trial, TrialStatus
 from otx.hpo.resource_manager import get_resource_manager
@@ -41,6 +43,8 @@ class HpoLoop:
                                                             It's used for GPUResourceManager. Defaults to None.
         available_gpu (Optional[str], optional): How many GPUs are available. It's used for GPUResourceManager.
                                                  Defaults to None.
+        wait_timeout (float, optional): Maximum time in seconds to wait for a report or the end of a trial process
+                                        before checking the HPO algorithm again. Defaults to 1.0.
     """
 
     def __init__(
@@ -51,6 +55,7 @@ class HpoLoop:
         num_parallel_trial: Optional[int] = None,
         num_gpu_for_single_trial: Optional[int] = None,
         available_gpu: Optional[str] = None,
+        wait_timeout: float = 1.0,
     ):
         self._hpo_algo = hpo_algo
         self._train_func = train_func
@@ -60,22 +65,74 @@ class HpoLoop:
         self._resource_manager = get_resource_manager(
             resource_type, num_parallel_trial, num_gpu_for_single_trial, available_gpu
         )
+        self._wait_timeout = wait_timeout
+        self._metrics: Dict[str, Union[int, float]] = {
+            "num_wakeups": 0,
+            "num_reports": 0,
+            "num_saves": 0,
+            "scheduling_time": 0.0,
+            "waiting_time": 0.0,
+        }
+
+    @property
+    def metrics(self) -> Dict[str, Union[int, float]]:
+        """Overhead of the HPO loop.
+
+        "num_wakeups" counts the iterations of the loop, "num_reports" the scores reported by the trials and
+        "num_saves" the writes of the HPO results. "scheduling_time" is the time in seconds spent by the loop itself,
+        and "waiting_time" the time spent waiting for the trials.
+        """
+        return dict(self._metrics)
 
     def run(self):
-        """Run a HPO loop."""
+        """Run a HPO loop.
+
+        The loop sleeps until a trial reports a score or a trial process ends, and saves the HPO results only when
+        they change.
+        """
         logger.info("HPO loop starts.")
+        loop_start = time.perf_counter()
         while not self._hpo_algo.is_done():
+            self._metrics["num_wakeups"] += 1
+            trial_started = False
             if self._resource_manager.have_available_resource():
                 trial = self._hpo_algo.get_next_sample()
                 if trial is not None:
                     self._start_trial_process(trial)
+                    trial_started = True
 
-            self._remove_finished_process()
-            self._get_reports()
+            updated = self._remove_finished_process()
+            updated = self._get_reports() or updated
+            if trial_started or updated:
+                self._save_results()
+            # Start the next trial right away if there are resources left
+            if not trial_started:
+                self._wait_for_trials()
 
         logger.info("HPO loop is done.")
         self._get_reports()
+        self._save_results()
         self._join_all_processes()
+        self._metrics["scheduling_time"] = time.perf_counter() - loop_start - self._metrics["waiting_time"]
+        logger.info(f"HPO loop overhead : {self._metrics}")
+
+    def _wait_for_trials(self):
+        """Wait until a trial reports a score or a trial process ends, or until the timeout."""
+        start = time.perf_counter()
+        objects: List[Any] = []
+        for val in self._running_trials.values():
+            if not val["pipe"].closed:
+                objects.append(val["pipe"])
+            objects.append(val["process"].sentinel)
+        if objects:
+            wait(objects, timeout=self._wait_timeout)
+        else:
+            time.sleep(self._wait_timeout)
+        self._metrics["waiting_time"] += time.perf_counter() - start
+
+    def _save_results(self):
+        self._hpo_algo.save_results()
+        self._metrics["num_saves"] += 1
 
     def _start_trial_process(self, trial: Trial):
         logger.info(f"{trial.id} trial is now running.")
@@ -103,11 +160,13 @@ class HpoLoop:
         self._running_trials[uid] = {"process": process, "trial": trial, "pipe": pipe1}
         process.start()
 
-    def _remove_finished_process(self):
+    def _remove_finished_process(self) -> bool:
         trial_to_remove = []
+        # The sentinel of a process is ready as soon as it exits, possibly slightly before is_alive() knows it
+        ended = set(wait([val["process"].sentinel for val in self._running_trials.values()], timeout=0))
         for uid, val in self._running_trials.items():
             process = val["process"]
-            if not process.is_alive():
+            if process.sentinel in ended or not process.is_alive():
                 val["pipe"].close()
                 process.join()
                 trial_to_remove.append(uid)
@@ -118,20 +177,27 @@ class HpoLoop:
             self._resource_manager.release_resource(uid)
             del self._running_trials[uid]
 
-    def _get_reports(self):
+        return bool(trial_to_remove)
+
+    def _get_reports(self) -> bool:
+        num_reports = 0
         for trial in self._running_trials.values():
             pipe = trial["pipe"]
-            if pipe.poll():
+            if not pipe.closed and pipe.poll():
                 try:
                     report = pipe.recv()
                 except EOFError:
+                    # The trial is exiting. Its pipe stays readable until the process ends, so stop waiting on it.
+                    pipe.close()
                     continue
                 trial_status = self._hpo_algo.report_score(
                     report["score"], report["progress"], report["trial_id"], report["done"]
                 )
                 pipe.send(trial_status)
+                num_reports += 1
 
-        self._hpo_algo.save_results()
+        self._metrics["num_reports"] += num_reports
+        return num_reports > 0
 
     def _join_all_processes(self):
         for val in self._running_trials.values():
@@ -177,6 +243,7 @@ def run_hpo_loop(
     num_parallel_trial: Optional[int] = None,
     num_gpu_for_single_trial: Optional[int] = None,
     available_gpu: Optional[str] = None,
+    wait_timeout: float = 1.0,
 ):
     """Run the HPO loop.
 
@@ -191,6 +258,16 @@ def run_hpo_loop(
                                                             It's used for GPUResourceManager. Defaults to None.
         available_gpu (Optional[str], optional): How many GPUs are available. It's used for GPUResourceManager.
                                                  Defaults to None.
+        wait_timeout (float, optional): Maximum time in seconds to wait for a report or the end of a trial process
+                                        before checking the HPO algorithm again. Defaults to 1.0.
     """
-    hpo_loop = HpoLoop(hpo_algo, train_func, resource_type, num_parallel_trial, num_gpu_for_single_trial, available_gpu)
+    hpo_loop = HpoLoop(
+        hpo_algo,
+        train_func,
+        resource_type,
+        num_parallel_trial,
+        num_gpu_for_single_trial,
+        available_gpu,
+        wait_timeout,
+    )
     hpo_loop.run()
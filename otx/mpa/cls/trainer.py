@@ -7,11 +7,13 @@ import os.path as osp
 import time
 
 from mmcls import __version__
+from mmcls.apis import train as mmcls_train
 from mmcls.apis import train_model
 from mmcls.datasets import build_dataloader, build_dataset
 from mmcls.utils import collect_env
 from torch import nn
 
+from otx.algorithms.common.adapters.mmcv.utils import support_cpu_distributed
 from otx.mpa.registry import STAGES
 from otx.mpa.utils.logger import get_logger
 
@@ -19,6 +21,9 @@ from .stage import ClsStage
 
 logger = get_logger()
 
+# mmcls only wraps the models on accelerators for distributed training
+mmcls_train.wrap_distributed_model = support_cpu_distributed(mmcls_train.wrap_distributed_model)
+
 
 @STAGES.register_module()
 class ClsTrainer(ClsStage):
@@ -134,6 +139,11 @@ class ClsTrainer(ClsStage):
         )
 
     def _modify_cfg_for_distributed(self, model, cfg):
+        if cfg.device == "cpu":
+            # SyncBatchNorm only runs on GPU, and the batch is split between the CPU processes
+            # so that the learning rate doesn't need to be scaled
+            return
+
         nn.SyncBatchNorm.convert_sync_batchnorm(model)
 
         if cfg.dist_params.get("linear_scale_lr", False):
@@ -8,11 +8,13 @@ import time
 
 from mmcv.utils import get_git_hash
 from mmdet import __version__
+from mmdet.apis import train as mmdet_train
 from mmdet.apis import train_detector
 from mmdet.datasets import build_dataset
 from mmdet.utils import collect_env
 from torch import nn
 
+from otx.algorithms.common.adapters.mmcv.utils import support_cpu_distributed
 from otx.mpa.modules.utils.task_adapt import extract_anchor_ratio
 from otx.mpa.registry import STAGES
 from otx.mpa.utils.logger import get_logger
@@ -21,6 +23,9 @@ from .stage import DetectionStage
 
 logger = get_logger()
 
+# mmdet only wraps the models on accelerators for distributed training
+mmdet_train.build_ddp = support_cpu_distributed(mmdet_train.build_ddp)
+
 
 @STAGES.register_module()
 class DetectionTrainer(DetectionStage):
@@ -124,6 +129,11 @@ class DetectionTrainer(DetectionStage):
         )
 
     def _modify_cfg_for_distributed(self, model, cfg):
+        if cfg.device == "cpu":
+            # SyncBatchNorm only runs on GPU, and the batch is split between the CPU processes
+            # so that the learning rate doesn't need to be scaled
+            return
+
         nn.SyncBatchNorm.convert_sync_batchnorm(model)
 
         if cfg.dist_params.get("linear_scale_lr", False):
@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 import torch
 import torch.nn.functional as F
@@ -233,16 +233,23 @@ class ReciproCAMHook(BaseRecordingForwardHook):
     recipro-cam: gradient-free reciprocal class activation map (https://arxiv.org/pdf/2209.14074.pdf)
     """
 
-    def __init__(self, module: torch.nn.Module, fpn_idx: int = -1) -> None:
+    # Maximum number of elements of the mosaic feature maps given to the head at once
+    max_mosaic_numel = 2**25
+
+    def __init__(self, module: torch.nn.Module, fpn_idx: int = -1, chunk_size: Optional[int] = None) -> None:
         super().__init__(module, fpn_idx)
         self._neck = module.neck if module.with_neck else None
         self._head = module.head
         self._num_classes = module.head.num_classes
+        self._chunk_size = chunk_size
 
     def func(self, feature_map: Union[torch.Tensor, Sequence[torch.Tensor]], fpn_idx: int = -1) -> torch.Tensor:
         """
         Generate the class-wise saliency maps using Recipro-CAM and then normalizing to (0, 255).
 
+        The mosaic feature maps of all the samples are predicted together, by chunks of spatial positions
+        to bound the peak memory.
+
         Args:
             feature_map (Union[torch.Tensor, List[torch.Tensor]]): feature maps from backbone or list of feature maps
                                                                     from FPN.
@@ -256,13 +263,16 @@ class ReciproCAMHook(BaseRecordingForwardHook):
             feature_map = feature_map[fpn_idx]
 
         bs, c, h, w = feature_map.size()
-        saliency_maps = torch.empty(bs, self._num_classes, h, w)
-        for f in range(bs):
-            mosaic_feature_map = self._get_mosaic_feature_map(feature_map[f], c, h, w)
+        chunk_size = self._get_chunk_size(bs, c, h, w)
+        saliency_maps = torch.empty(bs, self._num_classes, h * w)
+        for start in range(0, h * w, chunk_size):
+            positions = torch.arange(start, min(start + chunk_size, h * w), device=feature_map.device)
+            mosaic_feature_map = self._get_mosaic_feature_map(feature_map, positions)
             mosaic_prediction = self._predict_from_feature_map(mosaic_feature_map)
-            saliency_maps[f] = mosaic_prediction.transpose(0, 1).reshape((self._num_classes, h, w))
+            saliency_maps[:, :, start : start + len(positions)] = mosaic_prediction.reshape(
+                (bs, len(positions), self._num_classes)
+            ).transpose(1, 2)
 
-        saliency_maps = saliency_maps.reshape((bs, self._num_classes, h * w))
         max_values, _ = torch.max(saliency_maps, -1)
         min_values, _ = torch.min(saliency_maps, -1)
         saliency_maps = 255 * (saliency_maps - min_values[:, :, None]) / (max_values - min_values + 1e-12)[:, :, None]
@@ -279,22 +289,42 @@ class ReciproCAMHook(BaseRecordingForwardHook):
                 logits = torch.tensor(logits)
         return logits
 
-    def _get_mosaic_feature_map(self, feature_map: torch.Tensor, c: int, h: int, w: int) -> torch.Tensor:
-        if self._neck is not None and isinstance(self._neck, GlobalAveragePooling):
+    def _is_gap_neck(self) -> bool:
+        return self._neck is not None and isinstance(self._neck, GlobalAveragePooling)
+
+    def _get_chunk_size(self, bs: int, c: int, h: int, w: int) -> int:
+        """Number of spatial positions whose mosaic feature maps are predicted at once."""
+        if self._chunk_size is not None:
+            return max(1, self._chunk_size)
+        mosaic_numel = bs * c if self._is_gap_neck() else bs * c * h * w
+        return max(1, min(h * w, self.max_mosaic_numel // mosaic_numel))
+
+    def _get_mosaic_feature_map(self, feature_map: torch.Tensor, positions: torch.Tensor) -> torch.Tensor:
+        """Build the mosaic feature maps of the given spatial positions for all the samples.
+
+        Args:
+            feature_map (torch.Tensor): Feature maps of the batch - [batch, C, H, W]
+            positions (torch.Tensor): Flattened spatial positions to keep - [N]
+
+        Returns:
+            torch.Tensor: Feature maps keeping only one spatial position each - [batch * N, C, H, W],
+                          ordered by sample and then by position.
+        """
+        bs, c, h, w = feature_map.size()
+        if self._is_gap_neck():
             """
             Optimization workaround for the GAP case (simulate GAP with more simple compute graph)
             Possible due to static sparsity of mosaic_feature_map
             Makes the downstream GAP operation to be dummy
             """
-            feature_map_transposed = torch.flatten(feature_map, start_dim=1).transpose(0, 1)[:, :, None, None]
-            mosaic_feature_map = feature_map_transposed / (h * w)
+            feature_map_transposed = torch.flatten(feature_map, start_dim=2)[:, :, positions].transpose(1, 2)
+            mosaic_feature_map = feature_map_transposed.reshape((-1, c, 1, 1)) / (h * w)
         else:
-            feature_map_repeated = feature_map.repeat(h * w, 1, 1, 1)
-            mosaic_feature_map_mask = torch.zeros(h * w, c, h, w).to(feature_map.device)
-            spacial_order = torch.arange(h * w).reshape(h, w)
-            for i in range(h):
-                for j in range(w):
-                    k = spacial_order[i, j]
-                    mosaic_feature_map_mask[k, :, i, j] = torch.ones(c).to(feature_map.device)
-            mosaic_feature_map = feature_map_repeated * mosaic_feature_map_mask
+            # One-hot spatial masks of the positions, broadcast over the samples and channels
+            mosaic_feature_map_mask = torch.zeros(
+                len(positions), h * w, dtype=feature_map.dtype, device=feature_map.device
+            )
+            mosaic_feature_map_mask[torch.arange(len(positions), device=feature_map.device), positions] = 1
+            mosaic_feature_map_mask = mosaic_feature_map_mask.reshape((1, -1, 1, h, w))
+            mosaic_feature_map = (feature_map[:, None] * mosaic_feature_map_mask).reshape((-1, c, h, w))
         return mosaic_feature_map
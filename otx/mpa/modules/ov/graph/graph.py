@@ -3,9 +3,11 @@
 #
 
 import inspect
+from bisect import bisect_left, insort
 from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import asdict
+from functools import lru_cache
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 import _collections_abc
@@ -50,44 +52,66 @@ class NOOP:
     pass
 
 
+@lru_cache(maxsize=None)
+def get_valid_in_ports(op_cls: type) -> Optional[List[int]]:
+    """Get the valid input ports of an operation class from its forward signature, None for any number of inputs."""
+    spec = inspect.getfullargspec(op_cls.forward)
+    if spec.varargs is not None:
+        return None
+    return list(range(len(spec.args[1:])))
+
+
 class SortedDict(dict):
+    """Dictionary of the adjacent nodes, iterated in the order of the port of their edge.
+
+    The keys are kept sorted with bisection, by the port of the first edge and then by insertion order,
+    so that adding and removing an adjacent node doesn't sort or scan all the other ones.
+    """
+
     def __init__(self, sort_key, *args, **kwargs):
         self._sort_key = sort_key
+        # [sort_value, insertion_order, key, edge_key] sorted by (sort_value, insertion_order) which is unique
         self._sorted_keys = []
+        self._sort_values = {}
+        self._num_insertions = 0
         super().__init__(self, *args, **kwargs)
 
     def __setitem__(self, key, value):
         assert len(value) == 1
         edge_key, edge_attr = next(iter(value.items()))
-        sort_value = float("inf") if self._sort_key not in edge_attr else edge_attr[self._sort_key]
-        self._sorted_keys.append([sort_value, key, edge_key])
-        self._sorted_keys.sort(key=lambda x: x[0])
         if key in self:
             assert edge_key not in self[key]
             self[key].update(value)
-        else:
-            super().__setitem__(key, value)
+            return
+
+        sort_value = float("inf") if self._sort_key not in edge_attr else edge_attr[self._sort_key]
+        self._sort_values[key] = (sort_value, self._num_insertions)
+        insort(self._sorted_keys, [sort_value, self._num_insertions, key, edge_key])
+        self._num_insertions += 1
+        super().__setitem__(key, value)
 
     def __delitem__(self, key):
         super().__delitem__(key)
-        for i, (_, key_in, _) in enumerate(self._sorted_keys):
-            if key_in == key:
-                break
-        self._sorted_keys.pop(i)
+        self._remove_sorted_key(key)
+
+    def _remove_sorted_key(self, key):
+        sort_value, insertion_order = self._sort_values.pop(key)
+        # [sort_value, insertion_order] is right before its own entry
+        del self._sorted_keys[bisect_left(self._sorted_keys, [sort_value, insertion_order])]
 
     def __iter__(self):
-        for _, key, _ in self._sorted_keys:
+        for _, _, key, _ in self._sorted_keys:
             yield key
 
     def __reversed__(self):
-        for _, key, _ in self._sorted_keys[::-1]:
+        for _, _, key, _ in reversed(self._sorted_keys):
             yield key
 
     def __repr__(self):
         if not len(self):
             return "{}"
         repr = "{"
-        for _, key, _ in self._sorted_keys:
+        for key in self:
             repr += f"{key}: {self[key]}, "
         repr = repr[:-2]
         repr += "}"
@@ -104,6 +128,7 @@ class SortedDict(dict):
     def clear(self):
         super().clear()
         self._sorted_keys = []
+        self._sort_values = {}
 
     def pop(self, key, default=NOOP()):
         if isinstance(default, NOOP):
@@ -111,10 +136,8 @@ class SortedDict(dict):
         else:
             value = super().pop(key, default)
 
-        for i, (_, key_in, _) in enumerate(self._sorted_keys):
-            if key_in == key:
-                break
-        self._sorted_keys.pop(i)
+        if key in self._sort_values:
+            self._remove_sorted_key(key)
 
         return value
 
@@ -293,9 +316,8 @@ class Graph(nx.MultiDiGraph):
                 in_port = len(occupied)
 
         # validate in_port
-        spec = inspect.getfullargspec(node_to.forward)
-        if spec.varargs is None:
-            valid_range = list(range(len(spec.args[1:])))
+        valid_range = get_valid_in_ports(type(node_to))
+        if valid_range is not None:
             if in_port not in valid_range:
                 raise ValueError(f"in_port {in_port} is not in valid range {valid_range} " f"for {node_to.name}.")
         occupied = []
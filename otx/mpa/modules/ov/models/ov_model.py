@@ -7,7 +7,7 @@ import os
 import tempfile
 from collections import OrderedDict
 from copy import deepcopy
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import openvino.runtime as ov
 import torch
@@ -30,6 +30,19 @@ logger = get_logger()
 CONNECTION_SEPARATOR = "||"
 
 
+class ExecutionStep(NamedTuple):
+    """A node to run in the forward pass of OVModel.
+
+    inputs are the (node name, output port) pairs feeding the input ports of the node in order,
+    and frees are the names of the features which are not needed anymore once the node has run.
+    """
+
+    name: str
+    type: str
+    inputs: Tuple[Tuple[str, int], ...]
+    frees: Tuple[str, ...]
+
+
 class OVModel(torch.nn.Module):
     def __init__(
         self,
@@ -57,6 +70,7 @@ class OVModel(torch.nn.Module):
         self._inputs = []
         self._outputs = []
         self._feature_dict = OrderedDict()
+        self._execution_plan: Optional[List[ExecutionStep]] = None
 
         # build graph
         graph = self.build_graph(model_path_or_model, weight_path)
@@ -403,49 +417,60 @@ class OVModel(torch.nn.Module):
                 inputs[key] = arg
         return inputs
 
+    def build_execution_plan(self) -> List[ExecutionStep]:
+        """Freeze the order of the nodes, their input ports and the lifetime of the features.
+
+        The graph is walked once here instead of at every forward pass.
+        A feature is freed after its last use, unless it is a feature to keep or it has no successor.
+        """
+        nodes = list(self.model.values())
+        steps_inputs: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        last_uses: Dict[str, str] = {}
+        for node in nodes:
+            input_features: Dict[int, Tuple[str, int]] = {}
+            for input_node, edges in self._graph.predecessors(node, with_edge_data=True):
+                for edge in edges:
+                    assert edge["in_port"] not in input_features
+                    input_features[edge["in_port"]] = (input_node.name, edge["out_port"])
+                last_uses[input_node.name] = node.name
+            if not input_features and node.type not in ("Parameter", "Constant"):
+                raise ValueError(f"Broken graph. Node {node.name} is a type of {node.type} " "but it has no in edges.")
+            assert sorted(input_features) == list(range(len(input_features)))
+            steps_inputs[node.name] = tuple(input_features[in_port] for in_port in range(len(input_features)))
+
+        features_to_keep = set(self._features_to_keep) if self._features_to_keep is not None else set()
+        frees: Dict[str, List[str]] = {node.name: [] for node in nodes}
+        for input_node_name, node_name in last_uses.items():
+            if input_node_name not in features_to_keep:
+                frees[node_name].append(input_node_name)
+
+        return [ExecutionStep(node.name, node.type, steps_inputs[node.name], tuple(frees[node.name])) for node in nodes]
+
     def forward(self, *args, **kwargs):
         self._feature_dict.clear()
         inputs = self._build_forward_inputs(*args, **kwargs)
-
-        done = {}
-        for node_name, node in self.model.items():
-            done[node_name] = {node.name: False for node in self._graph.successors(node)}
-
-        for node_name, node in self.model.items():
-            predecessors_with_edge = list(self._graph.predecessors(node, with_edge_data=True))
-            if not predecessors_with_edge:
-                if node.type == "Parameter":
-                    self._feature_dict[node_name] = node(inputs[node_name])
-                elif node.type == "Constant":
-                    self._feature_dict[node_name] = node()
-                else:
-                    raise ValueError(
-                        f"Broken graph. Node {node_name} is a type of {node.type} " "but it has no in edges."
-                    )
+        if self._execution_plan is None:
+            self._execution_plan = self.build_execution_plan()
+
+        features = self._feature_dict
+        nodes = self.model
+        for step in self._execution_plan:
+            node = nodes[step.name]
+            if step.type == "Parameter":
+                feature = node(inputs[step.name])
+            elif not step.inputs:
+                feature = node()
             else:
-                input_nodes, edges = list(map(list, zip(*predecessors_with_edge)))
-                input_node_names = [input_node.name for input_node in input_nodes]
-
-                input_features = [edge["in_port"] for edges_ in edges for edge in edges_]
-                assert len(input_features) == len(set(input_features))
-                input_features = [None for _ in input_features]
-                for idx, input_node_name in enumerate(input_node_names):
-                    if self._features_to_keep is not None and input_node_name in self._features_to_keep:
-                        input_feature = self._feature_dict.get(input_node_name)
-                    else:
-                        input_feature = self._feature_dict.pop(input_node_name)
-                        done[input_node_name][node_name] = True
-                        if not all(done[input_node_name].values()):
-                            self._feature_dict[input_node_name] = input_feature
-
+                input_features = []
+                for input_node_name, out_port in step.inputs:
+                    input_feature = features[input_node_name]
                     if isinstance(input_feature, tuple):
-                        for edges_ in edges[idx]:
-                            input_features[edges_["in_port"]] = input_feature[edges_["out_port"]]
-                    else:
-                        for edges_ in edges[idx]:
-                            input_features[edges_["in_port"]] = input_feature
-                assert all(input_feature is not None for input_feature in input_features)
-                self._feature_dict[node_name] = node(*input_features)
+                        input_feature = input_feature[out_port]
+                    input_features.append(input_feature)
+                feature = node(*input_features)
+            for input_node_name in step.frees:
+                del features[input_node_name]
+            features[step.name] = feature
 
         outputs = OrderedDict()
         for output_name in self._outputs:
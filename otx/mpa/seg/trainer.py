@@ -9,11 +9,13 @@ import time
 
 from mmcv import get_git_hash
 from mmseg import __version__
+from mmseg.apis import train as mmseg_train
 from mmseg.apis import train_segmentor
 from mmseg.datasets import build_dataset
 from mmseg.utils import collect_env
 from torch import nn
 
+from otx.algorithms.common.adapters.mmcv.utils import support_cpu_distributed
 from otx.mpa.registry import STAGES
 from otx.mpa.utils.logger import get_logger
 
@@ -21,6 +23,9 @@ from .stage import SegStage
 
 logger = get_logger()
 
+# mmseg only wraps the models on accelerators for distributed training
+mmseg_train.build_ddp = support_cpu_distributed(mmseg_train.build_ddp)
+
 
 @STAGES.register_module()
 class SegTrainer(SegStage):
@@ -120,6 +125,11 @@ class SegTrainer(SegStage):
         )
 
     def _modify_cfg_for_distributed(self, model, cfg):
+        if cfg.device == "cpu":
+            # SyncBatchNorm only runs on GPU, and the batch is split between the CPU processes
+            # so that the learning rate doesn't need to be scaled
+            return
+
         nn.SyncBatchNorm.convert_sync_batchnorm(model)
 
         if cfg.dist_params.get("linear_scale_lr", False):
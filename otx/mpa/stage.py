@@ -4,6 +4,7 @@
 
 import importlib
 import json
+import math
 import os
 import os.path as osp
 import random
@@ -305,7 +306,12 @@ class Stage(object):
         dataset_len = len(data_cfg.otx_dataset)
 
         if distributed:
-            dataset_len = dataset_len // dist.get_world_size()
+            world_size = dist.get_world_size()
+            if cfg.get("device", None) == "cpu":
+                # CPU processes split the batch, to keep the batch size which the learning rate is tuned for
+                samples_per_gpu = max(1, math.ceil(samples_per_gpu / world_size))
+                dataloader_cfg.samples_per_gpu = samples_per_gpu
+            dataset_len = dataset_len // world_size
         if dataset_len < samples_per_gpu:
             dataloader_cfg.samples_per_gpu = dataset_len
         cfg.data[f"{subset}_dataloader"] = dataloader_cfg
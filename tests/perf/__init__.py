@@ -0,0 +1,10 @@
+"""Micro-benchmarks for OTX performance critical paths.
+
+Benchmarks are plain scripts (not collected by pytest), run them from the repository root, e.g.:
+
+    python -m tests.perf.benchmark_f_measure
+"""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
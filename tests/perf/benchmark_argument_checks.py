@@ -0,0 +1,109 @@
+"""Benchmark of the per-call overhead of check_input_parameters_type."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import inspect
+import timeit
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.utils.argument_checks import (
+    check_input_parameters_type,
+    check_parameter_type,
+    set_trusted_mode,
+)
+
+
+def reference_check_input_parameters_type(custom_checks: Optional[dict] = None):
+    """Reference implementation, inspecting the signature and checking all the elements on every call."""
+    if custom_checks is None:
+        custom_checks = {}
+
+    def _check_input_parameters_type(function):
+        @wraps(function)
+        def validate(*args, **kwargs):
+            signature = inspect.signature(function)
+            expected_types_map = signature.parameters
+            if len(expected_types_map) < len(args):
+                raise TypeError("Too many positional arguments")
+            input_parameters_values_map = dict(zip(signature.parameters.keys(), args))
+            for key, value in kwargs.items():
+                if key in input_parameters_values_map:
+                    raise TypeError(f"Duplication of the parameter {key} -- both in args and kwargs")
+                input_parameters_values_map[key] = value
+            for parameter_name in expected_types_map:
+                parameter = input_parameters_values_map.get(parameter_name)
+                if parameter_name not in input_parameters_values_map:
+                    default_value = expected_types_map.get(parameter_name).default
+                    if default_value != inspect._empty:  # pylint: disable=protected-access
+                        parameter = default_value
+                if parameter_name in custom_checks:
+                    custom_check = custom_checks[parameter_name]
+                    if custom_check is None:
+                        continue
+                    custom_check(parameter, parameter_name).check()
+                else:
+                    check_parameter_type(
+                        parameter=parameter,
+                        parameter_name=parameter_name,
+                        expected_type=expected_types_map.get(parameter_name).annotation,
+                    )
+            return function(**input_parameters_values_map)
+
+        return validate
+
+    return _check_input_parameters_type
+
+
+def load_image(self, results: Dict[str, Any]):
+    """Like the __call__ of the image loading pipelines."""
+    return results
+
+
+def predict(self, image: np.ndarray, labels: List[LabelEntity], threshold: float = 0.5, top_k: Optional[int] = None):
+    """Like the predict of the OpenVINO inferencers, with a list of labels."""
+    return image
+
+
+def run(num_calls: int, num_labels: int):
+    """Times the calls of the functions undecorated and with the decorators."""
+    labels = [LabelEntity(name=f"label_{idx}", domain=Domain.CLASSIFICATION) for idx in range(num_labels)]
+    calls = [
+        ("load_image", load_image, lambda function: function(None, {"img": None, "index": 0})),
+        ("predict", predict, lambda function: function(None, np.zeros((8, 8, 3)), labels, threshold=0.3)),
+    ]
+    print(f"per-call overhead in microseconds over {num_calls} calls, {num_labels} labels")
+    for name, function, call in calls:
+        undecorated = min(timeit.repeat(lambda: call(function), number=num_calls, repeat=3))
+
+        def overhead(decorated: Callable):
+            return (min(timeit.repeat(lambda: call(decorated), number=num_calls, repeat=3)) - undecorated) / num_calls
+
+        reference = overhead(reference_check_input_parameters_type()(function))
+        compiled = overhead(check_input_parameters_type()(function))
+        set_trusted_mode(True)
+        trusted = overhead(check_input_parameters_type()(function))
+        set_trusted_mode(False)
+        print(
+            f"{name:>12}: reference {reference * 1e6:8.2f}, compiled {compiled * 1e6:8.2f}, "
+            f"trusted {trusted * 1e6:8.2f}"
+        )
+
+
+def main():
+    """Parses the arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000, help="Number of calls of each function")
+    parser.add_argument("--labels", type=int, default=1000, help="Number of labels given to predict")
+    args = parser.parse_args()
+    run(args.calls, args.labels)
+
+
+if __name__ == "__main__":
+    main()
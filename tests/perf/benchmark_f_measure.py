@@ -0,0 +1,76 @@
+"""Benchmark of the vectorized and Python F-measure matching backends."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from otx.api.usecases.evaluation.f_measure import _FMeasureCalculator
+
+Box = Tuple[float, float, float, float, str, float]
+
+
+def generate_boxes(
+    n_images: int, n_boxes: int, classes: List[str], seed: int = 0
+) -> Tuple[List[List[Box]], List[List[Box]]]:
+    """Generates ground truth boxes and jittered predictions with a few extra false positives per image."""
+    rng = np.random.default_rng(seed)
+    ground_truth_per_image, prediction_per_image = [], []
+    for _ in range(n_images):
+        top_left = rng.uniform(0.0, 0.9, size=(n_boxes, 2))
+        size = rng.uniform(0.01, 0.1, size=(n_boxes, 2))
+        labels = rng.choice(classes, size=n_boxes)
+        ground_truth = [(x1, y1, x1 + w, y1 + h, str(c), 1.0) for (x1, y1), (w, h), c in zip(top_left, size, labels)]
+        jitter = rng.normal(0.0, 0.01, size=(n_boxes, 4))
+        predictions = [
+            (x1 + dx1, y1 + dy1, x2 + dx2, y2 + dy2, c, float(s))
+            for (x1, y1, x2, y2, c, _), (dx1, dy1, dx2, dy2), s in zip(ground_truth, jitter, rng.random(n_boxes))
+        ]
+        n_false_positives = n_boxes // 5
+        fp_top_left = rng.uniform(0.0, 0.9, size=(n_false_positives, 2))
+        predictions += [
+            (x1, y1, x1 + 0.05, y1 + 0.05, str(c), float(s))
+            for (x1, y1), c, s in zip(
+                fp_top_left, rng.choice(classes, size=n_false_positives), rng.random(n_false_positives)
+            )
+        ]
+        ground_truth_per_image.append(ground_truth)
+        prediction_per_image.append(predictions)
+    return ground_truth_per_image, prediction_per_image
+
+
+def run(n_images: int, n_boxes: int, n_classes: int, vary_nms: bool):
+    """Runs both backends on the same synthetic data, checks the results are identical and prints timings."""
+    classes = [f"class_{i}" for i in range(n_classes)]
+    ground_truth, predictions = generate_boxes(n_images, n_boxes, classes)
+    results = {}
+    for vectorized in [False, True]:
+        calculator = _FMeasureCalculator(ground_truth, predictions, vectorized=vectorized)
+        start = time.perf_counter()
+        results[vectorized] = calculator.evaluate_detections(classes, result_based_nms_threshold=vary_nms)
+        elapsed = time.perf_counter() - start
+        print(f"{'vectorized' if vectorized else 'python':>10}: {elapsed:8.3f} s")
+    assert vars(results[True].per_confidence) == vars(results[False].per_confidence), "Results differ"
+    if vary_nms:
+        assert vars(results[True].per_nms) == vars(results[False].per_nms), "Results differ"
+    print(f"best f-measure: {results[True].best_f_measure:.6f} (identical for both backends)")
+
+
+def main():
+    """Parses the arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--images", type=int, default=200)
+    parser.add_argument("--boxes", type=int, default=50, help="Ground truth boxes per image")
+    parser.add_argument("--classes", type=int, default=3)
+    parser.add_argument("--vary-nms", action="store_true", help="Also sweep the NMS thresholds")
+    args = parser.parse_args()
+    run(args.images, args.boxes, args.classes, args.vary_nms)
+
+
+if __name__ == "__main__":
+    main()
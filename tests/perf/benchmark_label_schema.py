@@ -0,0 +1,68 @@
+"""Benchmark of the hierarchical label resolution with the label graphs and with the compiled label schema index."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import time
+
+import numpy as np
+
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.entities.label_schema import LabelGroup, LabelSchemaEntity
+
+
+def build_label_schema(num_groups: int, group_size: int) -> LabelSchemaEntity:
+    """Builds a hierarchy of exclusive groups, each group being the children of a label of the previous groups."""
+    rng = np.random.default_rng(0)
+    label_schema = LabelSchemaEntity()
+    parents = []
+    for group_idx in range(num_groups):
+        labels = [
+            LabelEntity(name=f"label_{group_idx}_{idx}", domain=Domain.CLASSIFICATION) for idx in range(group_size)
+        ]
+        label_schema.add_group(LabelGroup(name=f"group_{group_idx}", labels=labels))
+        if parents:
+            parent = parents[rng.integers(len(parents))]
+            for label in labels:
+                label_schema.add_child(parent, label)
+        parents += labels
+    return label_schema
+
+
+def run(num_groups: int, group_size: int, num_items: int):
+    """Resolves random predictions of every label with both implementations and prints timings."""
+    label_schema = build_label_schema(num_groups, group_size)
+    labels = label_schema.get_labels(include_empty=False)
+    probabilities = np.random.default_rng(0).random((num_items, len(labels)))
+    print(f"{len(labels)} labels in {num_groups} groups, {num_items} predictions")
+
+    start = time.perf_counter()
+    expected_labels = [
+        label_schema._LabelSchemaEntity__resolve_labels_probabilistic(  # pylint: disable=protected-access
+            dict(zip(labels, item_probabilities)), None
+        )
+        for item_probabilities in probabilities
+    ]
+    print(f"{'graphs':>8}: {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    resolved_labels = label_schema.compile().resolve_labels_probabilistic(probabilities, labels)
+    print(f"{'index':>8}: {time.perf_counter() - start:8.3f} s (including the compilation)")
+    assert resolved_labels == expected_labels, "Resolved labels differ"
+    print("identical resolved labels")
+
+
+def main():
+    """Parses the arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--groups", type=int, default=50, help="Number of exclusive groups")
+    parser.add_argument("--group-size", type=int, default=6, help="Number of labels in each group")
+    parser.add_argument("--items", type=int, default=200, help="Number of predictions to resolve")
+    args = parser.parse_args()
+    run(args.groups, args.group_size, args.items)
+
+
+if __name__ == "__main__":
+    main()
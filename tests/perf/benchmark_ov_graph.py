@@ -0,0 +1,119 @@
+"""Benchmark of building and rewriting a large graph of OpenVINO operations."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import time
+from typing import Callable, List
+
+import torch
+
+from otx.mpa.modules.ov.graph.graph import NOOP, Graph, SortedDict
+from otx.mpa.modules.ov.ops import OPS
+from otx.mpa.modules.ov.ops.op import Operation
+
+
+class ReferenceSortedDict(SortedDict):
+    """Reference implementation, sorting all the keys on insertion and scanning them on removal."""
+
+    def __setitem__(self, key, value):
+        assert len(value) == 1
+        edge_key, edge_attr = next(iter(value.items()))
+        sort_value = float("inf") if self._sort_key not in edge_attr else edge_attr[self._sort_key]
+        self._sorted_keys.append([sort_value, 0, key, edge_key])
+        self._sorted_keys.sort(key=lambda x: x[0])
+        if key in self:
+            assert edge_key not in self[key]
+            self[key].update(value)
+        else:
+            dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._remove_sorted_key(key)
+
+    def _remove_sorted_key(self, key):
+        for i, (_, _, key_in, _) in enumerate(self._sorted_keys):
+            if key_in == key:
+                break
+        self._sorted_keys.pop(i)
+
+    def pop(self, key, default=NOOP()):
+        value = dict.pop(self, key) if isinstance(default, NOOP) else dict.pop(self, key, default)
+        self._remove_sorted_key(key)
+        return value
+
+
+class ReferenceSortedDictHelper(dict):
+    """Adjacency of the reference implementation."""
+
+    def __init__(self, sort_key=None):
+        self._sort_key = sort_key
+        super().__init__()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, ReferenceSortedDict(self._sort_key))
+        for v_key, v_value in value.items():
+            self[key][v_key] = v_value
+
+
+class ReferenceGraph(Graph):
+    """Graph with the reference adjacency."""
+
+    def __init__(self):
+        super().__init__()
+        self._adj = ReferenceSortedDictHelper("out_port")
+        self._pred = ReferenceSortedDictHelper("in_port")
+        self._succ = self._adj
+
+
+def build_nodes(num_nodes: int) -> List[Operation]:
+    """Builds an input, a bias and a chain of Add nodes."""
+    parameter = OPS.get_by_type_version("Parameter", 0)("input", shape=((-1, 8),))
+    bias = OPS.get_by_type_version("Constant", 0)("bias", data=torch.zeros(8), shape=((8,),))
+    add_cls = OPS.get_by_type_version("Add", 1)
+    return [parameter, bias] + [add_cls(f"add_{idx}", shape=((-1, 8),)) for idx in range(num_nodes)]
+
+
+def build_and_rewrite(graph_cls: Callable, nodes: List[Operation]) -> List[List[str]]:
+    """Chains the Add nodes sharing a bias, removes every other Add and returns the adjacency."""
+    graph = graph_cls()
+    previous, bias = nodes[:2]
+    for node in nodes[2:]:
+        graph.add_edge(previous, node, out_port=0, in_port=0)
+        graph.add_edge(bias, node, out_port=0, in_port=1)
+        previous = node
+
+    for node in nodes[2::2]:
+        graph.remove_node(node, keep_connect=True)
+
+    return [[successor.name for successor in graph.successors(node)] for node in graph] + [
+        [predecessor.name for predecessor in graph.predecessors(node)] for node in graph
+    ]
+
+
+def run(num_nodes: int):
+    """Builds and rewrites the graph with both implementations and prints timings."""
+    print(f"chain of {num_nodes} Add nodes sharing a bias, removing every other Add")
+    nodes = build_nodes(num_nodes)
+    results = {}
+    for name, graph_cls in [("bisect", Graph), ("sort", ReferenceGraph)]:
+        start = time.perf_counter()
+        results[name] = build_and_rewrite(graph_cls, nodes)
+        print(f"{name:>8}: {time.perf_counter() - start:8.3f} s")
+    assert results["bisect"] == results["sort"], "Adjacency orders differ"
+    print("identical adjacency orders")
+
+
+def main():
+    """Parses the arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=4000, help="Number of Add nodes in the graph")
+    args = parser.parse_args()
+    run(args.nodes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark of the conversion of segmentation maps to polygon annotations."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import time
+import warnings
+from copy import copy
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+from otx.api.entities.annotation import Annotation
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.polygon import Point, Polygon
+from otx.api.utils.segmentation_utils import create_annotation_from_segmentation_map
+
+
+def get_subcontours_reference(contour: List) -> List:
+    """Reference splitting of the contours, working on lists of tuples."""
+    base_contour = copy(contour)
+    if not np.array_equal(base_contour[0], base_contour[-1]):
+        base_contour.append(base_contour[0])
+    _, inverse, count = np.unique(base_contour, axis=0, return_inverse=True, return_counts=True)
+    loops = []
+    for duplicate in np.where(count > 1)[0]:
+        indices = np.nonzero(inverse == duplicate)[0]
+        loops.extend(indices[i : i + 2] for i in range(len(indices) - 1))
+    subcontours = []
+    for i, j in sorted(loops, key=lambda loop: loop[0], reverse=True):
+        subcontours.append([point for point in base_contour[i:j] if point is not None])
+        base_contour[i:j] = [None] * (j - i)
+    return [subcontour for subcontour in subcontours if len(subcontour) > 2]
+
+
+def create_annotations_reference(
+    hard_prediction: np.ndarray, soft_prediction: np.ndarray, label_map: Dict
+) -> List[Annotation]:
+    """Reference conversion, drawing a full-frame mask for every subcontour."""
+    height, width = hard_prediction.shape[:2]
+    annotations = []
+    for label_index, label in label_map.items():
+        if label_index == 0:
+            continue
+        current_soft_prediction = soft_prediction[:, :, label_index] if soft_prediction.ndim == 3 else soft_prediction
+        label_index_map = (hard_prediction == label_index).astype(np.uint8) * 255
+        contours, hierarchies = cv2.findContours(label_index_map, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_NONE)
+        if hierarchies is None:
+            continue
+        for contour, hierarchy in zip(contours, hierarchies[0]):
+            if hierarchy[3] != -1:
+                continue
+            for subcontour in get_subcontours_reference([(point[0][0], point[0][1]) for point in contour]):
+                mask = np.zeros(hard_prediction.shape, dtype=np.uint8)
+                cv2.drawContours(
+                    mask, np.asarray([[[x, y]] for x, y in subcontour]), contourIdx=-1, color=1, thickness=-1
+                )
+                probability = cv2.mean(current_soft_prediction, mask)[0]
+                polygon = Polygon(points=[Point(x=x / width, y=y / height) for x, y in subcontour])
+                if polygon.get_area() > 0:
+                    annotations.append(Annotation(shape=polygon, labels=[ScoredLabel(label, probability)]))
+    return annotations
+
+
+def generate_prediction(size: int, n_blobs: int, n_classes: int, seed: int = 0):
+    """Generates a soft prediction with random elliptic blobs, and the matching hard prediction."""
+    rng = np.random.default_rng(seed)
+    soft_prediction = np.zeros((size, size, n_classes + 1), dtype=np.float32)
+    soft_prediction[:, :, 0] = 0.5
+    for _ in range(n_blobs):
+        center = tuple(int(coord) for coord in rng.integers(0, size, 2))
+        axes = tuple(int(axis) for axis in rng.integers(2, max(3, size // 40), 2))
+        blob = np.zeros((size, size), dtype=np.uint8)
+        cv2.ellipse(blob, center, axes, float(rng.uniform(0, 180)), 0, 360, 1, -1)
+        label_index = int(rng.integers(1, n_classes + 1))
+        soft_prediction[:, :, label_index] += blob * rng.uniform(0.5, 1.0, (size, size)).astype(np.float32)
+    soft_prediction /= soft_prediction.sum(axis=2, keepdims=True)
+    return np.argmax(soft_prediction, axis=2), soft_prediction
+
+
+def run(size: int, n_blobs: int, n_classes: int):
+    """Converts a random segmentation map with both implementations and prints timings."""
+    hard_prediction, soft_prediction = generate_prediction(size, n_blobs, n_classes)
+    label_map = {0: "background"}
+    label_map.update(
+        {index: LabelEntity(name=f"class_{index}", domain=Domain.SEGMENTATION) for index in range(1, n_classes + 1)}
+    )
+    print(f"{size}x{size} segmentation map with {n_blobs} blobs of {n_classes} classes")
+
+    results = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for name, convert in [
+            ("current", create_annotation_from_segmentation_map),
+            ("full mask", create_annotations_reference),
+        ]:
+            start = time.perf_counter()
+            results[name] = convert(hard_prediction, soft_prediction, label_map)
+            print(f"{name:>12}: {time.perf_counter() - start:8.3f} s")
+
+    annotations, expected = results["current"], results["full mask"]
+    assert len(annotations) == len(expected), "Numbers of annotations differ"
+    for annotation, expected_annotation in zip(annotations, expected):
+        assert annotation.shape.points == expected_annotation.shape.points, "Polygons differ"
+        label, expected_label = annotation.get_labels()[0], expected_annotation.get_labels()[0]
+        assert label.label is expected_label.label, "Labels differ"
+        assert np.isclose(label.probability, expected_label.probability, rtol=1e-12), "Probabilities differ"
+    print(f"{len(annotations)} identical annotations")
+
+
+def main():
+    """Parses the arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2048, help="Height and width of the segmentation map")
+    parser.add_argument("--blobs", type=int, default=500)
+    parser.add_argument("--classes", type=int, default=3)
+    args = parser.parse_args()
+    run(args.size, args.blobs, args.classes)
+
+
+if __name__ == "__main__":
+    main()
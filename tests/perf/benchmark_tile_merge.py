@@ -0,0 +1,131 @@
+"""Benchmark of the merging of the tile-level predictions of large images."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pycocotools.mask as mask_util
+
+from otx.algorithms.detection.adapters.mmdet.data.tiling import Tile
+
+
+class SyntheticDataset:
+    """Large images without annotations, as seen by Tile.
+
+    Only the image shapes matter for the merge, so a tiny image stands for each large image.
+    """
+
+    def __init__(self, n_images: int, image_size: int, n_classes: int):
+        self.CLASSES = [f"class_{i}" for i in range(n_classes)]  # pylint: disable=invalid-name
+        self.n_images = n_images
+        self.image_size = image_size
+
+    def __len__(self):
+        return self.n_images
+
+    def __getitem__(self, idx: int) -> Dict:
+        if idx >= self.n_images:
+            raise IndexError(idx)
+        filename = f"image_{idx}.jpg"
+        return dict(
+            img=np.zeros((1, 1, 3), dtype=np.uint8),
+            img_shape=(self.image_size, self.image_size, 3),
+            filename=filename,
+            ori_filename=filename,
+            bbox_fields=[],
+            mask_fields=[],
+            seg_fields=[],
+            img_fields=["img"],
+        )
+
+
+class _PipelineStep(dict):
+    type = "Resize"
+
+
+def generate_results(tile: Tile, n_boxes: int, with_masks: bool, seed: int = 0) -> List:
+    """Generates random predictions for every tile, with a few small RLE masks per tile."""
+    rng = np.random.default_rng(seed)
+    rles: Dict[Tuple[int, int], Dict] = {}
+    results = []
+    for idx in range(len(tile)):
+        x_1, y_1, x_2, y_2 = tile.tile_boxes[idx]
+        width, height = x_2 - x_1, y_2 - y_1
+        bbox_result, mask_result = [], []
+        for _ in range(tile.num_classes):
+            top_left = rng.uniform(0, [width * 0.9, height * 0.9], size=(n_boxes, 2))
+            size = rng.uniform(5, 50, size=(n_boxes, 2))
+            boxes = np.concatenate([top_left, top_left + size, rng.random((n_boxes, 1))], axis=1)
+            bbox_result.append(boxes.astype(np.float32))
+            if with_masks:
+                if (height, width) not in rles:
+                    mask = np.zeros((height, width), dtype=np.uint8, order="F")
+                    mask[:40, :40] = 1
+                    rles[(height, width)] = mask_util.encode(mask)
+                mask_result.append([rles[(height, width)]] * n_boxes)
+        results.append((bbox_result, mask_result) if with_masks else bbox_result)
+    return results
+
+
+def readjust_tile_mask_dense(tile_rle: Dict, tile_box: Tuple[int, int, int, int], img_size: Tuple[int, int]) -> Dict:
+    """Reference mask shift decoding, padding and encoding the mask again."""
+    x_1, y_1, x_2, y_2 = tile_box
+    height, width = img_size
+    tile_mask = mask_util.decode(tile_rle)
+    return mask_util.encode(np.asfortranarray(np.pad(tile_mask, ((y_1, height - y_2), (x_1, width - x_2)))))
+
+
+def run(n_images: int, image_size: int, tile_size: int, n_boxes: int, n_classes: int, with_masks: bool):
+    """Tiles the synthetic dataset, merges random predictions and prints timings."""
+    tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    tile = Tile(
+        SyntheticDataset(n_images, image_size, n_classes),
+        [_PipelineStep()],
+        tmp_dir=tmp_dir,
+        tile_size=tile_size,
+        filter_empty_gt=False,
+    )
+    results = generate_results(tile, n_boxes, with_masks)
+    print(f"{n_images} images of {image_size}x{image_size}, {len(tile)} tiles, {n_boxes} boxes per class per tile")
+
+    start = time.perf_counter()
+    merged_results = tile.merge(results)
+    print(f"{'merge':>12}: {time.perf_counter() - start:8.3f} s")
+    tmp_dir.cleanup()
+
+    if with_masks:
+        tile_box = tuple(int(coord) for coord in tile.tile_boxes[-1])
+        tile_rle = results[-1][1][0][0]
+        n_repeats = 20
+        for name, readjust in [("rle shift", Tile.readjust_tile_mask), ("dense pad", readjust_tile_mask_dense)]:
+            start = time.perf_counter()
+            for _ in range(n_repeats):
+                image_rle = readjust(tile_rle, tile_box, (image_size, image_size))
+            print(f"{name:>12}: {(time.perf_counter() - start) / n_repeats * 1000:8.3f} ms per mask")
+        expected = readjust_tile_mask_dense(tile_rle, tile_box, (image_size, image_size))
+        assert image_rle["counts"] == expected["counts"], "Masks differ"
+        n_masks = sum(len(cls_masks) for _, masks in merged_results for cls_masks in masks)
+        print(f"{n_masks} masks kept after NMS")
+
+
+def main():
+    """Parses the arguments and runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--images", type=int, default=4)
+    parser.add_argument("--image-size", type=int, default=8192)
+    parser.add_argument("--tile-size", type=int, default=512)
+    parser.add_argument("--boxes", type=int, default=20, help="Predicted boxes per class per tile")
+    parser.add_argument("--classes", type=int, default=3)
+    parser.add_argument("--masks", action="store_true", help="Also merge instance segmentation masks")
+    args = parser.parse_args()
+    run(args.images, args.image_size, args.tile_size, args.boxes, args.classes, args.masks)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,17 @@
 
 import numpy as np
 import pytest
+from mmaction.datasets.pipelines import Resize
 
 from otx.algorithms.action.adapters.mmaction.data.cls_dataset import OTXActionClsDataset
 from otx.algorithms.action.adapters.mmaction.data.pipelines.loading import (
     RawFrameDecode,
+    setup_raw_frame_decode,
 )
 from otx.algorithms.action.configs.classification.x3d.data_pipeline import (
     train_pipeline,
 )
+from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.label import Domain
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
 from tests.unit.algorithms.action.test_helpers import (
@@ -62,3 +65,49 @@ class TestRawFrameDecode:
         assert outputs["img_shape"] == (256, 256)
         assert np.all(outputs["gt_bboxes"] == np.array([[0, 0, 256, 256]]))
         assert np.all(outputs["proposals"] == np.array([[0, 0, 256, 256]]))
+
+    @e2e_pytest_unit
+    def test_call_with_image_cache(self, mocker):
+        """Test __call__ function decodes each frame once with an image cache."""
+
+        inputs = self.dataset[0]
+        inputs["frame_inds"] = [0, 1]
+        decode = RawFrameDecode(image_cache=dict(type="memory", max_bytes=1024**2))
+        decode.otx_dataset = self.otx_dataset
+        spy_put = mocker.spy(decode.image_cache, "put")
+        outputs = decode(dict(inputs))
+        outputs["imgs"][0][:] = 0
+        outputs = decode(dict(inputs, frame_inds=[1, 0]))
+        assert spy_put.call_count == 2
+        assert np.array_equal(outputs["imgs"][1], self.otx_dataset[0].media.numpy)
+
+    @e2e_pytest_unit
+    def test_call_decodes_repeated_frames_once(self, mocker):
+        """Test __call__ function decodes a repeated frame index once with the default frame cache."""
+
+        inputs = self.dataset[0]
+        decode = RawFrameDecode()
+        decode.otx_dataset = self.otx_dataset
+        assert RawFrameDecode().image_cache is decode.image_cache
+        mock_numpy = mocker.patch.object(
+            DatasetItemEntity,
+            "numpy",
+            new_callable=mocker.PropertyMock,
+            side_effect=lambda: np.zeros((256, 256, 3), dtype=np.uint8),
+        )
+        outputs = decode(dict(inputs, frame_inds=[0, 1, 0, 1]))
+        outputs = decode(dict(inputs, frame_inds=[1, 0]))
+        assert mock_numpy.call_count == 2
+        assert len(outputs["imgs"]) == 2
+
+    @e2e_pytest_unit
+    def test_call_with_resized_frames(self):
+        """Test __call__ function downscales the frames to the short side of the following resize."""
+
+        inputs = self.dataset[0]
+        decode = RawFrameDecode(image_cache=dict(type="memory", max_bytes=1024**2), resize_frames=True)
+        setup_raw_frame_decode([decode, Resize(scale=(-1, 128))], self.otx_dataset)
+        assert decode.short_side == 128
+        outputs = decode(dict(inputs, frame_inds=[0, 0]))
+        assert outputs["img_shape"] == (128, 128)
+        assert all(img.shape == (128, 128, 3) for img in outputs["imgs"])
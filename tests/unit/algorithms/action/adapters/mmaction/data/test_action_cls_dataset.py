@@ -54,12 +54,13 @@ class TestOTXActionClsDataset:
 
     @e2e_pytest_unit
     def test_pipeline(self) -> None:
-        """Test RawFrameDecode transform contains otx_dataset."""
+        """Test RawFrameDecode transform contains otx_dataset and the frame cache."""
 
         dataset = OTXActionClsDataset(self.otx_dataset, self.labels, self.pipeline)
         for transform in dataset.pipeline.transforms:
             if isinstance(transform, RawFrameDecode):
                 assert transform.otx_dataset == self.otx_dataset
+                assert transform.image_cache is not None
 
     @e2e_pytest_unit
     def test_len(self) -> None:
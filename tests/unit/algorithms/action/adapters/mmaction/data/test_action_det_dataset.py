@@ -80,12 +80,13 @@ class TestOTXActionDetDataset:
 
     @e2e_pytest_unit
     def test_pipeline(self) -> None:
-        """Test RawFrameDecode transform contains otx_dataset."""
+        """Test RawFrameDecode transform contains otx_dataset and the frame cache."""
 
         dataset = OTXActionDetDataset(self.otx_dataset, self.labels, self.pipeline, fps=1)
         for transform in dataset.pipeline.transforms:
             if isinstance(transform, RawFrameDecode):
                 assert transform.otx_dataset == self.otx_dataset
+                assert transform.image_cache is not None
 
     @e2e_pytest_unit
     def test_prepare_train_frames(self) -> None:
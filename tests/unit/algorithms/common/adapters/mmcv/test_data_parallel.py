@@ -0,0 +1,67 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import pytest
+import torch
+import torch.distributed as dist
+from mmcv import Config
+from mmcv.parallel import DataContainer
+
+from otx.algorithms.common.adapters.mmcv.utils import (
+    CPUDistributedDataParallel,
+    build_data_parallel,
+    support_cpu_distributed,
+)
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+class MockModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear = torch.nn.Linear(3, 1)
+
+    def forward(self, img, img_metas, return_loss=True):
+        assert isinstance(img_metas, list)
+        return self.linear(img).sum()
+
+    def train_step(self, data, optimizer=None):
+        return dict(loss=self(**data))
+
+
+@pytest.fixture
+def gloo_process_group(mocker):
+    mocker.patch.dict("os.environ", {"MASTER_ADDR": "localhost", "MASTER_PORT": "29512"})
+    dist.init_process_group(backend="gloo", world_size=1, rank=0)
+    yield
+    dist.destroy_process_group()
+
+
+@e2e_pytest_unit
+def test_cpu_distributed_data_parallel(mocker, gloo_process_group):
+    mocker.patch("torch.cuda.is_available", return_value=False)
+    model = build_data_parallel(MockModel(), Config(dict(gpu_ids=range(-1, 0))), distributed=True)
+    # Collated batch of 2 samples, the DataContainers hold the data of each device
+    data = dict(
+        img=DataContainer([torch.ones(2, 3)], stack=True),
+        img_metas=DataContainer([[{"id": 0}, {"id": 1}]], cpu_only=True),
+    )
+
+    outputs = model.train_step(data, None)
+    outputs["loss"].backward()
+
+    assert isinstance(model, CPUDistributedDataParallel)
+    assert torch.equal(model.module.linear.weight.grad, torch.full((1, 3), 2.0))
+
+
+@e2e_pytest_unit
+def test_support_cpu_distributed(mocker, gloo_process_group):
+    mock_build_ddp = mocker.MagicMock()
+    build_ddp = support_cpu_distributed(mock_build_ddp)
+
+    build_ddp("model", "cuda", device_ids=[0])
+    mock_build_ddp.assert_called_once_with("model", "cuda", device_ids=[0])
+
+    model = build_ddp(MockModel(), "cpu", device_ids=[0], broadcast_buffers=False)
+    assert isinstance(model, CPUDistributedDataParallel)
+    assert mock_build_ddp.call_count == 1
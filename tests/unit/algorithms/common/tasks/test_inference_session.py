@@ -0,0 +1,154 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import numpy as np
+import pytest
+from mmcv.utils import Config, ConfigDict
+
+from otx.algorithms.common.tasks import BaseTask, InferenceSession
+from otx.algorithms.common.tasks.inference_session import CachedModelBuilder
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.datasets import DatasetEntity, DatasetItemEntity
+from otx.api.entities.image import Image
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.rectangle import Rectangle
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+class MockTask:
+    def __init__(self):
+        self._inference_session = None
+        self.batch_sizes = []
+        self.label = LabelEntity(name="fake", domain=Domain.DETECTION)
+
+    def open_inference_session(self, batch_size=1):
+        self._inference_session = InferenceSession(self, batch_size)
+        return self._inference_session
+
+    def infer(self, dataset, inference_parameters=None):
+        self.batch_sizes.append(len(dataset))
+        for item in dataset:
+            item.append_annotations([Annotation(Rectangle.generate_full_box(), [ScoredLabel(self.label, 1.0)])])
+        return dataset
+
+
+class MockInferrer:
+    MODEL_BUILDER = None
+
+    def __init__(self):
+        self.cfg = Config(
+            dict(
+                data=dict(train=dict(otx_dataset=None), test=dict(otx_dataset=None)),
+                custom_hooks=[dict(type="OTXProgressHook"), dict(type="CancelInterfaceHook")],
+                fp16=dict(loss_scale=512.0),
+            )
+        )
+        self.datasets = []
+
+    def configure(self, model_cfg, model_ckpt, data_cfg, training=True, **kwargs):
+        self.cfg.data.test.otx_dataset = data_cfg.data.test.otx_dataset
+        return self.cfg
+
+    def infer(self, cfg, model_builder=None, dump_features=False):
+        self.datasets.append(cfg.data.test.otx_dataset)
+        return dict(model=model_builder(cfg), dump_features=dump_features, fp16="fp16" in cfg)
+
+
+def generate_dataset(num_items):
+    return DatasetEntity(
+        items=[
+            DatasetItemEntity(
+                media=Image(data=np.zeros((4, 4, 3), dtype=np.uint8)),
+                annotation_scene=AnnotationSceneEntity(annotations=[], kind=AnnotationSceneKind.PREDICTION),
+            )
+            for _ in range(num_items)
+        ]
+    )
+
+
+class TestInferenceSession:
+    @e2e_pytest_unit
+    def test_cached_model_builder(self, mocker):
+        model_builder = mocker.MagicMock()
+        cached_model_builder = CachedModelBuilder(model_builder)
+
+        assert cached_model_builder("cfg") is cached_model_builder("cfg")
+        model_builder.assert_called_once_with("cfg")
+
+    @e2e_pytest_unit
+    def test_init_wrong_batch_size(self):
+        with pytest.raises(ValueError):
+            InferenceSession(MockTask(), batch_size=0)
+
+    @e2e_pytest_unit
+    def test_infer(self):
+        task = MockTask()
+        session = task.open_inference_session(batch_size=2)
+        dataset = generate_dataset(5)
+
+        predicted_dataset = session.infer(dataset)
+
+        assert predicted_dataset is dataset
+        assert task.batch_sizes == [2, 2, 1]
+        assert all(len(item.get_annotations()) == 1 for item in dataset)
+
+    @e2e_pytest_unit
+    def test_predict(self):
+        task = MockTask()
+        session = task.open_inference_session(batch_size=4)
+        images = [np.zeros((8, 6, 3), dtype=np.uint8) for _ in range(3)]
+
+        predictions = session.predict(images)
+
+        assert task.batch_sizes == [3]
+        assert len(predictions) == 3
+        assert all(annotations[0].get_labels()[0].label == task.label for annotations in predictions)
+
+    @e2e_pytest_unit
+    def test_close(self):
+        task = MockTask()
+        with task.open_inference_session() as session:
+            session.warm_stages["stage"] = "warm"
+            assert session.is_open
+
+        assert task._inference_session is None
+        assert not session.warm_stages
+        with pytest.raises(RuntimeError):
+            session.infer(generate_dataset(1))
+
+    @e2e_pytest_unit
+    def test_run_warm_task(self, mocker):
+        task = mocker.MagicMock()
+        task._inference_session = InferenceSession(task, batch_size=8)
+        task._copy_task_configs.side_effect = lambda dataset: (
+            None,
+            None,
+            ConfigDict(data=ConfigDict(test=ConfigDict(otx_dataset=dataset))),
+        )
+        task._initialize.side_effect = lambda options: options.update(model_builder=lambda cfg: object())
+        inferrer = MockInferrer()
+        mock_build = mocker.patch("otx.algorithms.common.tasks.training_base.build", return_value=inferrer)
+        datasets = [generate_dataset(1), generate_dataset(2)]
+
+        outputs = [
+            BaseTask._run_warm_task(task, "Inferrer", mode="train", dataset=dataset, dump_features=True, eval=True)
+            for dataset in datasets
+        ]
+
+        mock_build.assert_called_once()
+        task._initialize.assert_called_once()
+        assert inferrer.datasets == datasets
+        assert outputs[0]["outputs"]["model"] is outputs[1]["outputs"]["model"]
+        assert outputs[0]["outputs"]["dump_features"]
+        assert [output["outputs"]["fp16"] for output in outputs] == [True, False]
+        assert [hook.type for hook in inferrer.cfg.custom_hooks] == ["CancelInterfaceHook"]
+        assert inferrer.cfg.data.test_dataloader.samples_per_gpu == 8
+        assert inferrer.cfg.data.test_dataloader.workers_per_gpu == 0
+        # Only the datasets given to the stage are swapped
+        assert inferrer.cfg.data.train.otx_dataset is None
@@ -0,0 +1,146 @@
+import copy
+import gc
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+from otx.algorithms.common.utils.data import get_image
+from otx.algorithms.common.utils.image_cache import (
+    MemoryImageCache,
+    NumpyImageCache,
+    PersistentImageCache,
+    PngImageCache,
+    build_image_cache,
+    get_image_cache_key,
+)
+from otx.api.entities.annotation import NullAnnotationSceneEntity
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.image import Image
+from otx.api.entities.subset import Subset
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+def _get_results(media, index=0):
+    return {
+        "dataset_item": DatasetItemEntity(media, NullAnnotationSceneEntity(), subset=Subset.TRAINING),
+        "index": index,
+    }
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = str(tmp_path / "image.png")
+    cv2.imwrite(path, np.random.randint(0, 255, (8, 10, 3), dtype=np.uint8))
+    return path
+
+
+@e2e_pytest_unit
+@pytest.mark.parametrize(
+    "cache_cfg",
+    [
+        dict(type="memory", max_bytes=1024),
+        dict(type="npy"),
+        dict(type="png"),
+        dict(type="persistent", cache_dir="{tmp_path}/cache"),
+    ],
+)
+def test_get_image_with_cache(mocker, tmp_path, image_file, cache_cfg):
+    cache_cfg = {
+        key: value.format(tmp_path=tmp_path) if key == "cache_dir" else value for key, value in cache_cfg.items()
+    }
+    cache = build_image_cache(cache_cfg)
+    results = _get_results(Image(file_path=image_file))
+    expected = results["dataset_item"].numpy
+
+    mock_numpy = mocker.patch.object(
+        DatasetItemEntity, "numpy", new_callable=mocker.PropertyMock, return_value=expected.copy()
+    )
+    assert np.array_equal(get_image(results, cache), expected)
+    img = get_image(results, cache, to_float32=True)
+    assert img.dtype == np.float32
+    assert np.array_equal(img, expected)
+    # The second call hits the cache
+    assert mock_numpy.call_count == 1
+
+    # The cached image is not altered by the modifications of the returned image
+    get_image(results, cache)[:] = 0
+    assert np.array_equal(get_image(results, cache), expected)
+
+
+@e2e_pytest_unit
+def test_get_image_default_cache(mocker, image_file):
+    results = _get_results(Image(file_path=image_file))
+    mock_numpy = mocker.patch.object(
+        DatasetItemEntity, "numpy", new_callable=mocker.PropertyMock, return_value=np.zeros((8, 10, 3), np.uint8)
+    )
+    # Only the training video frames are cached by default
+    get_image(results)
+    get_image(results)
+    assert mock_numpy.call_count == 2
+
+
+@e2e_pytest_unit
+def test_persistent_image_cache(tmp_path, image_file):
+    cache_dir = str(tmp_path / "cache")
+    results = _get_results(Image(file_path=image_file), index=3)
+    get_image(results, PersistentImageCache(cache_dir))
+    assert len(os.listdir(cache_dir)) == 1
+
+    # A new cache on the same directory, e.g. in the next run, finds the image even at another index
+    key = get_image_cache_key(_get_results(Image(file_path=image_file), index=5), persistent=True)
+    assert np.array_equal(PersistentImageCache(cache_dir).get(key), results["dataset_item"].numpy)
+
+    # Images which are not loaded from a file can not be identified across runs
+    assert get_image_cache_key(_get_results(Image(data=np.zeros((4, 4, 3)))), persistent=True) is None
+    assert get_image_cache_key(_get_results(Image(data=np.zeros((4, 4, 3))), index=2), persistent=False) == (
+        "TRAINING-000002"
+    )
+
+
+@e2e_pytest_unit
+def test_get_image_shared_cache(mocker):
+    cache = NumpyImageCache()
+    datasets = [[np.full((4, 4, 3), value, np.uint8)] for value in range(2)]
+    for dataset in datasets:
+        results = dict(_get_results(Image(data=dataset[0])), dataset_id=id(dataset))
+        mocker.patch.object(DatasetItemEntity, "numpy", new_callable=mocker.PropertyMock, return_value=dataset[0])
+        # The items at the same index of two datasets sharing the cache are not mixed up
+        assert np.array_equal(get_image(results, cache), dataset[0])
+    assert len(os.listdir(cache.cache_dir)) == 2
+
+
+@e2e_pytest_unit
+def test_build_image_cache(tmp_path):
+    assert build_image_cache(None) is None
+    assert isinstance(build_image_cache(dict(type="memory")), MemoryImageCache)
+    numpy_cache = build_image_cache(dict(type="npy", video_frames_only=True))
+    assert isinstance(numpy_cache, NumpyImageCache)
+    assert numpy_cache.video_frames_only
+    assert not numpy_cache.persistent
+    png_cache = build_image_cache(dict(type="png", cache_dir=str(tmp_path)))
+    assert isinstance(png_cache, PngImageCache)
+    png_cache.put("mask", np.eye(4, dtype=np.uint8))
+    assert np.array_equal(png_cache.get("mask"), np.eye(4, dtype=np.uint8))
+    png_cache.put("float", np.eye(4, dtype=np.float32))
+    assert png_cache.get("float") is None
+    assert sorted(os.listdir(tmp_path)) == ["mask.png"]
+    persistent_cache = build_image_cache(dict(type="persistent", cache_dir=str(tmp_path)))
+    assert isinstance(persistent_cache, PersistentImageCache)
+    assert persistent_cache.persistent
+    with pytest.raises(ValueError):
+        build_image_cache(dict(type="unknown"))
+
+
+@e2e_pytest_unit
+def test_numpy_image_cache_copy():
+    cache = NumpyImageCache()
+    cache.put("image", np.eye(4, dtype=np.uint8))
+    cache_copy = copy.deepcopy(cache)
+    # The temporary directory lives as long as any of the copies
+    del cache
+    gc.collect()
+    assert np.array_equal(cache_copy.get("image"), np.eye(4, dtype=np.uint8))
+    cache_copy.put("other", np.eye(2, dtype=np.uint8))
+    assert sorted(os.listdir(cache_copy.cache_dir)) == ["image.npy", "other.npy"]
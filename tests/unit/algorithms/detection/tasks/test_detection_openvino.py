@@ -21,6 +21,7 @@ from otx.algorithms.detection.utils import generate_label_schema
 from otx.api.configuration.helper import create
 from otx.api.entities.annotation import AnnotationSceneEntity, AnnotationSceneKind
 from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.inference_parameters import InferenceParameters
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.metrics import Performance, ScoreMetric
 from otx.api.entities.model_template import (
@@ -185,6 +186,23 @@ class TestOpenVINODetectionTask:
         for updated in updated_dataset:
             assert updated.annotation_scene.contains_any([LabelEntity(name=labels[0].name, domain="DETECTION")])
 
+    @e2e_pytest_unit
+    def test_infer_pipelined(self, mocker):
+        """Test infer method in OpenVINODetectionTask with the pipelined inference engine."""
+        self.dataset, labels = generate_det_dataset(task_type=TaskType.DETECTION)
+        fake_ann_scene = self.dataset[0].annotation_scene
+        mocker.patch.object(OpenVINODetectionInferencer, "pre_process", return_value=({}, {}))
+        mock_forward = mocker.patch.object(OpenVINODetectionInferencer, "forward", return_value={})
+        mock_post_process = mocker.patch.object(
+            OpenVINODetectionInferencer, "post_process_outputs", return_value=(fake_ann_scene, (None, None))
+        )
+        updated_dataset = self.ov_task.infer(self.dataset, InferenceParameters(num_workers=2))
+
+        assert mock_forward.call_count == len(self.dataset)
+        assert mock_post_process.call_count == len(self.dataset)
+        for updated in updated_dataset:
+            assert updated.annotation_scene.contains_any([LabelEntity(name=labels[0].name, domain="DETECTION")])
+
     @e2e_pytest_unit
     def test_evaluate(self, mocker):
         """Test evaluate method in OpenVINODetectionTask."""
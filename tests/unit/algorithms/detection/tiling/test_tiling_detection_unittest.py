@@ -1,7 +1,9 @@
+import os
 import unittest
 from typing import List
 
 import numpy as np
+import pycocotools.mask as mask_util
 import torch
 from mmcv import ConfigDict
 from mmdet.datasets import build_dataloader, build_dataset
@@ -9,6 +11,7 @@ from mmdet.datasets import build_dataloader, build_dataset
 from otx.algorithms.detection.adapters.mmdet.data import (  # noqa: F401
     ImageTilingDataset,
 )
+from otx.algorithms.detection.adapters.mmdet.data.tiling import Tile
 from otx.api.entities.annotation import AnnotationSceneEntity, AnnotationSceneKind
 from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
@@ -174,3 +177,64 @@ class TestTilingDetection(unittest.TestCase):
 
         merged_bbox_results = dataset.merge(results)
         self.assertEqual(len(merged_bbox_results), dataset.num_samples)
+
+    @e2e_pytest_unit
+    def test_tile_cache_modes(self):
+        """Test that the lazy tiles are cropped from the decoded image instead of being encoded to disk"""
+        lazy_dataset = build_dataset(self.train_data_cfg)
+        jpeg_dataset = build_dataset(ConfigDict(dict(self.train_data_cfg, tile_cache_mode="jpeg")))
+        self.assertFalse(any(name.endswith(".jpg") for name in os.listdir(lazy_dataset.tmp_dir.name)))
+        self.assertEqual(len(lazy_dataset), len(jpeg_dataset))
+
+        ori_img = lazy_dataset.dataset[0]["img"]
+        for idx in range(len(lazy_dataset)):
+            lazy_tile = lazy_dataset.tile_dataset[idx]
+            jpeg_tile = jpeg_dataset.tile_dataset[idx]
+            x_1, y_1, x_2, y_2 = lazy_tile["tile_box"]
+            self.assertEqual(lazy_tile["tile_box"], jpeg_tile["tile_box"])
+            self.assertTrue(np.array_equal(lazy_tile["img"], ori_img[y_1:y_2, x_1:x_2]))
+            self.assertEqual(lazy_tile["img"].shape, jpeg_tile["img"].shape)
+            self.assertTrue(np.array_equal(lazy_tile["gt_bboxes"], jpeg_tile["gt_bboxes"]))
+            self.assertTrue(np.array_equal(lazy_tile["gt_labels"], jpeg_tile["gt_labels"]))
+
+        # The tiles are built from the index, so that the pipeline can modify them freely
+        lazy_dataset.tile_dataset[0]["gt_bboxes"][:] = 0
+        lazy_dataset.tile_dataset[0]["bbox_fields"].append("gt_bboxes")
+        self.assertTrue(
+            np.array_equal(lazy_dataset.tile_dataset[0]["gt_bboxes"], jpeg_dataset.tile_dataset[0]["gt_bboxes"])
+        )
+        self.assertNotIn("gt_bboxes", lazy_dataset.tile_dataset[0]["bbox_fields"])
+
+    @e2e_pytest_unit
+    def test_readjust_tile_mask(self):
+        """Test that shifting the tile masks in RLE space matches padding the decoded masks"""
+        height, width = 50, 70
+        for tile_box in [(10, 5, 40, 30), (0, 0, 70, 20), (40, 20, 70, 50), (0, 0, 70, 50)]:
+            x_1, y_1, x_2, y_2 = tile_box
+            for tile_mask in [
+                np.random.randint(0, 2, (y_2 - y_1, x_2 - x_1)),
+                np.zeros((y_2 - y_1, x_2 - x_1)),
+                np.ones((y_2 - y_1, x_2 - x_1)),
+            ]:
+                tile_rle = mask_util.encode(np.asfortranarray(tile_mask, dtype=np.uint8))
+                expected_mask = np.pad(tile_mask, ((y_1, height - y_2), (x_1, width - x_2)))
+                expected_rle = mask_util.encode(np.asfortranarray(expected_mask, dtype=np.uint8))
+                image_rle = Tile.readjust_tile_mask(tile_rle, tile_box, (height, width))
+                self.assertEqual(image_rle["counts"], expected_rle["counts"])
+                self.assertTrue(np.array_equal(mask_util.decode(image_rle), expected_mask))
+
+    @e2e_pytest_unit
+    def test_tile_nms(self):
+        """Test that the NMS of the merged boxes is exact for large image indices and coordinates"""
+        tile = build_dataset(self.test_data_cfg).tile_dataset
+        tile.iou_threshold = 0.45
+        # IoU of 0.40, suppressed with float32 coordinates offset by an image index of 8000
+        bboxes = np.array(
+            [[7900, 7900, 8000, 8000], [7943, 7900, 8043, 8000], [7900, 7900, 8000, 8000], [7901, 7900, 8001, 8000]],
+            dtype=np.float32,
+        )
+        scores = np.array([0.9, 0.8, 0.7, 0.6], dtype=np.float32)
+        image_indices = np.array([8000, 8000, 7999, 7999])
+        labels = np.array([0, 0, 0, 0])
+        keep = tile.tile_nms(bboxes, scores, image_indices, labels)
+        self.assertTrue(np.array_equal(keep, [2, 0, 1]))
@@ -57,6 +57,12 @@ class TestLoadAnnotationFromOTXDataset:
         assert "gt_semantic_seg" in loaded_annotations
         assert loaded_annotations["dataset_item"] == self.dataset_item
 
+    @e2e_pytest_unit
+    def test_default_mask_cache_is_shared(self) -> None:
+        assert LoadAnnotationFromOTXDataset().mask_cache is self.pipeline.mask_cache
+        assert LoadAnnotationFromOTXDataset(mask_cache={"type": "png"}).mask_cache is not self.pipeline.mask_cache
+        assert LoadAnnotationFromOTXDataset(mask_cache=None).mask_cache is None
+
 
 class TestNDArrayToPILImage:
     @pytest.fixture(autouse=True)
@@ -0,0 +1,182 @@
+"""This UnitTest tests AnnotationStore and ColumnarAnnotationSceneEntity functionality"""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import numpy as np
+import pytest
+
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.annotation_store import (
+    AnnotationStore,
+    ColumnarAnnotationSceneEntity,
+)
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.image import Image
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.ellipse import Ellipse
+from otx.api.entities.shapes.polygon import Point, Polygon
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.utils.segmentation_utils import (
+    mask_from_annotation,
+    mask_from_annotation_store,
+)
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+def _summarize(annotations):
+    return [
+        (repr(annotation.shape), [(label.name, label.probability) for label in annotation.get_labels(True)])
+        for annotation in annotations
+    ]
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestAnnotationStore:
+    car = LabelEntity(name="car", domain=Domain.DETECTION, id="1")
+    person = LabelEntity(name="person", domain=Domain.DETECTION, id="2")
+    empty = LabelEntity(name="empty", domain=Domain.DETECTION, is_empty=True, id="3")
+
+    def annotations(self):
+        return [
+            Annotation(Rectangle(x1=0.1, y1=0.2, x2=0.4, y2=0.5), labels=[ScoredLabel(self.car, 0.9)]),
+            Annotation(
+                Polygon(points=[Point(0.5, 0.5), Point(0.9, 0.6), Point(0.7, 0.9)]),
+                labels=[ScoredLabel(self.person, 0.8), ScoredLabel(self.car, 0.3)],
+            ),
+            Annotation(Ellipse(x1=0.0, y1=0.6, x2=0.3, y2=1.0), labels=[ScoredLabel(self.person)]),
+            Annotation(Rectangle(x1=0.6, y1=0.0, x2=0.9, y2=0.2), labels=[ScoredLabel(self.empty)]),
+        ]
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_store_arrays(self):
+        """
+        <b>Description:</b>
+        Checks that the annotations are converted to arrays and back
+
+        <b>Input data:</b>
+        Rectangle, polygon and ellipse annotations with one or two labels
+
+        <b>Expected results:</b>
+        The test passes if the arrays describe the annotations, and the annotations created from the store are equal
+        to the original ones except for their ids
+        """
+        annotations = self.annotations()
+        store = AnnotationStore.from_annotations(annotations)
+
+        assert len(store) == 4
+        assert store.labels == [self.car, self.person, self.empty]
+        assert np.array_equal(store.point_offsets, [0, 2, 5, 7, 9])
+        assert np.array_equal(store.label_offsets, [0, 1, 3, 4, 5])
+        assert np.array_equal(store.label_indices, [0, 1, 0, 1, 2])
+        assert np.array_equal(store.label_annotation_indices, [0, 1, 1, 2, 3])
+        assert np.allclose(
+            store.boxes, [[0.1, 0.2, 0.4, 0.5], [0.5, 0.5, 0.9, 0.9], [0.0, 0.6, 0.3, 1.0], [0.6, 0.0, 0.9, 0.2]]
+        )
+        assert np.array_equal(store.get_polygon(0), [[0.1, 0.2], [0.4, 0.2], [0.4, 0.5], [0.1, 0.5], [0.1, 0.2]])
+        assert not store.has_full_box()
+        assert _summarize(store.to_annotations()) == _summarize(annotations)
+
+        selected = store.select(np.array([False, True, True, False]), store.label_indices != 0)
+        assert _summarize(selected.to_annotations()) == [
+            (repr(annotations[1].shape), [("person", 0.8)]),
+            (repr(annotations[2].shape), [("person", 0.0)]),
+        ]
+
+        empty_store = AnnotationStore.from_annotations([])
+        assert len(empty_store) == 0
+        assert empty_store.boxes.shape == (0, 4)
+        assert empty_store.to_annotations() == []
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_columnar_annotation_scene(self):
+        """
+        <b>Description:</b>
+        Checks that the columnar annotation scene behaves as an AnnotationSceneEntity
+
+        <b>Input data:</b>
+        Columnar scene and regular scene of the same annotations
+
+        <b>Expected results:</b>
+        The test passes if the labels are read from the arrays, and the annotations are created once on the first
+        access so that they can be modified
+        """
+        scene = ColumnarAnnotationSceneEntity.from_annotations(self.annotations(), AnnotationSceneKind.ANNOTATION)
+        reference = AnnotationSceneEntity(self.annotations(), AnnotationSceneKind.ANNOTATION)
+
+        assert scene.get_labels() == reference.get_labels()
+        assert scene.get_labels(include_empty=True) == reference.get_labels(include_empty=True)
+        assert scene.get_label_ids() == reference.get_label_ids()
+        assert "num_annotations=4" in repr(scene)
+        assert scene.store is not None
+
+        annotations = scene.annotations
+        assert scene.store is None
+        assert scene.annotations is annotations
+        assert _summarize(annotations) == _summarize(reference.annotations)
+        scene.append_annotation(Annotation(Rectangle(x1=0.0, y1=0.0, x2=0.1, y2=0.1), labels=[]))
+        assert len(scene.annotations) == 5
+        assert scene.get_labels() == reference.get_labels()
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_dataset_item_fast_path(self):
+        """
+        <b>Description:</b>
+        Checks that the dataset items with a columnar scene give the same annotations as with a regular scene
+
+        <b>Input data:</b>
+        Dataset items with a columnar and a regular scene of the same annotations, with an ignored label
+
+        <b>Expected results:</b>
+        The test passes if the annotations, the arrays, the labels and the segmentation masks are the same, and the
+        columnar scene keeps its arrays
+        """
+        image = Image(data=np.zeros((40, 50, 3), dtype=np.uint8))
+        columnar_scene = ColumnarAnnotationSceneEntity.from_annotations(
+            self.annotations(), AnnotationSceneKind.ANNOTATION
+        )
+        columnar_item = DatasetItemEntity(image, columnar_scene, ignored_labels=[self.car])
+        reference_item = DatasetItemEntity(
+            image,
+            AnnotationSceneEntity(self.annotations(), AnnotationSceneKind.ANNOTATION),
+            ignored_labels=[self.car],
+        )
+
+        for labels in [None, [self.car], [self.person, self.empty]]:
+            for include_empty in [False, True]:
+                for include_ignored in [False, True]:
+                    if labels is None and include_empty and include_ignored:
+                        continue
+                    kwargs = dict(labels=labels, include_empty=include_empty, include_ignored=include_ignored)
+                    expected = _summarize(reference_item.get_annotations(**kwargs))
+                    assert _summarize(columnar_item.get_annotations(**kwargs)) == expected
+                    assert _summarize(columnar_item.get_annotation_store(**kwargs).to_annotations()) == expected
+                    assert set(columnar_item.get_shapes_labels(**kwargs)) == set(
+                        reference_item.get_shapes_labels(**kwargs)
+                    )
+
+        labels = [self.car, self.person]
+        expected_mask = mask_from_annotation(reference_item.get_annotations(), labels, 50, 40)
+        assert np.array_equal(
+            mask_from_annotation_store(columnar_item.get_annotation_store(), labels, 50, 40), expected_mask
+        )
+        assert columnar_scene.store is not None
+
+        # A full box is the ROI of the item
+        full_box = Annotation(Rectangle.generate_full_box(), labels=[ScoredLabel(self.person)])
+        scene = ColumnarAnnotationSceneEntity.from_annotations([full_box], AnnotationSceneKind.ANNOTATION)
+        assert scene.store.has_full_box()
+        assert DatasetItemEntity(image, scene).roi is scene.annotations[0]
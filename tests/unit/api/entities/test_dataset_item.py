@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import datetime
+import pickle
 from copy import deepcopy
 from typing import List
 
@@ -841,6 +842,29 @@ class TestDatasetItemEntity:
         assert dataset_item.get_metadata() == copy_dataset.get_metadata()
         assert dataset_item.subset == copy_dataset.subset
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_dataset_item_pickle(self):
+        """
+        <b>Description:</b>
+        Check DatasetItemEntity class __getstate__ and __setstate__ methods
+
+        <b>Input data:</b>
+        DatasetItemEntity class object with specified "media", "annotation_scene", "roi", "metadata" and "subset"
+        parameters
+
+        <b>Expected results:</b>
+        Test passes if DatasetItemEntity object restored from pickle is equal to the original one and has its own lock
+        """
+        dataset_item = DatasetItemParameters().dataset_item()
+        restored_item = pickle.loads(pickle.dumps(dataset_item))
+        assert restored_item._DatasetItemEntity__roi_lock is not dataset_item._DatasetItemEntity__roi_lock
+        assert dataset_item.annotation_scene.annotations == restored_item.annotation_scene.annotations
+        assert np.array_equal(dataset_item.media.numpy, restored_item.media.numpy)
+        assert dataset_item.roi == restored_item.roi
+        assert dataset_item.subset == restored_item.subset
+
     @pytest.mark.priority_medium
     @pytest.mark.unit
     @pytest.mark.reqids(Requirements.REQ_1)
@@ -23,9 +23,15 @@ import numpy as np
 import pytest
 
 from otx.api.entities.annotation import Annotation
-from otx.api.entities.image import Image
+from otx.api.entities.image import (
+    Image,
+    get_decoded_image_cache,
+    get_image_size,
+    set_decoded_image_cache,
+)
 from otx.api.entities.shapes.ellipse import Ellipse
 from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.utils.image_cache import SharedImageCache
 from tests.unit.api.constants.components import OtxSdkComponent
 from tests.unit.api.constants.requirements import Requirements
 
@@ -141,3 +147,62 @@ class TestImage:
 
         if os.path.exists(image_path):
             os.remove(image_path)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_image_known_size(self):
+        """
+        <b>Description:</b>
+        To test Image class created with an already known size
+
+        <b>Input data:</b>
+        Path to forged image and its size
+
+        <b>Expected results:</b>
+        Height and width properties return the given size without reading the file, and "get_image_size" returns
+        the size read from the file header
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = os.path.join(tmp_dir, "image.png")
+            cv2.imwrite(image_path, np.zeros((24, 32, 3), dtype=np.uint8))
+            assert get_image_size(image_path) == (24, 32)
+
+            fp_instance = Image(file_path=image_path, size=(24, 32))
+            os.remove(image_path)
+            assert fp_instance.height == 24
+            assert fp_instance.width == 32
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_image_decoded_image_cache(self):
+        """
+        <b>Description:</b>
+        To test Image class with a decoded image cache
+
+        <b>Input data:</b>
+        Path to forged image, decoded image cache
+
+        <b>Expected results:</b>
+        The image is decoded once and then returned from the cache until the cache is unset
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = os.path.join(tmp_dir, "image.png")
+            data = np.random.randint(0, 255, (24, 32, 3), dtype=np.uint8)
+            cv2.imwrite(image_path, data)
+            fp_instance = Image(file_path=image_path)
+
+            cache = SharedImageCache(max_bytes=data.nbytes)
+            set_decoded_image_cache(cache)
+            try:
+                assert get_decoded_image_cache() is cache
+                assert np.array_equal(fp_instance.numpy, data[:, :, ::-1])
+                assert np.array_equal(fp_instance.numpy, data[:, :, ::-1])
+                assert cache.stats().misses == 1
+                assert cache.stats().hits == 1
+            finally:
+                set_decoded_image_cache(None)
+            assert get_decoded_image_cache() is None
+            assert np.array_equal(fp_instance.numpy, data[:, :, ::-1])
+            assert cache.stats().hits == 1
@@ -45,13 +45,20 @@ class TestInferenceParameters:
         infer_params = InferenceParameters()
 
         assert dataclasses.is_dataclass(infer_params)
-        assert len(dataclasses.fields(infer_params)) == 3
+        assert len(dataclasses.fields(infer_params)) == 5
         assert dataclasses.fields(infer_params)[0].name == "is_evaluation"
         assert dataclasses.fields(infer_params)[1].name == "update_progress"
         assert dataclasses.fields(infer_params)[2].name == "explainer"
+        assert dataclasses.fields(infer_params)[3].name == "num_requests"
+        assert dataclasses.fields(infer_params)[4].name == "num_workers"
         assert type(infer_params.is_evaluation) is bool
         assert callable(infer_params.update_progress)
         assert type(infer_params.explainer) is str
+        assert infer_params.num_requests == 1
+        assert infer_params.num_workers == 0
+        assert not infer_params.is_pipelined
+        assert InferenceParameters(num_requests=2).is_pipelined
+        assert InferenceParameters(num_workers=1).is_pipelined
         with pytest.raises(AttributeError):
             str(infer_params.WRONG)
 
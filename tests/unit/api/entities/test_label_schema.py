@@ -4,6 +4,11 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import copy
+import pickle
+import random
+
+import numpy as np
 import pytest
 from networkx.classes.reportviews import EdgeDataView, NodeView, OutMultiEdgeDataView
 
@@ -18,6 +23,7 @@ from otx.api.entities.label_schema import (
     LabelGroupExistsException,
     LabelGroupType,
     LabelSchemaEntity,
+    LabelSchemaIndex,
     LabelTree,
     ScoredLabel,
 )
@@ -2093,3 +2099,166 @@ class TestLabelSchemaEntity:
         ]
         resloved_labels = label_schema.resolve_labels_probabilistic(predicted_labels)
         assert [ScoredLabel(labels_2[1], 0.5)] == resloved_labels
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestLabelSchemaIndex:
+    @staticmethod
+    def random_label_schema(seed: int) -> LabelSchemaEntity:
+        """Random schema with labels in the tree and the groups, only in the tree, and only in the groups"""
+        rng = random.Random(seed)
+        labels = [
+            LabelEntity(name=f"Label {i}", domain=Domain.CLASSIFICATION, id=ID(f"{i}"), is_empty=rng.random() < 0.1)
+            for i in range(rng.randint(1, 12))
+        ]
+        label_tree = LabelTree()
+        tree_labels = [label for label in labels if rng.random() < 0.7]
+        for i, label in enumerate(tree_labels):
+            label_tree.add_node(label)
+            parents = [parent for parent in tree_labels[:i] if not parent.is_empty]
+            if parents and rng.random() < 0.7:
+                label_tree.add_child(rng.choice(parents), label)
+        group_labels = [label for label in labels if rng.random() < 0.85]
+        label_groups = [
+            LabelGroup(name=f"Group {i}", labels=group_labels[i : i + 3], group_type=LabelGroupType.EXCLUSIVE)
+            for i in range(0, len(group_labels), 3)
+        ]
+        return LabelSchemaEntity(label_tree=label_tree, label_groups=label_groups)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_label_schema_index(self):
+        """
+        <b>Description:</b>
+        Check that the compiled index of LabelSchemaEntity answers like the label graphs
+
+        <b>Input data:</b>
+        LabelSchemaEntity objects with random label trees and label groups
+
+        <b>Expected results:</b>
+        Test passes if the ancestors, descendants and exclusive labels given by the index are equal to the ones
+        found by walking the label graphs, and if the index is compiled again when the label tree changes
+
+        <b>Steps</b>
+        1. Check get_ancestors, get_descendants and get_labels_exclusive_to of the index
+        2. Check are_exclusive of LabelSchemaEntity
+        3. Check that the index is cached, and compiled again after a change of the label tree
+        """
+        for seed in range(100):
+            label_schema = self.random_label_schema(seed)
+            index = label_schema.compile()
+            for label in index.labels:
+                assert index.get_ancestors(label) == label_schema.label_tree.get_ancestors(label)
+                assert index.get_descendants(label) == label_schema.label_tree.get_descendants(label)
+                if label.is_empty:
+                    exclusive_labels = label_schema._LabelSchemaEntity__get_exclusivity_for_empty_label(label)
+                else:
+                    exclusive_labels = label_schema._LabelSchemaEntity__get_exclusivity_recursion(label)
+                assert set(index.get_labels_exclusive_to(label)) == set(exclusive_labels)
+                for other_label in index.labels:
+                    assert label_schema.are_exclusive(label, other_label) == (other_label in exclusive_labels)
+
+        label_schema = LabelSchemaEntity(
+            label_tree=TestLabelTree.label_tree(),
+            label_groups=TestLabelSchemaEntity.label_groups(),
+        )
+        index = label_schema.compile()
+        assert isinstance(index, LabelSchemaIndex)
+        assert label_schema.compile() is index
+        assert label_schema.get_descendants(labels.label_0_2) == [labels.label_0_2_4, labels.label_0_2_5]
+        new_label = LabelEntity(name="New label", domain=Domain.CLASSIFICATION, id=ID("0_2_6"))
+        label_schema.add_child(labels.label_0_2, new_label)
+        assert label_schema.compile() is not index
+        assert label_schema.get_descendants(labels.label_0_2) == [labels.label_0_2_4, labels.label_0_2_5, new_label]
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_label_schema_index_changes_and_copies(self):
+        """
+        <b>Description:</b>
+        Check that the compiled index follows the in-place changes of the label groups and is not copied
+
+        <b>Input data:</b>
+        LabelSchemaEntity object with a label tree and two exclusive label groups
+
+        <b>Expected results:</b>
+        Test passes if the index is compiled again after a label of a group is replaced or a group type changes,
+        and if copies of a compiled LabelSchemaEntity compile their own index
+
+        <b>Steps</b>
+        1. Check are_exclusive after replacing a label of a group with another one
+        2. Check are_exclusive after changing the type of a group
+        3. Check deepcopy and pickle of a compiled LabelSchemaEntity
+        """
+        label_schema = LabelSchemaEntity(
+            label_tree=TestLabelTree.label_tree(),
+            label_groups=TestLabelSchemaEntity.label_groups(),
+        )
+        group = label_schema.get_groups()[0]
+        assert label_schema.are_exclusive(labels.label_0_1, labels.label_0_2)
+        group.labels[1] = labels.label_0_1_3
+        assert not label_schema.are_exclusive(labels.label_0_1, labels.label_0_2)
+        assert label_schema.are_exclusive(labels.label_0_1, labels.label_0_1_3)
+        index = label_schema.compile()
+        group.group_type = LabelGroupType.EMPTY_LABEL
+        assert label_schema.compile() is not index
+
+        for copied_label_schema in (copy.deepcopy(label_schema), pickle.loads(pickle.dumps(label_schema))):
+            assert copied_label_schema == label_schema
+            assert copied_label_schema.compile() is not label_schema.compile()
+            assert copied_label_schema.compile().label_to_index == label_schema.compile().label_to_index
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_label_schema_index_resolve_labels_probabilistic(self):
+        """
+        <b>Description:</b>
+        Check that the compiled index resolves probabilistic labels like LabelSchemaEntity walking the label graphs
+
+        <b>Input data:</b>
+        LabelSchemaEntity objects with random label trees and label groups, and random predictions with ties
+
+        <b>Expected results:</b>
+        Test passes if the labels resolved by the index, one by one and by batches, are equal to the ones resolved
+        by walking the label graphs, in the same order and with the same probabilities
+
+        <b>Steps</b>
+        1. Check resolve_labels_probabilistic for random predictions, with and without selected labels
+        2. Check resolve_labels_probabilistic for a batch of predictions
+        """
+        rng = random.Random(0)
+        for seed in range(100):
+            label_schema = self.random_label_schema(seed)
+            index = label_schema.compile()
+            all_labels = list(index.labels)
+            for _ in range(5):
+                predicted_labels = rng.sample(all_labels, rng.randint(0, len(all_labels)))
+                probabilities = [rng.choice([0.0, 0.2, 0.5, rng.random()]) for _ in predicted_labels]
+                selected_labels = None if rng.random() < 0.5 else rng.sample(all_labels, len(all_labels) // 2)
+                expected_labels = label_schema._LabelSchemaEntity__resolve_labels_probabilistic(
+                    dict(zip(predicted_labels, probabilities)), selected_labels
+                )
+                resolved_labels = index.resolve_labels_probabilistic(
+                    np.array([probabilities]), predicted_labels, selected_labels
+                )
+                assert resolved_labels == [expected_labels]
+                assert [label.probability for label in resolved_labels[0]] == [
+                    label.probability for label in expected_labels
+                ]
+
+            probabilities = np.array(
+                [[rng.choice([np.nan, 0.0, 0.5, rng.random()]) for _ in all_labels] for _ in range(4)]
+            )
+            resolved_labels = index.resolve_labels_probabilistic(probabilities, all_labels)
+            for item_probabilities, item_labels in zip(probabilities, resolved_labels):
+                label_to_probability = {
+                    label: probability
+                    for label, probability in zip(all_labels, item_probabilities)
+                    if not np.isnan(probability)
+                }
+                assert item_labels == label_schema._LabelSchemaEntity__resolve_labels_probabilistic(
+                    label_to_probability, None
+                )
@@ -189,7 +189,8 @@ class TestDice:
 
         <b>Steps</b>
         1. Check attributes of "DiceAverage" object initialized with default value of "average" parameter
-        2. Check attributes of "DiceAverage" object initialized with specified value of "average" parameter
+        2. Check attributes of "DiceAverage" object initialized with specified value of "average" parameter, in
+        streaming mode or not, and with or without worker threads
         3. Check that "ValueError" exception is raised when initializing "DiceAverage" object with empty list prediction
         "resultset" attribute
         4. Check "ValueError" exception is raised when initializing "DiceAverage" object with "resultset" attribute with
@@ -269,6 +270,17 @@ class TestDice:
             expected_average_type=MetricAverageMethod.MICRO,
             expected_overall_dice=0.7746741154562383,
         )
+        # Checking that the masks held in memory and the masks rasterized in the calling thread give the same scores
+        for kwargs in [dict(streaming=False), dict(num_workers=0), dict(num_workers=2)]:
+            for average, expected_overall_dice in [
+                (MetricAverageMethod.MACRO, 0.44565217391304346),
+                (MetricAverageMethod.MICRO, 0.7746741154562383),
+            ]:
+                check_dice_attributes(
+                    dice_actual=DiceAverage(resultset=result_set, average=average, **kwargs),
+                    expected_average_type=average,
+                    expected_overall_dice=expected_overall_dice,
+                )
         # Checking "ValueError" exception raised when initializing "DiceAverage" with empty list prediction result_set
         result_set = ResultSetEntity(
             model=model,
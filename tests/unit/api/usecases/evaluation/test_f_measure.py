@@ -57,7 +57,9 @@ from otx.api.usecases.evaluation.f_measure import (
     _OverallResults,
     _ResultCounters,
     bounding_box_intersection_over_union,
+    get_batched_iou_matrix,
     get_iou_matrix,
+    get_matching_statistics,
     get_n_false_negatives,
     intersection_box,
 )
@@ -177,6 +179,58 @@ class TestFMeasureFunctions:
         # "iou_threshold"
         assert get_n_false_negatives(iou_matrix, 0.09) == 2
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_get_batched_iou_matrix(self):
+        """
+        <b>Description:</b>
+        Check "get_batched_iou_matrix" function
+
+        <b>Input data:</b>
+        Bounding boxes coordinates arrays
+
+        <b>Expected results:</b>
+        Test passes if array returned by "get_batched_iou_matrix" function is equal to the one returned by
+        "get_iou_matrix" function
+
+        <b>Steps</b>
+        1. Check array returned by "get_batched_iou_matrix" function for non-empty boxes arrays
+        2. Check array returned by "get_batched_iou_matrix" function for empty boxes array
+        """
+        boxes_1 = [[2, 2, 5, 6], [2, 8, 6, 1], [1, 3, 3, 7]]
+        boxes_2 = [[7, 4, 4, 8], [2, 4, 5, 5], [1, 1, 2, 2], [0, 0, 10, 10]]
+        # Checking array returned by "get_batched_iou_matrix" for non-empty boxes arrays
+        batched_matrix = get_batched_iou_matrix(np.array(boxes_1, dtype=float), np.array(boxes_2, dtype=float))
+        assert np.array_equal(batched_matrix, get_iou_matrix(boxes_1, boxes_2))
+        # Checking array returned by "get_batched_iou_matrix" for empty boxes array
+        assert get_batched_iou_matrix(np.zeros((0, 4)), np.array(boxes_2, dtype=float)).shape == (0, 4)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_get_matching_statistics(self):
+        """
+        <b>Description:</b>
+        Check "get_matching_statistics" function
+
+        <b>Input data:</b>
+        IoU-matrix np.array, activation np.array and IoU threshold
+
+        <b>Expected results:</b>
+        Test passes if false negatives derived from "get_matching_statistics" are equal to the ones returned by
+        "get_n_false_negatives" for the predicted boxes active at each threshold
+        """
+        iou_matrix = np.array([[0.0, 0.25, 0.0, 0.09], [0.0, 0.0, 0.0, 0.0], [0.0, 0.1, 0.0, 0.08]])
+        activation = np.array([0.9, 0.3, 0.5, 0.7])
+        for iou_threshold in [0.08, 0.09, 0.11]:
+            ground_truth_activation, extra_matches = get_matching_statistics(iou_matrix, activation, iou_threshold)
+            for threshold in [0.0, 0.3, 0.6, 0.8]:
+                active = activation > threshold
+                expected = get_n_false_negatives(iou_matrix[:, active], iou_threshold) if any(active) else 3
+                actual = np.sum(ground_truth_activation <= threshold) + np.sum(extra_matches[active])
+                assert actual == expected
+
 
 @pytest.mark.components(OtxSdkComponent.OTX_API)
 class TestMetrics:
@@ -441,6 +495,7 @@ class TestFMeasureCalculator:
         assert f_measure_calculator.confidence_range == [0.025, 1.0, 0.025]
         assert f_measure_calculator.nms_range == [0.1, 1, 0.05]
         assert f_measure_calculator.default_confidence_threshold == 0.35
+        assert f_measure_calculator.vectorized
 
     @pytest.mark.priority_medium
     @pytest.mark.unit
@@ -1098,6 +1153,49 @@ class TestFMeasureCalculator:
             cross_class_nms=True,
         )
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_f_measure_calculator_vectorized_matches_python(self):
+        """
+        <b>Description:</b>
+        Check that vectorized and Python "_FMeasureCalculator" backends give identical results
+
+        <b>Input data:</b>
+        "_FMeasureCalculator" class objects with "vectorized" parameter set to True and False for randomly generated
+        boxes
+
+        <b>Expected results:</b>
+        Test passes if "_OverallResults" objects returned by "evaluate_detections" method are equal for both backends
+        """
+        rng = np.random.default_rng(seed=42)
+
+        def generate_boxes(n_boxes: int) -> list:
+            boxes = []
+            for _ in range(n_boxes):
+                x1, y1 = rng.uniform(0.0, 0.8, size=2)
+                width, height = rng.uniform(0.01, 0.3, size=2)
+                boxes.append((x1, y1, x1 + width, y1 + height, rng.choice(["class_1", "Class_2"]), rng.random()))
+            return boxes
+
+        ground_truth_boxes_per_image = [generate_boxes(rng.integers(0, 10)) for _ in range(8)]
+        prediction_boxes_per_image = [
+            [(x1 + 0.02, y1, x2, y2 - 0.02, class_name, rng.random()) for x1, y1, x2, y2, class_name, _ in boxes]
+            + generate_boxes(rng.integers(0, 5))
+            for boxes in ground_truth_boxes_per_image
+        ]
+        for cross_class_nms in [False, True]:
+            results = [
+                _FMeasureCalculator(
+                    ground_truth_boxes_per_image, prediction_boxes_per_image, vectorized=vectorized
+                ).evaluate_detections(["class_2", "class_1", "All Classes"], 0.5, True, cross_class_nms)
+                for vectorized in [True, False]
+            ]
+            assert results[0].best_f_measure == results[1].best_f_measure
+            assert results[0].best_f_measure_per_class == results[1].best_f_measure_per_class
+            assert vars(results[0].per_confidence) == vars(results[1].per_confidence)
+            assert vars(results[0].per_nms) == vars(results[1].per_nms)
+
 
 @pytest.mark.components(OtxSdkComponent.OTX_API)
 class TestFMeasure:
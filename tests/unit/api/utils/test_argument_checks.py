@@ -0,0 +1,173 @@
+"""This UnitTest tests check_input_parameters_type functionality"""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pytest
+
+from otx.api.utils import argument_checks
+from otx.api.utils.argument_checks import (
+    BaseInputArgumentChecker,
+    check_input_parameters_type,
+    is_trusted_mode,
+    set_trusted_mode,
+)
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+class PositiveCheck(BaseInputArgumentChecker):
+    def __init__(self, parameter, parameter_name):
+        self.parameter = parameter
+        self.parameter_name = parameter_name
+
+    def check(self):
+        if not isinstance(self.parameter, int) or self.parameter <= 0:
+            raise ValueError(f"{self.parameter_name} should be positive")
+
+
+class Point:
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
+
+class SubPoint(Point):
+    pass
+
+
+@check_input_parameters_type({"count": PositiveCheck})
+def dummy_function(
+    count: int,
+    ratio: float,
+    name: Optional[str] = None,
+    points: Sequence["Point"] = (),
+    mapping: Optional[Dict[str, List[int]]] = None,
+    shape: Union[int, Tuple[int, ...]] = 1,
+    *,
+    flag: bool = False,
+    **kwargs,
+):
+    return count, ratio, name, points, mapping, shape, flag, kwargs
+
+
+@pytest.fixture
+def trusted_mode():
+    set_trusted_mode(True)
+    yield
+    set_trusted_mode(False)
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestCheckInputParametersType:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_valid_parameters(self):
+        """
+        <b>Description:</b>
+        Checks that the decorated function is called with valid parameters
+
+        <b>Input data:</b>
+        Positional, keyword and default parameters of the expected types
+
+        <b>Expected results:</b>
+        The test passes if the function returns its parameters
+        """
+        assert dummy_function(1, 2) == (1, 2, None, (), None, 1, False, {})
+        assert dummy_function(
+            3, 0.5, "name", [Point(0, 0), SubPoint(1, 1)], {"a": [1, 2]}, shape=(1, 2), flag=True, extra=0
+        )[5:] == ((1, 2), True, {"extra": 0})
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_unexpected_parameters(self):
+        """
+        <b>Description:</b>
+        Checks that unexpected parameters raise exceptions
+
+        <b>Input data:</b>
+        Parameters of unexpected types, nested elements of unexpected types, a parameter failing its custom check,
+        duplicated and too many parameters
+
+        <b>Expected results:</b>
+        The test passes if ValueError is raised for the unexpected types and the custom check, and TypeError for the
+        duplicated and too many parameters
+        """
+        for args, kwargs in [
+            (("1", 2), {}),
+            ((0, 2), {}),
+            ((1, "2"), {}),
+            ((1, 2, 3), {}),
+            ((1, 2), {"points": [Point(0, 0), 1]}),
+            ((1, 2), {"mapping": {"a": [1, "2"]}}),
+            ((1, 2), {"mapping": {1: [1]}}),
+            ((1, 2), {"shape": (1, "2")}),
+            ((1, 2), {"flag": 1}),
+        ]:
+            with pytest.raises(ValueError):
+                dummy_function(*args, **kwargs)
+        with pytest.raises(TypeError):
+            dummy_function(1, 2, count=1)
+        with pytest.raises(TypeError):
+            dummy_function(*range(1, 10))
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_sampled_elements(self, mocker):
+        """
+        <b>Description:</b>
+        Checks that only a sample of the elements of large containers and of the shallow nested containers is checked
+
+        <b>Input data:</b>
+        Lists with unexpected elements at sampled and unsampled positions, deeply nested lists
+
+        <b>Expected results:</b>
+        The test passes if only the unexpected elements at sampled positions and shallow depths raise ValueError
+        """
+        mocker.patch.object(argument_checks, "MAX_CHECKED_ELEMENTS", 4)
+        mocker.patch.object(argument_checks, "MAX_CHECKED_DEPTH", 2)
+
+        @check_input_parameters_type()
+        def function(values: List[int], nested: Optional[List[List[List[int]]]] = None):
+            return values
+
+        for index in range(10):
+            values = list(range(10))
+            values[index] = str(index)
+            if index in (0, 3, 6, 9):
+                with pytest.raises(ValueError):
+                    function(values)
+            else:
+                assert function(values) == values
+        with pytest.raises(ValueError):
+            function(["0", 1, 2, 3])
+
+        assert function([0], [[["a"]]]) == [0]
+        with pytest.raises(ValueError):
+            function([0], [["a"]])
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_trusted_mode(self, trusted_mode):
+        """
+        <b>Description:</b>
+        Checks that nothing is checked in trusted mode
+
+        <b>Input data:</b>
+        Parameters of unexpected types
+
+        <b>Expected results:</b>
+        The test passes if the function is called with the unexpected parameters
+        """
+        assert is_trusted_mode()
+        assert dummy_function("1", "2")[:2] == ("1", "2")
+        set_trusted_mode(False)
+        with pytest.raises(ValueError):
+            dummy_function("1", "2")
@@ -0,0 +1,136 @@
+"""This UnitTest tests SharedImageCache functionality"""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from otx.api.utils.image_cache import SharedImageCache
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+def _put_image(cache: SharedImageCache, key: str, image: np.ndarray):
+    cache.put(key, image)
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestSharedImageCache:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_get_and_put(self):
+        """
+        <b>Description:</b>
+        Checks that images put in the cache are returned by get
+
+        <b>Input data:</b>
+        Color and grayscale uint8 images, a float image
+
+        <b>Expected results:</b>
+        The test passes if the cached images are returned as copies, the float image is not cached and the statistics
+        count the hits and misses
+        """
+        cache = SharedImageCache(max_bytes=1024)
+        color_image = np.random.randint(0, 255, (8, 8, 3), dtype=np.uint8)
+        gray_image = np.random.randint(0, 255, (4, 6), dtype=np.uint8)
+
+        assert cache.get("color") is None
+        assert cache.put("color", color_image)
+        assert cache.put("gray", gray_image)
+        assert not cache.put("float", color_image.astype(np.float32))
+        assert not cache.put("too_large", np.zeros((32, 32, 3), dtype=np.uint8))
+
+        cached_image = cache.get("color")
+        assert np.array_equal(cached_image, color_image)
+        cached_image[:] = 0
+        assert np.array_equal(cache.get("color"), color_image)
+        assert np.array_equal(cache.get("gray"), gray_image)
+        assert cache.get("float") is None
+
+        stats = cache.stats()
+        assert stats.hits == 3
+        assert stats.misses == 2
+        assert stats.hit_rate == 0.6
+        assert stats.num_images == 2
+        assert stats.used_bytes == color_image.nbytes + gray_image.nbytes
+
+        cache.clear()
+        assert cache.get("color") is None
+        assert cache.stats().num_images == 0
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_lru_eviction(self):
+        """
+        <b>Description:</b>
+        Checks that the least recently used images are evicted when the cache is full
+
+        <b>Input data:</b>
+        Cache with room for 3 images of 100 bytes or 2 images in the index
+
+        <b>Expected results:</b>
+        The test passes if the least recently used images are evicted
+        """
+        image = np.ones((10, 10), dtype=np.uint8)
+        cache = SharedImageCache(max_bytes=300)
+        for key in ["a", "b", "c"]:
+            cache.put(key, image)
+        cache.get("a")
+        cache.put("d", image)
+        assert cache.get("b") is None
+        assert all(cache.get(key) is not None for key in ["a", "c", "d"])
+        # A larger image evicts as many images as needed
+        assert cache.put("e", np.ones((20, 10), dtype=np.uint8))
+        assert cache.get("e") is not None
+        assert cache.stats().used_bytes <= 300
+
+        cache = SharedImageCache(max_bytes=1000, max_images=2)
+        for key in ["a", "b", "c"]:
+            cache.put(key, image)
+        assert cache.get("a") is None
+        assert cache.stats().num_images == 2
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_shared_with_forked_process(self):
+        """
+        <b>Description:</b>
+        Checks that the cache is shared with the forked processes
+
+        <b>Input data:</b>
+        Image put in the cache by a forked process
+
+        <b>Expected results:</b>
+        The test passes if the image is found in the cache of the parent process
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("fork is not available")
+        cache = SharedImageCache(max_bytes=1024)
+        image = np.random.randint(0, 255, (8, 8, 3), dtype=np.uint8)
+        process = multiprocessing.get_context("fork").Process(target=_put_image, args=(cache, "image", image))
+        process.start()
+        process.join()
+        assert np.array_equal(cache.get("image"), image)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_invalid_size(self):
+        """
+        <b>Description:</b>
+        Checks that the size of the cache must be positive
+
+        <b>Expected results:</b>
+        The test passes if ValueError is raised
+        """
+        with pytest.raises(ValueError):
+            SharedImageCache(max_bytes=0)
+        with pytest.raises(ValueError):
+            SharedImageCache(max_bytes=1024, max_images=0)
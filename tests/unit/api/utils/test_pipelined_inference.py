@@ -0,0 +1,257 @@
+"""This UnitTest tests PipelinedInferenceEngine functionality"""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import random
+import threading
+import time
+
+import pytest
+
+from otx.api.entities.inference_parameters import InferenceParameters
+from otx.api.utils.pipelined_inference import (
+    PipelinedInferenceEngine,
+    predict_pipelined,
+)
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+class MockModelAdapter:
+    def __init__(self):
+        self.callback = None
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    @staticmethod
+    def copy_raw_result(request):
+        return dict(request)
+
+
+class MockAsyncModel:
+    """Model inferring on threads with random delays, like the infer requests of the OpenVINO model API."""
+
+    def __init__(self, num_requests, fail_at=None, slow_at=None):
+        self.model_adapter = MockModelAdapter()
+        self.num_requests = num_requests
+        self.fail_at = fail_at
+        self.slow_at = slow_at
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def infer_sync(self, inputs):
+        return {"output": inputs * 10}
+
+    def infer_async(self, inputs, callback_data):
+        with self._condition:
+            assert self._in_flight < self.num_requests
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        threading.Thread(target=self._infer, args=(inputs, callback_data)).start()
+
+    def _infer(self, inputs, callback_data):
+        time.sleep(0.1 if inputs == self.slow_at else random.uniform(0.002, 0.005))
+        request = None if inputs == self.fail_at else {"output": inputs * 10}
+        self.model_adapter.callback(request, callback_data)
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def is_ready(self):
+        with self._condition:
+            return self._in_flight < self.num_requests
+
+    def await_any(self):
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.num_requests)
+
+    def await_all(self):
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight == 0)
+
+
+def pre_process(item):
+    time.sleep(random.uniform(0, 0.001))
+    return item, {"item": item}
+
+
+def post_process(raw_predictions, metadata):
+    time.sleep(random.uniform(0, 0.002))
+    return raw_predictions["output"] + metadata["item"]
+
+
+class MockInferencer:
+    """Inferencer of the OpenVINO tasks, predicting the items synchronously or in pipelined steps."""
+
+    def __init__(self, num_requests):
+        self.model = MockAsyncModel(num_requests)
+        self.pre_process = pre_process
+        self.post_process = post_process
+        self.forward = self.model.infer_sync
+
+    def predict(self, item):
+        inputs, metadata = self.pre_process(item)
+        return self.post_process(self.forward(inputs), metadata)
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestPipelinedInferenceEngine:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("num_requests", [1, 4])
+    @pytest.mark.parametrize("num_workers", [1, 3])
+    def test_predict(self, num_requests, num_workers):
+        """
+        <b>Description:</b>
+        Checks that the items are predicted in order
+
+        <b>Input data:</b>
+        Items inferred by a model with random delays, synchronously or on several requests
+
+        <b>Expected results:</b>
+        The test passes if the predictions are yielded in the order of the items, with at most num_requests items in
+        flight, and the throughput counts all the items
+        """
+        model = MockAsyncModel(num_requests)
+        engine = PipelinedInferenceEngine(
+            pre_process, post_process, model=model, num_requests=num_requests, num_workers=num_workers
+        )
+
+        predictions = list(engine.predict(range(50)))
+
+        assert predictions == [(item, item * 11) for item in range(50)]
+        if num_requests > 1:
+            assert 1 < model.max_in_flight <= num_requests
+        else:
+            assert model.max_in_flight == 0
+        assert engine.throughput.num_items == 50
+        assert engine.throughput.items_per_second > 0
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_predict_with_forward(self):
+        """
+        <b>Description:</b>
+        Checks that the items are inferred with the forward function if there is no model
+
+        <b>Input data:</b>
+        Items and a forward function
+
+        <b>Expected results:</b>
+        The test passes if the predictions are yielded in order and the engine can not be built without model and
+        forward function or with wrong numbers of requests and workers
+        """
+        engine = PipelinedInferenceEngine(pre_process, post_process, forward=lambda inputs: {"output": -inputs})
+
+        assert list(engine.predict(range(10))) == [(item, 0) for item in range(10)]
+        assert list(engine.predict([])) == []
+        with pytest.raises(ValueError):
+            PipelinedInferenceEngine(pre_process, post_process)
+        with pytest.raises(ValueError):
+            PipelinedInferenceEngine(pre_process, post_process, forward=abs, num_requests=0)
+        with pytest.raises(ValueError):
+            PipelinedInferenceEngine(pre_process, post_process, forward=abs, num_workers=0)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_predict_failure(self):
+        """
+        <b>Description:</b>
+        Checks that the failures of the infer requests are raised
+
+        <b>Input data:</b>
+        Items whose inference fails for one of them
+
+        <b>Expected results:</b>
+        The test passes if the exception raised in the callback of the request is raised by predict
+        """
+        model = MockAsyncModel(num_requests=3, fail_at=7)
+        engine = PipelinedInferenceEngine(pre_process, post_process, model=model, num_requests=3)
+
+        with pytest.raises(TypeError):
+            list(engine.predict(range(20)))
+        assert model.is_ready()
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("num_requests", [1, 4])
+    def test_predict_bounded_pending(self, num_requests):
+        """
+        <b>Description:</b>
+        Checks that the predictions waiting to be yielded in order do not pile up
+
+        <b>Input data:</b>
+        Items whose post-processing is slower than their inference, with one item inferred much slower than the others
+
+        <b>Expected results:</b>
+        The test passes if the predictions are yielded in order and the number of items taken but not yet yielded
+        stays bounded by the pre-processed and pending items
+        """
+        model = MockAsyncModel(num_requests, slow_at=5)
+        engine = PipelinedInferenceEngine(
+            pre_process,
+            lambda raw_predictions, metadata: time.sleep(0.002) or post_process(raw_predictions, metadata),
+            model=model,
+            num_requests=num_requests,
+        )
+        num_taken = 0
+
+        def items():
+            nonlocal num_taken
+            for item in range(60):
+                num_taken += 1
+                yield item
+
+        max_taken_ahead = 0
+        predictions = []
+        for prediction in engine.predict(items()):
+            predictions.append(prediction)
+            max_taken_ahead = max(max_taken_ahead, num_taken - len(predictions))
+
+        assert predictions == [(item, item * 11) for item in range(60)]
+        assert max_taken_ahead <= 3 * (num_requests + 1) + 1
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestPredictPipelined:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_predict_pipelined(self):
+        """
+        <b>Description:</b>
+        Checks that predict_pipelined predicts the items with the inferencer, pipelined if the parameters ask for it
+
+        <b>Input data:</b>
+        Items predicted by an inferencer without inference parameters, with default parameters and with several
+        requests
+
+        <b>Expected results:</b>
+        The test passes if the predictions are yielded in order, with the inputs and the post-processing function
+        given, and the items are inferred on several requests only with pipelined parameters
+        """
+        inferencer = MockInferencer(num_requests=4)
+        items = [{"value": item} for item in range(20)]
+        expected = [(item, item["value"] * 11) for item in items]
+        for inference_parameters in (None, InferenceParameters(), InferenceParameters(num_requests=4)):
+            predictions = predict_pipelined(
+                items, inferencer, inference_parameters, get_inputs=lambda item: item["value"]
+            )
+            assert list(predictions) == expected
+        assert inferencer.model.max_in_flight > 1
+
+        predictions = predict_pipelined(
+            range(5),
+            inferencer,
+            InferenceParameters(num_workers=2),
+            post_process=lambda raw_predictions, metadata: -metadata["item"],
+        )
+        assert list(predictions) == [(item, -item) for item in range(5)]
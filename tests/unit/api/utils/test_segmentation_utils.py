@@ -20,9 +20,13 @@ from otx.api.entities.scored_label import ScoredLabel
 from otx.api.entities.shapes.ellipse import Ellipse
 from otx.api.entities.shapes.polygon import Point, Polygon
 from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.utils.image_cache import SharedImageCache
 from otx.api.utils.segmentation_utils import (
+    _get_doubled_area,
+    _split_contour,
     create_annotation_from_segmentation_map,
     create_hard_prediction_from_soft_prediction,
+    get_mask_cache_key,
     get_subcontours,
     mask_from_annotation,
     mask_from_dataset_item,
@@ -154,7 +158,8 @@ class TestSegmentationUtils:
         "DatasetItemEntity" class object, list with "LabelEntity" class objects
 
         <b>Expected results:</b>
-        Test passes if array returned by "mask_from_dataset_item" function is equal to expected
+        Test passes if array returned by "mask_from_dataset_item" function is equal to expected, with or without
+        cache, and if the cached mask is not used anymore once the annotations change
         """
         rectangle_label = self.rectangle_label()
         non_included_label = self.rectangle_label()
@@ -193,6 +198,24 @@ class TestSegmentationUtils:
         )
         mask = mask_from_dataset_item(dataset_item=dataset_item, labels=labels)
         assert np.array_equal(mask, expected_mask)
+        # Checking the cached masks, which are rasterized again when the annotations change
+        cache = SharedImageCache(max_bytes=10 * 640 * 480)
+        for _ in range(2):
+            mask = mask_from_dataset_item(dataset_item=dataset_item, labels=labels, cache=cache)
+            assert np.array_equal(mask, expected_mask)
+        assert cache.stats().hits == 1
+        assert get_mask_cache_key(dataset_item, labels) == get_mask_cache_key(dataset_item, labels[::-1])
+        assert get_mask_cache_key(dataset_item, labels) != get_mask_cache_key(dataset_item, labels[:2])
+        # The annotations without labels are not drawn, so that the cached mask is still valid
+        dataset_item.append_annotations([Annotation(shape=Rectangle(x1=0.0, y1=0.0, x2=0.5, y2=0.5), labels=[])])
+        mask = mask_from_dataset_item(dataset_item=dataset_item, labels=labels, cache=cache)
+        assert cache.stats().hits == 2
+        dataset_item.append_annotations(
+            [Annotation(shape=Rectangle(x1=0.0, y1=0.0, x2=0.5, y2=0.5), labels=[ScoredLabel(rectangle_label)])]
+        )
+        mask = mask_from_dataset_item(dataset_item=dataset_item, labels=labels, cache=cache)
+        assert cache.stats().hits == 2
+        assert not np.array_equal(mask, expected_mask)
 
     @pytest.mark.priority_medium
     @pytest.mark.unit
@@ -344,6 +367,41 @@ class TestSegmentationUtils:
         contour = [(0.1, 0.2), (0.1, 0.2), (0.1, 0.2), (0.1, 0.2)]
         assert get_subcontours(contour) == []
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_split_self_intersecting_contour(self):
+        """
+        <b>Description:</b>
+        Check "_split_contour" and "_get_doubled_area" functions for a self-intersecting contour of integer points
+
+        <b>Input data:</b>
+        Contour of two squares touching at one vertex, with non-negative and negative coordinates
+
+        <b>Expected results:</b>
+        Test passes if the contour is split into the two squares and their doubled areas are exact
+
+        <b>Steps</b>
+        1. Check subcontours returned by "_split_contour" function for contour with non-negative coordinates
+        2. Check values returned by "_get_doubled_area" function for the contour and its subcontours
+        3. Check subcontours returned by "_split_contour" function for contour with negative coordinates
+        """
+        contour = np.array([(0, 0), (0, 2), (2, 2), (4, 2), (4, 4), (2, 4), (2, 2), (2, 0)], dtype=np.int32)
+        subcontours = _split_contour(contour)
+        assert [subcontour.tolist() for subcontour in subcontours] == [
+            [[2, 2], [4, 2], [4, 4], [2, 4]],
+            [[0, 0], [0, 2], [2, 2], [2, 0]],
+        ]
+        # Checking "_get_doubled_area" for the contour and its subcontours of opposite orientations
+        assert [_get_doubled_area(subcontour) for subcontour in subcontours] == [8, -8]
+        assert _get_doubled_area(contour) == 0
+        # Checking "_split_contour" for contour with negative coordinates
+        subcontours = _split_contour(contour - 3)
+        assert [subcontour.tolist() for subcontour in subcontours] == [
+            [[-1, -1], [1, -1], [1, 1], [-1, 1]],
+            [[-3, -3], [-3, -1], [-1, -1], [-1, -3]],
+        ]
+
     @pytest.mark.priority_medium
     @pytest.mark.unit
     @pytest.mark.reqids(Requirements.REQ_1)
@@ -0,0 +1,146 @@
+"""This UnitTest tests Tiler functionality"""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import sys
+import types
+from collections import namedtuple
+
+import numpy as np
+import pytest
+
+from otx.api.utils.tiler import Tiler
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+Detection = namedtuple("Detection", ["xmin", "ymin", "xmax", "ymax", "score", "id"])
+
+
+class MockModel:
+    """Model predicting one box per tile, derived from the mean of the tile"""
+
+    def preprocess(self, image):
+        return {"image": image}, {"original_shape": image.shape}
+
+    def infer_sync(self, dict_data):
+        mean = float(dict_data["image"].mean())
+        return {"mean": mean, "feature_vector": np.full((1, 4), mean), "saliency_map": np.full((1, 2, 2), mean)}
+
+    def postprocess(self, outputs, meta):
+        mean = outputs["mean"]
+        return [Detection(mean / 10, mean / 20, mean / 10 + 50, mean / 20 + 40, mean / 255, int(mean) % 3)]
+
+
+class MockAsyncPipeline:
+    """AsyncPipeline of the OpenVINO model API completing the requests out of order"""
+
+    def __init__(self, model):
+        self.model = model
+        self.pending = []
+        self.completed_results = {}
+
+    def callback(self, request, callback_args):
+        pass
+
+    def submit_data(self, inputs, id, meta):
+        inputs, preprocessing_meta = self.model.preprocess(inputs)
+        self.pending.append((id, self.model.infer_sync(inputs), meta, preprocessing_meta))
+        if len(self.pending) == 3:
+            self.await_all()
+
+    def get_raw_result(self, id):
+        return self.completed_results.pop(id, None)
+
+    def await_all(self):
+        for id, raw_result, meta, preprocessing_meta in reversed(self.pending):
+            self.completed_results[id] = (raw_result, meta, preprocessing_meta, 0.0)
+        self.pending = []
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestTiler:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_async_predict(self, mocker):
+        """
+        <b>Description:</b>
+        Checks that the asynchronous tile inference gives the same predictions as the synchronous one
+
+        <b>Input data:</b>
+        Random image split into 9 tiles plus the full image, model API pipeline completing the requests out of order
+
+        <b>Expected results:</b>
+        The test passes if the detections and the features of the full image are identical, also for the next image
+        predicted with the same pipeline
+        """
+        pipelines = types.ModuleType("openvino.model_zoo.model_api.pipelines")
+        pipelines.AsyncPipeline = MockAsyncPipeline
+        mocker.patch.dict(sys.modules, {"openvino.model_zoo.model_api.pipelines": pipelines})
+        image = np.random.randint(0, 255, (300, 300, 3), dtype=np.uint8)
+
+        sync_tiler = Tiler(tile_size=100, overlap=0.0, max_number=100, model=MockModel())
+        async_model = MockModel()
+        async_model.model_adapter = mocker.MagicMock()
+        async_tiler = Tiler(tile_size=100, overlap=0.0, max_number=100, model=async_model, num_requests=4)
+        sync_detections, sync_features = sync_tiler.predict(image)
+        async_detections, async_features = async_tiler.predict(image)
+
+        assert len(sync_tiler.tile(image)) == 10
+        assert len(sync_detections) > 0
+        assert np.array_equal(async_detections, sync_detections)
+        for async_feature, sync_feature in zip(async_features, sync_features):
+            assert np.array_equal(async_feature, sync_feature)
+        assert sync_features[0][0] == image.mean()
+
+        async_pipeline = async_tiler.async_pipeline
+        image = image[::-1]
+        async_detections, _ = async_tiler.predict(image)
+        assert async_tiler.async_pipeline is async_pipeline
+        async_model.model_adapter.set_callback.assert_called_once_with(async_pipeline.callback)
+        assert np.array_equal(async_detections, sync_tiler.predict(image)[0])
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_skip_tiles(self, mocker):
+        """
+        <b>Description:</b>
+        Checks that the coarse-to-fine mode only infers the tiles selected by the prediction on the full image
+
+        <b>Input data:</b>
+        Dark image with a bright patch, split into 9 tiles plus the full image, model returning a saliency map
+
+        <b>Expected results:</b>
+        The test passes if only the tiles overlapping the full image detection or the bright patch are inferred
+        """
+        model = MockModel()
+        infer_sync = model.infer_sync
+
+        def infer_sync_with_saliency(dict_data):
+            outputs = infer_sync(dict_data)
+            outputs["saliency_map"] = dict_data["image"][None, None, ::10, ::10, 0]
+            return outputs
+
+        model.infer_sync = mocker.MagicMock(side_effect=infer_sync_with_saliency)
+        image = np.zeros((300, 300, 3), dtype=np.uint8)
+        image[220:240, 120:140] = 255
+
+        tiler = Tiler(tile_size=100, overlap=0.0, max_number=100, model=model, skip_threshold=0.5)
+        detections, features = tiler.predict(image)
+        tiler.predict(image)
+
+        # The full image detection overlaps the top-left tile, the bright patch is in the bottom-middle tile
+        assert model.infer_sync.call_count == 2 * 3
+        assert tiler.num_tiles == 2 * 9
+        assert tiler.num_skipped_tiles == 2 * 7
+        assert len(detections) == 3
+        assert features[1].shape == (1, 30, 30)
+        saliency_map = features[1]
+        assert tiler.select_tiles(
+            [[0, 200, 100, 300], [100, 200, 200, 300]], detections[:0], saliency_map, image.shape
+        ) == [[100, 200, 200, 300]]
+        # Without saliency map, no tile is skipped
+        assert len(tiler.select_tiles(tiler.tile(image)[1:], detections[:0], None, image.shape)) == 9
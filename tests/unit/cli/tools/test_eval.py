@@ -14,6 +14,7 @@ def test_get_args(mocker):
         "--load-weights": "weight/path",
         "--save-performance": "save/path",
         "--work-dir": "work/dir/path",
+        "--data-cache-dir": "data/cache/dir",
     }
     mock_command = ["otx"]
     for key, value in mock_options.items():
@@ -31,6 +32,8 @@ def test_get_args(mocker):
     assert parsed_args.load_weights == "weight/path"
     assert parsed_args.save_performance == "save/path"
     assert parsed_args.work_dir == "work/dir/path"
+    assert parsed_args.data_cache_dir == "data/cache/dir"
+    assert parsed_args.invalidate_data_cache is False
 
 
 @pytest.fixture
@@ -65,14 +68,13 @@ def mock_config_manager(mocker):
 
 
 @pytest.fixture
-def mock_dataset_adapter(mocker):
-    mock_dataset_adapter = mocker.patch("otx.cli.tools.eval.get_dataset_adapter")
+def mock_get_otx_dataset(mocker):
+    mock_get_otx_dataset = mocker.patch("otx.cli.tools.eval.get_otx_dataset_and_label_schema")
     mock_dataset = mocker.MagicMock()
     mock_label_schema = mocker.MagicMock()
-    mock_dataset_adapter.return_value.get_otx_dataset.return_value = mock_dataset
-    mock_dataset_adapter.return_value.get_label_schema.return_value = mock_label_schema
+    mock_get_otx_dataset.return_value = (mock_dataset, mock_label_schema)
 
-    return mock_dataset_adapter
+    return mock_get_otx_dataset
 
 
 @pytest.fixture
@@ -90,7 +92,7 @@ def test_main(
     mocker,
     mock_args,
     mock_config_manager,
-    mock_dataset_adapter,
+    mock_get_otx_dataset,
 ):
 
     mocker.patch.object(
@@ -105,12 +107,6 @@ def test_main(
         return_value=mocker.MagicMock(),
     )
 
-    mocker.patch.object(
-        target_package,
-        "get_dataset_adapter",
-        return_value=mock_dataset_adapter,
-    )
-
     mocker.patch.object(
         target_package,
         "ResultSetEntity",
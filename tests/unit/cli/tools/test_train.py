@@ -2,6 +2,7 @@ import argparse
 
 import pytest
 
+from otx.api.utils.image_cache import SharedImageCache
 from otx.cli.tools import train as target_package
 from otx.cli.tools.train import get_args, main
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
@@ -20,10 +21,13 @@ def test_get_args(mocker):
         "--work-dir": "work/dir/path",
         "--hpo-time-ratio": "2",
         "--gpus": "0,1",
+        "--cpu-procs": "2",
         "--rdzv-endpoint": "localhost:1",
         "--base-rank": "1",
         "--world-size": "1",
         "--data": "data/yaml",
+        "--data-cache-dir": "data/cache/dir",
+        "--decoded-image-cache-size": "64",
     }
     mock_command = ["otx"]
     for key, value in mock_options.items():
@@ -47,10 +51,14 @@ def test_get_args(mocker):
     assert parsed_args.work_dir == "work/dir/path"
     assert parsed_args.hpo_time_ratio == 2.0
     assert parsed_args.gpus == "0,1"
+    assert parsed_args.cpu_procs == 2
     assert parsed_args.rdzv_endpoint == "localhost:1"
     assert parsed_args.base_rank == 1
     assert parsed_args.world_size == 1
     assert parsed_args.data == "data/yaml"
+    assert parsed_args.data_cache_dir == "data/cache/dir"
+    assert parsed_args.invalidate_data_cache is False
+    assert parsed_args.decoded_image_cache_size == 64
 
 
 @pytest.fixture
@@ -65,12 +73,16 @@ def mock_args(mocker, tmp_path):
     mock_args.enable_hpo = False
     mock_args.hpo_time_ratio = 4
     mock_args.gpus = None
+    mock_args.cpu_procs = 0
     mock_args.rdzv_endpoint = "localhost:0"
     mock_args.base_rank = 0
     mock_args.world_size = 0
     mock_args.data = None
     mock_args.unlabeled_data_roots = None
     mock_args.unlabeled_file_list = None
+    mock_args.data_cache_dir = None
+    mock_args.invalidate_data_cache = False
+    mock_args.decoded_image_cache_size = 0
 
     def mock_contains(self, val):
         return val in self.__dict__
@@ -96,14 +108,13 @@ def mock_config_manager(mocker):
 
 
 @pytest.fixture
-def mock_dataset_adapter(mocker):
-    mock_dataset_adapter = mocker.patch("otx.cli.tools.train.get_dataset_adapter")
+def mock_get_otx_dataset(mocker):
+    mock_get_otx_dataset = mocker.patch("otx.cli.tools.train.get_otx_dataset_and_label_schema")
     mock_dataset = mocker.MagicMock()
     mock_label_schema = mocker.MagicMock()
-    mock_dataset_adapter.return_value.get_otx_dataset.return_value = mock_dataset
-    mock_dataset_adapter.return_value.get_label_schema.return_value = mock_label_schema
+    mock_get_otx_dataset.return_value = (mock_dataset, mock_label_schema)
 
-    return mock_dataset_adapter
+    return mock_get_otx_dataset
 
 
 @pytest.fixture
@@ -117,7 +128,7 @@ def mock_task(mocker):
 
 
 @e2e_pytest_unit
-def test_main(mocker, mock_args, mock_config_manager, mock_dataset_adapter, mock_task):
+def test_main(mocker, mock_args, mock_config_manager, mock_get_otx_dataset, mock_task):
     mocker.patch.object(target_package, "read_label_schema")
     mocker.patch.object(target_package, "read_binary")
     mocker.patch.object(
@@ -130,3 +141,19 @@ def test_main(mocker, mock_args, mock_config_manager, mock_dataset_adapter, mock
     ret = main()
 
     assert ret["retcode"] == 0
+
+
+@e2e_pytest_unit
+def test_main_with_decoded_image_cache(mocker, mock_args, mock_config_manager, mock_get_otx_dataset, mock_task):
+    mocker.patch.object(target_package, "read_label_schema")
+    mocker.patch.object(target_package, "read_binary")
+    mocker.patch.object(target_package, "save_model_data")
+    mock_set_decoded_image_cache = mocker.patch.object(target_package, "set_decoded_image_cache")
+    mock_args.decoded_image_cache_size = 2
+
+    ret = main()
+
+    assert ret["retcode"] == 0
+    cache = mock_set_decoded_image_cache.call_args.args[0]
+    assert isinstance(cache, SharedImageCache)
+    assert cache.max_bytes == 2 * 1024 * 1024
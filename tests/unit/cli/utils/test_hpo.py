@@ -5,16 +5,23 @@ from tempfile import TemporaryDirectory
 from typing import List
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 import otx
 from otx.api.configuration.helper import create as create_conf_hp
+from otx.api.entities.annotation import NullAnnotationSceneEntity
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.image import Image
+from otx.api.entities.label_schema import LabelSchemaEntity
 from otx.api.entities.model import ModelEntity
 from otx.api.entities.model_template import TaskType
 from otx.api.entities.subset import Subset
 from otx.api.entities.task_environment import TaskEnvironment
 from otx.cli.registry import find_and_parse_model_template
 from otx.cli.utils.hpo import (
+    SHARED_DATASET_KEY,
     HpoCallback,
     HpoDataset,
     HpoRunner,
@@ -25,6 +32,8 @@ from otx.cli.utils.hpo import (
     run_hpo,
     run_trial,
 )
+from otx.core.data.caching import DatasetCache
+from otx.hpo import BOHB
 from otx.hpo.hpo_base import TrialStatus
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
 
@@ -183,6 +192,15 @@ def make_task_env(template_path: str) -> TaskEnvironment:
     return TaskEnvironment(template, None, create_conf_hp(template.hyper_parameters.data), MagicMock())
 
 
+def make_file_dataset(num_items: int) -> DatasetEntity:
+    return DatasetEntity(
+        [
+            DatasetItemEntity(Image(file_path=f"image_{i}.jpg", size=(8, 8)), NullAnnotationSceneEntity())
+            for i in range(num_items)
+        ]
+    )
+
+
 @pytest.fixture(scope="module")
 def cls_template_path() -> str:
     return str(get_template_path("classification/configs"))
@@ -473,6 +491,38 @@ class TestHpoRunner:
         mock_run_hpo_loop.assert_called()  # call hpo_loop to run HPO
         mock_hb.assert_called()  # make hyperband
 
+    @e2e_pytest_unit
+    def test_get_smbo_hpo_algo(self, cls_task_env):
+        hpo_runner = HpoRunner(cls_task_env, 100, 10, "fake_path")
+        hpo_runner._hpo_config["search_algorithm"] = "smbo"
+
+        assert isinstance(hpo_runner._get_hpo_algo(), BOHB)
+
+    @e2e_pytest_unit
+    def test_run_hpo_w_shared_dataset(self, mocker, cls_template_path, tmp_path):
+        task_env = make_task_env(cls_template_path)
+        task_env.label_schema = LabelSchemaEntity()
+        hpo_workdir = tmp_path / "hpo"
+        hpo_runner = HpoRunner(task_env, 100, 10, hpo_workdir)
+        mock_run_hpo_loop = mocker.patch("otx.cli.utils.hpo.run_hpo_loop")
+        mocker.patch("otx.cli.utils.hpo.HyperBand")
+        dataset = make_file_dataset(num_items=3)
+
+        hpo_runner.run_hpo(mocker.MagicMock(), {"fake", "fake"}, dataset, share_image_cache=True)
+
+        # The dataset is saved once for all the trials
+        train_func = mock_run_hpo_loop.call_args.args[1]
+        shared_dataset, _ = DatasetCache(train_func.keywords["shared_dataset_dir"]).load(SHARED_DATASET_KEY)
+        assert [item.media.path for item in shared_dataset] == [item.media.path for item in dataset]
+        assert train_func.keywords["image_cache_dir"] == str(hpo_workdir / "image_cache")
+
+        # The trials convert the dataset themselves if it can't be shared
+        dataset = DatasetEntity([DatasetItemEntity(Image(data=np.zeros((4, 4, 3))), NullAnnotationSceneEntity())])
+        hpo_runner.run_hpo(mocker.MagicMock(), {"fake", "fake"}, dataset)
+        train_func = mock_run_hpo_loop.call_args.args[1]
+        assert train_func.keywords["shared_dataset_dir"] is None
+        assert train_func.keywords["image_cache_dir"] is None
+
 
 class TestTrainer:
     @e2e_pytest_unit
@@ -531,6 +581,38 @@ class TestTrainer:
 
         mock_task.train.assert_called()  # check task.train() is called
 
+    @e2e_pytest_unit
+    def test_run_w_shared_dataset(self, mocker, cls_template_path, tmp_path):
+        dataset = make_file_dataset(num_items=3)
+        shared_dataset_dir = str(tmp_path / "dataset")
+        DatasetCache(shared_dataset_dir).save(SHARED_DATASET_KEY, dataset, LabelSchemaEntity())
+        mock_task = mocker.MagicMock()
+        mock_task.project_path = str(tmp_path / "fake_project")
+        mocker.patch.object(TaskEnvironmentManager, "get_train_task", return_value=mock_task)
+        mock_get_dataset_adapter = mocker.patch("otx.cli.utils.hpo.get_dataset_adapter")
+        mock_hpo_dataset = mocker.patch("otx.cli.utils.hpo.HpoDataset")
+        mock_set_default_image_cache = mocker.patch("otx.algorithms.common.utils.data.set_default_image_cache")
+
+        trainer = Trainer(
+            hp_config={"configuration": {"iterations": 10}, "id": "1"},
+            report_func=mocker.MagicMock(),
+            model_template=find_and_parse_model_template(cls_template_path),
+            data_roots=mocker.MagicMock(),
+            task_type=TaskType.CLASSIFICATION,
+            hpo_workdir=tmp_path / "hpo_dir",
+            initial_weight_name="fake",
+            metric="fake",
+            shared_dataset_dir=shared_dataset_dir,
+            image_cache_dir=str(tmp_path / "image_cache"),
+        )
+        trainer.run()
+
+        # The trial loads the shared dataset instead of converting the dataset
+        mock_get_dataset_adapter.assert_not_called()
+        loaded_dataset = mock_hpo_dataset.call_args.args[0]
+        assert [item.media.path for item in loaded_dataset] == [item.media.path for item in dataset]
+        assert mock_set_default_image_cache.call_args.args[0].cache_dir == str(tmp_path / "image_cache")
+
 
 class TestHpoCallback:
     @e2e_pytest_unit
@@ -8,8 +8,10 @@ import torch
 
 from otx.cli.utils import multi_gpu
 from otx.cli.utils.multi_gpu import (
+    MultiCPUManager,
     MultiGPUManager,
     _get_free_port,
+    get_cpu_ids,
     get_gpu_ids,
     set_arguments_to_argv,
 )
@@ -375,3 +377,89 @@ class TestMultiGPUManager:
 
         # check
         mock_cur_process.kill.assert_called_once()
+
+
+@e2e_pytest_unit
+def test_get_cpu_ids(mocker):
+    mocker.patch.object(multi_gpu.os, "sched_getaffinity", return_value=set(range(8)), create=True)
+
+    assert get_cpu_ids(1, 2) == [4, 5, 6, 7]
+    assert get_cpu_ids(2, 3) == [4, 5]
+    assert get_cpu_ids(3, 16) == list(range(8))
+
+
+class TestMultiCPUManager:
+    @pytest.fixture(autouse=True)
+    def _set_up(self, mocker):
+        self.mock_singal = mocker.patch.object(multi_gpu, "signal")
+        self.mock_thread = mocker.patch.object(multi_gpu.threading, "Thread")
+        self.mock_train_func = mocker.MagicMock()
+        self.mock_mp = mocker.patch.object(multi_gpu, "mp")
+        self.mock_process = mocker.MagicMock()
+        self.mock_mp.get_context.return_value.Process = self.mock_process
+        self.num_processes = 4
+
+        self.multicpu_manager = MultiCPUManager(self.mock_train_func, self.num_processes)
+
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("num_processes", [0, -1])
+    def test_init_wrong_num_processes(self, mocker, num_processes):
+        with pytest.raises(ValueError):
+            MultiCPUManager(mocker.MagicMock(), num_processes)
+
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("num_processes,available", [(1, False), (2, True)])
+    def test_is_available(self, mocker, num_processes, available):
+        assert MultiCPUManager(mocker.MagicMock(), num_processes).is_available() == available
+
+    @e2e_pytest_unit
+    def test_setup_multi_gpu_train(self, mocker):
+        mock_initialize_multigpu_train = mocker.patch.object(MultiCPUManager, "initialize_multigpu_train")
+
+        self.multicpu_manager.setup_multi_gpu_train("fake")
+
+        assert self.mock_process.call_count == self.num_processes - 1
+        assert self.mock_process.call_args.kwargs["target"] == MultiCPUManager.run_child_process
+        assert self.mock_process.call_args.kwargs["args"][-2] == list(range(self.num_processes))
+        mock_initialize_multigpu_train.assert_called_once()
+        assert mock_initialize_multigpu_train.call_args.args[1:] == (0, 0, list(range(self.num_processes)), 4)
+
+    @e2e_pytest_unit
+    def test_initialize_multigpu_train(self, mocker):
+        mocker.patch.dict(multi_gpu.os.environ)
+        mocker.patch.object(multi_gpu, "get_cpu_ids", return_value=[2, 3])
+        mock_sched_setaffinity = mocker.patch.object(multi_gpu.os, "sched_setaffinity", create=True)
+        mock_set_num_threads = mocker.patch.object(multi_gpu.torch, "set_num_threads")
+        mock_init_process_group = mocker.patch.object(multi_gpu.dist, "init_process_group")
+        mocker.patch.object(multi_gpu.dist, "get_world_size", return_value=2)
+        mocker.patch.object(multi_gpu.dist, "get_rank", return_value=1)
+
+        MultiCPUManager.initialize_multigpu_train(
+            rdzv_endpoint="localhost:1234",
+            rank=1,
+            local_rank=1,
+            gpu_ids=[0, 1],
+            world_size=2,
+        )
+
+        assert multi_gpu.os.environ["LOCAL_WORLD_SIZE"] == "2"
+        assert multi_gpu.os.environ["LOCAL_RANK"] == "1"
+        assert multi_gpu.os.environ["OMP_NUM_THREADS"] == "2"
+        mock_sched_setaffinity.assert_called_once_with(0, [2, 3])
+        mock_set_num_threads.assert_called_once_with(2)
+        assert mock_init_process_group.call_args.kwargs["backend"] == "gloo"
+
+    @e2e_pytest_unit
+    def test_run_child_process(self, mocker):
+        mocker.patch.object(multi_gpu.mp, "set_start_method")
+        mock_sys = mocker.patch.object(multi_gpu, "sys")
+        mock_sys.argv = ["--cpu-procs", "2"]
+        mock_initialize_multigpu_train = mocker.patch.object(MultiCPUManager, "initialize_multigpu_train")
+        mocker.patch.object(multi_gpu, "threading")
+        mock_train_func = mocker.MagicMock()
+
+        MultiCPUManager.run_child_process(mock_train_func, "output", "localhost:1234", 1, 1, [0, 1], 2)
+
+        assert "--cpu-procs" not in mock_sys.argv
+        mock_initialize_multigpu_train.assert_called_once()
+        mock_train_func.assert_called_once()
@@ -88,3 +88,46 @@ class TestOTXDetectionDatasetAdapter:
         assert Subset.TESTING in instance_seg_test_dataset_adapter.dataset
         assert isinstance(instance_seg_test_dataset_adapter.get_otx_dataset(), DatasetEntity)
         assert isinstance(instance_seg_test_dataset_adapter.get_label_schema(), LabelSchemaEntity)
+
+    @e2e_pytest_unit
+    def test_get_otx_dataset_parallel_and_streaming(self):
+        def summarize(dataset_items):
+            return [
+                (
+                    item.media.path,
+                    item.subset,
+                    [
+                        (repr(annotation.shape), [label.name for label in annotation.get_labels()])
+                        for annotation in item.get_annotations()
+                    ],
+                )
+                for item in dataset_items
+            ]
+
+        serial_dataset = self.train_dataset_adapter.get_otx_dataset()
+        serial_labels = [label.name for label in self.train_dataset_adapter.get_label_schema().get_labels(False)]
+
+        parallel_adapter = DetectionDatasetAdapter(
+            task_type=self.task_type,
+            train_data_roots=self.train_data_roots,
+            val_data_roots=self.val_data_roots,
+            unlabeled_data_roots=self.unlabeled_data_roots,
+        )
+        parallel_dataset = parallel_adapter.get_otx_dataset(num_workers=2)
+        assert summarize(parallel_dataset) == summarize(serial_dataset)
+        assert [label.name for label in parallel_adapter.get_label_schema().get_labels(False)] == serial_labels
+        label_entities = parallel_adapter.label_entities
+        for item in parallel_dataset:
+            for annotation in item.get_annotations():
+                assert all(any(label.label is entity for entity in label_entities) for label in annotation.get_labels())
+
+        streaming_adapter = DetectionDatasetAdapter(
+            task_type=self.task_type,
+            train_data_roots=self.train_data_roots,
+            val_data_roots=self.val_data_roots,
+            unlabeled_data_roots=self.unlabeled_data_roots,
+        )
+        streamed_items = streaming_adapter.iter_otx_dataset_items()
+        assert not isinstance(streamed_items, list)
+        assert summarize(streamed_items) == summarize(serial_dataset)
+        assert [label.name for label in streaming_adapter.get_label_schema().get_labels(False)] == serial_labels
@@ -3,7 +3,8 @@ import os
 import pytest
 
 from otx.algorithms.common.configs.training_base import TrainType
-from otx.core.data.adapter import get_dataset_adapter
+from otx.core.data import adapter as adapter_package
+from otx.core.data.adapter import get_dataset_adapter, get_otx_dataset_and_label_schema
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
 from tests.unit.core.data.test_helpers import (
     TASK_NAME_TO_DATA_ROOT,
@@ -74,3 +75,41 @@ def test_get_dataset_adapter_selfsl_segmentation(task_name, train_type):
             train_type=train_type,
             test_data_roots=os.path.join(root_path, data_root["test"]),
         )
+
+
+@e2e_pytest_unit
+def test_get_otx_dataset_and_label_schema(mocker, tmp_path):
+    root_path = os.getcwd()
+    task_type = TASK_NAME_TO_TASK_TYPE["detection"]
+    data_root = os.path.join(root_path, TASK_NAME_TO_DATA_ROOT["detection"]["train"])
+    cache_dir = str(tmp_path / "cache")
+
+    dataset, label_schema = get_otx_dataset_and_label_schema(
+        task_type=task_type, train_type=TrainType.INCREMENTAL.value, train_data_roots=data_root
+    )
+    assert not os.path.exists(cache_dir)
+
+    spy_get_dataset_adapter = mocker.spy(adapter_package, "get_dataset_adapter")
+    cached_dataset, cached_label_schema = get_otx_dataset_and_label_schema(
+        task_type=task_type, train_type=TrainType.INCREMENTAL.value, train_data_roots=data_root, cache_dir=cache_dir
+    )
+    assert spy_get_dataset_adapter.call_count == 1
+    assert len(cached_dataset) == len(dataset)
+
+    cached_dataset, cached_label_schema = get_otx_dataset_and_label_schema(
+        task_type=task_type, train_type=TrainType.INCREMENTAL.value, train_data_roots=data_root, cache_dir=cache_dir
+    )
+    assert spy_get_dataset_adapter.call_count == 1
+    assert [item.media.path for item in cached_dataset] == [item.media.path for item in dataset]
+    assert [label.name for label in cached_label_schema.get_labels(False)] == [
+        label.name for label in label_schema.get_labels(False)
+    ]
+
+    get_otx_dataset_and_label_schema(
+        task_type=task_type,
+        train_type=TrainType.INCREMENTAL.value,
+        train_data_roots=data_root,
+        cache_dir=cache_dir,
+        invalidate_cache=True,
+    )
+    assert spy_get_dataset_adapter.call_count == 2
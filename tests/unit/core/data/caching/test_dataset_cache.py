@@ -0,0 +1,155 @@
+"""Unit-Test case for otx.core.data.caching.dataset_cache."""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from otx.algorithms.common.configs.training_base import TrainType
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.annotation_store import ColumnarAnnotationSceneEntity
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.image import Image
+from otx.api.entities.label_schema import LabelSchemaEntity
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.core.data.adapter import get_dataset_adapter
+from otx.core.data.caching import DatasetCache, get_dataset_cache_key
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+from tests.unit.core.data.test_helpers import (
+    TASK_NAME_TO_DATA_ROOT,
+    TASK_NAME_TO_TASK_TYPE,
+)
+
+
+def summarize(dataset):
+    return [
+        (
+            item.media.path,
+            item.media.height,
+            item.media.width,
+            item.subset,
+            item.annotation_scene.kind,
+            [
+                (
+                    type(annotation.shape).__name__,
+                    repr(annotation.shape),
+                    [(label.name, label.id_, label.probability) for label in annotation.get_labels(True)],
+                )
+                for annotation in item.get_annotations()
+            ],
+            [repr(metadata.data) for metadata in item.get_metadata()],
+        )
+        for item in dataset
+    ]
+
+
+class TestDatasetCache:
+    @e2e_pytest_unit
+    @pytest.mark.parametrize(
+        "task_name",
+        ["classification", "detection", "instance_segmentation", "anomaly_segmentation", "action_detection"],
+    )
+    def test_save_and_load(self, task_name, tmp_path):
+        data_root = TASK_NAME_TO_DATA_ROOT[task_name]
+        dataset_adapter = get_dataset_adapter(
+            task_type=TASK_NAME_TO_TASK_TYPE[task_name],
+            train_type=TrainType.INCREMENTAL.value,
+            train_data_roots=os.path.join(os.getcwd(), data_root["train"]),
+            val_data_roots=os.path.join(os.getcwd(), data_root["val"]),
+        )
+        dataset, label_schema = dataset_adapter.get_otx_dataset(), dataset_adapter.get_label_schema()
+
+        cache = DatasetCache(str(tmp_path))
+        assert cache.load("key") is None
+        assert cache.save("key", dataset, label_schema)
+        assert os.path.isfile(tmp_path / "key" / "points.npy")
+
+        cached_dataset, cached_label_schema = cache.load("key")
+        if task_name in ("detection", "instance_segmentation"):
+            # The cached annotations stay columnar until they are accessed
+            for item in cached_dataset:
+                assert isinstance(item.annotation_scene, ColumnarAnnotationSceneEntity)
+                assert item.annotation_scene.store is not None
+        assert summarize(cached_dataset) == summarize(dataset)
+        assert [label.name for label in cached_label_schema.get_labels(True)] == [
+            label.name for label in label_schema.get_labels(True)
+        ]
+        # The annotations refer to the labels of the label schema
+        schema_labels = cached_label_schema.get_labels(True)
+        for item in cached_dataset:
+            for annotation in item.get_annotations():
+                for scored_label in annotation.get_labels(True):
+                    if scored_label.name in [label.name for label in schema_labels]:
+                        assert any(scored_label.label is label for label in schema_labels)
+
+    @e2e_pytest_unit
+    def test_save_unsupported_dataset(self, tmp_path):
+        item = DatasetItemEntity(
+            Image(data=np.zeros((4, 4, 3), dtype=np.uint8)),
+            AnnotationSceneEntity([], kind=AnnotationSceneKind.ANNOTATION),
+        )
+        cache = DatasetCache(str(tmp_path))
+        assert not cache.save("key", DatasetEntity([item]), LabelSchemaEntity())
+        assert cache.load("key") is None
+
+    @e2e_pytest_unit
+    def test_invalidate_and_evict(self, tmp_path):
+        items = [
+            DatasetItemEntity(
+                Image(file_path=f"image_{i}.jpg", size=(8, 8)),
+                AnnotationSceneEntity(
+                    [Annotation(Rectangle(x1=0.1, y1=0.1, x2=0.5, y2=0.5), [])], kind=AnnotationSceneKind.ANNOTATION
+                ),
+            )
+            for i in range(100)
+        ]
+        dataset = DatasetEntity(items)
+
+        cache = DatasetCache(str(tmp_path))
+        cache.save("a", dataset, LabelSchemaEntity())
+        cache.save("b", dataset, LabelSchemaEntity())
+        cache.invalidate("a")
+        assert cache.load("a") is None
+        assert cache.load("b") is not None
+        cache.invalidate()
+        assert cache.load("b") is None
+
+        cache.save("a", dataset, LabelSchemaEntity())
+        entry_size = sum(file.stat().st_size for file in (tmp_path / "a").iterdir())
+        cache.max_size = 2 * entry_size
+        cache.save("b", dataset, LabelSchemaEntity())
+        cache.load("a")
+        cache.save("c", dataset, LabelSchemaEntity())
+        # "b" is the least recently used entry
+        assert sorted(os.listdir(tmp_path)) == ["a", "c"]
+
+    @e2e_pytest_unit
+    def test_load_broken_entry(self, tmp_path):
+        cache = DatasetCache(str(tmp_path))
+        os.makedirs(tmp_path / "key")
+        (tmp_path / "key" / "header.json").write_text("{}")
+        assert cache.load("key") is None
+        assert not os.path.exists(tmp_path / "key")
+
+
+@e2e_pytest_unit
+def test_get_dataset_cache_key(tmp_path):
+    data_root = str(tmp_path / "data")
+    shutil.copytree(TASK_NAME_TO_DATA_ROOT["detection"]["train"], data_root)
+
+    key = get_dataset_cache_key({"train": data_root, "val": None}, task_type="DETECTION")
+    assert key == get_dataset_cache_key({"train": data_root, "val": None}, task_type="DETECTION")
+    assert key != get_dataset_cache_key({"train": data_root, "val": None}, task_type="INSTANCE_SEGMENTATION")
+    assert key != get_dataset_cache_key({"train": data_root, "val": data_root}, task_type="DETECTION")
+
+    with open(os.path.join(data_root, "new_file.txt"), "w", encoding="utf-8") as new_file:
+        new_file.write("new")
+    assert key != get_dataset_cache_key({"train": data_root, "val": None}, task_type="DETECTION")
@@ -0,0 +1,120 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import math
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from otx.hpo.bohb import BOHB, TreeParzenEstimator
+from otx.hpo.search_space import SearchSpace
+from tests.test_suite.e2e_test_system import e2e_pytest_component
+
+
+@pytest.fixture
+def good_bohb_args():
+    with TemporaryDirectory() as tmp_dir:
+        yield {
+            "search_space": {
+                "hp1": {"param_type": "uniform", "max": 100, "min": 10},
+                "hp2": {"param_type": "qloguniform", "max": 1000, "min": 100, "step": 2, "log_base": 10},
+            },
+            "save_path": tmp_dir,
+            "mode": "max",
+            "num_full_iterations": 64,
+            "full_dataset_size": 100,
+            "maximum_resource": 64,
+            "minimum_resource": 1,
+            "reduction_factor": 4,
+            "asynchronous_sha": True,
+            "asynchronous_bracket": True,
+            "seed": 0,
+        }
+
+
+def objective(configuration):
+    return -(((configuration["hp1"] - 10) / 90 - 0.8) ** 2) - (math.log10(configuration["hp2"]) - 2.2) ** 2
+
+
+class TestTreeParzenEstimator:
+    @e2e_pytest_component
+    def test_unit_point(self):
+        search_space = SearchSpace(
+            {
+                "lr": {"param_type": "loguniform", "range": [0.0001, 0.1]},
+                "momentum": {"param_type": "uniform", "range": [0.5, 0.9]},
+                "optimizer": {"param_type": "choice", "choice_list": ["sgd", "adam", "adamw"]},
+            }
+        )
+        estimator = TreeParzenEstimator(search_space)
+        config = {"lr": 0.001, "momentum": 0.6, "optimizer": "adam"}
+
+        point = estimator.to_unit_point(config)
+
+        assert np.allclose(point, [1 / 3, 0.25, 0.5])
+        converted = estimator.from_unit_point(point)
+        assert converted["lr"] == pytest.approx(0.001)
+        assert converted["momentum"] == pytest.approx(0.6)
+        assert converted["optimizer"] == "adam"
+
+    @e2e_pytest_component
+    @pytest.mark.parametrize("mode", ["max", "min"])
+    def test_suggest(self, mode):
+        search_space = SearchSpace({f"x{i}": {"param_type": "uniform", "range": [0, 1]} for i in range(3)})
+        estimator = TreeParzenEstimator(search_space, mode=mode, seed=0)
+        rng = np.random.default_rng(0)
+        sign = 1 if mode == "min" else -1
+
+        def loss(config):
+            return sum((value - 0.3) ** 2 for value in config.values())
+
+        observations = []
+        for _ in range(estimator.min_num_observations - 1):
+            config = {key: float(rng.random()) for key in search_space}
+            observations.append((config, sign * loss(config)))
+        assert estimator.suggest(observations) is None
+
+        for _ in range(40):
+            config = estimator.suggest(observations)
+            if config is None:
+                config = {key: float(rng.random()) for key in search_space}
+            observations.append((config, sign * loss(config)))
+
+        # The suggested configurations are much better than random ones, whose mean loss is about 0.33
+        assert np.mean([loss(config) for config, _ in observations[-20:]]) < 0.1
+
+
+class TestBOHB:
+    @e2e_pytest_component
+    @pytest.mark.parametrize("random_ratio", [-0.1, 1.1])
+    def test_init_wrong_random_ratio(self, good_bohb_args, random_ratio):
+        with pytest.raises(ValueError):
+            BOHB(random_ratio=random_ratio, **good_bohb_args)
+
+    @e2e_pytest_component
+    @pytest.mark.parametrize("random_ratio", [0, 1])
+    def test_run(self, good_bohb_args, random_ratio):
+        prior = {"hp1": 55, "hp2": 500}
+        bohb = BOHB(random_ratio=random_ratio, prior_hyper_parameters=prior, **good_bohb_args)
+
+        while True:
+            trial = bohb.get_next_sample()
+            if trial is None:
+                break
+            for resource in range(math.floor(trial.get_progress()) + 1, math.ceil(trial.iteration) + 1):
+                bohb.report_score(objective(trial.configuration), resource, trial.id)
+            bohb.report_score(0, trial.iteration, trial.id, done=True)
+
+        assert bohb.is_done()
+        assert bohb.get_best_config() is not None
+        # The prior hyper parameters are tried as they are
+        assert bohb._trials["0"].configuration["hp1"] == 55
+        for trial in bohb._trials.values():
+            assert 10 <= trial.configuration["hp1"] <= 100
+            assert 100 <= trial.configuration["hp2"] <= 1000
+        if random_ratio == 1:
+            assert bohb._num_model_based_trials == 0
+        else:
+            assert bohb._num_model_based_trials > len(bohb._trials) // 2
@@ -0,0 +1,67 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import time
+
+import pytest
+
+from otx.hpo.hpo_base import Trial, TrialStatus
+from otx.hpo.hpo_runner import HpoLoop
+from tests.test_suite.e2e_test_system import e2e_pytest_component
+
+
+def train_func(hp_config, report_func):
+    for progress in range(1, hp_config["configuration"]["iterations"] + 1):
+        time.sleep(0.1)
+        if report_func(progress * 0.1, progress, done=progress == 3) == TrialStatus.STOP:
+            break
+
+
+class FakeHpoAlgo:
+    def __init__(self, num_trials):
+        self.trials = []
+        for idx in range(num_trials):
+            trial = Trial(idx, {})
+            trial.iteration = 3
+            self.trials.append(trial)
+        self.num_sampled = 0
+        self.reports = []
+        self.num_saves = 0
+
+    def is_done(self):
+        return len(self.reports) == 3 * len(self.trials)
+
+    def get_next_sample(self):
+        if self.num_sampled == len(self.trials):
+            return None
+        self.num_sampled += 1
+        return self.trials[self.num_sampled - 1]
+
+    def report_score(self, score, resource, trial_id, done):
+        self.reports.append((trial_id, resource, done))
+        return TrialStatus.RUNNING
+
+    def save_results(self):
+        self.num_saves += 1
+
+
+class TestHpoLoop:
+    @e2e_pytest_component
+    @pytest.mark.parametrize("num_parallel_trial", [1, 2])
+    def test_run(self, num_parallel_trial):
+        hpo_algo = FakeHpoAlgo(num_trials=2)
+        hpo_loop = HpoLoop(hpo_algo, train_func, "cpu", num_parallel_trial=num_parallel_trial, wait_timeout=10.0)
+        hpo_loop.run()
+
+        assert sorted(hpo_algo.reports) == [
+            (idx, progress, progress == 3) for idx in range(2) for progress in (1, 2, 3)
+        ]
+        metrics = hpo_loop.metrics
+        assert metrics["num_reports"] == 6
+        assert metrics["num_saves"] == hpo_algo.num_saves
+        # The results are only saved when a trial starts, reports or ends, and once at the end
+        assert hpo_algo.num_saves <= 2 + 6 + 2 + 1
+        # The loop waits for the trials instead of polling them
+        assert metrics["num_wakeups"] < 50
+        assert metrics["scheduling_time"] < metrics["waiting_time"]
@@ -0,0 +1,4 @@
+"""Test for otx.mpa.modules.hooks"""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
@@ -0,0 +1,74 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import pytest
+import torch
+from mmcls.models.necks.gap import GlobalAveragePooling
+
+from otx.mpa.modules.hooks.recording_forward_hooks import ReciproCAMHook
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+class MockHead(torch.nn.Module):
+    def __init__(self, in_channels, num_classes):
+        super().__init__()
+        self.num_classes = num_classes
+        self.fc = torch.nn.Linear(in_channels, num_classes)
+
+    def simple_test(self, x):
+        if x.ndim == 4:
+            x = torch.amax(x, dim=(2, 3))
+        return torch.softmax(self.fc(x.flatten(1)), dim=1)
+
+
+class MockClassifier(torch.nn.Module):
+    def __init__(self, with_gap_neck):
+        super().__init__()
+        self.with_neck = with_gap_neck
+        self.neck = GlobalAveragePooling() if with_gap_neck else None
+        self.head = MockHead(8, 5)
+
+
+def reference_recipro_cam(model, feature_map):
+    """Sample by sample and position by position Recipro-CAM."""
+    bs, c, h, w = feature_map.size()
+    saliency_maps = torch.empty(bs, model.head.num_classes, h * w)
+    for f in range(bs):
+        for k in range(h * w):
+            mask = torch.zeros(1, c, h * w)
+            mask[:, :, k] = 1
+            x = feature_map[f : f + 1] * mask.reshape(1, c, h, w)
+            if model.neck is not None:
+                x = model.neck(x)
+            saliency_maps[f, :, k] = model.head.simple_test(x)[0]
+    max_values, _ = torch.max(saliency_maps, -1)
+    min_values, _ = torch.min(saliency_maps, -1)
+    saliency_maps = 255 * (saliency_maps - min_values[:, :, None]) / (max_values - min_values + 1e-12)[:, :, None]
+    return saliency_maps.reshape((bs, -1, h, w)).to(torch.uint8)
+
+
+class TestReciproCAMHook:
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("with_gap_neck", [True, False])
+    @pytest.mark.parametrize("chunk_size", [None, 1, 7])
+    def test_func(self, with_gap_neck, chunk_size):
+        torch.manual_seed(0)
+        model = MockClassifier(with_gap_neck)
+        feature_map = torch.rand(3, 8, 4, 5)
+
+        saliency_maps = ReciproCAMHook(model, chunk_size=chunk_size).func(feature_map)
+
+        assert saliency_maps.shape == (3, 5, 4, 5)
+        assert saliency_maps.dtype == torch.uint8
+        assert (saliency_maps.int() - reference_recipro_cam(model, feature_map).int()).abs().max() <= 1
+
+    @e2e_pytest_unit
+    def test_get_chunk_size(self, mocker):
+        mocker.patch.object(ReciproCAMHook, "max_mosaic_numel", 8 * 4 * 5 * 12)
+        hook = ReciproCAMHook(MockClassifier(with_gap_neck=False))
+        assert hook._get_chunk_size(3, 8, 4, 5) == 4
+        assert hook._get_chunk_size(100, 8, 4, 5) == 1
+
+        hook = ReciproCAMHook(MockClassifier(with_gap_neck=True))
+        assert hook._get_chunk_size(3, 8, 4, 5) == 20
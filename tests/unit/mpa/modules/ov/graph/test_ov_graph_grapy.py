@@ -83,6 +83,23 @@ class TestSortedDict:
         instance.clear()
         assert len(instance) == 0
 
+    @e2e_pytest_unit
+    def test_same_sort_values(self):
+        instance = SortedDict("key")
+        for key, sort_value in [("a", 1), ("b", 0), ("c", 1), ("d", 0), ("e", 1)]:
+            instance[key] = {"edge": {"key": sort_value}}
+        instance["f"] = {"edge": {}}
+
+        # equal sort values keep the insertion order, and a missing sort value comes last
+        assert list(instance) == ["b", "d", "a", "c", "e", "f"]
+
+        del instance["c"]
+        instance.pop("b")
+        instance.pop("x", None)
+        instance["c"] = {"edge": {"key": 0}}
+        assert list(instance) == ["d", "c", "a", "e", "f"]
+        assert list(reversed(instance)) == ["f", "e", "a", "c", "d"]
+
 
 class TestGraph:
     @pytest.fixture(autouse=True)
@@ -10,20 +10,23 @@ from otx.mpa.modules.ov.models.ov_model import OVModel
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
 
 
+def build_ov_model():
+    param = ov.opset10.parameter([1, 3, 64, 64], ov.Type.f32, name="in")
+    constant = ov.opset10.constant(np.array([103.0, 116.0, 123.0]).reshape(1, 3, 1, 1), ov.Type.f32)
+    node = ov.opset10.subtract(param, constant, "numpy")
+    constant = ov.opset10.constant(np.random.normal(size=(32, 3, 3, 3)), ov.Type.f32)
+    node = ov.opset10.convolution(node, constant, [2, 2], [1, 1], [1, 1], [1, 1], "explicit")
+    constant = ov.opset10.constant(np.random.normal(size=(1, 32, 1, 1)), ov.Type.f32)
+    node = ov.opset10.add(node, constant, "numpy")
+    node = ov.opset10.clamp(node, 0, 6)
+    result = ov.opset10.result(node, name="out")
+    return ov.Model([result], [param], "model")
+
+
 class TestOVModel:
     @e2e_pytest_unit
     def test(self):
-
-        param = ov.opset10.parameter([1, 3, 64, 64], ov.Type.f32, name="in")
-        constant = ov.opset10.constant(np.array([103.0, 116.0, 123.0]).reshape(1, 3, 1, 1), ov.Type.f32)
-        node = ov.opset10.subtract(param, constant, "numpy")
-        constant = ov.opset10.constant(np.random.normal(size=(32, 3, 3, 3)), ov.Type.f32)
-        node = ov.opset10.convolution(node, constant, [2, 2], [1, 1], [1, 1], [1, 1], "explicit")
-        constant = ov.opset10.constant(np.random.normal(size=(1, 32, 1, 1)), ov.Type.f32)
-        node = ov.opset10.add(node, constant, "numpy")
-        node = ov.opset10.clamp(node, 0, 6)
-        result = ov.opset10.result(node, name="out")
-        ov_model = ov.Model([result], [param], "model")
+        ov_model = build_ov_model()
 
         model = OVModel(
             model_path_or_model=ov_model,
@@ -43,3 +46,28 @@ class TestOVModel:
             shape = [1 if i == -1 else i for i in shape]
             data[key] = torch.randn(shape)
         model(**data)
+
+    @e2e_pytest_unit
+    def test_execution_plan(self):
+        model = OVModel(model_path_or_model=build_ov_model())
+        data = torch.randn(1, 3, 64, 64)
+
+        outputs = model(data)
+
+        plan = model._execution_plan
+        assert [step.name for step in plan] == list(model.model.keys())
+        assert plan[0].type in ("Parameter", "Constant")
+        produced = set()
+        freed = []
+        for step in plan:
+            assert all(name in produced for name, _ in step.inputs)
+            assert all(name in produced for name in step.frees)
+            produced.add(step.name)
+            freed.extend(step.frees)
+        # every feature but the outputs is freed once after its last use
+        assert sorted(freed) == sorted(set(produced) - set(model.outputs))
+        assert list(model.features.keys()) == model.outputs
+
+        # the plan is built once and reused
+        assert torch.equal(model(data)[model.outputs[0]], outputs[model.outputs[0]])
+        assert model._execution_plan is plan
@@ -106,6 +106,20 @@ class TestStage:
         assert "train_dataloader" in cfg.data
         assert cfg.data["train_dataloader"]["samples_per_gpu"] == 1
 
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("device,expected", [("cpu", 3), ("cuda", 8)])
+    def test_configure_samples_per_gpu_distributed(self, mocker, device, expected):
+        cfg = mmcv.ConfigDict(device=device, data=dict(train_dataloader=dict(samples_per_gpu=8)))
+        mock_otx_dataset = mocker.MagicMock()
+        mock_otx_dataset.__len__.return_value = 100
+
+        mocker.patch("otx.mpa.stage.get_data_cfg", return_value=mmcv.ConfigDict(otx_dataset=mock_otx_dataset))
+        mocker.patch("otx.mpa.stage.dist.get_world_size", return_value=3)
+        Stage.configure_samples_per_gpu(cfg, "train", True)
+
+        # The CPU processes split the batch
+        assert cfg.data["train_dataloader"]["samples_per_gpu"] == expected
+
     @e2e_pytest_unit
     def test_configure_compat_cfg(self):
         cfg = mmcv.ConfigDict(